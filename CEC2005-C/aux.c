@@ -1,15 +1,18 @@
 /* Some auxillary functions (not part of any algorithm or procdure) */
 
+# define _POSIX_C_SOURCE 200112L
+
 # include <stdio.h>
 # include <stdlib.h>
 # include <math.h>
+# include <time.h>
 
 # include "global.h"
 # include "sub.h"
 # include "rand.h"
 
 /* Function to return the maximum of two variables */
-long double maximum (long double a, long double b)
+real maximum (real a, real b)
 {
     if (a>b)
     {
@@ -19,7 +22,7 @@ long double maximum (long double a, long double b)
 }
 
 /* Function to return the minimum of two variables */
-long double minimum (long double a, long double b)
+real minimum (real a, real b)
 {
     if (a<b)
     {
@@ -29,10 +32,10 @@ long double minimum (long double a, long double b)
 }
 
 /* Function to return the modulus of a vector */
-long double modulus (long double *x, int n)
+real modulus (real *x, int n)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<n; i++)
     {
@@ -42,10 +45,10 @@ long double modulus (long double *x, int n)
 }
 
 /* Function to return the dot product of two vecors */
-long double dot (long double *a, long double *b, int n)
+real dot (real *a, real *b, int n)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<n; i++)
     {
@@ -55,14 +58,22 @@ long double dot (long double *a, long double *b, int n)
 }
 
 /* Function to return the mean of n variables */
-long double mean (long double *x, int n)
+real mean (real *x, int n)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<n; i++)
     {
         res += x[i];
     }
-    return (res/(long double)n);
+    return (res/(real)n);
+}
+
+/* Function to return a monotonic wall-clock time in seconds (for phase timings) */
+double wall_time (void)
+{
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return ((double)now.tv_sec + 1e-9*(double)now.tv_nsec);
 }
@@ -10,34 +10,35 @@
 int nreal;                  /* number of real variables */
 int nfunc;                  /* number of basic functions */
 int function_id;            /* function identifier (1-25) */
-long double bound;          /* required for plotting the function profiles for nreal=2 */
+real bound;                 /* required for plotting the function profiles for nreal=2 */
 int density;                /* density of grid points for plotting for nreal=2 */
+const char *input_data_dir = "input_data";  /* directory holding the constant files */
 
 /* Global variables being used in evaluation of various functions */
-long double C;
-long double global_bias;
-long double *trans_x;
-long double *basic_f;
-long double *temp_x1;
-long double *temp_x2;
-long double *temp_x3;
-long double *temp_x4;
-long double *weight;
-long double *sigma;
-long double *lambda;
-long double *bias;
-long double *norm_x;
-long double *norm_f;
-long double **o;
-long double **g;
-long double ***l;
+real C;
+real global_bias;
+real *trans_x;
+real *basic_f;
+real *temp_x1;
+real *temp_x2;
+real *temp_x3;
+real *temp_x4;
+real *weight;
+real *sigma;
+real *lambda;
+real *bias;
+real *norm_x;
+real *norm_f;
+real **o;
+real **g;
+real ***l;
 
 /* Function-specific global variables */
 /* F5 */
-long double **A_f5;
-long double *B_f5;
+real **A_f5;
+real *B_f5;
 
 /* F12 */
-long double **A_f12;
-long double **B_f12;
-long double *alpha_f12; 
+real **A_f12;
+real **B_f12;
+real *alpha_f12; 
@@ -0,0 +1,302 @@
+/* Shared library entry points for the CEC2005 benchmark functions */
+/* The library keeps the state of one (function, dimension) pair at a time */
+
+# include <stdio.h>
+# include <stdlib.h>
+# include <string.h>
+# include <time.h>
+
+# ifdef _OPENMP
+# include <omp.h>
+# endif
+
+# include "global.h"
+# include "sub.h"
+# include "rand.h"
+# include "trace.h"
+# include "cec2005.h"
+
+static int initialized = 0;
+static real *eval_x = NULL;
+static real *block_x = NULL;
+static char *input_dir_copy = NULL;
+static double initialize_time = 0.0;
+static double normalize_time = 0.0;
+static int num_threads = 1;
+
+/* Set the directory holding the constant files */
+int cec2005_set_input_dir (const char *dir)
+{
+    char *copy;
+    if (dir == NULL)
+    {
+        return (-1);
+    }
+    copy = (char *)malloc(strlen(dir)+1);
+    if (copy == NULL)
+    {
+        return (-1);
+    }
+    strcpy(copy, dir);
+    free(input_dir_copy);
+    input_dir_copy = copy;
+    input_data_dir = input_dir_copy;
+    close_constant_pack();
+    return (0);
+}
+
+/* Load constants and normalization for a function and dimension */
+int cec2005_init (int func_id, int dimension)
+{
+    double start;
+    if (func_id < 1 || func_id > 25)
+    {
+        fprintf(stderr, "\n Error: Function ID must be between 1 and 25, got %d\n", func_id);
+        return (-1);
+    }
+    if (dimension != 2 && dimension != 10 && dimension != 30 && dimension != 50)
+    {
+        fprintf(stderr, "\n Error: Dimension must be 2, 10, 30, or 50, got %d\n", dimension);
+        return (-1);
+    }
+    if (initialized)
+    {
+        cec2005_free();
+    }
+    function_id = func_id;
+    nreal = dimension;
+    if (function_id <= 14)
+    {
+        nfunc = 1;
+    }
+    else
+    {
+        nfunc = 10;
+    }
+    randomize();
+    initrandomnormaldeviate();
+    allocate_memory();
+    start = wall_time();
+    initialize();
+    initialize_time = wall_time()-start;
+    normalize_time = 0.0;
+    if (function_id >= 15)
+    {
+        start = wall_time();
+        calc_benchmark_norm();
+        normalize_time = wall_time()-start;
+    }
+    eval_x = (real *)malloc(nreal*sizeof(real));
+    block_x = (real *)malloc(TRANSFORM_BLOCK*nreal*sizeof(real));
+    if (eval_x == NULL || block_x == NULL || trace_start() != 0)
+    {
+        free(eval_x);
+        free(block_x);
+        eval_x = NULL;
+        block_x = NULL;
+        free_memory();
+        return (-1);
+    }
+    initialized = 1;
+    return (0);
+}
+
+/* Number of threads cec2005_evaluate uses */
+int cec2005_set_threads (int threads)
+{
+    if (threads < 0)
+    {
+        return (-1);
+    }
+    num_threads = threads;
+    return (0);
+}
+
+/* Number of threads a large batch is split across (1 without OpenMP) */
+int cec2005_threads (void)
+{
+# ifdef _OPENMP
+    return (num_threads > 0 ? num_threads : omp_get_max_threads());
+# else
+    return (1);
+# endif
+}
+
+/* Evaluate block 'index' (TRANSFORM_BLOCK vectors) of the count vectors in x into f */
+/* bx and ex are the buffers of the calling thread, for the block and for one vector */
+static void evaluate_block (const double *x, int count, double *f, int index, real *bx, real *ex)
+{
+    int i, j;
+    int start, block;
+    start = index*TRANSFORM_BLOCK;
+    block = count-start < TRANSFORM_BLOCK ? count-start : TRANSFORM_BLOCK;
+    for (i=0; i<block*nreal; i++)
+    {
+        bx[i] = x[start*nreal+i];
+    }
+    /* Composite functions transform the whole block at once */
+    transform_block(bx, block);
+    for (i=0; i<block; i++)
+    {
+        for (j=0; j<nreal; j++)
+        {
+            ex[j] = bx[i*nreal+j];
+        }
+        f[start+i] = (double)calc_benchmark_func(ex);
+    }
+    return;
+}
+
+/* Whether the current function draws noise from rand() (F4, F17, F24, F25) */
+static int noisy_function (void)
+{
+    return (function_id == 4 || function_id == 17 || function_id == 24 || function_id == 25);
+}
+
+/* Evaluate count vectors stored row-major in x into f */
+/* With OpenMP, the blocks are shared out among threads that each have their own scratch */
+/* buffers (kept until cec2005_free); the constants are shared. Every vector gets the same */
+/* value as when run serially. */
+/* The noisy functions share the rand() stream, so they are always evaluated serially: */
+/* their noise is drawn in vector order, as in a serial run. */
+int cec2005_evaluate (const double *x, int count, double *f)
+{
+    int index, blocks, threads;
+    int failed = 0;
+    if (!initialized)
+    {
+        fprintf(stderr, "\n Error: cec2005_init must be called before cec2005_evaluate\n");
+        return (-1);
+    }
+    /* The calling thread need not be the one that called cec2005_init */
+    ensure_scratch();
+    blocks = (count+TRANSFORM_BLOCK-1)/TRANSFORM_BLOCK;
+    threads = cec2005_threads();
+    if (threads > blocks)
+    {
+        threads = blocks;
+    }
+    if (threads <= 1 || noisy_function())
+    {
+        for (index=0; index<blocks; index++)
+        {
+            evaluate_block(x, count, f, index, block_x, eval_x);
+        }
+        return (0);
+    }
+# ifdef _OPENMP
+# pragma omp parallel num_threads(threads) private(index)
+    {
+        real *bx = block_x;
+        real *ex = eval_x;
+        int worker = omp_get_thread_num() != 0;
+        /* The calling thread (thread 0) keeps its buffers, the others get their own */
+        if (worker)
+        {
+            ensure_scratch();
+            bx = (real *)malloc(TRANSFORM_BLOCK*nreal*sizeof(real));
+            ex = (real *)malloc(nreal*sizeof(real));
+            if (bx == NULL || ex == NULL)
+            {
+# pragma omp critical
+                failed = 1;
+            }
+        }
+# pragma omp for schedule(dynamic)
+        for (index=0; index<blocks; index++)
+        {
+            if (bx != NULL && ex != NULL)
+            {
+                evaluate_block(x, count, f, index, bx, ex);
+            }
+        }
+        if (worker)
+        {
+            free(bx);
+            free(ex);
+        }
+    }
+# endif
+    return (failed ? -1 : 0);
+}
+
+/* Point k of the landscape axis over [-bound, bound] (as numpy.linspace computes it) */
+static double grid_point (double grid_bound, double step, int k)
+{
+    return (k == density-1 ? grid_bound : k*step + (-grid_bound));
+}
+
+/* Evaluate a D=2 function on the density x density grid over [-bound, bound]^2 into f */
+/* f[i*density+j] is the value at (x_j, x_i): rows run along the second variable */
+int cec2005_landscape (double grid_bound, int grid_density, double *f)
+{
+    int i, j;
+    int status = 0;
+    double step;
+    double *row;
+    if (!initialized)
+    {
+        fprintf(stderr, "\n Error: cec2005_init must be called before cec2005_landscape\n");
+        return (-1);
+    }
+    if (nreal != 2 || grid_density < 2 || !(grid_bound > 0.0))
+    {
+        fprintf(stderr, "\n Error: A landscape needs dimension 2, a positive bound and a density of at least 2\n");
+        return (-1);
+    }
+    bound = grid_bound;
+    density = grid_density;
+    step = (2.0*grid_bound)/(grid_density-1);
+    row = (double *)malloc(2*(size_t)density*sizeof(double));
+    if (row == NULL)
+    {
+        return (-1);
+    }
+    for (i=0; i<density && status == 0; i++)
+    {
+        for (j=0; j<density; j++)
+        {
+            row[2*j] = grid_point(grid_bound, step, j);
+            row[2*j+1] = grid_point(grid_bound, step, i);
+        }
+        status = cec2005_evaluate(row, density, f + (size_t)i*density);
+    }
+    free(row);
+    return (status);
+}
+
+/* Select the traced functions and their directory, reopening the trace of the current one */
+int cec2005_set_trace (const char *functions, const char *dir)
+{
+    trace_stop();
+    if (trace_configure(functions, dir) != 0)
+    {
+        return (-1);
+    }
+    return (initialized ? trace_start() : 0);
+}
+
+/* Wall-clock time (seconds) spent loading constants and normalizing in the last cec2005_init */
+void cec2005_init_times (double *initialize_seconds, double *normalize_seconds)
+{
+    *initialize_seconds = initialize_time;
+    *normalize_seconds = normalize_time;
+    return;
+}
+
+/* Release everything allocated by cec2005_init */
+void cec2005_free (void)
+{
+    if (!initialized)
+    {
+        return;
+    }
+    trace_stop();
+    free_memory();
+    free(eval_x);
+    free(block_x);
+    eval_x = NULL;
+    block_x = NULL;
+    initialized = 0;
+    return;
+}
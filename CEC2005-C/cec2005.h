@@ -0,0 +1,41 @@
+/* Shared library interface to the CEC2005 benchmark functions */
+/* Built as libcec2005.so for in-process evaluation (e.g. via ctypes) */
+
+# ifndef _CEC2005_H
+# define _CEC2005_H
+
+/* Set the directory holding the constant files (default "input_data") */
+int cec2005_set_input_dir (const char *dir);
+
+/* Load constants and normalization for a function and dimension */
+/* Any previously initialized function is released first */
+int cec2005_init (int func_id, int dimension);
+
+/* Evaluate count vectors stored row-major in x (count x dimension) into f */
+/* Large batches are split across cec2005_threads() OpenMP threads (F4, F17, F24 and F25, */
+/* which draw noise from rand(), are always evaluated serially) */
+int cec2005_evaluate (const double *x, int count, double *f);
+
+/* Number of threads of cec2005_evaluate: 1 (the default) evaluates serially, */
+/* 0 uses the OpenMP default (OMP_NUM_THREADS, else one per core); returns -1 if negative */
+int cec2005_set_threads (int threads);
+
+/* Number of threads a large batch is split across (1 when built without OpenMP) */
+int cec2005_threads (void);
+
+/* Evaluate a D=2 function on the density x density grid over [-bound, bound]^2 */
+/* (density*density values, row i at x2 = point i, column j at x1 = point j) */
+int cec2005_landscape (double bound, int density, double *f);
+
+/* Trace the evaluations of the listed functions ("3", "3,15", "all"; NULL or "" for none) */
+/* to <dir>/fNN_D<dimension>.trace, instead of the CEC2005_TRACE and CEC2005_TRACE_DIR */
+/* environment variables; -1 unless built with -DCEC2005_TRACE (see trace.h) */
+int cec2005_set_trace (const char *functions, const char *dir);
+
+/* Wall-clock time (seconds) spent loading constants and normalizing in the last cec2005_init */
+void cec2005_init_times (double *initialize_seconds, double *normalize_seconds);
+
+/* Release everything allocated by cec2005_init */
+void cec2005_free (void);
+
+# endif
@@ -9,10 +9,10 @@
 # include "rand.h"
 
 /* Code to evaluate ackley's function */
-long double calc_ackley (long double *x)
+real calc_ackley (real *x)
 {
     int i;
-    long double sum1, sum2, res;
+    real sum1, sum2, res;
     sum1 = 0.0;
     sum2 = 0.0;
     for (i=0; i<nreal; i++)
@@ -27,10 +27,10 @@ long double calc_ackley (long double *x)
 }
 
 /* Code to evaluate rastrigin's function */
-long double calc_rastrigin (long double *x)
+real calc_rastrigin (real *x)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<nreal; i++)
     {
@@ -40,12 +40,12 @@ long double calc_rastrigin (long double *x)
 }
 
 /* Code to evaluate weierstrass's function */
-long double calc_weierstrass (long double *x)
+real calc_weierstrass (real *x)
 {
     int i, j;
-    long double res;
-    long double sum;
-    long double a, b;
+    real res;
+    real sum;
+    real a, b;
     int k_max;
     a = 0.5;
     b = 3.0;
@@ -64,11 +64,11 @@ long double calc_weierstrass (long double *x)
 }
 
 /* Code to evaluate griewank's function */
-long double calc_griewank (long double *x)
+real calc_griewank (real *x)
 {
     int i;
-    long double s, p;
-    long double res;
+    real s, p;
+    real res;
     s = 0.0;
     p = 1.0;
     for (i=0; i<nreal; i++)
@@ -81,10 +81,10 @@ long double calc_griewank (long double *x)
 }
 
 /* code to evaluate sphere function */
-long double calc_sphere (long double *x)
+real calc_sphere (real *x)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<nreal; i++)
     {
@@ -94,10 +94,10 @@ long double calc_sphere (long double *x)
 }
 
 /* Code to evaluate schwefel's function */
-long double calc_schwefel (long double *x)
+real calc_schwefel (real *x)
 {
     int i, j;
-    long double sum1, sum2;
+    real sum1, sum2;
     sum1 = 0.0;
     for (i=0; i<nreal; i++)
     {
@@ -112,10 +112,10 @@ long double calc_schwefel (long double *x)
 }
 
 /* Code to evaluate rosenbrock's function */
-long double calc_rosenbrock (long double *x)
+real calc_rosenbrock (real *x)
 {
     int i;
-    long double res;
+    real res;
     res = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -125,14 +125,14 @@ long double calc_rosenbrock (long double *x)
 }
 
 /* Code to evaluate schaffer's function and rounding-off variables */
-long double nc_schaffer (long double x, long double y)
+real nc_schaffer (real x, real y)
 {
     int i;
     int a;
-    long double b;
-    long double res;
-    long double temp1, temp2;
-    long double t1[2], t2[2];
+    real b;
+    real res;
+    real temp1, temp2;
+    real t1[2], t2[2];
     t1[0] = x;
     t1[1] = y;
     for (i=0; i<2; i++)
@@ -170,12 +170,12 @@ long double nc_schaffer (long double x, long double y)
 }
 
 /* Code to evaluate rastrigin's function and rounding-off variables */
-long double nc_rastrigin (long double *x)
+real nc_rastrigin (real *x)
 {
     int i;
     int a;
-    long double b;
-    long double res;
+    real b;
+    real res;
     for (i=0; i<nreal; i++)
     {
         if (fabs(x[i]) >= 0.5)
@@ -1,106 +1,293 @@
 /* Function definitions of utility functions */
 
+/* posix_memalign for the aligned constant blocks */
+# define _POSIX_C_SOURCE 200112L
+
 # include <stdio.h>
 # include <stdlib.h>
+# include <string.h>
 # include <math.h>
 
 # include "global.h"
 # include "sub.h"
 # include "rand.h"
+# include "trace.h"
+
+/* Flat, row-major storage behind o, g and l: o[i], g[i] and l[i][j] are rows of these blocks */
+static real *o_data = NULL;
+static real *g_data = NULL;
+static real *l_data = NULL;
+
+/* Whether g and each l[i] is the identity (set by prepare_transform), their products are then skipped */
+static int g_identity = 0;
+static int *l_identity = NULL;
+
+/* Transforms of every component for the current vector (transform_all), read by transform_select */
+static real *trans_all = NULL;
+static const real *trans_cur = NULL;
+
+/* Vectors transformed ahead by transform_block, and their transforms */
+static real *block_x = NULL;
+static real *block_in = NULL;
+static real *block_mid = NULL;
+static real *block_trans = NULL;
+static int block_count = 0;
+static int block_next = 0;
+
+/* Every thread evaluating vectors has its own transforms (allocate_scratch) */
+/* scratch_generation is the current_generation its buffers were allocated in */
+static int scratch_generation = 0;
+# ifdef _OPENMP
+# pragma omp threadprivate(trans_all, trans_cur, block_x, block_in, block_mid, block_trans, block_count, block_next, scratch_generation)
+# endif
+
+/* The scratch buffers of one thread, listed so that free_scratch releases those of every thread */
+# define SCRATCH_BUFFERS 13
+typedef struct scratch_set
+{
+    real *buffers[SCRATCH_BUFFERS];
+    struct scratch_set *next;
+} scratch_set;
+static scratch_set *scratch_sets = NULL;
+/* Advanced by free_scratch: the buffers of older generations are freed */
+static int current_generation = 1;
+
+/* Allocate a zeroed block of count reals aligned to a cache line */
+static real *allocate_block (size_t count)
+{
+    void *block;
+    if (count == 0)
+    {
+        count = 1;
+    }
+    if (posix_memalign(&block, ALIGNMENT, count*sizeof(real)) != 0)
+    {
+        fprintf(stderr, "\n Error: Out of memory allocating %lu values\n", (unsigned long)count);
+        exit(1);
+    }
+    memset(block, 0, count*sizeof(real));
+    return ((real *)block);
+}
+
+/* Allocate the scratch buffers of an evaluation for the calling thread */
+/* With OpenMP they are threadprivate: each thread evaluating vectors allocates its own */
+void allocate_scratch (void)
+{
+    int i;
+    scratch_set *set;
+    norm_x = (real *)malloc(nreal*sizeof(real));
+    trans_x = (real *)malloc(nreal*sizeof(real));
+    basic_f = (real *)malloc(nfunc*sizeof(real));
+    temp_x1 = (real *)malloc(nreal*sizeof(real));
+    temp_x2 = (real *)malloc(nreal*sizeof(real));
+    temp_x3 = (real *)malloc(nreal*sizeof(real));
+    temp_x4 = (real *)malloc(nreal*sizeof(real));
+    weight = (real *)malloc(nfunc*sizeof(real));
+    trans_all = allocate_block((size_t)nfunc*nreal);
+    trans_cur = NULL;
+    block_x = allocate_block((size_t)TRANSFORM_BLOCK*nreal);
+    block_in = allocate_block((size_t)TRANSFORM_BLOCK*nreal);
+    block_mid = allocate_block((size_t)TRANSFORM_BLOCK*nreal);
+    block_trans = allocate_block((size_t)TRANSFORM_BLOCK*nfunc*nreal);
+    block_count = 0;
+    block_next = 0;
+    for (i=0; i<nreal; i++)
+    {
+        norm_x[i] = 5.0;
+        trans_x[i] = 0.0;
+        temp_x1[i] = 0.0;
+        temp_x2[i] = 0.0;
+        temp_x3[i] = 0.0;
+        temp_x4[i] = 0.0;
+    }
+    for (i=0; i<nfunc; i++)
+    {
+        basic_f[i] = 0.0;
+        weight[i] = 1.0/(real)nfunc;
+    }
+    set = (scratch_set *)malloc(sizeof(scratch_set));
+    if (set == NULL)
+    {
+        fprintf(stderr, "\n Error: Out of memory allocating scratch buffers\n");
+        exit(1);
+    }
+    set->buffers[0] = norm_x;
+    set->buffers[1] = trans_x;
+    set->buffers[2] = basic_f;
+    set->buffers[3] = temp_x1;
+    set->buffers[4] = temp_x2;
+    set->buffers[5] = temp_x3;
+    set->buffers[6] = temp_x4;
+    set->buffers[7] = weight;
+    set->buffers[8] = trans_all;
+    set->buffers[9] = block_x;
+    set->buffers[10] = block_in;
+    set->buffers[11] = block_mid;
+    set->buffers[12] = block_trans;
+# ifdef _OPENMP
+# pragma omp critical (scratch_sets)
+# endif
+    {
+        set->next = scratch_sets;
+        scratch_sets = set;
+    }
+    scratch_generation = current_generation;
+    return;
+}
+
+/* Allocate the calling thread's scratch buffers unless it holds them for the current constants */
+/* (a thread other than the initializing one, or one whose buffers free_scratch released) */
+void ensure_scratch (void)
+{
+    if (scratch_generation != current_generation)
+    {
+        allocate_scratch();
+        initrandomnormaldeviate();
+    }
+    return;
+}
 
 /* Code to allocate memory to global variables being used in evaluation of functions */
 void allocate_memory (void)
 {
-    int i, j, k;
-    norm_x = (long double *)malloc(nreal*sizeof(long double));
-    norm_f = (long double *)malloc(nfunc*sizeof(long double));
-    trans_x = (long double *)malloc(nreal*sizeof(long double));
-    basic_f = (long double *)malloc(nfunc*sizeof(long double));
-    temp_x1 = (long double *)malloc(nreal*sizeof(long double));
-    temp_x2 = (long double *)malloc(nreal*sizeof(long double));
-    temp_x3 = (long double *)malloc(nreal*sizeof(long double));
-    temp_x4 = (long double *)malloc(nreal*sizeof(long double));
-    weight = (long double *)malloc(nfunc*sizeof(long double));
-    sigma = (long double *)malloc(nfunc*sizeof(long double));
-    lambda = (long double *)malloc(nfunc*sizeof(long double));
-    bias = (long double *)malloc(nfunc*sizeof(long double));
-    o = (long double **)malloc(nfunc*sizeof(long double));
-    l = (long double ***)malloc(nfunc*sizeof(long double));
-    g = (long double **)malloc(nreal*sizeof(long double));
+    int i, j;
+    norm_f = (real *)malloc(nfunc*sizeof(real));
+    sigma = (real *)malloc(nfunc*sizeof(real));
+    lambda = (real *)malloc(nfunc*sizeof(real));
+    bias = (real *)malloc(nfunc*sizeof(real));
+    o_data = allocate_block((size_t)nfunc*nreal);
+    g_data = allocate_block((size_t)nreal*nreal);
+    l_data = allocate_block((size_t)nfunc*nreal*nreal);
+    o = (real **)malloc(nfunc*sizeof(real *));
+    l = (real ***)malloc(nfunc*sizeof(real **));
+    g = (real **)malloc(nreal*sizeof(real *));
     for (i=0; i<nfunc; i++)
     {
-        o[i] = (long double *)malloc(nreal*sizeof(long double));
-        l[i] = (long double **)malloc(nreal*sizeof(long double));
+        o[i] = o_data + (size_t)i*nreal;
+        l[i] = (real **)malloc(nreal*sizeof(real *));
+        for (j=0; j<nreal; j++)
+        {
+            l[i][j] = l_data + ((size_t)i*nreal + j)*nreal;
+        }
+    }
+    for (i=0; i<nreal; i++)
+    {
+        g[i] = g_data + (size_t)i*nreal;
     }
+    l_identity = (int *)malloc(nfunc*sizeof(int));
+    allocate_scratch();
+    /* Do some trivial (common) initialization here itself */
+	C = 2000.0;
     for (i=0; i<nreal; i++)
     {
-        g[i] = (long double *)malloc(nreal*sizeof(long double));
+        g[i][i] = 1.0;
     }
+    g_identity = 1;
     for (i=0; i<nfunc; i++)
     {
+        norm_f[i] = 0.0;
+        sigma[i] = 1.0;
+        lambda[i] = 1.0;
+        bias[i] = 100.0*(real)i;
         for (j=0; j<nreal; j++)
         {
-            l[i][j] = (long double *)malloc(nreal*sizeof(long double));
+            l[i][j][j] = 1.0;
         }
+        l_identity[i] = 1;
     }
-    /* Do some trivial (common) initialization here itself */
-	C = 2000.0;
+    return;
+}
+
+/* Check whether an nreal x nreal row-major matrix is exactly the identity */
+static int is_identity (const real *m)
+{
+    int i, j;
     for (i=0; i<nreal; i++)
     {
-        norm_x[i] = 5.0;
-        trans_x[i] = 0.0;
-        temp_x1[i] = 0.0;
-        temp_x2[i] = 0.0;
-        temp_x3[i] = 0.0;
-        temp_x4[i] = 0.0;
         for (j=0; j<nreal; j++)
         {
-            if (i==j)
+            if (m[i*nreal+j] != (i==j ? 1.0 : 0.0))
             {
-                g[i][j]=1.0;
-            }
-            else
-            {
-                g[i][j]=0.0;
+                return (0);
             }
         }
     }
+    return (1);
+}
+
+/* Record which rotation matrices are the identity, once the constants are loaded */
+void prepare_transform (void)
+{
+    int i;
+    g_identity = is_identity(g_data);
     for (i=0; i<nfunc; i++)
     {
-        basic_f[i] = 0.0;
-        norm_f[i] = 0.0;
-        weight[i] = 1.0/(long double)nfunc;
-        sigma[i] = 1.0;
-        lambda[i] = 1.0;
-        bias[i] = 100.0*(long double)i;
-        for (j=0; j<nreal; j++)
+        l_identity[i] = is_identity(l[i][0]);
+    }
+    block_count = 0;
+    block_next = 0;
+    return;
+}
+
+/* Multiply count row vectors v by the row-major matrix m into out (out = v*m) */
+/* The rows of m are streamed in order; each out[j] still sums over i in ascending order */
+static void rotate (const real *v, const real *m, int count, real *out)
+{
+    int b, i, j;
+    const real *row;
+    real vi;
+    real *acc;
+    for (b=0; b<count*nreal; b++)
+    {
+        out[b] = 0.0;
+    }
+    for (i=0; i<nreal; i++)
+    {
+        row = m + (size_t)i*nreal;
+        for (b=0; b<count; b++)
         {
-            o[i][j] = 0.0;
-            for (k=0; k<nreal; k++)
+            vi = v[b*nreal+i];
+            acc = out + (size_t)b*nreal;
+            for (j=0; j<nreal; j++)
             {
-                if (j==k)
-                {
-                    l[i][j][k] = 1.0;
-                }
-                else
-                {
-                    l[i][j][k] = 0.0;
-                }
+                acc[j] += row[j]*vi;
             }
         }
     }
     return;
 }
 
+/* Rotate temp_x2 by g and then by l[count] into trans_x, skipping identity matrices */
+static void rotate_component (int count)
+{
+    if (g_identity)
+    {
+        memcpy(temp_x3, temp_x2, nreal*sizeof(real));
+    }
+    else
+    {
+        rotate(temp_x2, g_data, 1, temp_x3);
+    }
+    if (l_identity[count])
+    {
+        memcpy(trans_x, temp_x3, nreal*sizeof(real));
+    }
+    else
+    {
+        rotate(temp_x3, l[count][0], 1, trans_x);
+    }
+    return;
+}
+
 /* 
     Code to transform a variable vector based on function index 'count' 
     This is the original transform function from the CEC2005-C code.
     It is used to transform the variable vector x based on the function index count.
     The result is stored in the trans_x vector.
 */
-void transform (long double *x, int count)
+void transform (real *x, int count)
 {
-    int i, j;
+    int i;
     /* Shift the vector x by the shift vector o */
     for (i=0; i<nreal; i++)
     {
@@ -110,60 +297,164 @@ void transform (long double *x, int count)
     {
         temp_x2[i] = temp_x1[i]/lambda[count];
     }
+    TRACE_VECTOR("shifted", count, temp_x2, nreal);
 
-    /* Rotate the vector temp_x2 by the rotation matrix g */
-    for (j=0; j<nreal; j++)
+    /* Rotate the vector temp_x2 by the rotation matrices g and l[count] */
+    rotate_component(count);
+    TRACE_VECTOR("rotated", count, trans_x, nreal);
+    return;
+}
+
+/* Shift, scale and rotate count vectors for every component in one pass */
+/* out holds, for each vector b, the nfunc transformed vectors of nreal values */
+static void transform_vectors (const real *x, int count, real *out)
+{
+    int b, c, i;
+    real *rotated;
+    for (c=0; c<nfunc; c++)
     {
-        temp_x3[j] = 0.0;
-        for (i=0; i<nreal; i++)
+        for (b=0; b<count; b++)
         {
-            temp_x3[j] += g[i][j]*temp_x2[i];
+            for (i=0; i<nreal; i++)
+            {
+                block_in[b*nreal+i] = (x[b*nreal+i] - o[c][i])/lambda[c];
+            }
+        }
+        if (!g_identity)
+        {
+            rotate(block_in, g_data, count, block_mid);
+            memcpy(block_in, block_mid, (size_t)count*nreal*sizeof(real));
+        }
+        rotated = block_in;
+        if (!l_identity[c])
+        {
+            rotate(block_in, l[c][0], count, block_mid);
+            rotated = block_mid;
+        }
+        for (b=0; b<count; b++)
+        {
+            memcpy(out + ((size_t)b*nfunc + c)*nreal, rotated + (size_t)b*nreal, nreal*sizeof(real));
         }
     }
-    for (j=0; j<nreal; j++)
+    return;
+}
+
+# ifdef CEC2005_TRACE
+/* Trace the shifted and scaled vector of every component, which the block transforms do not keep */
+static void trace_shifted (const real *x)
+{
+    int c, i;
+    for (c=0; c<nfunc; c++)
     {
-        trans_x[j] = 0.0;
         for (i=0; i<nreal; i++)
         {
-            trans_x[j] += l[count][i][j]*temp_x3[i];
+            temp_x1[i] = (x[i] - o[c][i])/lambda[c];
         }
+        trace_vector("shifted", c, temp_x1, nreal);
     }
     return;
 }
+# endif
 
-/* Code to transform a vector (with elements 5.0) based on function index 'count' */
-void transform_norm (int count)
+/* Whether two vectors hold the same values, signs of zeros included */
+/* (not memcmp: the padding bytes of a long double are not part of its value) */
+static int same_vector (const real *x, const real *y)
 {
-    int i, j;
+    int i;
     for (i=0; i<nreal; i++)
     {
-        temp_x2[i] = 5.0/lambda[count];
+        if (x[i] != y[i] || signbit(x[i]) != signbit(y[i]))
+        {
+            return (0);
+        }
     }
-    for (j=0; j<nreal; j++)
+    return (1);
+}
+
+/* Transform a vector for every component of a composite function at once */
+/* Uses the transforms computed ahead by transform_block when x is the next vector of the block */
+void transform_all (real *x)
+{
+    const real *next;
+# ifdef CEC2005_TRACE
+    if (trace_active)
     {
-        temp_x3[j] = 0.0;
-        for (i=0; i<nreal; i++)
+        trace_shifted(x);
+    }
+# endif
+    if (block_next < block_count)
+    {
+        next = block_x + (size_t)block_next*nreal;
+        if (same_vector(next, x))
         {
-            temp_x3[j] += g[i][j]*temp_x2[i];
+            trans_cur = block_trans + (size_t)block_next*nfunc*nreal;
+            block_next++;
+            return;
         }
+        /* The vectors are not evaluated in block order, drop the rest of the block */
+        block_count = 0;
+        block_next = 0;
+    }
+    transform_vectors(x, 1, trans_all);
+    trans_cur = trans_all;
+    return;
+}
+
+/* Copy the transform of component 'count' computed by transform_all into trans_x */
+void transform_select (int count)
+{
+    memcpy(trans_x, trans_cur + (size_t)count*nreal, nreal*sizeof(real));
+    TRACE_VECTOR("rotated", count, trans_x, nreal);
+    return;
+}
+
+/* Transform up to TRANSFORM_BLOCK vectors (count x nreal, row-major) ahead of their evaluation */
+/* The rotations become matrix-matrix products; returns the number of vectors transformed */
+int transform_block (const real *x, int count)
+{
+    int b;
+    block_count = 0;
+    block_next = 0;
+    if (nfunc == 1 || count < 2)
+    {
+        return (0);
     }
-    for (j=0; j<nreal; j++)
+    if (count > TRANSFORM_BLOCK)
     {
-        trans_x[j] = 0.0;
-        for (i=0; i<nreal; i++)
+        count = TRANSFORM_BLOCK;
+    }
+    memcpy(block_x, x, (size_t)count*nreal*sizeof(real));
+    /* F23 transforms its vectors rounded (calc_benchmark_f23): round them likewise */
+    if (function_id == 23)
+    {
+        for (b=0; b<count; b++)
         {
-            trans_x[j] += l[count][i][j]*temp_x3[i];
+            round_f23(block_x + (size_t)b*nreal, block_x + (size_t)b*nreal);
         }
     }
+    transform_vectors(block_x, count, block_trans);
+    block_count = count;
+    return (count);
+}
+
+/* Code to transform a vector (with elements 5.0) based on function index 'count' */
+void transform_norm (int count)
+{
+    int i;
+    for (i=0; i<nreal; i++)
+    {
+        temp_x2[i] = 5.0/lambda[count];
+    }
+    rotate_component(count);
     return;
 }
 
 /* Code to compute the weights for a variable vector */
-void calc_weight (long double *x)
+void calc_weight (real *x)
 {
     int i, j;
-    long double sum;
-    long double max;
+    real sum;
+    real max;
     max = -INF;
     for (i=0; i<nfunc; i++)
     {
@@ -188,7 +479,7 @@ void calc_weight (long double *x)
     {
         for (i=0; i<nfunc; i++)
         {
-            weight[i] = 1.0/(long double)nfunc;
+            weight[i] = 1.0/(real)nfunc;
         }
     }
     else
@@ -201,40 +492,82 @@ void calc_weight (long double *x)
     return;
 }
 
+/* Free the scratch buffers of every thread (allocate_scratch) */
+/* The other threads still point at theirs: ensure_scratch allocates them new ones */
+void free_scratch (void)
+{
+    int i;
+    scratch_set *set;
+    while (scratch_sets != NULL)
+    {
+        set = scratch_sets;
+        scratch_sets = set->next;
+        for (i=0; i<SCRATCH_BUFFERS; i++)
+        {
+            free (set->buffers[i]);
+        }
+        free (set);
+    }
+    current_generation++;
+    scratch_generation = 0;
+    norm_x = trans_x = basic_f = NULL;
+    temp_x1 = temp_x2 = temp_x3 = temp_x4 = NULL;
+    weight = NULL;
+    trans_all = NULL;
+    trans_cur = NULL;
+    block_x = block_in = block_mid = block_trans = NULL;
+    block_count = 0;
+    block_next = 0;
+    return;
+}
+
 /* Code to free the allocated memory */
 void free_memory(void)
 {
-    int i, j;
-    free (norm_x);
+    int i;
+    free_scratch();
     free (norm_f);
-    free (trans_x);
-    free (basic_f);
-    free (temp_x1);
-    free (temp_x2);
-    free (temp_x3);
-    free (temp_x4);
-    free (weight);
     free (sigma);
     free (lambda);
     free (bias);
     for (i=0; i<nfunc; i++)
     {
-        for (j=0; j<nreal; j++)
-        {
-            free (l[i][j]);
-        }
-    }
-    for (i=0; i<nfunc; i++)
-    {
-        free (o[i]);
         free (l[i]);
     }
-    for (i=0; i<nreal; i++)
-    {
-        free (g[i]);
-    }
     free (o);
     free (l);
     free (g);
+    free (o_data);
+    free (g_data);
+    free (l_data);
+    free (l_identity);
+    o_data = g_data = l_data = NULL;
+    l_identity = NULL;
+    /* Function-specific arrays are only allocated by initialize_f5/f12 */
+    if (A_f5 != NULL)
+    {
+        for (i=0; i<nreal; i++)
+        {
+            free (A_f5[i]);
+        }
+        free (A_f5);
+        free (B_f5);
+        A_f5 = NULL;
+        B_f5 = NULL;
+    }
+    if (A_f12 != NULL)
+    {
+        for (i=0; i<nreal; i++)
+        {
+            free (A_f12[i]);
+            free (B_f12[i]);
+        }
+        free (A_f12);
+        free (B_f12);
+        free (alpha_f12);
+        A_f12 = NULL;
+        B_f12 = NULL;
+        alpha_f12 = NULL;
+    }
     return;
 }
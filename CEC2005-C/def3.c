@@ -14,6 +14,7 @@
 /* Function to select the appropriate initialization function based on function_id */
 void initialize(void)
 {
+    reset_input_mtime();
     switch (function_id) {
         case 1: initialize_f1(); break;
         case 2: initialize_f2(); break;
@@ -44,14 +45,15 @@ void initialize(void)
             fprintf(stderr, "Error: Invalid function ID %d\n", function_id);
             exit(1);
     }
+    prepare_transform();
 }
 
 /* F1: Shifted Sphere Function */
 void initialize_f1(void)
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f01/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f01/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f01/shift_D50.txt for reading \n");
@@ -62,10 +64,10 @@ void initialize_f1(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -450.0;
     return;
 }
@@ -74,8 +76,8 @@ void initialize_f1(void)
 void initialize_f2(void)
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f02/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f02/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f02/shift_D50.txt for reading \n");
@@ -85,10 +87,10 @@ void initialize_f2(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -450.0;
     return;
 }
@@ -97,11 +99,11 @@ void initialize_f2(void)
 void initialize_f3(void)
 {
     int i, j;
-    FILE *fpt;
-    if (nreal==2) fpt = fopen("input_data/f03/rot_D2.txt","r");
-    if (nreal==10) fpt = fopen("input_data/f03/rot_D10.txt","r");
-    if (nreal==30) fpt = fopen("input_data/f03/rot_D30.txt","r");
-    if (nreal==50) fpt = fopen("input_data/f03/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2) fpt = open_input_file("f03/rot_D2.txt");
+    if (nreal==10) fpt = open_input_file("f03/rot_D10.txt");
+    if (nreal==30) fpt = open_input_file("f03/rot_D30.txt");
+    if (nreal==50) fpt = open_input_file("f03/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open rotation matrix file elliptic_M_D*.txt for reading \n");
@@ -111,11 +113,11 @@ void initialize_f3(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
-    fpt = fopen("input_data/f03/shift_D50.txt","r");
+    close_input_file(fpt);
+    fpt = open_input_file("f03/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open shift vector file input_data/f03/shift_D50.txt for reading \n");
@@ -125,10 +127,10 @@ void initialize_f3(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -450.0;
     return;
 }
@@ -137,8 +139,8 @@ void initialize_f3(void)
 void initialize_f4(void)
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f02/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f02/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f02/shift_D50.txt for reading \n");
@@ -148,10 +150,10 @@ void initialize_f4(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -450.0;
     return;
 }
@@ -161,17 +163,17 @@ void initialize_f5(void)
 {
     int i, j;
     int index;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Allocate memory for F5 specific arrays */
-    A_f5 = (long double **)malloc(nreal*sizeof(long double*));
+    A_f5 = (real **)malloc(nreal*sizeof(real*));
     for (i=0; i<nreal; i++)
     {
-        A_f5[i] = (long double *)malloc(nreal*sizeof(long double));
+        A_f5[i] = (real *)malloc(nreal*sizeof(real));
     }
-    B_f5 = (long double *)malloc(nreal*sizeof(long double));
+    B_f5 = (real *)malloc(nreal*sizeof(real));
 
-    fpt = fopen("input_data/f05/shift_D50.txt","r");
+    fpt = open_input_file("f05/shift_D50.txt");
     if (fpt==NULL) {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
         exit(0);
@@ -181,17 +183,17 @@ void initialize_f5(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
     for (i=0; i<nreal; i++)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&A_f5[i][j]);
+            read_input_value(fpt,&A_f5[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     if (nreal%4==0)
     {
         index = nreal/4;
@@ -225,8 +227,8 @@ void initialize_f5(void)
 void initialize_f6(void)
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f06/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f06/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -236,11 +238,11 @@ void initialize_f6(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
             o[i][j] -= 1.0;
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = 390.0;
     return;
 }
@@ -249,11 +251,11 @@ void initialize_f6(void)
 void initialize_f7(void)
 {
     int i, j;
-    FILE *fpt;
-    if (nreal==2)    fpt = fopen("input_data/f07/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f07/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f07/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f07/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2)    fpt = open_input_file("f07/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f07/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f07/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f07/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -263,11 +265,11 @@ void initialize_f7(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
-    fpt = fopen("input_data/f07/shift_D50.txt","r");
+    close_input_file(fpt);
+    fpt = open_input_file("f07/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -277,10 +279,10 @@ void initialize_f7(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -180.0;
     return;
 }
@@ -290,11 +292,11 @@ void initialize_f8(void)
 {
     int i, j;
     int index;
-    FILE *fpt;
-    if (nreal==2)    fpt = fopen("input_data/f08/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f08/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f08/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f08/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2)    fpt = open_input_file("f08/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f08/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f08/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f08/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -304,11 +306,11 @@ void initialize_f8(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
-    fpt = fopen("input_data/f08/shift_D50.txt","r");
+    close_input_file(fpt);
+    fpt = open_input_file("f08/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -318,10 +320,10 @@ void initialize_f8(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     index = nreal/2;
     for (i=1; i<=index; i++)
     {
@@ -335,8 +337,8 @@ void initialize_f8(void)
 void initialize_f9(void)
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f09/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f09/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -346,10 +348,10 @@ void initialize_f9(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -330.0;
     return;
 }
@@ -358,11 +360,11 @@ void initialize_f9(void)
 void initialize_f10(void)
 {
     int i, j;
-    FILE *fpt;
-    if (nreal==2)    fpt = fopen("input_data/f10/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f10/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f10/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f10/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2)    fpt = open_input_file("f10/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f10/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f10/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f10/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -372,12 +374,12 @@ void initialize_f10(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     /* The shift is the same as f9 */
-    fpt = fopen("input_data/f09/shift_D50.txt","r");
+    fpt = open_input_file("f09/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -387,10 +389,10 @@ void initialize_f10(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -330.0;
     return;
 }
@@ -399,11 +401,11 @@ void initialize_f10(void)
 void initialize_f11(void)
 {
     int i, j;
-    FILE *fpt;
-    if (nreal==2)    fpt = fopen("input_data/f11/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f11/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f11/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f11/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2)    fpt = open_input_file("f11/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f11/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f11/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f11/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file weierstrass_M_D*.txt for reading \n");
@@ -413,11 +415,11 @@ void initialize_f11(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
-    fpt = fopen("input_data/f11/shift_D50.txt","r");
+    close_input_file(fpt);
+    fpt = open_input_file("f11/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f11/shift_D50.txt for reading \n");
@@ -427,10 +429,10 @@ void initialize_f11(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = 90.0;
     return;
 }
@@ -439,19 +441,19 @@ void initialize_f11(void)
 void initialize_f12(void)
 {
     int i, j;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Allocate memory for F12 specific arrays */
-    A_f12 = (long double **)malloc(nreal*sizeof(long double*));
-    B_f12 = (long double **)malloc(nreal*sizeof(long double*));
-    alpha_f12 = (long double *)malloc(nreal*sizeof(long double));
+    A_f12 = (real **)malloc(nreal*sizeof(real*));
+    B_f12 = (real **)malloc(nreal*sizeof(real*));
+    alpha_f12 = (real *)malloc(nreal*sizeof(real));
     
     for (i=0; i<nreal; i++)
     {
-        A_f12[i] = (long double *)malloc(nreal*sizeof(long double));
-        B_f12[i] = (long double *)malloc(nreal*sizeof(long double));
+        A_f12[i] = (real *)malloc(nreal*sizeof(real));
+        B_f12[i] = (real *)malloc(nreal*sizeof(real));
     }
-    fpt = fopen("input_data/f12/bias_D50.txt","r");
+    fpt = open_input_file("f12/bias_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for function 12 \n");
@@ -461,7 +463,7 @@ void initialize_f12(void)
     /* Read alpha values */
     for (i=0; i<nreal; i++)
     {
-        fscanf(fpt,"%Lf",&alpha_f12[i]);
+        read_input_value(fpt,&alpha_f12[i]);
     }
     
     /* Read A values */
@@ -469,7 +471,7 @@ void initialize_f12(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&A_f12[i][j]);
+            read_input_value(fpt,&A_f12[i][j]);
         }
     }
     
@@ -478,7 +480,7 @@ void initialize_f12(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&B_f12[i][j]);
+            read_input_value(fpt,&B_f12[i][j]);
         }
     }
     if (i!=100)
@@ -491,9 +493,9 @@ void initialize_f12(void)
     /* Reading alpha */
     for (i=0; i<nreal; i++)
     {
-        fscanf(fpt,"%Lf",&alpha_f12[i]);
+        read_input_value(fpt,&alpha_f12[i]);
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -460.0;
     return;
 }
@@ -501,8 +503,8 @@ void initialize_f12(void)
 void initialize_f13(void) 
 {
     int i, j;
-    FILE *fpt;
-    fpt = fopen("input_data/f13/shift_D50.txt","r");
+    const_stream *fpt;
+    fpt = open_input_file("f13/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -512,22 +514,22 @@ void initialize_f13(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
             o[i][j] -= 1.0;
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -130.0;
     return;
 }
 void initialize_f14(void) 
 {
     int i, j;
-    FILE *fpt;
-    if (nreal==2)    fpt = fopen("input_data/f14/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f14/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f14/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f14/rot_D50.txt","r");
+    const_stream *fpt;
+    if (nreal==2)    fpt = open_input_file("f14/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f14/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f14/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f14/rot_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -537,11 +539,11 @@ void initialize_f14(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&g[i][j]);
+            read_input_value(fpt,&g[i][j]);
         }
     }
-    fclose(fpt);
-    fpt = fopen("input_data/f14/shift_D50.txt","r");
+    close_input_file(fpt);
+    fpt = open_input_file("f14/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file for reading \n");
@@ -551,48 +553,33 @@ void initialize_f14(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
     }
-    fclose(fpt);
+    close_input_file(fpt);
     bias[0] = -300.0;
     return;
 }
 void initialize_f15(void) 
 {
     int i, j;
-    FILE *fpt;
+    const_stream *fpt;
     
-    printf("\nDEBUG: Starting initialize_f15\n");
-    
-    fpt = fopen("input_data/f15/shift_D50.txt","r");
+    fpt = open_input_file("f15/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f15/shift_D50.txt for reading \n");
         exit(0);
     }
     
-    printf("DEBUG: File opened successfully, starting to read shift data\n");
-    
     for (i=0; i<nfunc; i++)
     {
-        printf("DEBUG: Reading shift data for function %d\n", i+1);
-        
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
-            
-            if (j == 0 || j == nreal-1)
-                printf("DEBUG: Read o[%d][%d] = %Lf\n", i, j, o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        
-        printf("DEBUG: Completed reading function %d\n", i+1);
     }
-    
-    fclose(fpt);
-    
-    printf("DEBUG: Setting lambda values\n");
-    
+    close_input_file(fpt);
     lambda[0] = 1.0;
     lambda[1] = 1.0;
     lambda[2] = 10.0;
@@ -604,18 +591,15 @@ void initialize_f15(void)
     lambda[8] = 1.0/20.0;
     lambda[9] = 1.0/20.0;
     global_bias = 120.0;
-    
-    printf("DEBUG: initialize_f15 completed successfully\n");
-    
     return;
 }
 void initialize_f16(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Uses the same shift data as f15 */
-    fpt = fopen("input_data/f15/shift_D50.txt","r");
+    fpt = open_input_file("f15/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f15/shift_D50.txt for reading \n");
@@ -625,27 +609,30 @@ void initialize_f16(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
-    if (nreal==2)    fpt = fopen("input_data/f16/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f16/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f16/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f16/rot_D50.txt","r");
+    close_input_file(fpt);
+    if (nreal==2)    fpt = open_input_file("f16/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f16/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f16/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f16/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f16/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     lambda[0] = 1.0;
     lambda[1] = 1.0;
     lambda[2] = 10.0;
@@ -662,10 +649,10 @@ void initialize_f16(void)
 void initialize_f17(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Uses the same shift data as f15 */
-    fpt = fopen("input_data/f15/shift_D50.txt","r");
+    fpt = open_input_file("f15/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f15/shift_D50.txt for reading \n");
@@ -675,28 +662,31 @@ void initialize_f17(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
+    close_input_file(fpt);
     /* Same rotation data as f16 */
-    if (nreal==2)    fpt = fopen("input_data/f16/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f16/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f16/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f16/rot_D50.txt","r");
+    if (nreal==2)    fpt = open_input_file("f16/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f16/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f16/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f16/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f16/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     lambda[0] = 1.0;
     lambda[1] = 1.0;
     lambda[2] = 10.0;
@@ -713,9 +703,9 @@ void initialize_f17(void)
 void initialize_f18(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
-    fpt = fopen("input_data/f18/shift_D50.txt","r");
+    fpt = open_input_file("f18/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f18/shift_D50.txt for reading \n");
@@ -725,27 +715,30 @@ void initialize_f18(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
-    if (nreal==2)    fpt = fopen("input_data/f18/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f18/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f18/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f18/rot_D50.txt","r");
+    close_input_file(fpt);
+    if (nreal==2)    fpt = open_input_file("f18/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f18/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f18/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f18/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f18/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     for (i=0; i<nreal; i++)
     {
         o[nfunc-1][i] = 0.0;
@@ -776,10 +769,10 @@ void initialize_f18(void)
 void initialize_f19(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Same shift data as f18 */
-    fpt = fopen("input_data/f18/shift_D50.txt","r");
+    fpt = open_input_file("f18/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f18/shift_D50.txt for reading \n");
@@ -789,28 +782,31 @@ void initialize_f19(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
+    close_input_file(fpt);
     /* Same rotation data as f18 */
-    if (nreal==2)    fpt = fopen("input_data/f18/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f18/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f18/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f18/rot_D50.txt","r");
+    if (nreal==2)    fpt = open_input_file("f18/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f18/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f18/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f18/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f18/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     for (i=0; i<nreal; i++)
     {
         o[nfunc-1][i] = 0.0;
@@ -842,10 +838,10 @@ void initialize_f20(void)
 {
     int i, j, k;
     int index;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Same shift data as f18 */
-    fpt = fopen("input_data/f18/shift_D50.txt","r");
+    fpt = open_input_file("f18/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f18/shift_D50.txt for reading \n");
@@ -855,33 +851,36 @@ void initialize_f20(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
+    close_input_file(fpt);
     index = nreal/2;
     for (i=1; i<=index; i++)
     {
         o[0][2*i-1] = 5.0;
     }
     /* Same rotation data as f18 */
-    if (nreal==2)    fpt = fopen("input_data/f18/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f18/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f18/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f18/rot_D50.txt","r");
+    if (nreal==2)    fpt = open_input_file("f18/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f18/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f18/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f18/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f18/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     for (i=0; i<nreal; i++)
     {
         o[nfunc-1][i] = 0.0;
@@ -912,9 +911,9 @@ void initialize_f20(void)
 void initialize_f21(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
-    fpt = fopen("input_data/f21/shift_D50.txt","r");
+    fpt = open_input_file("f21/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f21/shift_D50.txt for reading \n");
@@ -924,27 +923,30 @@ void initialize_f21(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
-    if (nreal==2)    fpt = fopen("input_data/f21/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f21/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f21/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f21/rot_D50.txt","r");
+    close_input_file(fpt);
+    if (nreal==2)    fpt = open_input_file("f21/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f21/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f21/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f21/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f21/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     sigma[0] = 1.0;
     sigma[1] = 1.0;
     sigma[2] = 1.0;
@@ -971,10 +973,10 @@ void initialize_f21(void)
 void initialize_f22(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Same shift data as f21 */
-    fpt = fopen("input_data/f21/shift_D50.txt","r");
+    fpt = open_input_file("f21/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f21/shift_D50.txt for reading \n");
@@ -984,27 +986,30 @@ void initialize_f22(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
-    if (nreal==2)    fpt = fopen("input_data/f22/rot_sub_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f22/rot_sub_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f22/rot_sub_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f22/rot_sub_D50.txt","r");
+    close_input_file(fpt);
+    if (nreal==2)    fpt = open_input_file("f22/rot_sub_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f22/rot_sub_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f22/rot_sub_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f22/rot_sub_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f22/rot_sub_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     sigma[0] = 1.0;
     sigma[1] = 1.0;
     sigma[2] = 1.0;
@@ -1031,10 +1036,10 @@ void initialize_f22(void)
 void initialize_f23(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
     /* Same shift data as f21 */
-    fpt = fopen("input_data/f21/shift_D50.txt","r");
+    fpt = open_input_file("f21/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f21/shift_D50.txt for reading \n");
@@ -1044,28 +1049,31 @@ void initialize_f23(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
+    close_input_file(fpt);
     /* Same rotation data as f21 */
-    if (nreal==2)    fpt = fopen("input_data/f21/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f21/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f21/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f21/rot_D50.txt","r");
+    if (nreal==2)    fpt = open_input_file("f21/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f21/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f21/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f21/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f21/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     sigma[0] = 1.0;
     sigma[1] = 1.0;
     sigma[2] = 1.0;
@@ -1092,9 +1100,9 @@ void initialize_f23(void)
 void initialize_f24(void) 
 {
     int i, j, k;
-    FILE *fpt;
+    const_stream *fpt;
     
-    fpt = fopen("input_data/f24/shift_D50.txt","r");
+    fpt = open_input_file("f24/shift_D50.txt");
     if (fpt==NULL)
     {
         fprintf(stderr,"\n Error: Cannot open input file input_data/f24/shift_D50.txt for reading \n");
@@ -1104,27 +1112,30 @@ void initialize_f24(void)
     {
         for (j=0; j<nreal; j++)
         {
-            fscanf(fpt,"%Lf",&o[i][j]);
+            read_input_value(fpt,&o[i][j]);
         }
-        printf("\n");
     }
-    fclose(fpt);
-    if (nreal==2)    fpt = fopen("input_data/f24/rot_D2.txt","r");
-    if (nreal==10)    fpt = fopen("input_data/f24/rot_D10.txt","r");
-    if (nreal==30)    fpt = fopen("input_data/f24/rot_D30.txt","r");
-    if (nreal==50)    fpt = fopen("input_data/f24/rot_D50.txt","r");
+    close_input_file(fpt);
+    if (nreal==2)    fpt = open_input_file("f24/rot_D2.txt");
+    if (nreal==10)    fpt = open_input_file("f24/rot_D10.txt");
+    if (nreal==30)    fpt = open_input_file("f24/rot_D30.txt");
+    if (nreal==50)    fpt = open_input_file("f24/rot_D50.txt");
+    if (fpt==NULL)
+    {
+        fprintf(stderr,"\n Error: Cannot open input file input_data/f24/rot_D%d.txt for reading \n", nreal);
+        exit(0);
+    }
     for (i=0; i<nfunc; i++)
     {
         for (j=0; j<nreal; j++)
         {
             for (k=0; k<nreal; k++)
             {
-                fscanf(fpt,"%Lf",&l[i][j][k]);
+                read_input_value(fpt,&l[i][j][k]);
             }
-            printf("\n");
         }
-        printf("\n");
     }
+    close_input_file(fpt);
     for (i=0; i<nfunc; i++)
     {
         sigma[i] = 2.0;
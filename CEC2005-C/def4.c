@@ -10,9 +10,10 @@
 # include "global.h"
 # include "sub.h"
 # include "rand.h"
+# include "trace.h"
 
 /* Function to select the appropriate calculation function based on function_id */
-long double calc_benchmark_func(long double *x)
+static real calc_selected_func(real *x)
 {
     switch (function_id) {
         case 1: return calc_benchmark_f1(x);
@@ -47,8 +48,71 @@ long double calc_benchmark_func(long double *x)
     }
 }
 
-/* Function to select the appropriate normalization function based on function_id */
+/* Evaluate x with the selected function, writing its trace when enabled (see trace.h) */
+real calc_benchmark_func(real *x)
+{
+    real res;
+    TRACE_BEGIN();
+    TRACE_VECTOR("x", 0, x, nreal);
+    res = calc_selected_func(x);
+    TRACE_VECTOR("basic_f", 0, basic_f, nfunc);
+    if (nfunc > 1)
+    {
+        TRACE_VECTOR("weight", 0, weight, nfunc);
+    }
+    TRACE_VECTOR("f", 0, &res, 1);
+    return (res);
+}
+
+/* Load the normalization constants cached in input_data/fNN/norm_D<nreal>.txt */
+/* (written by "make norm"), returns 0 if the cache is disabled, missing, stale or incomplete */
+static int load_benchmark_norm(void)
+{
+    char name[64];
+    FILE *fpt;
+    real extra;
+    int i;
+    if (getenv("CEC2005_NO_NORM_CACHE") != NULL)
+    {
+        return (0);
+    }
+    sprintf(name, "f%02d/norm_D%d.txt", function_id, nreal);
+    fpt = open_derived_file(name);
+    if (fpt == NULL)
+    {
+        return (0);
+    }
+    for (i=0; i<nfunc; i++)
+    {
+        if (fscanf(fpt, REAL_SCANF, &norm_f[i]) != 1)
+        {
+            fclose(fpt);
+            return (0);
+        }
+    }
+    /* Exactly nfunc values, anything more means the file belongs to something else */
+    i = fscanf(fpt, REAL_SCANF, &extra);
+    fclose(fpt);
+    return (i == EOF);
+}
+
+/* Set the normalization of a composite function, from the cache when it is up to date */
 void calc_benchmark_norm(void)
+{
+    if (function_id < 15 || !load_benchmark_norm())
+    {
+        compute_benchmark_norm();
+    }
+    /* F24/F25 normalize their last component with a noisy value, drawn on every initialization */
+    if (function_id == 24 || function_id == 25)
+    {
+        norm_f[9] *= (1.0 + 0.1*fabs(randomnormaldeviate()));
+    }
+}
+
+/* Function to select the appropriate normalization function based on function_id */
+/* Computes the noiseless normalization constants (the values cached by "make norm") */
+void compute_benchmark_norm(void)
 {
     switch (function_id) {
         case 15: calc_benchmark_norm_f15(); break;
@@ -73,9 +137,9 @@ void calc_benchmark_norm(void)
 }
 
 /* F1: Shifted Sphere Function */
-long double calc_benchmark_f1(long double *x)
+real calc_benchmark_f1(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_sphere(trans_x);
     res = basic_f[0] + bias[0];
@@ -83,9 +147,9 @@ long double calc_benchmark_f1(long double *x)
 }
 
 /* F2: Shifted Schwefel's Problem 1.2 */
-long double calc_benchmark_f2(long double *x)
+real calc_benchmark_f2(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_schwefel(trans_x);
     res = basic_f[0] + bias[0];
@@ -93,71 +157,11 @@ long double calc_benchmark_f2(long double *x)
 }
 
 /* F3: Shifted Rotated High Conditioned Elliptic Function */
-long double calc_benchmark_f3(long double *x)
+real calc_benchmark_f3(real *x)
 {
     int i;
-    long double res;
-    
-    /* Write the x vector BEFORE transform for verification */
-    {
-        char filename[256];
-        FILE *fp;
-        int j;
-        
-        /* Create output directory */
-        system("mkdir -p f3_data_dump");
-        
-        sprintf(filename, "f3_data_dump/x_before_transform_D%d.txt", nreal);
-        fp = fopen(filename, "w");
-        if (fp != NULL) {
-            fprintf(fp, "# F3 Vector x before transform for D=%d\n", nreal);
-            for (j=0; j<nreal; j++) {
-                fprintf(fp, "%.15Lf\n", x[j]);
-            }
-            fclose(fp);
-            printf("\nWrote x vector before transform to %s\n", filename);
-        } else {
-            printf("\nWarning: Could not write x vector to file\n");
-        }
-    }
-    
-    /* Now call transform */
+    real res;
     transform(x, 0);
-    
-    /* Write the x vector after transform for verification */
-    {
-        char filename[256];
-        FILE *fp;
-        int j;
-        
-        /* Create output directory */
-        system("mkdir -p f3_data_dump");
-        
-        sprintf(filename, "f3_data_dump/x_after_transform_D%d.txt", nreal);
-        fp = fopen(filename, "w");
-        if (fp != NULL) {
-            fprintf(fp, "# F3 Vector x after transform for D=%d\n", nreal);
-            for (j=0; j<nreal; j++) {
-                fprintf(fp, "%.15Lf\n", x[j]);
-            }
-            fclose(fp);
-            printf("\nWrote x vector after transform to %s\n", filename);
-        } else {
-            printf("\nWarning: Could not write x vector to file\n");
-        }
-
-        /* Also write trans_x vector for completeness */
-        sprintf(filename, "f3_data_dump/trans_x_D%d.txt", nreal);
-        fp = fopen(filename, "w");
-        if (fp != NULL) {
-            fprintf(fp, "# F3 trans_x vector for D=%d\n", nreal);
-            for (j=0; j<nreal; j++) {
-                fprintf(fp, "%.15Lf\n", trans_x[j]);
-            }
-            fclose(fp);
-        }
-    }
-
     basic_f[0] = 0.0;
     for (i=0; i<nreal; i++)
     {
@@ -168,9 +172,9 @@ long double calc_benchmark_f3(long double *x)
 }
 
 /* F4: Shifted Schwefel's Problem 1.2 with Noise in Fitness */
-long double calc_benchmark_f4(long double *x)
+real calc_benchmark_f4(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_schwefel(trans_x)*(1.0 + 0.4*fabs(randomnormaldeviate()));
     res = basic_f[0] + bias[0];
@@ -178,10 +182,10 @@ long double calc_benchmark_f4(long double *x)
 }
 
 /* F5: Schwefel's Problem 2.6 with Global Optimum on Bounds */
-long double calc_benchmark_f5(long double *x)
+real calc_benchmark_f5(real *x)
 {
     int i, j;
-    long double res;
+    real res;
     basic_f[0] = -INF;
     for (i=0; i<nreal; i++)
     {
@@ -201,9 +205,9 @@ long double calc_benchmark_f5(long double *x)
 }
 
 /* F6: Shifted Rosenbrock's Function */
-long double calc_benchmark_f6(long double *x)
+real calc_benchmark_f6(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_rosenbrock(trans_x);
     res = basic_f[0] + bias[0];
@@ -211,9 +215,9 @@ long double calc_benchmark_f6(long double *x)
 }
 
 /* F7: Shifted Rotated Griewank's Function */
-long double calc_benchmark_f7(long double *x)
+real calc_benchmark_f7(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_griewank(trans_x);
     res = basic_f[0] + bias[0];
@@ -221,9 +225,9 @@ long double calc_benchmark_f7(long double *x)
 }
 
 /* F8: Shifted Rotated Ackley's Function with Global Optimum on Bounds */
-long double calc_benchmark_f8(long double *x)
+real calc_benchmark_f8(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_ackley(trans_x);
     res = basic_f[0] + bias[0];
@@ -231,9 +235,9 @@ long double calc_benchmark_f8(long double *x)
 }
 
 /* F9: Shifted Rastrigin's Function */
-long double calc_benchmark_f9(long double *x)
+real calc_benchmark_f9(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_rastrigin(trans_x);
     res = basic_f[0] + bias[0];
@@ -241,9 +245,9 @@ long double calc_benchmark_f9(long double *x)
 }
 
 /* F10: Shifted Rotated Rastrigin's Function */
-long double calc_benchmark_f10(long double *x)
+real calc_benchmark_f10(real *x)
 {
-    long double res;
+    real res;
     transform(x, 0);
     basic_f[0] = calc_rastrigin(trans_x);
     res = basic_f[0] + bias[0];
@@ -251,10 +255,10 @@ long double calc_benchmark_f10(long double *x)
 }
 
 /* F11: Shifted Rotated Weierstrass Function */
-long double calc_benchmark_f11(long double *x)
+real calc_benchmark_f11(real *x)
 {
     int i;
-    long double res;
+    real res;
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
@@ -266,10 +270,10 @@ long double calc_benchmark_f11(long double *x)
 }
 
 /* F12: Schwefel's Problem 2.13 */
-long double calc_benchmark_f12(long double *x)
+real calc_benchmark_f12(real *x)
 {
-    long double res;
-    long double sum1, sum2;
+    real res;
+    real sum1, sum2;
     int i, j;
     basic_f[0] = 0.0;
     for (i=0; i<nreal; i++)
@@ -288,11 +292,11 @@ long double calc_benchmark_f12(long double *x)
 }
 
 /* F13: Shifted Expanded Griewank's plus Rosenbrock's Function */
-long double calc_benchmark_f13(long double *x)
+real calc_benchmark_f13(real *x)
 {
     int i;
-    long double temp;
-    long double res;
+    real temp;
+    real res;
     transform(x, 0);
     res = 0.0;
     for (i=0; i<nreal-1; i++)
@@ -306,11 +310,11 @@ long double calc_benchmark_f13(long double *x)
 }
 
 /* F14: Shifted Rotated Expanded Scaffer's F6 Function */
-long double calc_benchmark_f14(long double *x)
+real calc_benchmark_f14(real *x)
 {
     int i;
-    long double temp1, temp2;
-    long double res;
+    real temp1, temp2;
+    real res;
     transform(x,0);
     res = 0.0;
     for (i=0; i<nreal-1; i++)
@@ -345,24 +349,25 @@ void calc_benchmark_norm_f15(void)
     return;
 }
 
-long double calc_benchmark_f15(long double *x) 
+real calc_benchmark_f15(real *x) 
 {
     int i;
-    long double res; 
-    transform (x, 0);    basic_f[0] = calc_rastrigin(trans_x);
-    transform (x, 1);    basic_f[1] = calc_rastrigin(trans_x);
+    real res; 
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_rastrigin(trans_x);
+    transform_select (1);    basic_f[1] = calc_rastrigin(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 4);    basic_f[4] = calc_griewank(trans_x);
-    transform (x, 5);    basic_f[5] = calc_griewank(trans_x);
-    transform (x, 6);    basic_f[6] = calc_ackley(trans_x);
-    transform (x, 7);    basic_f[7] = calc_ackley(trans_x);
-    transform (x, 8);    basic_f[8] = calc_sphere(trans_x);
-    transform (x, 9);    basic_f[9] = calc_sphere(trans_x);
+    transform_select (2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (4);    basic_f[4] = calc_griewank(trans_x);
+    transform_select (5);    basic_f[5] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_ackley(trans_x);
+    transform_select (7);    basic_f[7] = calc_ackley(trans_x);
+    transform_select (8);    basic_f[8] = calc_sphere(trans_x);
+    transform_select (9);    basic_f[9] = calc_sphere(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -396,24 +401,25 @@ void calc_benchmark_norm_f16()
     return;
 }
 
-long double calc_benchmark_f16(long double *x)
+real calc_benchmark_f16(real *x)
 {
     int i;
-    long double res;
-    transform (x, 0);    basic_f[0] = calc_rastrigin(trans_x);
-    transform (x, 1);    basic_f[1] = calc_rastrigin(trans_x);
+    real res;
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_rastrigin(trans_x);
+    transform_select (1);    basic_f[1] = calc_rastrigin(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 4);    basic_f[4] = calc_griewank(trans_x);
-    transform (x, 5);    basic_f[5] = calc_griewank(trans_x);
-    transform (x, 6);    basic_f[6] = calc_ackley(trans_x);
-    transform (x, 7);    basic_f[7] = calc_ackley(trans_x);
-    transform (x, 8);    basic_f[8] = calc_sphere(trans_x);
-    transform (x, 9);    basic_f[9] = calc_sphere(trans_x);
+    transform_select (2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (4);    basic_f[4] = calc_griewank(trans_x);
+    transform_select (5);    basic_f[5] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_ackley(trans_x);
+    transform_select (7);    basic_f[7] = calc_ackley(trans_x);
+    transform_select (8);    basic_f[8] = calc_sphere(trans_x);
+    transform_select (9);    basic_f[9] = calc_sphere(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -447,24 +453,25 @@ void calc_benchmark_norm_f17(void)
     return;
 }
 
-long double calc_benchmark_f17(long double *x)
+real calc_benchmark_f17(real *x)
 {
     int i;
-    long double res;
-    transform (x, 0);    basic_f[0] = calc_rastrigin(trans_x);
-    transform (x, 1);    basic_f[1] = calc_rastrigin(trans_x);
+    real res;
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_rastrigin(trans_x);
+    transform_select (1);    basic_f[1] = calc_rastrigin(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 4);    basic_f[4] = calc_griewank(trans_x);
-    transform (x, 5);    basic_f[5] = calc_griewank(trans_x);
-    transform (x, 6);    basic_f[6] = calc_ackley(trans_x);
-    transform (x, 7);    basic_f[7] = calc_ackley(trans_x);
-    transform (x, 8);    basic_f[8] = calc_sphere(trans_x);
-    transform (x, 9);    basic_f[9] = calc_sphere(trans_x);
+    transform_select (2);    basic_f[2] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (3);    basic_f[3] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (4);    basic_f[4] = calc_griewank(trans_x);
+    transform_select (5);    basic_f[5] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_ackley(trans_x);
+    transform_select (7);    basic_f[7] = calc_ackley(trans_x);
+    transform_select (8);    basic_f[8] = calc_sphere(trans_x);
+    transform_select (9);    basic_f[9] = calc_sphere(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -499,24 +506,25 @@ void calc_benchmark_norm_f18(void)
     return;
 }
 
-long double calc_benchmark_f18(long double *x)
+real calc_benchmark_f18(real *x)
 {
     int i;
-    long double res;
-    transform (x, 0);    basic_f[0] = calc_ackley(trans_x);
-    transform (x, 1);    basic_f[1] = calc_ackley(trans_x);
-    transform (x, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (x, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (x, 4);    basic_f[4] = calc_sphere(trans_x);
-    transform (x, 5);    basic_f[5] = calc_sphere(trans_x);
+    real res;
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_ackley(trans_x);
+    transform_select (1);    basic_f[1] = calc_ackley(trans_x);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);    basic_f[4] = calc_sphere(trans_x);
+    transform_select (5);    basic_f[5] = calc_sphere(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (x, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -550,24 +558,25 @@ void calc_benchmark_norm_f19(void)
     return;
 }
 
-long double calc_benchmark_f19(long double *x)
+real calc_benchmark_f19(real *x)
 {
     int i;
-    long double res;
-    transform (x, 0);    basic_f[0] = calc_ackley(trans_x);
-    transform (x, 1);    basic_f[1] = calc_ackley(trans_x);
-    transform (x, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (x, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (x, 4);    basic_f[4] = calc_sphere(trans_x);
-    transform (x, 5);    basic_f[5] = calc_sphere(trans_x);
+    real res;
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_ackley(trans_x);
+    transform_select (1);    basic_f[1] = calc_ackley(trans_x);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);    basic_f[4] = calc_sphere(trans_x);
+    transform_select (5);    basic_f[5] = calc_sphere(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (x, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -601,24 +610,25 @@ void calc_benchmark_norm_f20(void)
     return;
 }
 
-long double calc_benchmark_f20(long double *x)
+real calc_benchmark_f20(real *x)
 {
     int i;
-    long double res;
-    transform (x, 0);    basic_f[0] = calc_ackley(trans_x);
-    transform (x, 1);    basic_f[1] = calc_ackley(trans_x);
-    transform (x, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (x, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (x, 4);    basic_f[4] = calc_sphere(trans_x);
-    transform (x, 5);    basic_f[5] = calc_sphere(trans_x);
+    real res;
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_ackley(trans_x);
+    transform_select (1);    basic_f[1] = calc_ackley(trans_x);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);    basic_f[4] = calc_sphere(trans_x);
+    transform_select (5);    basic_f[5] = calc_sphere(trans_x);
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (x, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -635,7 +645,7 @@ long double calc_benchmark_f20(long double *x)
 void calc_benchmark_norm_f21(void)
 {
     int i;
-    long double temp1, temp2, temp;
+    real temp1, temp2, temp;
     transform_norm (0);
     norm_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
@@ -689,12 +699,13 @@ void calc_benchmark_norm_f21(void)
     return;
 }
 
-long double calc_benchmark_f21(long double *x)
+real calc_benchmark_f21(real *x)
 {
     int i;
-    long double temp1, temp2, temp;
-    long double res;
-    transform (x, 0);
+    real temp1, temp2, temp;
+    real res;
+    transform_all (x);
+    transform_select (0);
     basic_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -705,7 +716,7 @@ long double calc_benchmark_f21(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[0] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (x, 1);
+    transform_select (1);
     basic_f[1] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -716,9 +727,9 @@ long double calc_benchmark_f21(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[1] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (x, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (x, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (x, 4);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);
     basic_f[4] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -727,7 +738,7 @@ long double calc_benchmark_f21(long double *x)
     }
     temp = 100.0*pow((trans_x[nreal-1]*trans_x[nreal-1]-trans_x[0]),2.0) + 1.0*pow((trans_x[nreal-1]-1.0),2.0);
     basic_f[4] += (temp*temp)/4000.0 - cos(temp) + 1.0;
-    transform(x, 5);
+    transform_select (5);
     basic_f[5] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -740,10 +751,10 @@ long double calc_benchmark_f21(long double *x)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (x, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -760,7 +771,7 @@ long double calc_benchmark_f21(long double *x)
 void calc_benchmark_norm_f22(void)
 {
     int i;
-    long double temp1, temp2, temp;
+    real temp1, temp2, temp;
     transform_norm (0);
     norm_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
@@ -814,12 +825,13 @@ void calc_benchmark_norm_f22(void)
     return;
 }
 
-long double calc_benchmark_f22(long double *x)
+real calc_benchmark_f22(real *x)
 {
     int i;
-    long double temp1, temp2, temp;
-    long double res;
-    transform (x, 0);
+    real temp1, temp2, temp;
+    real res;
+    transform_all (x);
+    transform_select (0);
     basic_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -830,7 +842,7 @@ long double calc_benchmark_f22(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[0] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (x, 1);
+    transform_select (1);
     basic_f[1] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -841,9 +853,9 @@ long double calc_benchmark_f22(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[1] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (x, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (x, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (x, 4);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);
     basic_f[4] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -852,7 +864,7 @@ long double calc_benchmark_f22(long double *x)
     }
     temp = 100.0*pow((trans_x[nreal-1]*trans_x[nreal-1]-trans_x[0]),2.0) + 1.0*pow((trans_x[nreal-1]-1.0),2.0);
     basic_f[4] += (temp*temp)/4000.0 - cos(temp) + 1.0;
-    transform(x, 5);
+    transform_select (5);
     basic_f[5] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -865,10 +877,10 @@ long double calc_benchmark_f22(long double *x)
     {
         norm_x[i] = 0.0;
     }
-    transform (x, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (x, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (x, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -885,7 +897,7 @@ long double calc_benchmark_f22(long double *x)
 void calc_benchmark_norm_f23(void)
 {
     int i;
-    long double temp1, temp2, temp;
+    real temp1, temp2, temp;
     transform_norm (0);
     norm_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
@@ -939,13 +951,14 @@ void calc_benchmark_norm_f23(void)
     return;
 }
 
-long double calc_benchmark_f23(long double *x)
+/* Round the coordinates of x at least 0.5 away from the optimum to the nearest multiple */
+/* of 0.5 into out (F23's non-continuous variables); out may be x */
+void round_f23 (const real *x, real *out)
 {
     int i;
-    long double temp1, temp2, temp;
-    long double res;
     int a;
-    long double b;
+    real b;
+    real res;
     for (i=0; i<nreal; i++)
     {
         if (fabs(x[i]-o[0][i]) >= 0.5)
@@ -955,26 +968,36 @@ long double calc_benchmark_f23(long double *x)
             b = fabs(res-a);
             if (b<0.5)
             {
-                temp_x4[i] = a/2.0;
+                out[i] = a/2.0;
             }
             else
             {
                 if (res<=0.0)
                 {
-                    temp_x4[i] = (a-1.0)/2.0;
+                    out[i] = (a-1.0)/2.0;
                 }
                 else
                 {
-                    temp_x4[i] = (a+1.0)/2.0;
+                    out[i] = (a+1.0)/2.0;
                 }
             }
         }
         else
         {
-            temp_x4[i] = x[i];
+            out[i] = x[i];
         }
     }
-    transform (temp_x4, 0);
+    return;
+}
+
+real calc_benchmark_f23(real *x)
+{
+    int i;
+    real temp1, temp2, temp;
+    real res;
+    round_f23(x, temp_x4);
+    transform_all (temp_x4);
+    transform_select (0);
     basic_f[0] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -985,7 +1008,7 @@ long double calc_benchmark_f23(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[0] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (temp_x4, 1);
+    transform_select (1);
     basic_f[1] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -996,9 +1019,9 @@ long double calc_benchmark_f23(long double *x)
     temp1 = pow((sin(sqrt(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0)))),2.0);
     temp2 = 1.0 + 0.001*(pow(trans_x[nreal-1],2.0)+pow(trans_x[0],2.0));
     basic_f[1] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
-    transform (temp_x4, 2);    basic_f[2] = calc_rastrigin(trans_x);
-    transform (temp_x4, 3);    basic_f[3] = calc_rastrigin(trans_x);
-    transform (temp_x4, 4);
+    transform_select (2);    basic_f[2] = calc_rastrigin(trans_x);
+    transform_select (3);    basic_f[3] = calc_rastrigin(trans_x);
+    transform_select (4);
     basic_f[4] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -1007,7 +1030,7 @@ long double calc_benchmark_f23(long double *x)
     }
     temp = 100.0*pow((trans_x[nreal-1]*trans_x[nreal-1]-trans_x[0]),2.0) + 1.0*pow((trans_x[nreal-1]-1.0),2.0);
     basic_f[4] += (temp*temp)/4000.0 - cos(temp) + 1.0;
-    transform(temp_x4, 5);
+    transform_select (5);
     basic_f[5] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -1020,10 +1043,10 @@ long double calc_benchmark_f23(long double *x)
     {
         norm_x[i] = 0.0;
     }
-    transform (temp_x4, 6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (temp_x4, 7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
-    transform (temp_x4, 8);    basic_f[8] = calc_griewank(trans_x);
-    transform (temp_x4, 9);    basic_f[9] = calc_griewank(trans_x);
+    transform_select (6);    basic_f[6] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (7);    basic_f[7] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_select (8);    basic_f[8] = calc_griewank(trans_x);
+    transform_select (9);    basic_f[9] = calc_griewank(trans_x);
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -1040,7 +1063,7 @@ long double calc_benchmark_f23(long double *x)
 void calc_benchmark_norm_f24(void)
 {
     int i;
-    long double temp1, temp2, temp;
+    real temp1, temp2, temp;
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
@@ -1083,24 +1106,26 @@ void calc_benchmark_norm_f24(void)
     {
         norm_f[8] += trans_x[i]*trans_x[i]*pow(1.0e6,i/(nreal-1.0));
     }
-    transform_norm (9);    norm_f[9] = calc_sphere(trans_x)*(1.0 + 0.1*fabs(randomnormaldeviate()));
+    /* The noise factor of norm_f[9] is applied by calc_benchmark_norm */
+    transform_norm (9);    norm_f[9] = calc_sphere(trans_x);
     return;
 }
 
-long double calc_benchmark_f24(long double *x)
+real calc_benchmark_f24(real *x)
 {
     int i;
-    long double temp1, temp2, temp;
-    long double res;
+    real temp1, temp2, temp;
+    real res;
     for (i=0; i<nreal; i++)
     {
         norm_x[i] = 0.0;
     }
     /* First function */
-    transform (x, 0);    basic_f[0] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
+    transform_all (x);
+    transform_select (0);    basic_f[0] = calc_weierstrass(trans_x) - calc_weierstrass(norm_x);
 
     /* Second function */
-    transform (x, 1);
+    transform_select (1);
     basic_f[1] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -1113,7 +1138,7 @@ long double calc_benchmark_f24(long double *x)
     basic_f[1] += 0.5 + (temp1-0.5)/(pow(temp2,2.0));
 
     /* Third Function */
-    transform (x, 2);
+    transform_select (2);
     basic_f[2] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -1123,12 +1148,12 @@ long double calc_benchmark_f24(long double *x)
     temp = 100.0*pow((trans_x[nreal-1]*trans_x[nreal-1]-trans_x[0]),2.0) + 1.0*pow((trans_x[nreal-1]-1.0),2.0);
     basic_f[2] += (temp*temp)/4000.0 - cos(temp) + 1.0;
 
-    transform (x, 3);    basic_f[3] = calc_ackley(trans_x);
-    transform (x, 4);    basic_f[4] = calc_rastrigin(trans_x);
-    transform (x, 5);    basic_f[5] = calc_griewank(trans_x);
+    transform_select (3);    basic_f[3] = calc_ackley(trans_x);
+    transform_select (4);    basic_f[4] = calc_rastrigin(trans_x);
+    transform_select (5);    basic_f[5] = calc_griewank(trans_x);
 
     /* Seventh Function */
-    transform (x, 6);
+    transform_select (6);
     basic_f[6] = 0.0;
     for (i=0; i<nreal-1; i++)
     {
@@ -1136,15 +1161,15 @@ long double calc_benchmark_f24(long double *x)
     }
     basic_f[6] += nc_schaffer(trans_x[nreal-1], trans_x[0]);
 
-    transform (x, 7);    basic_f[7] = nc_rastrigin(trans_x);
+    transform_select (7);    basic_f[7] = nc_rastrigin(trans_x);
 
-    transform (x, 8);
+    transform_select (8);
     basic_f[8] = 0.0;
     for (i=0; i<nreal; i++)
     {
         basic_f[8] += trans_x[i]*trans_x[i]*pow(1.0e6,i/(nreal-1.0));
     }
-    transform (x, 9);    basic_f[9] = (calc_sphere(trans_x))*(1.0 + 0.1*fabs(randomnormaldeviate()));
+    transform_select (9);    basic_f[9] = (calc_sphere(trans_x))*(1.0 + 0.1*fabs(randomnormaldeviate()));
     for (i=0; i<nfunc; i++)
     {
         basic_f[i] *= C/norm_f[i];
@@ -1158,5 +1183,5 @@ long double calc_benchmark_f24(long double *x)
     return (res);
 }
 
-long double calc_benchmark_f25(long double *x) { return calc_benchmark_f24(x); }
+real calc_benchmark_f25(real *x) { return calc_benchmark_f24(x); }
 void calc_benchmark_norm_f25(void) { calc_benchmark_norm_f24(); }
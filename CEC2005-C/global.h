@@ -4,6 +4,17 @@
 # define _GLOBAL_H
 
 # include <float.h>
+# include <stdio.h>
+
+/* Floating-point type of the computations: long double by default (x87 on */
+/* x86-64), double when compiled with -DCEC2005_DOUBLE (SSE/SIMD, faster) */
+# ifdef CEC2005_DOUBLE
+typedef double real;
+# define REAL_SCANF "%lf"
+# else
+typedef long double real;
+# define REAL_SCANF "%Lf"
+# endif
 
 /* Global Constants */
 # define INF DBL_MAX
@@ -11,67 +22,108 @@
 # define E  2.7182818284590452353602874713526625
 # define PI 3.1415926535897932384626433832795029
 
+/* Alignment (bytes) of the flat constant blocks behind o, g and l */
+# define ALIGNMENT 64
+/* Number of vectors transform_block transforms together */
+# define TRANSFORM_BLOCK 32
+
 /* Global variables that you are required to initialize */
 extern int nreal;                /* number of real variables */
 extern int nfunc;                /* number of basic functions */
 extern int function_id;          /* function identifier (1-25) */
-extern long double bound;        /* required for plotting the function profiles for nreal=2 */
+extern real bound;               /* required for plotting the function profiles for nreal=2 */
 extern int density;              /* density of grid points for plotting for nreal=2 */
+extern const char *input_data_dir; /* directory holding the constant files */
 
 /* Global variables being used in evaluation of various functions */
 /* These are initalized in file def2.c */
-extern long double C;
-extern long double global_bias;
-extern long double *trans_x;
-extern long double *basic_f;
-extern long double *temp_x1;
-extern long double *temp_x2;
-extern long double *temp_x3;
-extern long double *temp_x4;
-extern long double *weight;
-extern long double *sigma;
-extern long double *lambda;
-extern long double *bias;
-extern long double *norm_x;
-extern long double *norm_f;
-extern long double **o;
-extern long double **g;
-extern long double ***l;
+extern real C;
+extern real global_bias;
+extern real *trans_x;
+extern real *basic_f;
+extern real *temp_x1;
+extern real *temp_x2;
+extern real *temp_x3;
+extern real *temp_x4;
+extern real *weight;
+extern real *sigma;
+extern real *lambda;
+extern real *bias;
+extern real *norm_x;
+extern real *norm_f;
+/* Rows of flat, row-major blocks: o[i][j], g[i][j] and l[i][j][k] are contiguous in their last index */
+extern real **o;
+extern real **g;
+extern real ***l;
+
+/* Scratch buffers written while evaluating a vector, one set per thread (ensure_scratch) */
+# ifdef _OPENMP
+# pragma omp threadprivate(trans_x, basic_f, temp_x1, temp_x2, temp_x3, temp_x4, weight, norm_x)
+# endif
 
 /* Function-specific global variables */
 /* F5 */
-extern long double **A_f5;
-extern long double *B_f5;
+extern real **A_f5;
+extern real *B_f5;
 
 /* F12 */
-extern long double **A_f12;
-extern long double **B_f12;
-extern long double *alpha_f12;
+extern real **A_f12;
+extern real **B_f12;
+extern real *alpha_f12;
 
 /* Auxillary function declarations */
-long double maximum (long double, long double);
-long double minimum (long double, long double);
-long double modulus (long double*, int);
-long double dot (long double*, long double*, int);
-long double mean (long double*, int);
+real maximum (real, real);
+real minimum (real, real);
+real modulus (real*, int);
+real dot (real*, real*, int);
+real mean (real*, int);
+double wall_time (void);
 
 /* Basic funcion declarations */
-long double calc_ackley (long double*);
-long double calc_rastrigin (long double*);
-long double calc_weierstrass (long double*);
-long double calc_griewank (long double*);
-long double calc_sphere (long double*);
-long double calc_schwefel (long double*);
-long double calc_rosenbrock (long double *x);
-long double nc_schaffer (long double, long double);
-long double nc_rastrigin (long double*);
+real calc_ackley (real*);
+real calc_rastrigin (real*);
+real calc_weierstrass (real*);
+real calc_griewank (real*);
+real calc_sphere (real*);
+real calc_schwefel (real*);
+real calc_rosenbrock (real *x);
+real nc_schaffer (real, real);
+real nc_rastrigin (real*);
+
+/* Stream over the values of a constant file */
+/* Backed by the binary constant pack when available, else by the text file */
+/* A packed value is data[i] + low[i]: the text value rounded to double, and */
+/* the remainder to its long double value */
+typedef struct
+{
+    FILE *fpt;
+    const double *data;
+    const double *low;
+    long count;
+    long pos;
+} const_stream;
+
+/* Constant file access declarations (pack.c) */
+const_stream *open_input_file(const char *name);
+int read_input_value(const_stream *stream, real *value);
+void close_input_file(const_stream *stream);
+void close_constant_pack(void);
+void reset_input_mtime(void);
+FILE *open_derived_file(const char *name);
 
 /* Utility function declarations */
 void allocate_memory(void);
+void allocate_scratch(void);
+void ensure_scratch(void);
 void initialize(void);
-void transform (long double*, int);
+void prepare_transform (void);
+void transform (real*, int);
+void transform_all (real*);
+void transform_select (int);
+int transform_block (const real*, int);
 void transform_norm (int);
-void calc_weight (long double*);
+void calc_weight (real*);
+void free_scratch(void);
 void free_memory(void);
 
 /* Function-specific initialization declarations */
@@ -102,31 +154,32 @@ void initialize_f24(void);
 void initialize_f25(void);
 
 /* Function-specific calculation declarations */
-long double calc_benchmark_f1(long double *x);
-long double calc_benchmark_f2(long double *x);
-long double calc_benchmark_f3(long double *x);
-long double calc_benchmark_f4(long double *x);
-long double calc_benchmark_f5(long double *x);
-long double calc_benchmark_f6(long double *x);
-long double calc_benchmark_f7(long double *x);
-long double calc_benchmark_f8(long double *x);
-long double calc_benchmark_f9(long double *x);
-long double calc_benchmark_f10(long double *x);
-long double calc_benchmark_f11(long double *x);
-long double calc_benchmark_f12(long double *x);
-long double calc_benchmark_f13(long double *x);
-long double calc_benchmark_f14(long double *x);
-long double calc_benchmark_f15(long double *x);
-long double calc_benchmark_f16(long double *x);
-long double calc_benchmark_f17(long double *x);
-long double calc_benchmark_f18(long double *x);
-long double calc_benchmark_f19(long double *x);
-long double calc_benchmark_f20(long double *x);
-long double calc_benchmark_f21(long double *x);
-long double calc_benchmark_f22(long double *x);
-long double calc_benchmark_f23(long double *x);
-long double calc_benchmark_f24(long double *x);
-long double calc_benchmark_f25(long double *x);
+real calc_benchmark_f1(real *x);
+real calc_benchmark_f2(real *x);
+real calc_benchmark_f3(real *x);
+real calc_benchmark_f4(real *x);
+real calc_benchmark_f5(real *x);
+real calc_benchmark_f6(real *x);
+real calc_benchmark_f7(real *x);
+real calc_benchmark_f8(real *x);
+real calc_benchmark_f9(real *x);
+real calc_benchmark_f10(real *x);
+real calc_benchmark_f11(real *x);
+real calc_benchmark_f12(real *x);
+real calc_benchmark_f13(real *x);
+real calc_benchmark_f14(real *x);
+real calc_benchmark_f15(real *x);
+real calc_benchmark_f16(real *x);
+real calc_benchmark_f17(real *x);
+real calc_benchmark_f18(real *x);
+real calc_benchmark_f19(real *x);
+real calc_benchmark_f20(real *x);
+real calc_benchmark_f21(real *x);
+real calc_benchmark_f22(real *x);
+real calc_benchmark_f23(real *x);
+real calc_benchmark_f24(real *x);
+real calc_benchmark_f25(real *x);
+void round_f23(const real *x, real *out);
 
 /* Normalization function declarations */
 void calc_benchmark_norm_f15(void);
@@ -142,7 +195,8 @@ void calc_benchmark_norm_f24(void);
 void calc_benchmark_norm_f25(void);
 
 /* Benchmark function declaration */
-long double calc_benchmark_func (long double*);
+real calc_benchmark_func (real*);
 void calc_benchmark_norm(void);
+void compute_benchmark_norm(void);
 
 # endif 
@@ -5,30 +5,118 @@
 # include <stdio.h>
 # include <stdlib.h>
 # include <string.h>
+# include <time.h>
 
 # include "global.h"
 # include "sub.h"
 # include "rand.h"
+# include "trace.h"
 
 void print_usage(char* progname) {
     fprintf(stderr, "\nUsage: %s <function_id> <dimension> [input_file]\n", progname);
+    fprintf(stderr, "       %s <function_id> <dimension> --batch [input_file]\n", progname);
+    fprintf(stderr, "       %s <function_id> <dimension> --norm\n", progname);
     fprintf(stderr, "   <function_id>: An integer from 1 to 25\n");
     fprintf(stderr, "   <dimension>: The problem dimension (2, 10, 30, or 50)\n");
-    fprintf(stderr, "   [input_file]: Optional file containing input vector values (one per line)\n");
+    fprintf(stderr, "   [input_file]: Optional file containing input vector values (one per line), \"-\" for stdin\n");
+    fprintf(stderr, "   --batch: Evaluate every vector in the input (file, or stdin if omitted or \"-\"),\n");
+    fprintf(stderr, "            printing one objective value per vector\n");
+    fprintf(stderr, "   --norm: Print the normalization constants of a composite function (15-25),\n");
+    fprintf(stderr, "           the contents of input_data/fNN/norm_D<dimension>.txt\n");
     exit(1);
 }
 
+/* Phase timings (wall-clock seconds), reported on stderr when CEC2005_TIMING is set */
+int timing_enabled = 0;
+double evaluate_time = 0.0;
+
+void report_timing(const char *phase, double elapsed)
+{
+	if (timing_enabled) {
+		fprintf(stderr, "TIMING %s %.9f\n", phase, elapsed);
+	}
+}
+
+/* Evaluate consecutive vectors of nreal values until end of input */
+/* Initialization and normalization are done once by the caller; vectors are read */
+/* in blocks of TRANSFORM_BLOCK so that composite functions transform them together */
+int run_batch(FILE *input, real *x)
+{
+	int i, b;
+	int count;
+	int filled;
+	real *block;
+	real f;
+	double start;
+	
+	block = (real *)malloc(TRANSFORM_BLOCK * nreal * sizeof(real));
+	if (block == NULL) {
+		fprintf(stderr, "\nError: Out of memory for the batch input\n");
+		return -1;
+	}
+	count = 0;
+	while (1) {
+		for (filled = 0; filled < TRANSFORM_BLOCK; filled++) {
+			for (i = 0; i < nreal; i++) {
+				if (fscanf(input, REAL_SCANF, &block[filled*nreal + i]) != 1) {
+					break;
+				}
+			}
+			if (i == 0) {
+				break;
+			}
+			if (i < nreal) {
+				fprintf(stderr, "\nError: Incomplete vector %d in batch input (read %d of %d values)\n", count+filled+1, i, nreal);
+				free(block);
+				return -1;
+			}
+		}
+		if (filled == 0) {
+			break;
+		}
+		start = wall_time();
+		transform_block(block, filled);
+		evaluate_time += wall_time() - start;
+		for (b = 0; b < filled; b++) {
+			for (i = 0; i < nreal; i++) {
+				x[i] = block[b*nreal + i];
+			}
+			start = wall_time();
+			f = calc_benchmark_func(x);
+			evaluate_time += wall_time() - start;
+			printf("Objective value = %1.15LE\n", (long double)f);
+		}
+		count += filled;
+		if (filled < TRANSFORM_BLOCK) {
+			break;
+		}
+	}
+	free(block);
+	return count;
+}
+
 int main(int argc, char** argv)
 {
 	int i;
-	long double *x;
-	long double f;
+	int batch_mode = 0;
+	int norm_mode = 0;
+	int count;
+	real *x;
+	real f;
+	double start;
 	FILE *input_file = NULL;
 	
 	/* Check command line arguments */
 	if (argc < 3) {
 		print_usage(argv[0]);
 	}
+	if (argc > 3 && strcmp(argv[3], "--batch") == 0) {
+		batch_mode = 1;
+	}
+	if (argc > 3 && strcmp(argv[3], "--norm") == 0) {
+		norm_mode = 1;
+	}
+	timing_enabled = (getenv("CEC2005_TIMING") != NULL);
 	
 	/* Parse function ID and dimension */
 	function_id = atoi(argv[1]);
@@ -53,6 +141,23 @@ int main(int argc, char** argv)
 		nfunc = 10; /* Composite functions for F15-F25 */
 	}
 	
+	if (norm_mode && function_id < 15) {
+		fprintf(stderr, "\nError: Only the composite functions (15-25) are normalized, got %d\n", function_id);
+		print_usage(argv[0]);
+	}
+	
+	/* Normalization mode: print the freshly computed constants, one per line, and nothing else */
+	if (norm_mode) {
+		allocate_memory();
+		initialize();
+		compute_benchmark_norm();
+		for (i = 0; i < nfunc; i++) {
+			printf("%1.21LE\n", (long double)norm_f[i]);
+		}
+		free_memory();
+		return 0;
+	}
+	
 	printf("\nRunning function F%d with %d variables\n", function_id, nreal);
 	
 	/* Initialize random number generators for noise functions */
@@ -63,46 +168,94 @@ int main(int argc, char** argv)
 	allocate_memory();
 	
 	/* Initialize variables for the selected function */
+	start = wall_time();
 	initialize();
+	report_timing("initialize", wall_time() - start);
 	
 	/* Calculate normalization for composite functions (F15-F25) */
 	if (function_id >= 15) {
+		start = wall_time();
 		calc_benchmark_norm();
+		report_timing("normalize", wall_time() - start);
+	}
+	
+	/* Trace the evaluations when CEC2005_TRACE selects this function (see trace.h) */
+	if (trace_start() != 0) {
+		free_memory();
+		exit(1);
 	}
 	
 	/* Allocate memory for input vector */
-	x = (long double *)malloc(nreal * sizeof(long double));
+	x = (real *)malloc(nreal * sizeof(real));
+	
+	/* Batch mode: evaluate all vectors in the input with a single initialization */
+	if (batch_mode) {
+		if (argc > 4 && strcmp(argv[4], "-") != 0) {
+			input_file = fopen(argv[4], "r");
+			if (!input_file) {
+				fprintf(stderr, "\nError: Cannot open input file %s\n", argv[4]);
+				exit(1);
+			}
+		} else {
+			input_file = stdin;
+		}
+		count = run_batch(input_file, x);
+		report_timing("evaluate", evaluate_time);
+		if (input_file != stdin) {
+			fclose(input_file);
+		}
+		trace_stop();
+		free_memory();
+		free(x);
+		if (count < 0) {
+			exit(1);
+		}
+		printf("\nEvaluated %d vectors\n", count);
+		printf("\nRoutine exited without any error.\n");
+		return 0;
+	}
 	
 	/* Check if an input file was provided */
 	if (argc > 3) {
-		input_file = fopen(argv[3], "r");
-		if (!input_file) {
-			fprintf(stderr, "\nError: Cannot open input file %s\n", argv[3]);
-			exit(1);
+		if (strcmp(argv[3], "-") == 0) {
+			input_file = stdin;
+		} else {
+			input_file = fopen(argv[3], "r");
+			if (!input_file) {
+				fprintf(stderr, "\nError: Cannot open input file %s\n", argv[3]);
+				exit(1);
+			}
 		}
 		
 		for (i = 0; i < nreal; i++) {
-			if (fscanf(input_file, "%Lf", &x[i]) != 1) {
+			if (fscanf(input_file, REAL_SCANF, &x[i]) != 1) {
 				fprintf(stderr, "\nError: Failed to read value %d from input file\n", i+1);
-				fclose(input_file);
+				if (input_file != stdin) {
+					fclose(input_file);
+				}
 				exit(1);
 			}
-			printf("x[%d] = %Lf\n", i+1, x[i]);
+			printf("x[%d] = %Lf\n", i+1, (long double)x[i]);
+		}
+		if (input_file != stdin) {
+			fclose(input_file);
 		}
-		fclose(input_file);
 	} else {
 		/* Read from standard input */
 		for (i = 0; i < nreal; i++) {
 			printf("\nEnter the value of variable x[%d] : ", i+1);
-			scanf("%Lf", &x[i]);
+			scanf(REAL_SCANF, &x[i]);
 		}
 	}
 	
 	/* Calculate objective function value */
+	start = wall_time();
 	f = calc_benchmark_func(x);
-	printf("\nObjective value = %1.15LE\n", f);
+	report_timing("evaluate", wall_time() - start);
+	printf("\nObjective value = %1.15LE\n", (long double)f);
 	
 	/* Free memory */
+	trace_stop();
 	free_memory();
 	free(x);
 	
@@ -0,0 +1,388 @@
+/* Access to the constant files, either through the binary constant pack */
+/* (input_data/constants.pack, built by utility_scripts/pack_constants.py) */
+/* or, when no usable pack entry exists, by parsing the text files */
+/* An entry is only used when the text file is absent or has the entry's SHA-256 */
+
+# define _POSIX_C_SOURCE 200112L
+
+# include <stdio.h>
+# include <stdlib.h>
+# include <string.h>
+# include <fcntl.h>
+# include <unistd.h>
+# include <sys/mman.h>
+# include <sys/stat.h>
+
+# include "global.h"
+
+/* Layout of the constant pack (all fields little-endian, 64-bit offsets) */
+/* An entry holds count doubles (the values rounded to double) followed by */
+/* count doubles of remainders, which restore the long double values exactly */
+# define PACK_FILENAME "constants.pack"
+# define PACK_MAGIC "CECPACK"
+# define PACK_VERSION 2
+# define PACK_ENDIAN_MARKER 0x01020304
+# define PACK_HEADER_SIZE 64
+# define PACK_ENTRY_SIZE 128
+# define PACK_NAME_SIZE 64
+
+typedef struct
+{
+    char magic[8];
+    unsigned int version;
+    unsigned int endian_marker;
+    unsigned int year;
+    unsigned int entry_count;
+    unsigned long index_offset;
+    unsigned long data_offset;
+    unsigned long data_size;
+    char reserved[16];
+} pack_header;
+
+typedef struct
+{
+    char name[PACK_NAME_SIZE];
+    unsigned long offset;
+    unsigned long count;
+    unsigned int rows;
+    unsigned int cols;
+    unsigned char sha256[32];
+    char reserved[8];
+} pack_entry;
+
+/* State of the mapped pack (opened lazily, once per input directory) */
+static int pack_checked = 0;
+static void *pack_map = NULL;
+static size_t pack_size = 0;
+static const pack_header *pack_head = NULL;
+static const pack_entry *pack_index = NULL;
+
+/* Newest modification time of the constant files opened since reset_input_mtime */
+static time_t inputs_mtime = 0;
+
+/* SHA-256 (FIPS 180-4) round constants */
+static const unsigned int sha256_k[64] =
+{
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+};
+
+# define ROTR(x, n) (((x) >> (n)) | ((x) << (32-(n))))
+
+/* Add a 64-byte block to the SHA-256 state (unsigned int is 32 bits where the pack is used) */
+static void sha256_block (unsigned int *state, const unsigned char *block)
+{
+    unsigned int w[64];
+    unsigned int a, b, c, d, e, f, g, h, t1, t2;
+    int i;
+    for (i=0; i<16; i++)
+    {
+        w[i] = ((unsigned int)block[4*i] << 24) | ((unsigned int)block[4*i+1] << 16)
+            | ((unsigned int)block[4*i+2] << 8) | (unsigned int)block[4*i+3];
+    }
+    for (i=16; i<64; i++)
+    {
+        w[i] = (ROTR(w[i-2], 17) ^ ROTR(w[i-2], 19) ^ (w[i-2] >> 10)) + w[i-7]
+            + (ROTR(w[i-15], 7) ^ ROTR(w[i-15], 18) ^ (w[i-15] >> 3)) + w[i-16];
+    }
+    a = state[0];
+    b = state[1];
+    c = state[2];
+    d = state[3];
+    e = state[4];
+    f = state[5];
+    g = state[6];
+    h = state[7];
+    for (i=0; i<64; i++)
+    {
+        t1 = h + (ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25)) + ((e & f) ^ (~e & g)) + sha256_k[i] + w[i];
+        t2 = (ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        h = g;
+        g = f;
+        f = e;
+        e = d + t1;
+        d = c;
+        c = b;
+        b = a;
+        a = t1 + t2;
+    }
+    state[0] += a;
+    state[1] += b;
+    state[2] += c;
+    state[3] += d;
+    state[4] += e;
+    state[5] += f;
+    state[6] += g;
+    state[7] += h;
+    return;
+}
+
+/* SHA-256 of the file at path into digest, returns 0 if it cannot be read */
+static int sha256_file (const char *path, unsigned char *digest)
+{
+    unsigned int state[8] =
+    {
+        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    };
+    unsigned char block[128];
+    unsigned long length = 0;
+    size_t got;
+    int i, end;
+    FILE *fpt;
+
+    fpt = fopen(path, "rb");
+    if (fpt == NULL)
+    {
+        return (0);
+    }
+    while ((got = fread(block, 1, 64, fpt)) == 64)
+    {
+        sha256_block(state, block);
+        length += 64;
+    }
+    if (ferror(fpt))
+    {
+        fclose(fpt);
+        return (0);
+    }
+    fclose(fpt);
+    length += got;
+    /* Padding: 0x80, zeros and the bit length (big-endian), in one or two blocks */
+    memset(block + got, 0, sizeof(block) - got);
+    block[got] = 0x80;
+    end = got < 56 ? 64 : 128;
+    for (i=0; i<8; i++)
+    {
+        block[end-1-i] = (unsigned char)((length*8) >> (8*i));
+    }
+    sha256_block(state, block);
+    if (end == 128)
+    {
+        sha256_block(state, block + 64);
+    }
+    for (i=0; i<32; i++)
+    {
+        digest[i] = (unsigned char)(state[i/4] >> (24 - 8*(i%4)));
+    }
+    return (1);
+}
+
+/* Build "input_data_dir/name" into path, returns 0 if it does not fit */
+static int input_path (char *path, size_t size, const char *name)
+{
+    if (strlen(input_data_dir) + strlen(name) + 2 > size)
+    {
+        return (0);
+    }
+    sprintf(path, "%s/%s", input_data_dir, name);
+    return (1);
+}
+
+/* Map the constant pack if present and consistent, otherwise leave it closed */
+static void open_constant_pack (void)
+{
+    char path[1024];
+    struct stat st;
+    int fd;
+    void *map;
+    const pack_header *head;
+
+    pack_checked = 1;
+    /* The structures only match the file layout where unsigned long is 64 bits */
+    if (sizeof(pack_header) != PACK_HEADER_SIZE || sizeof(pack_entry) != PACK_ENTRY_SIZE)
+    {
+        return;
+    }
+    if (getenv("CEC2005_NO_PACK") != NULL || !input_path(path, sizeof(path), PACK_FILENAME))
+    {
+        return;
+    }
+    fd = open(path, O_RDONLY);
+    if (fd < 0)
+    {
+        return;
+    }
+    if (fstat(fd, &st) != 0 || (size_t)st.st_size < PACK_HEADER_SIZE)
+    {
+        close(fd);
+        return;
+    }
+    map = mmap(NULL, (size_t)st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (map == MAP_FAILED)
+    {
+        return;
+    }
+    head = (const pack_header *)map;
+    /* A pack of another version is left to pack_constants.py to rebuild */
+    if (memcmp(head->magic, PACK_MAGIC, sizeof(PACK_MAGIC)) == 0 && head->version != PACK_VERSION)
+    {
+        munmap(map, (size_t)st.st_size);
+        return;
+    }
+    if (memcmp(head->magic, PACK_MAGIC, sizeof(PACK_MAGIC)) != 0
+        || head->endian_marker != PACK_ENDIAN_MARKER
+        || head->index_offset + (unsigned long)head->entry_count*PACK_ENTRY_SIZE > (unsigned long)st.st_size
+        || head->data_offset + head->data_size > (unsigned long)st.st_size)
+    {
+        fprintf(stderr, "\n Warning: Ignoring invalid constant pack %s \n", path);
+        munmap(map, (size_t)st.st_size);
+        return;
+    }
+    pack_map = map;
+    pack_size = (size_t)st.st_size;
+    pack_head = head;
+    pack_index = (const pack_entry *)((const char *)map + head->index_offset);
+    return;
+}
+
+/* Find the pack entry for a constant file, NULL if it is not packed */
+static const pack_entry *find_pack_entry (const char *name)
+{
+    unsigned int i;
+    if (!pack_checked)
+    {
+        open_constant_pack();
+    }
+    if (pack_map == NULL)
+    {
+        return (NULL);
+    }
+    for (i=0; i<pack_head->entry_count; i++)
+    {
+        if (strncmp(pack_index[i].name, name, PACK_NAME_SIZE) == 0)
+        {
+            if (pack_index[i].offset + 2*pack_index[i].count*sizeof(double) > pack_head->data_size)
+            {
+                return (NULL);
+            }
+            return (&pack_index[i]);
+        }
+    }
+    return (NULL);
+}
+
+/* Open a constant file given its path relative to the input data directory */
+const_stream *open_input_file (const char *name)
+{
+    char path[1024];
+    struct stat st;
+    const pack_entry *entry;
+    const_stream *stream;
+    unsigned char digest[32];
+    int have_stat;
+
+    if (!input_path(path, sizeof(path), name))
+    {
+        return (NULL);
+    }
+    stream = (const_stream *)malloc(sizeof(const_stream));
+    if (stream == NULL)
+    {
+        return (NULL);
+    }
+    stream->fpt = NULL;
+    stream->data = NULL;
+    stream->low = NULL;
+    stream->count = 0;
+    stream->pos = 0;
+
+    have_stat = (stat(path, &st) == 0);
+    if (have_stat && st.st_mtime > inputs_mtime)
+    {
+        inputs_mtime = st.st_mtime;
+    }
+
+    /* A text file edited since the pack was built takes precedence */
+    entry = find_pack_entry(name);
+    if (entry != NULL && (!have_stat || (sha256_file(path, digest)
+                                         && memcmp(digest, entry->sha256, sizeof(digest)) == 0)))
+    {
+        stream->data = (const double *)((const char *)pack_map + pack_head->data_offset + entry->offset);
+        stream->low = stream->data + entry->count;
+        stream->count = (long)entry->count;
+        return (stream);
+    }
+
+    stream->fpt = fopen(path, "r");
+    if (stream->fpt == NULL)
+    {
+        free(stream);
+        return (NULL);
+    }
+    return (stream);
+}
+
+/* Read the next value of a constant file, returns 1 on success like fscanf */
+int read_input_value (const_stream *stream, real *value)
+{
+    if (stream->fpt != NULL)
+    {
+        return (fscanf(stream->fpt, REAL_SCANF, value));
+    }
+    if (stream->pos >= stream->count)
+    {
+        return (EOF);
+    }
+    /* Same value as fscanf: the double build takes the rounded value as is */
+    *value = (real)stream->data[stream->pos];
+    if (sizeof(real) > sizeof(double))
+    {
+        *value += (real)stream->low[stream->pos];
+    }
+    stream->pos++;
+    return (1);
+}
+
+/* Close a constant file opened with open_input_file */
+void close_input_file (const_stream *stream)
+{
+    if (stream->fpt != NULL)
+    {
+        fclose(stream->fpt);
+    }
+    free(stream);
+    return;
+}
+
+/* Forget the constant files opened so far (called before loading a function's constants) */
+void reset_input_mtime (void)
+{
+    inputs_mtime = 0;
+    return;
+}
+
+/* Open a text file derived from the constant files opened since reset_input_mtime */
+/* Returns NULL if it is missing or older than any of them, so stale data is never used */
+FILE *open_derived_file (const char *name)
+{
+    char path[1024];
+    struct stat st;
+
+    if (!input_path(path, sizeof(path), name) || stat(path, &st) != 0 || st.st_mtime < inputs_mtime)
+    {
+        return (NULL);
+    }
+    return (fopen(path, "r"));
+}
+
+/* Unmap the constant pack, it is mapped again on the next open_input_file */
+void close_constant_pack (void)
+{
+    if (pack_map != NULL)
+    {
+        munmap(pack_map, pack_size);
+    }
+    pack_map = NULL;
+    pack_size = 0;
+    pack_head = NULL;
+    pack_index = NULL;
+    pack_checked = 0;
+    return;
+}
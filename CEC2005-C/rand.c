@@ -10,7 +10,10 @@
 
 /* Static variables for Box-Muller transform */
 static int rndcalcflag_local;
-static long double rndx1_local, rndx2_local;
+static real rndx1_local, rndx2_local;
+# ifdef _OPENMP
+# pragma omp threadprivate(rndcalcflag_local, rndx1_local, rndx2_local)
+# endif
 
 /* Get seed number for random and start it up */
 void randomize(void)
@@ -20,9 +23,9 @@ void randomize(void)
 }
 
 /* Fetch a single random number between 0.0 and 1.0 */
-long double randomperc(void)
+real randomperc(void)
 {
-    return ((long double)rand() / (long double)RAND_MAX);
+    return ((real)rand() / (real)RAND_MAX);
 }
 
 /* Fetch a single random integer between low and high including the bounds */
@@ -54,7 +57,7 @@ int rnd (int low, int high)
 }
 
 /* Fetch a single random real number between low and high including the bounds */
-long double rndreal (long double low, long double high)
+real rndreal (real low, real high)
 {
     return (low + (high-low)*randomperc());
 }
@@ -67,24 +70,24 @@ void initrandomnormaldeviate(void)
 }
 
 /* Return the noise value */
-long double noise (long double mu, long double sigma)
+real noise (real mu, real sigma)
 {
     return((randomnormaldeviate()*sigma) + mu);
 }
 
 /* Compute the noise using Box-Muller transform */
-long double randomnormaldeviate(void)
+real randomnormaldeviate(void)
 {
-    long double t;
+    real t;
     if(rndcalcflag_local)
     {
         /* Ensure randomperc() > 0 for log() */
-        long double r1 = 0.0L, r2 = 0.0L;
+        real r1 = 0.0L, r2 = 0.0L;
         while (r1 == 0.0L) r1 = randomperc(); /* Avoid log(0) */
         r2 = randomperc();
 
         rndx1_local = sqrt(-2.0L * log(r1));
-        t = 2.0L * M_PI * r2; /* M_PI is from math.h, ensure it's available or defined */
+        t = 2.0L * PI * r2;
         rndx2_local = sin(t);
         rndcalcflag_local = 0;
         return(rndx1_local * cos(t));
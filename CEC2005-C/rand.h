@@ -9,11 +9,11 @@
 
 /* Function declarations for the random number generator */
 void randomize(void);
-long double randomperc(void);
+real randomperc(void);
 int rnd (int low, int high);
-long double rndreal (long double low, long double high);
+real rndreal (real low, real high);
 void initrandomnormaldeviate(void);
-long double noise (long double mu, long double sigma);
-long double randomnormaldeviate(void);
+real noise (real mu, real sigma);
+real randomnormaldeviate(void);
 
 # endif
@@ -6,14 +6,14 @@
 # include "global.h"
 
 # ifdef f5
-long double **A;
-long double *B;
+real **A;
+real *B;
 # endif
 
 # ifdef f12
-long double **A;
-long double **B;
-long double *alpha;
+real **A;
+real **B;
+real *alpha;
 # endif
 
 # endif
@@ -0,0 +1,155 @@
+/* Tracing of the intermediate vectors of an evaluation (see trace.h) */
+/* A trace file has one line per traced vector: */
+/*   <evaluation> <stage> <component> <value> ... */
+/* with the stages x, shifted, rotated (per component), basic_f, weight and f */
+
+# include <stdio.h>
+# include <stdlib.h>
+# include <string.h>
+
+# include "global.h"
+# include "trace.h"
+
+/* Traced functions (traced[function_id]) and the directory of their files */
+static int traced[26];
+static char trace_dir[FILENAME_MAX] = ".";
+static int trace_configured = 0;
+
+# ifdef CEC2005_TRACE
+int trace_active = 0;
+static FILE *trace_file = NULL;
+static long trace_count = 0;
+/* Index of the evaluation being traced by the calling thread */
+static long trace_eval = 0;
+# ifdef _OPENMP
+# pragma omp threadprivate(trace_eval)
+# endif
+
+/* Mark the functions of a list "3,15" (or "all") as traced */
+static int parse_functions (const char *functions)
+{
+    const char *p;
+    char *end;
+    long id;
+    if (strcmp(functions, "all") == 0)
+    {
+        for (id=1; id<=25; id++)
+        {
+            traced[id] = 1;
+        }
+        return (0);
+    }
+    p = functions;
+    while (*p != '\0')
+    {
+        id = strtol(p, &end, 10);
+        if (end == p || id < 1 || id > 25 || (*end != ',' && *end != '\0'))
+        {
+            fprintf(stderr, "\n Error: Invalid list of functions to trace: %s\n", functions);
+            memset(traced, 0, sizeof(traced));
+            return (-1);
+        }
+        traced[id] = 1;
+        p = (*end == ',') ? end + 1 : end;
+    }
+    return (0);
+}
+# endif
+
+int trace_configure (const char *functions, const char *dir)
+{
+    memset(traced, 0, sizeof(traced));
+    trace_configured = 1;
+    if (dir != NULL && dir[0] != '\0')
+    {
+        if (strlen(dir) >= sizeof(trace_dir))
+        {
+            fprintf(stderr, "\n Error: Trace directory path too long: %s\n", dir);
+            return (-1);
+        }
+        strcpy(trace_dir, dir);
+    }
+    if (functions == NULL || functions[0] == '\0')
+    {
+        return (0);
+    }
+# ifdef CEC2005_TRACE
+    return (parse_functions(functions));
+# else
+    fprintf(stderr, "\n Error: Tracing is not compiled in (build with -DCEC2005_TRACE)\n");
+    return (-1);
+# endif
+}
+
+int trace_start (void)
+{
+# ifdef CEC2005_TRACE
+    char path[FILENAME_MAX];
+    trace_stop();
+    if (!trace_configured && trace_configure(getenv(TRACE_ENV), getenv(TRACE_DIR_ENV)) != 0)
+    {
+        return (-1);
+    }
+    if (!traced[function_id])
+    {
+        return (0);
+    }
+    sprintf(path, "%.*s/f%02d_D%d.trace", (int)(sizeof(path) - 16), trace_dir, function_id, nreal);
+    trace_file = fopen(path, "a");
+    if (trace_file == NULL)
+    {
+        fprintf(stderr, "\n Error: Could not open the trace file %s\n", path);
+        return (-1);
+    }
+    trace_count = 0;
+    trace_active = 1;
+    return (0);
+# else
+    if (!trace_configured)
+    {
+        return (trace_configure(getenv(TRACE_ENV), getenv(TRACE_DIR_ENV)));
+    }
+    return (0);
+# endif
+}
+
+void trace_stop (void)
+{
+# ifdef CEC2005_TRACE
+    if (trace_file != NULL)
+    {
+        fclose(trace_file);
+        trace_file = NULL;
+    }
+    trace_active = 0;
+# endif
+    return;
+}
+
+# ifdef CEC2005_TRACE
+void trace_begin (void)
+{
+# ifdef _OPENMP
+# pragma omp critical (cec2005_trace)
+# endif
+    trace_eval = trace_count++;
+    return;
+}
+
+void trace_vector (const char *stage, int component, const real *v, int n)
+{
+    int i;
+# ifdef _OPENMP
+# pragma omp critical (cec2005_trace)
+# endif
+    {
+        fprintf(trace_file, "%ld %s %d", trace_eval, stage, component);
+        for (i=0; i<n; i++)
+        {
+            fprintf(trace_file, " %1.20LE", (long double)v[i]);
+        }
+        fprintf(trace_file, "\n");
+    }
+    return;
+}
+# endif
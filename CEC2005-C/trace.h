@@ -0,0 +1,40 @@
+/* Declarations for tracing the intermediate vectors of an evaluation */
+
+# ifndef _TRACE_H
+# define _TRACE_H
+
+# include "global.h"
+
+/* Environment variables: the functions to trace ("3", "3,15" or "all") and */
+/* the existing directory the trace files are written to (default ".") */
+# define TRACE_ENV "CEC2005_TRACE"
+# define TRACE_DIR_ENV "CEC2005_TRACE_DIR"
+
+/* Select the traced functions and the directory; -1 on an invalid list, or */
+/* when functions are selected in a build without -DCEC2005_TRACE */
+int trace_configure (const char *functions, const char *dir);
+
+/* Open the trace file of function_id at nreal (<dir>/fNN_D<nreal>.trace, */
+/* appended to) when that function is traced; configured from the */
+/* environment unless trace_configure was called */
+int trace_start (void);
+void trace_stop (void);
+
+/* The TRACE_ macros are compiled in with -DCEC2005_TRACE, and to nothing */
+/* otherwise: tracing costs nothing in the other builds */
+# ifdef CEC2005_TRACE
+extern int trace_active;
+void trace_begin (void);
+void trace_vector (const char *stage, int component, const real *v, int n);
+
+/* Start the trace of an evaluation (numbered from 0 in each trace_start) */
+# define TRACE_BEGIN() do { if (trace_active) trace_begin(); } while (0)
+/* Write one line: evaluation, stage, component and the n values of v */
+# define TRACE_VECTOR(stage, component, v, n) \
+    do { if (trace_active) trace_vector(stage, component, v, n); } while (0)
+# else
+# define TRACE_BEGIN() ((void)0)
+# define TRACE_VECTOR(stage, component, v, n) ((void)0)
+# endif
+
+# endif
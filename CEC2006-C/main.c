@@ -5,9 +5,14 @@
  * The CEC2006 suite consists of 24 constrained optimization problems.
  * 
  * Usage: ./main <function_id> <dimension> <input_file>
+ *        ./main <function_id> <dimension> --batch [input_file]
  *   function_id: 1-24
  *   dimension: problem-specific (see problem definitions)
  *   input_file: text file with one value per line
+ *   --batch: evaluate every vector of nx whitespace-separated values in the
+ *            input (stdin if omitted or "-"), printing one line per vector:
+ *            f violation feasible g[1..ng] h[1..nh]
+ *            after a "# nx ng nh" header line
  */
 
 #include <stdio.h>
@@ -76,6 +81,9 @@ static ProblemInfo problem_info[24] = {
     {2, 2, 0}     /* g24 */
 };
 
+/* Tolerance below which an equality constraint is satisfied */
+#define EQUALITY_TOLERANCE 1e-6
+
 /* Function pointer type */
 typedef void (*BenchmarkFunction)(double *, double *, double *, double *, int, int, int, int);
 
@@ -86,18 +94,88 @@ static BenchmarkFunction functions[24] = {
     g17, g18, g19, g20, g21, g22, g23, g24
 };
 
+/* Sum of positive g plus sum of |h| */
+static double constraint_violation(const double *g, const double *h, ProblemInfo info) {
+    double total_violation = 0.0;
+    int i;
+    for (i = 0; i < info.ng; i++) {
+        if (g[i] > 0) {
+            total_violation += g[i];
+        }
+    }
+    for (i = 0; i < info.nh; i++) {
+        total_violation += fabs(h[i]);
+    }
+    return total_violation;
+}
+
+static int is_feasible(const double *g, const double *h, ProblemInfo info) {
+    int i;
+    for (i = 0; i < info.ng; i++) {
+        if (g[i] > 0) {
+            return 0;
+        }
+    }
+    for (i = 0; i < info.nh; i++) {
+        if (fabs(h[i]) > EQUALITY_TOLERANCE) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* Evaluate consecutive vectors of nx values until end of input, one result line each */
+/* (%.17g keeps every bit of the doubles); returns the number of vectors or -1 */
+static int run_batch(FILE *input, BenchmarkFunction function, ProblemInfo info,
+                     double *x, double *f, double *g, double *h) {
+    int i, count = 0;
+    
+    printf("# %d %d %d\n", info.nx, info.ng, info.nh);
+    while (1) {
+        for (i = 0; i < info.nx; i++) {
+            if (fscanf(input, "%lf", &x[i]) != 1) {
+                break;
+            }
+        }
+        if (i == 0) {
+            break;
+        }
+        if (i < info.nx) {
+            fprintf(stderr, "Error: Incomplete vector %d in batch input (read %d of %d values)\n",
+                    count + 1, i, info.nx);
+            return -1;
+        }
+        function(x, f, g, h, info.nx, 1, info.ng, info.nh);
+        printf("%.17g %.17g %d", f[0], constraint_violation(g, h, info), is_feasible(g, h, info));
+        for (i = 0; i < info.ng; i++) {
+            printf(" %.17g", g[i]);
+        }
+        for (i = 0; i < info.nh; i++) {
+            printf(" %.17g", h[i]);
+        }
+        printf("\n");
+        count++;
+    }
+    return count;
+}
+
 int main(int argc, char *argv[]) {
     int func_id, dimension, i;
+    int batch_mode;
     double *x, *f, *g, *h;
     FILE *input_file;
     char line[256];
     
     /* Check arguments */
-    if (argc != 4) {
+    batch_mode = argc >= 4 && strcmp(argv[3], "--batch") == 0;
+    if (batch_mode ? argc > 5 : argc != 4) {
         printf("Usage: %s <function_id> <dimension> <input_file>\n", argv[0]);
+        printf("       %s <function_id> <dimension> --batch [input_file]\n", argv[0]);
         printf("  function_id: 1-24\n");
         printf("  dimension: problem dimension (use -1 for default)\n");
-        printf("  input_file: text file with one value per line\n");
+        printf("  input_file: text file with one value per line (\"-\" for stdin)\n");
+        printf("  --batch: evaluate every vector of the input (stdin if omitted or \"-\"),\n");
+        printf("           printing \"f violation feasible g[1..ng] h[1..nh]\" per vector\n");
         return 1;
     }
     
@@ -138,8 +216,23 @@ int main(int argc, char *argv[]) {
         return 1;
     }
     
+    /* Batch mode: machine-readable results of every vector in the input */
+    if (batch_mode) {
+        int count;
+        input_file = (argc < 5 || strcmp(argv[4], "-") == 0) ? stdin : fopen(argv[4], "r");
+        if (!input_file) {
+            fprintf(stderr, "Error: Cannot open input file %s\n", argv[4]);
+            free(x); free(f); free(g); free(h);
+            return 1;
+        }
+        count = run_batch(input_file, functions[func_id - 1], info, x, f, g, h);
+        if (input_file != stdin) fclose(input_file);
+        free(x); free(f); free(g); free(h);
+        return count < 0 ? 1 : 0;
+    }
+    
     /* Read input file */
-    input_file = fopen(argv[3], "r");
+    input_file = strcmp(argv[3], "-") == 0 ? stdin : fopen(argv[3], "r");
     if (!input_file) {
         fprintf(stderr, "Error: Cannot open input file %s\n", argv[3]);
         free(x); free(f); free(g); free(h);
@@ -151,14 +244,14 @@ int main(int argc, char *argv[]) {
     for (i = 0; i < info.nx; i++) {
         if (fgets(line, sizeof(line), input_file) == NULL) {
             fprintf(stderr, "Error: Input file has fewer values than required (%d)\n", info.nx);
-            fclose(input_file);
+            if (input_file != stdin) fclose(input_file);
             free(x); free(f); free(g); free(h);
             return 1;
         }
         x[i] = atof(line);
         printf("x[%d] = %f\n", i + 1, x[i]);
     }
-    fclose(input_file);
+    if (input_file != stdin) fclose(input_file);
     
     /* Call the benchmark function */
     functions[func_id - 1](x, f, g, h, info.nx, 1, info.ng, info.nh);
@@ -182,7 +275,7 @@ int main(int argc, char *argv[]) {
         printf("\nEquality constraints (h = 0):\n");
         for (i = 0; i < info.nh; i++) {
             printf("h[%d] = %.15E", i + 1, h[i]);
-            if (fabs(h[i]) > 1e-6) {
+            if (fabs(h[i]) > EQUALITY_TOLERANCE) {
                 printf(" (VIOLATED)");
             }
             printf("\n");
@@ -190,15 +283,7 @@ int main(int argc, char *argv[]) {
     }
     
     /* Calculate total constraint violation */
-    double total_violation = 0.0;
-    for (i = 0; i < info.ng; i++) {
-        if (g[i] > 0) {
-            total_violation += g[i];
-        }
-    }
-    for (i = 0; i < info.nh; i++) {
-        total_violation += fabs(h[i]);
-    }
+    double total_violation = constraint_violation(g, h, info);
     
     if (total_violation > 0) {
         printf("\nTotal constraint violation = %.15E\n", total_violation);
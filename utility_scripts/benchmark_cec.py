@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+CEC Benchmark Throughput Measurement
+
+Measures how fast each executor backend evaluates the CEC benchmark functions:
+evaluations per second and per-call latency percentiles, for every function
+and dimension at several batch sizes. Results are written as JSON and can be
+compared against a saved baseline to catch performance regressions.
+
+Usage:
+    python benchmark_cec.py                                   # All years, backends, functions
+    python benchmark_cec.py --year 2005 --backend numpy ctypes
+    python benchmark_cec.py --year 2005 --func 1 21 --dim 10 50 --batch 1 100 1000
+    python benchmark_cec.py --year 2005 --backend ctypes --threads 0 --batch 10000   # All cores
+    python benchmark_cec.py --output baseline.json            # Save results
+    python benchmark_cec.py --compare baseline.json           # Flag regressions (exit code 1)
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from executors import ExecutorFactory, FunctionExecutor
+from executors.build import BUILD_PROFILES
+from executors.cec2006_numpy import PROBLEM_INFO
+from fuzz_backends import function_bounds
+from validate_cec import CECConfig, get_cec_config
+
+
+# ============================================================================
+# Data Structures
+# ============================================================================
+
+
+@dataclass
+class BenchmarkConfig:
+    """Configuration of a benchmark run."""
+    batch_sizes: Tuple[int, ...] = (1, 10, 100)
+    repeat: int = 10          # timed calls per case
+    warmup: int = 1           # untimed calls per case
+    seed: int = 0
+    regression_threshold: float = 0.2  # flagged when throughput drops by more than this fraction
+
+
+def function_label(year: int, func_id: int) -> str:
+    """Name of a function as its year's competition writes it (F01, g01)."""
+    return f"g{func_id:02d}" if year == 2006 else f"F{func_id:02d}"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one (year, backend, profile, function, dimension, batch size) case."""
+    year: int
+    backend: str
+    func_id: int
+    dimension: int
+    batch_size: int
+    calls: int
+    evals_per_sec: float
+    latency_mean_ms: float
+    latency_p50_ms: float
+    latency_p90_ms: float
+    latency_p99_ms: float
+    profile: Optional[str] = None  # build profile of a compiled backend
+
+    @property
+    def key(self) -> Tuple[int, str, Optional[str], int, int, int]:
+        """Identity of the case, used to match results against a baseline."""
+        return (self.year, self.backend, self.profile, self.func_id, self.dimension, self.batch_size)
+
+    @property
+    def label(self) -> str:
+        """Name of the benchmarked function (F01, g01)."""
+        return function_label(self.year, self.func_id)
+
+
+# ============================================================================
+# Benchmark Runner
+# ============================================================================
+
+
+class BenchmarkRunner:
+    """Times the evaluations of one executor backend."""
+
+    def __init__(self, config: CECConfig, backend: str, bench_config: BenchmarkConfig,
+                 profile: Optional[str] = None, threads: Optional[int] = None):
+        self.config = config
+        self.backend = backend
+        self.bench_config = bench_config
+        self.profile = profile
+        self.executor: FunctionExecutor = ExecutorFactory.create_executor(
+            config.year, config.implementation_dir, backend, profile, threads=threads
+        )
+        with open(config.metadata_path, "r") as f:
+            self.functions: Dict[str, Dict] = json.load(f)["functions"]
+
+    def case_dimensions(self, func_id: int, dimensions: Optional[List[int]]) -> List[int]:
+        """Dimensions to benchmark for a function."""
+        if self.config.year == 2006:
+            # CEC2006 problems have a fixed number of variables
+            return [PROBLEM_INFO[func_id].nx] if func_id in PROBLEM_INFO else []
+        supported = self.config.supported_dimensions
+        return [dim for dim in (dimensions or supported) if dim in supported]
+
+    def sample_bounds(self, func_id: int, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower and upper bounds the benchmark vectors of a function are drawn within
+        (its "search_range" in the year's metadata, per variable for CEC2006)."""
+        return function_bounds(self.functions[f"f{func_id:02d}"], dimension)
+
+    def time_case(self, func_id: int, dimension: int, batch_size: int) -> BenchmarkResult:
+        """Time repeated evaluations of one batch of vectors."""
+        low, high = self.sample_bounds(func_id, dimension)
+        rng = np.random.default_rng(
+            np.random.SeedSequence(self.bench_config.seed,
+                                   spawn_key=(self.config.year, func_id, dimension))
+        )
+        vectors = rng.uniform(low, high, (batch_size, dimension)).tolist()
+
+        def call():
+            if batch_size == 1:
+                self.executor.run(func_id, dimension, vectors[0])
+            else:
+                self.executor.run_batch(func_id, dimension, vectors)
+
+        for _ in range(self.bench_config.warmup):
+            call()
+
+        latencies = []
+        for _ in range(self.bench_config.repeat):
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+
+        latencies_ms = np.array(latencies) * 1e3
+        total = float(np.sum(latencies))
+        return BenchmarkResult(
+            year=self.config.year,
+            backend=self.backend,
+            func_id=func_id,
+            dimension=dimension,
+            batch_size=batch_size,
+            calls=len(latencies),
+            evals_per_sec=batch_size * len(latencies) / total if total > 0 else float("inf"),
+            latency_mean_ms=float(np.mean(latencies_ms)),
+            latency_p50_ms=float(np.percentile(latencies_ms, 50)),
+            latency_p90_ms=float(np.percentile(latencies_ms, 90)),
+            latency_p99_ms=float(np.percentile(latencies_ms, 99)),
+            profile=self.profile,
+        )
+
+    def run(self, func_ids: Optional[List[int]] = None,
+            dimensions: Optional[List[int]] = None) -> List[BenchmarkResult]:
+        """Benchmark the selected functions and dimensions at every batch size."""
+        if not self.executor.build():
+            raise RuntimeError(f"Failed to build the '{self.backend}' backend of CEC{self.config.year}")
+
+        results = []
+        func_ids = func_ids or list(range(1, self.config.num_functions + 1))
+        try:
+            for func_id in func_ids:
+                for dim in self.case_dimensions(func_id, dimensions):
+                    for batch_size in self.bench_config.batch_sizes:
+                        try:
+                            result = self.time_case(func_id, dim, batch_size)
+                        except Exception as e:
+                            print(f"  {function_label(self.config.year, func_id)} D{dim:2d} "
+                                  f"batch {batch_size:5d}: ✗ Error: {e}")
+                            continue
+                        BenchmarkReporter.print_result(result)
+                        results.append(result)
+        finally:
+            self.executor.cleanup()
+        return results
+
+
+# ============================================================================
+# Reporting and Comparison
+# ============================================================================
+
+
+class BenchmarkReporter:
+    """Formats benchmark results and regression reports."""
+
+    @staticmethod
+    def print_header(year: int, backend: str):
+        """Print the header of a backend's benchmark."""
+        print("=" * 70)
+        print(f"CEC{year} Benchmark Throughput: {backend} backend")
+        print("=" * 70)
+
+    @staticmethod
+    def print_result(result: BenchmarkResult):
+        """Print the timing of one case."""
+        print(f"  {result.label} D{result.dimension:2d} batch {result.batch_size:5d}: "
+              f"{result.evals_per_sec:12.1f} evals/s  "
+              f"p50 {result.latency_p50_ms:9.3f} ms  p99 {result.latency_p99_ms:9.3f} ms")
+
+    @staticmethod
+    def print_regressions(regressions: List[Tuple[BenchmarkResult, BenchmarkResult]],
+                          compared: int, threshold: float):
+        """Print the cases that are slower than the baseline."""
+        print("\n" + "=" * 70)
+        print("COMPARISON WITH BASELINE")
+        print("=" * 70)
+        print(f"Compared cases: {compared}")
+        print(f"Regressions (throughput down by more than {threshold:.0%}): {len(regressions)}")
+        for result, baseline in regressions:
+            change = result.evals_per_sec / baseline.evals_per_sec - 1.0
+            backend = result.backend + (f" ({result.profile})" if result.profile else "")
+            print(f"  - CEC{result.year} {backend} {result.label} "
+                  f"D{result.dimension} batch {result.batch_size}: "
+                  f"{baseline.evals_per_sec:.1f} -> {result.evals_per_sec:.1f} evals/s ({change:+.1%})")
+
+
+def save_results(path: str, results: List[BenchmarkResult], bench_config: BenchmarkConfig,
+                 profile: Optional[str], threads: Optional[int] = None) -> None:
+    """Write benchmark results and the run's environment as JSON."""
+    data = {
+        "metadata": {
+            "date_generated": datetime.now().isoformat(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "profile": profile or "default",
+            "threads": threads,
+            "batch_sizes": list(bench_config.batch_sizes),
+            "repeat": bench_config.repeat,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    """Load benchmark results saved by save_results."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    return [BenchmarkResult(**entry) for entry in data["results"]]
+
+
+def find_regressions(results: List[BenchmarkResult], baseline: List[BenchmarkResult],
+                     threshold: float) -> Tuple[List[Tuple[BenchmarkResult, BenchmarkResult]], int]:
+    """Find cases whose throughput dropped by more than threshold against the baseline.
+
+    Returns:
+        The (result, baseline result) pairs of regressed cases, and the number
+        of cases present in both runs
+    """
+    baseline_by_key: Dict[Tuple, BenchmarkResult] = {entry.key: entry for entry in baseline}
+    regressions = []
+    compared = 0
+    for result in results:
+        reference = baseline_by_key.get(result.key)
+        if reference is None:
+            continue
+        compared += 1
+        if result.evals_per_sec < reference.evals_per_sec * (1.0 - threshold):
+            regressions.append((result, reference))
+    return regressions, compared
+
+
+# ============================================================================
+# Main Entry Point
+# ============================================================================
+
+
+def main():
+    """Main entry point for the benchmark script."""
+    parser = argparse.ArgumentParser(
+        description="Measure the throughput of the CEC benchmark executors",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        nargs='+',
+        choices=[2005, 2006],
+        default=[2005, 2006],
+        help="CEC competition years (default: all)"
+    )
+    parser.add_argument(
+        "--backend",
+        nargs='+',
+        help="Executor backends to benchmark (default: every backend of each year)"
+    )
+    parser.add_argument(
+        "--func",
+        type=int,
+        nargs='+',
+        metavar="ID",
+        help="Function IDs to benchmark"
+    )
+    parser.add_argument(
+        "--dim",
+        type=int,
+        nargs='+',
+        help="Dimensions to benchmark (CEC2005; CEC2006 problems have fixed dimensions)"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        nargs='+',
+        default=list(BenchmarkConfig.batch_sizes),
+        metavar="SIZE",
+        help="Batch sizes, i.e. vectors per call (default: 1 10 100)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=BenchmarkConfig.repeat,
+        help="Timed calls per case (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(BUILD_PROFILES),
+        help="Build profile of the compiled backends (default: the Makefile's flags)"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Threads a batch is split across, for the backends that support it (0: one per core)"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write the results as JSON"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="Compare against saved results and exit with 1 on regressions"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=BenchmarkConfig.regression_threshold,
+        help="Relative throughput drop flagged as a regression (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=".",
+        help="Base directory for CEC implementations (default: current directory)"
+    )
+
+    args = parser.parse_args()
+
+    bench_config = BenchmarkConfig(
+        batch_sizes=tuple(args.batch),
+        repeat=args.repeat,
+        regression_threshold=args.threshold
+    )
+
+    try:
+        results = []
+        for year in args.year:
+            config = get_cec_config(year, args.base_dir)
+            backends = args.backend or ExecutorFactory.available_backends(year)
+            for backend in backends:
+                executor_class = ExecutorFactory.backend_class(year, backend)
+                if executor_class is None:
+                    print(f"Skipping CEC{year}: no '{backend}' backend")
+                    continue
+                # Build profiles only apply to the compiled backends
+                profile = (args.profile or "default") if executor_class.supports_profiles else None
+                threads = args.threads if executor_class.supports_threads else None
+                BenchmarkReporter.print_header(year, backend)
+                runner = BenchmarkRunner(config, backend, bench_config, profile, threads)
+                results.extend(runner.run(args.func, args.dim))
+
+        if args.output:
+            save_results(args.output, results, bench_config, args.profile, args.threads)
+            print(f"\nResults written to {args.output}")
+
+        if args.compare:
+            regressions, compared = find_regressions(
+                results, load_results(args.compare), bench_config.regression_threshold
+            )
+            BenchmarkReporter.print_regressions(regressions, compared,
+                                                bench_config.regression_threshold)
+            sys.exit(1 if regressions else 0)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
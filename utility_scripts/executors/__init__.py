@@ -6,14 +6,37 @@ Each executor handles the specific interface and requirements of its year's benc
 """
 
 from .base import FunctionExecutor, TestType
+from .build import BUILD_PROFILES, BuildCache, BuildProfile
+from .caching import CacheStats, CachingExecutor
 from .cec2005 import CEC2005Executor
+from .cec2005_lib import CEC2005LibraryExecutor
+from .cec2005_numpy import CEC2005NumpyExecutor
 from .cec2006 import CEC2006Executor
+from .cec2006_numpy import CEC2006NumpyExecutor
+from .concurrency import DEFAULT_MAX_CONCURRENCY, ConcurrencyLimit
+from .constants import ConstantPack, build_constant_pack, load_constant_values
 from .factory import ExecutorFactory
+from .results import ConstrainedResult, EvaluationResult
 
 __all__ = [
     'FunctionExecutor',
     'TestType', 
+    'BUILD_PROFILES',
+    'BuildCache',
+    'BuildProfile',
+    'CacheStats',
+    'CachingExecutor',
     'CEC2005Executor',
+    'CEC2005LibraryExecutor',
+    'CEC2005NumpyExecutor',
     'CEC2006Executor',
+    'CEC2006NumpyExecutor',
+    'ConstrainedResult',
+    'EvaluationResult',
+    'ConcurrencyLimit',
+    'DEFAULT_MAX_CONCURRENCY',
+    'ConstantPack',
+    'build_constant_pack',
+    'load_constant_values',
     'ExecutorFactory'
 ]
\ No newline at end of file
@@ -2,10 +2,15 @@
 Base classes and common types for CEC benchmark executors.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
+
+from .concurrency import ConcurrencyLimit
+from .fingerprint import module_fingerprint
+from .timing import PhaseTimings
 
 
 class TestType(Enum):
@@ -15,11 +20,24 @@ class TestType(Enum):
     OPTIMAL = "optimal"
     ZEROS = "zeros"
     RANDOM = "random"
+    REGRESSION = "regression"  # disagreements between backends found by fuzz_backends.py
 
 
 class FunctionExecutor(ABC):
     """Abstract base class for CEC function executors."""
     
+    # Whether the executor compiles its implementation and accepts a build profile
+    supports_profiles: bool = False
+    
+    # Whether the executor splits a batch across threads and accepts a thread count
+    supports_threads: bool = False
+    
+    # Per-phase timings, recorded only once enable_timing() has been called
+    timings: Optional[PhaseTimings] = None
+    
+    # Bound on the evaluations arun()/arun_batch() keep in flight, created on first use
+    _concurrency: Optional[ConcurrencyLimit] = None
+    
     @abstractmethod
     def __init__(self, implementation_dir: Path):
         """Initialize the executor with implementation directory."""
@@ -35,6 +53,69 @@ class FunctionExecutor(ABC):
         """Execute a benchmark function and return the result."""
         pass
     
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a benchmark function on several vectors.
+        
+        The default implementation calls run() once per vector. Executors that
+        can evaluate many vectors with a single initialization should override it.
+        """
+        return [self.run(func_id, dimension, vector) for vector in vectors]
+    
+    def source_fingerprint(self, func_id: int) -> str:
+        """Fingerprint of the implementation code a function's results depend on.
+        
+        Used to skip validation cases whose inputs have not changed. The
+        default covers the executor's own module; executors wrapping another
+        implementation should also cover the parts of it the function uses.
+        """
+        return module_fingerprint(type(self))
+    
+    @property
+    def concurrency(self) -> ConcurrencyLimit:
+        """The limit on evaluations in flight in arun() and arun_batch()."""
+        if self._concurrency is None:
+            self._concurrency = ConcurrencyLimit()
+        return self._concurrency
+    
+    def set_max_concurrency(self, limit: int) -> None:
+        """Set how many evaluations arun() and arun_batch() keep in flight at most."""
+        self.concurrency.set_limit(limit)
+    
+    async def arun(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Asynchronous counterpart of run().
+        
+        The default implementation calls run() in the event loop's default
+        thread pool. Executors that spawn processes should override it to
+        drive them with asyncio instead.
+        """
+        async with self.concurrency.slot():
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.run, func_id, dimension, input_vector
+            )
+    
+    async def arun_batch(self, func_id: int, dimension: int,
+                         vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Asynchronous counterpart of run_batch().
+        
+        The default implementation calls run_batch() in the event loop's
+        default thread pool.
+        """
+        async with self.concurrency.slot():
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.run_batch, func_id, dimension, vectors
+            )
+    
+    def enable_timing(self) -> PhaseTimings:
+        """Start recording the time spent in each evaluation phase.
+        
+        Returns:
+            The PhaseTimings collecting the timings per (function, dimension)
+        """
+        if self.timings is None:
+            self.timings = PhaseTimings()
+        return self.timings
+    
     @abstractmethod
     def cleanup(self) -> None:
         """Cleanup any resources."""
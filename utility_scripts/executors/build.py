@@ -0,0 +1,185 @@
+"""
+Build profiles and content-hashed build cache for the C implementations.
+
+Each build is keyed by a hash of the implementation's sources (``*.c``,
+``*.h`` and the Makefile), the profile's compiler and preprocessor flags
+and the compiler
+version. The built artifacts are kept in ``<implementation>/.build/<key>/``,
+so an unchanged tree is never rebuilt, and several profiles can be used
+side by side. After each new build, only the most recently used builds of
+its profile are kept (``BUILD_CACHE_KEEP``). make builds in the
+implementation directory itself, so builds hold a file lock in the cache
+directory: concurrent builds of any process (validation jobs, pool workers)
+run one after the other.
+"""
+
+import fcntl
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Sequence
+
+BUILD_CACHE_DIRNAME = ".build"
+
+# Lock file serializing the builds of an implementation, in its cache directory
+BUILD_LOCK_FILENAME = ".lock"
+
+# Builds kept per profile: a new build evicts the least recently used beyond these
+BUILD_CACHE_KEEP = 3
+
+# Files whose contents determine a build
+SOURCE_PATTERNS = ("*.c", "*.h", "Makefile")
+
+
+@dataclass(frozen=True)
+class BuildProfile:
+    """Named set of compiler flags, passed to make as OPTFLAGS (and CPPFLAGS)."""
+    name: str
+    optflags: Optional[str]  # None keeps the Makefile's own OPTFLAGS
+    description: str
+    cppflags: Optional[str] = None  # preprocessor flags selecting a variant of the code
+
+
+BUILD_PROFILES: Dict[str, BuildProfile] = {
+    "default": BuildProfile("default", None, "flags from the implementation's Makefile"),
+    "debug": BuildProfile("debug", "-O0 -g", "no optimization, debug symbols"),
+    "release": BuildProfile("release", "-O2", "optimized"),
+    "native": BuildProfile("native", "-O3 -march=native", "optimized for the build machine's CPU"),
+    # CEC2005 computes in long double (x87) by default; these compute in double (SSE)
+    "double": BuildProfile("double", "-O2", "optimized, CEC2005 in double precision",
+                           cppflags="-DCEC2005_DOUBLE"),
+    "double-native": BuildProfile("double-native", "-O3 -march=native",
+                                  "double precision, optimized for the build machine's CPU",
+                                  cppflags="-DCEC2005_DOUBLE"),
+    # Compiles in the trace of the intermediate vectors (CEC2005-C/trace.h)
+    "trace": BuildProfile("trace", "-O2 -g", "optimized, with the CEC2005 evaluation trace",
+                          cppflags="-DCEC2005_TRACE"),
+}
+
+DEFAULT_PROFILE = "default"
+
+
+def get_build_profile(name: Optional[str]) -> BuildProfile:
+    """Look up a build profile by name (the default profile for None)."""
+    profile = BUILD_PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        raise ValueError(
+            f"Unknown build profile '{name}'. Available profiles: {sorted(BUILD_PROFILES)}"
+        )
+    return profile
+
+
+class BuildCache:
+    """Builds an implementation with make and caches the artifacts by content hash."""
+
+    def __init__(self, source_dir: Path, artifacts: Sequence[str], compiler: str = "gcc",
+                 keep: int = BUILD_CACHE_KEEP):
+        """
+        Args:
+            source_dir: Implementation directory holding the Makefile
+            artifacts: Files produced by ``make`` to keep (e.g. "main")
+            compiler: Compiler whose version is part of the build key
+            keep: Builds kept per profile, the most recently used ones
+        """
+        if keep < 1:
+            raise ValueError(f"keep must be at least 1, got {keep}")
+        self.source_dir = Path(source_dir)
+        self.artifacts = list(artifacts)
+        self.compiler = compiler
+        self.keep = keep
+        self.cache_dir = self.source_dir / BUILD_CACHE_DIRNAME
+        self._version: Optional[str] = None
+
+    def key(self, profile: BuildProfile) -> str:
+        """Hash of the sources, the profile flags and the compiler version."""
+        digest = hashlib.sha256()
+        for pattern in SOURCE_PATTERNS:
+            for path in sorted(self.source_dir.glob(pattern)):
+                digest.update(path.name.encode() + b"\0")
+                digest.update(path.read_bytes())
+        digest.update(f"OPTFLAGS={profile.optflags}\0".encode())
+        if profile.cppflags is not None:
+            digest.update(f"CPPFLAGS={profile.cppflags}\0".encode())
+        digest.update(self.compiler_version().encode())
+        return f"{profile.name}-{digest.hexdigest()[:16]}"
+
+    def artifact_dir(self, profile: BuildProfile) -> Path:
+        """Directory holding the cached artifacts of a profile's current build."""
+        return self.cache_dir / self.key(profile)
+
+    def is_cached(self, profile: BuildProfile) -> bool:
+        """Check whether the current sources are already built with a profile."""
+        target = self.artifact_dir(profile)
+        return all((target / name).exists() for name in self.artifacts)
+
+    def build(self, profile: BuildProfile) -> Path:
+        """Build with a profile unless cached, and return the artifact directory.
+
+        Raises:
+            subprocess.CalledProcessError: If make fails
+        """
+        target = self.artifact_dir(profile)
+        if self.is_cached(profile):
+            # The modification time of a build orders the builds for eviction
+            os.utime(target)
+            return target
+
+        make_args = ["make"]
+        if profile.optflags is not None:
+            make_args.append(f"OPTFLAGS={profile.optflags}")
+        if profile.cppflags is not None:
+            make_args.append(f"CPPFLAGS={profile.cppflags}")
+        with self._build_lock():
+            # Another build may have produced it while this one waited
+            if self.is_cached(profile):
+                return target
+            subprocess.run(["make", "clean"], cwd=self.source_dir, capture_output=True, check=False)
+            subprocess.run(make_args, cwd=self.source_dir, capture_output=True, check=True)
+
+            # Populate a temporary directory first so a cache entry is never partial
+            staging = self.cache_dir / f".{target.name}.tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+            for name in self.artifacts:
+                shutil.copy2(self.source_dir / name, staging / name)
+            shutil.rmtree(target, ignore_errors=True)
+            staging.rename(target)
+            self._evict(profile)
+        return target
+
+    def _evict(self, profile: BuildProfile) -> None:
+        """Delete the builds of a profile beyond the self.keep most recently used
+        (under the build lock)."""
+        pattern = re.compile(re.escape(profile.name) + r"-[0-9a-f]{16}")
+        builds = [path for path in self.cache_dir.iterdir()
+                  if path.is_dir() and pattern.fullmatch(path.name)]
+        builds.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in builds[self.keep:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    @contextmanager
+    def _build_lock(self) -> Iterator[None]:
+        """Hold the exclusive lock on the implementation's builds (also between
+        threads: each holder opens the lock file itself)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_dir / BUILD_LOCK_FILENAME, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def compiler_version(self) -> str:
+        """First line of the compiler's version output (empty if unavailable)."""
+        if self._version is None:
+            try:
+                result = subprocess.run([self.compiler, "--version"], capture_output=True, text=True)
+                self._version = result.stdout.split("\n", 1)[0]
+            except OSError:
+                self._version = ""
+        return self._version
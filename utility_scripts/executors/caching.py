@@ -0,0 +1,263 @@
+"""
+Evaluation memoization for CEC benchmark executors.
+
+CachingExecutor wraps any FunctionExecutor and remembers its results, keyed by
+(year, function, dimension, exact bytes of the input vector as float64), so
+optimizers that revisit points (Nelder-Mead, pattern search, ...) do not pay
+for the evaluation again. The cache is bounded by a number of entries and/or
+an approximate memory size, and evicts the least recently used entries.
+Noisy functions are never cached: each of their evaluations draws new noise.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import FunctionExecutor
+from .concurrency import ConcurrencyLimit
+from .timing import PhaseTimings
+
+# Default bound on the number of cached evaluations
+DEFAULT_CACHE_ENTRIES = 100_000
+
+# Approximate memory of an entry besides its input bytes (key tuple, value, LRU links)
+ENTRY_OVERHEAD_BYTES = 200
+
+CacheKey = Tuple[int, int, int, bytes]
+
+
+@dataclass
+class CacheStats:
+    """Counters of a CachingExecutor."""
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0   # evaluations of noisy functions, never cached
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"hits={self.hits} misses={self.misses} hit_rate={self.hit_rate:.1%} "
+                f"bypassed={self.bypassed} evictions={self.evictions} "
+                f"entries={self.entries} bytes={self.bytes}")
+
+
+def noisy_functions(metadata_path: Path) -> List[int]:
+    """IDs of the functions marked "noisy" in a meta_{year}.json file."""
+    with open(metadata_path, "r") as f:
+        metadata = json.load(f)
+    return sorted(int(key[1:]) for key, info in metadata.get("functions", {}).items()
+                  if info.get("noisy", False))
+
+
+class CachingExecutor(FunctionExecutor):
+    """Memoizes another executor's evaluations with LRU eviction."""
+
+    def __init__(self, executor: FunctionExecutor, year: int,
+                 noisy: Iterable[int] = (),
+                 max_entries: Optional[int] = DEFAULT_CACHE_ENTRIES,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            executor: The executor whose results are cached
+            year: CEC year of the executor (part of the cache key)
+            noisy: IDs of the noisy functions, which are never cached
+            max_entries: Maximum number of cached evaluations (None: unbounded)
+            max_bytes: Maximum approximate memory of the cache (None: unbounded)
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"max_bytes must be at least 1, got {max_bytes}")
+        self.executor = executor
+        self.year = year
+        self.noisy = frozenset(noisy)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, float]" = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_metadata(cls, executor: FunctionExecutor, metadata_path: Path,
+                      **kwargs) -> "CachingExecutor":
+        """Wrap an executor, taking the year and the noisy functions from meta_{year}.json."""
+        with open(metadata_path, "r") as f:
+            year = int(json.load(f)["year"])
+        return cls(executor, year, noisy_functions(metadata_path), **kwargs)
+
+    # ------------------------------------------------------------------
+    # Delegation to the wrapped executor
+    # ------------------------------------------------------------------
+
+    @property
+    def supports_profiles(self) -> bool:
+        return self.executor.supports_profiles
+
+    @property
+    def supports_threads(self) -> bool:
+        return self.executor.supports_threads
+
+    @property
+    def timings(self) -> Optional[PhaseTimings]:
+        return self.executor.timings
+
+    @property
+    def concurrency(self) -> ConcurrencyLimit:
+        return self.executor.concurrency
+
+    def build(self) -> bool:
+        """Build the wrapped executor's implementation."""
+        return self.executor.build()
+
+    def enable_timing(self) -> PhaseTimings:
+        """Record the wrapped executor's phase timings (cache hits take no time)."""
+        return self.executor.enable_timing()
+
+    def source_fingerprint(self, func_id: int) -> str:
+        return self.executor.source_fingerprint(func_id)
+
+    def cleanup(self) -> None:
+        """Clean up the wrapped executor; the cached results are kept."""
+        self.executor.cleanup()
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit/miss statistics and the cache size."""
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def clear(self) -> None:
+        """Drop every cached evaluation (the statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = 0
+            self._stats.bytes = 0
+
+    def _key(self, func_id: int, dimension: int, vector: Sequence[float]) -> CacheKey:
+        """Cache key: the exact float64 bytes of the vector (so -0.0 and 0.0 differ)."""
+        return (self.year, func_id, dimension,
+                np.ascontiguousarray(vector, dtype=np.float64).tobytes())
+
+    def _lookup(self, keys: List[CacheKey]) -> Dict[CacheKey, float]:
+        """Cached values of the keys that are present, marking them recently used."""
+        found = {}
+        missed = set()
+        with self._lock:
+            for key in keys:
+                # Repeats within a batch are evaluated once: they count as hits
+                if key in found or key in missed:
+                    self._stats.hits += 1
+                    continue
+                value = self._entries.get(key)
+                if value is None:
+                    self._stats.misses += 1
+                    missed.add(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    found[key] = value
+        return found
+
+    def _store(self, items: Iterable[Tuple[CacheKey, float]]) -> None:
+        """Insert evaluations, evicting the least recently used beyond the bounds."""
+        with self._lock:
+            for key, value in items:
+                if key not in self._entries:
+                    self._stats.entries += 1
+                    self._stats.bytes += len(key[3]) + ENTRY_OVERHEAD_BYTES
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while self._entries and self._over_bounds():
+                key, _ = self._entries.popitem(last=False)
+                self._stats.entries -= 1
+                self._stats.bytes -= len(key[3]) + ENTRY_OVERHEAD_BYTES
+                self._stats.evictions += 1
+
+    def _over_bounds(self) -> bool:
+        return ((self.max_entries is not None and self._stats.entries > self.max_entries)
+                or (self.max_bytes is not None and self._stats.bytes > self.max_bytes))
+
+    def _bypass(self, count: int) -> None:
+        with self._lock:
+            self._stats.bypassed += count
+
+    def _plan(self, func_id: int, dimension: int, vectors: Sequence[Sequence[float]]):
+        """Keys of the vectors, the cached values, and the distinct vectors to evaluate."""
+        keys = [self._key(func_id, dimension, vector) for vector in vectors]
+        found = self._lookup(keys)
+        missing: Dict[CacheKey, Sequence[float]] = {}
+        for key, vector in zip(keys, vectors):
+            if key not in found and key not in missing:
+                missing[key] = vector
+        return keys, found, missing
+
+    def _complete(self, keys: List[CacheKey], found: Dict[CacheKey, float],
+                  missing: Dict[CacheKey, Sequence[float]], values: List[float]) -> List[float]:
+        """Cache the new values and assemble the results in the order of the vectors.
+
+        Float subclasses (e.g. EvaluationResult with its constraint values) are
+        cached as they are.
+        """
+        computed = dict(zip(missing, (value if isinstance(value, float) else float(value)
+                                      for value in values)))
+        self._store(computed.items())
+        found.update(computed)
+        return [found[key] for key in keys]
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Evaluate a vector, from the cache when it was evaluated before."""
+        if func_id in self.noisy:
+            self._bypass(1)
+            return self.executor.run(func_id, dimension, input_vector)
+        keys, found, missing = self._plan(func_id, dimension, [input_vector])
+        values = [self.executor.run(func_id, dimension, input_vector)] if missing else []
+        return self._complete(keys, found, missing, values)[0]
+
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Evaluate vectors, passing only the distinct uncached ones to the wrapped executor."""
+        if func_id in self.noisy:
+            self._bypass(len(vectors))
+            return self.executor.run_batch(func_id, dimension, vectors)
+        keys, found, missing = self._plan(func_id, dimension, vectors)
+        values = self.executor.run_batch(func_id, dimension, list(missing.values())) if missing else []
+        return self._complete(keys, found, missing, values)
+
+    async def arun(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Asynchronous counterpart of run()."""
+        if func_id in self.noisy:
+            self._bypass(1)
+            return await self.executor.arun(func_id, dimension, input_vector)
+        keys, found, missing = self._plan(func_id, dimension, [input_vector])
+        values = [await self.executor.arun(func_id, dimension, input_vector)] if missing else []
+        return self._complete(keys, found, missing, values)[0]
+
+    async def arun_batch(self, func_id: int, dimension: int,
+                         vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Asynchronous counterpart of run_batch()."""
+        if func_id in self.noisy:
+            self._bypass(len(vectors))
+            return await self.executor.arun_batch(func_id, dimension, vectors)
+        keys, found, missing = self._plan(func_id, dimension, vectors)
+        values = (await self.executor.arun_batch(func_id, dimension, list(missing.values()))
+                  if missing else [])
+        return self._complete(keys, found, missing, values)
@@ -7,61 +7,258 @@ Handles execution of CEC2005 benchmark functions via the C implementation.
 import os
 import subprocess
 import tempfile
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from .base import FunctionExecutor
+from .build import BuildCache, get_build_profile
+from .concurrency import run_process
+from .fingerprint import SourceGraph, module_fingerprint
+from .timing import C_TIMING_ENV, parse_c_timings, timed
+
+
+# Environment variables of the C code selecting the traced functions and the
+# directory of their trace files, in builds with TRACE_CPPFLAGS (CEC2005-C/trace.h)
+C_TRACE_ENV = "CEC2005_TRACE"
+C_TRACE_DIR_ENV = "CEC2005_TRACE_DIR"
+TRACE_CPPFLAGS = "-DCEC2005_TRACE"
+
+
+def trace_spec(functions: Union[str, Sequence[int], None]) -> str:
+    """The C code's list of traced functions: "3,15", "all", or "" for none."""
+    if functions is None:
+        return ""
+    if isinstance(functions, str):
+        return functions
+    return ",".join(str(int(func_id)) for func_id in functions)
 
 
 class CEC2005Executor(FunctionExecutor):
     """Executor for CEC2005 C implementation."""
     
-    def __init__(self, implementation_dir: Path):
+    supports_profiles = True
+    
+    # C functions that belong to a single benchmark function (initialize_f21,
+    # calc_benchmark_f21, calc_benchmark_norm_f21)
+    function_symbols = r"_f(\d+)$"
+    
+    # Files of a build kept in the build cache
+    artifacts = ("main", "libcec2005.so")
+    
+    def __init__(self, implementation_dir: Path, profile: Optional[str] = None):
         self.implementation_dir = implementation_dir
+        self.profile = get_build_profile(profile)
+        self.build_cache = BuildCache(implementation_dir, self.artifacts)
+        self.artifact_dir: Optional[Path] = None
         self.executable = "./main"
+        self._source_graph: Optional[SourceGraph] = None
+        # (functions, directory) set by set_trace; None leaves the environment's
+        self.trace: Optional[Tuple[str, str]] = None
         
     def build(self) -> bool:
-        """Build the C implementation using make."""
+        """Build the C implementation with the executor's profile.
+        
+        The build is skipped when the sources, flags and compiler match a
+        build already in the cache. The constant pack is not built: it is
+        optional ("make pack"), and the text files are parsed without it.
+        """
         try:
-            subprocess.run(
-                ["make", "clean"], 
-                cwd=self.implementation_dir, 
-                capture_output=True, 
-                check=False
-            )
-            result = subprocess.run(
-                ["make"], 
-                cwd=self.implementation_dir, 
-                capture_output=True, 
-                check=True
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError:
+            self.artifact_dir = self.build_cache.build(self.profile)
+            self.executable = str((self.artifact_dir / "main").resolve())
+            return True
+        except (subprocess.CalledProcessError, OSError):
             return False
     
+    def set_trace(self, functions: Union[str, Sequence[int], None],
+                  directory: Optional[Path] = None) -> None:
+        """Trace the intermediate vectors of the evaluations of some functions.
+        
+        Each evaluation of a traced function appends its input, shifted and
+        rotated vectors, component values, weights and value to
+        <directory>/fNN_D<dimension>.trace. The profile must compile the trace
+        in (the "trace" profile); other builds cost nothing for it.
+        
+        Args:
+            functions: Function IDs, "all", or None to trace nothing
+            directory: Existing directory of the trace files (default: the current directory)
+        
+        Raises:
+            ValueError: If functions are traced with a profile without the trace
+        """
+        spec = trace_spec(functions)
+        if spec and TRACE_CPPFLAGS not in (self.profile.cppflags or ""):
+            raise ValueError(f"The '{self.profile.name}' profile does not compile the trace in; "
+                             f"use the 'trace' profile")
+        self.trace = (spec, str(Path(directory or ".").resolve()))
+    
+    def source_fingerprint(self, func_id: int) -> str:
+        """Fingerprint of the C code reachable from the function, the build flags and the compiler."""
+        if self._source_graph is None:
+            self._source_graph = SourceGraph(self.implementation_dir)
+        return self._source_graph.function_fingerprint(func_id, self.function_symbols, [
+            module_fingerprint(type(self)),
+            f"OPTFLAGS={self.profile.optflags}",
+            f"CPPFLAGS={self.profile.cppflags}",
+            self.build_cache.compiler_version()
+        ])
+    
     def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
         """Execute a CEC2005 function via C binary."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            for val in input_vector:
-                f.write(f"{val}\n")
-            temp_file = f.name
+        with timed(self.timings, func_id, dimension, "write_input"):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+                for val in input_vector:
+                    f.write(f"{val}\n")
+                temp_file = f.name
         
         try:
-            result = subprocess.run(
-                [self.executable, str(func_id), str(dimension), temp_file],
-                capture_output=True,
-                text=True,
-                cwd=str(self.implementation_dir)
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Function execution failed: {result.stderr}")
+            output = self._run_process(func_id, dimension, [temp_file])
             
-            return self._parse_output(result.stdout)
+            with timed(self.timings, func_id, dimension, "parse_output"):
+                return self._parse_output(output)
             
         finally:
             os.unlink(temp_file)
     
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a CEC2005 function on many vectors with one C process.
+        
+        The vectors are streamed to the binary's batch mode on stdin, so the
+        constants are loaded and normalized only once for the whole batch.
+        """
+        if len(vectors) == 0:
+            return []
+        
+        input_text = self._batch_input(func_id, dimension, vectors)
+        output = self._run_process(func_id, dimension, ["--batch", "-"], input_text)
+        return self._batch_values(func_id, dimension, output, len(vectors))
+    
+    def norm_constants(self, func_id: int, dimension: int) -> List[float]:
+        """Normalization constants of a composite function (15-25) as the C code
+        computes them now, without the cache ("main --norm", what "make norm" writes)."""
+        result = subprocess.run(
+            [self.executable, str(func_id), str(dimension), "--norm"],
+            capture_output=True,
+            text=True,
+            cwd=str(self.implementation_dir)
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Normalization failed: {result.stderr}")
+        return [float(value.replace("E", "e")) for value in result.stdout.split()]
+    
+    async def arun(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Execute a CEC2005 function via an asyncio subprocess, the vector on stdin."""
+        with timed(self.timings, func_id, dimension, "write_input"):
+            input_text = "".join(f"{val}\n" for val in input_vector)
+        
+        output = await self._arun_process(func_id, dimension, ["-"], input_text)
+        
+        with timed(self.timings, func_id, dimension, "parse_output"):
+            return self._parse_output(output)
+    
+    async def arun_batch(self, func_id: int, dimension: int,
+                         vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a CEC2005 function on many vectors with one asyncio subprocess."""
+        if len(vectors) == 0:
+            return []
+        
+        input_text = self._batch_input(func_id, dimension, vectors)
+        output = await self._arun_process(func_id, dimension, ["--batch", "-"], input_text)
+        return self._batch_values(func_id, dimension, output, len(vectors))
+    
+    def _batch_input(self, func_id: int, dimension: int,
+                     vectors: Sequence[Sequence[float]]) -> str:
+        """Format vectors as batch mode input, one vector per line."""
+        with timed(self.timings, func_id, dimension, "write_input"):
+            lines = []
+            for vector in vectors:
+                if len(vector) != dimension:
+                    raise ValueError(
+                        f"Expected vectors of length {dimension}, got {len(vector)}"
+                    )
+                lines.append(" ".join(str(val) for val in vector))
+            return "\n".join(lines) + "\n"
+    
+    def _batch_values(self, func_id: int, dimension: int, output: str,
+                      count: int) -> List[float]:
+        """Parse the objective values of a batch and check there is one per vector."""
+        with timed(self.timings, func_id, dimension, "parse_output"):
+            values = self._parse_batch_output(output)
+        if len(values) != count:
+            raise ValueError(
+                f"Expected {count} objective values, got {len(values)}"
+            )
+        return values
+    
+    def _process_env(self) -> Optional[Dict[str, str]]:
+        """Environment of the C binary: asks for its phase timings when timing is
+        enabled, and for the trace selected by set_trace."""
+        env = {}
+        if self.timings is not None:
+            env[C_TIMING_ENV] = "1"
+        if self.trace is not None:
+            env[C_TRACE_ENV], env[C_TRACE_DIR_ENV] = self.trace
+        return dict(os.environ, **env) if env else None
+    
+    def _run_process(self, func_id: int, dimension: int, args: List[str],
+                     input_text: Optional[str] = None) -> str:
+        """Run the C binary on a function and dimension and return its output.
+        
+        With timing enabled, the binary reports the wall-clock time of its
+        initialize, normalize and evaluate phases on stderr; the remainder of
+        the process's wall-clock time is recorded as the spawn phase.
+        """
+        start = time.perf_counter()
+        result = subprocess.run(
+            [self.executable, str(func_id), str(dimension)] + args,
+            input=input_text,
+            capture_output=True,
+            text=True,
+            cwd=str(self.implementation_dir),
+            env=self._process_env()
+        )
+        elapsed = time.perf_counter() - start
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Function execution failed: {result.stderr}")
+        
+        self._record_process_timings(func_id, dimension, elapsed, result.stderr)
+        return result.stdout
+    
+    async def _arun_process(self, func_id: int, dimension: int, args: List[str],
+                            input_text: str) -> str:
+        """Asynchronous counterpart of _run_process, bounded by the executor's concurrency limit.
+        
+        The spawn phase does not include the time spent waiting for a slot.
+        """
+        async with self.concurrency.slot():
+            start = time.perf_counter()
+            result = await run_process(
+                [self.executable, str(func_id), str(dimension)] + args,
+                self.implementation_dir,
+                input_text,
+                self._process_env()
+            )
+            elapsed = time.perf_counter() - start
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Function execution failed: {result.stderr}")
+        
+        self._record_process_timings(func_id, dimension, elapsed, result.stderr)
+        return result.stdout
+    
+    def _record_process_timings(self, func_id: int, dimension: int,
+                                elapsed: float, stderr: str) -> None:
+        """Record the binary's phase timings and the rest of its wall-clock time as spawn."""
+        if self.timings is None:
+            return
+        c_timings = parse_c_timings(stderr)
+        self.timings.add(func_id, dimension, "spawn",
+                         max(elapsed - sum(c_timings.values()), 0.0))
+        for phase, seconds in c_timings.items():
+            self.timings.add(func_id, dimension, phase, seconds)
+    
     def _parse_output(self, output: str) -> float:
         """Parse the objective value from C program output."""
         for line in output.strip().split('\n'):
@@ -70,6 +267,15 @@ class CEC2005Executor(FunctionExecutor):
                 return float(value_str.replace("E", "e"))
         raise ValueError(f"Could not parse output: {output}")
     
+    def _parse_batch_output(self, output: str) -> List[float]:
+        """Parse every objective value from batch mode output, in order."""
+        values = []
+        for line in output.strip().split('\n'):
+            if line.startswith("Objective value = "):
+                value_str = line.split("=")[1].strip()
+                values.append(float(value_str.replace("E", "e")))
+        return values
+    
     def cleanup(self) -> None:
         """No cleanup needed for C implementation."""
         pass
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+CEC2005 Shared Library Executor
+
+Evaluates CEC2005 benchmark functions in-process through libcec2005.so,
+without spawning a subprocess or parsing text output. Large batches can be
+split across OpenMP threads that share the loaded constants.
+"""
+
+import asyncio
+import ctypes
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .cec2005 import C_TRACE_DIR_ENV, C_TRACE_ENV, CEC2005Executor
+from .timing import timed
+
+
+@dataclass
+class _LibraryState:
+    """What a loaded library currently holds.
+
+    The library's state (the initialized function and dimension, the thread
+    count, the trace) lives in C globals, and every ctypes.CDLL of the same
+    path shares them: the executors of a process share one _LibraryState per
+    library and apply their own settings under its lock before evaluating.
+    """
+    lib: ctypes.CDLL
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    current: Optional[Tuple[int, int]] = None
+    threads: Optional[int] = None
+    trace: Optional[Tuple[str, str]] = None   # None: configured from the environment
+
+
+# Loaded libraries by resolved path
+_LIBRARIES: Dict[Path, _LibraryState] = {}
+_LIBRARIES_LOCK = threading.Lock()
+
+
+class CEC2005LibraryExecutor(CEC2005Executor):
+    """Executor for the CEC2005 C implementation loaded as a shared library.
+
+    The library holds the constants of one (function, dimension) pair at a
+    time, for the whole process; it is re-initialized only when a different
+    pair is requested, by this or another executor of the same library.
+    """
+
+    library_name = "libcec2005.so"
+    supports_threads = True
+
+    def __init__(self, implementation_dir: Path, profile: Optional[str] = None,
+                 threads: int = 1):
+        """
+        Args:
+            implementation_dir: Path to the implementation directory
+            profile: Build profile name (default: the Makefile's flags)
+            threads: Threads a batch is split across (1: serial, 0: the OpenMP
+                default, i.e. OMP_NUM_THREADS or one per core)
+        """
+        super().__init__(implementation_dir, profile)
+        if threads < 0:
+            raise ValueError(f"threads must be at least 0, got {threads}")
+        self.threads = threads
+        self.library_path = Path(implementation_dir) / self.library_name
+        self._state: Optional[_LibraryState] = None
+
+    def build(self) -> bool:
+        """Build the implementation and use the library of the cached build."""
+        if not super().build():
+            return False
+        self.library_path = self.artifact_dir / self.library_name
+        return True
+
+    def _load_library(self) -> _LibraryState:
+        """The state of the shared library, loading it and declaring its entry points
+        the first time the process uses it."""
+        if self._state is not None:
+            return self._state
+
+        if not self.library_path.exists():
+            raise RuntimeError(
+                f"Shared library not found: {self.library_path} (run build() first)"
+            )
+
+        path = self.library_path.resolve()
+        with _LIBRARIES_LOCK:
+            state = _LIBRARIES.get(path)
+            if state is None:
+                state = _LibraryState(self._open_library(path))
+                _LIBRARIES[path] = state
+        self._state = state
+        return state
+
+    def _open_library(self, path: Path) -> ctypes.CDLL:
+        """Load the shared library at path and declare its entry points."""
+        lib = ctypes.CDLL(str(path))
+        lib.cec2005_set_input_dir.argtypes = [ctypes.c_char_p]
+        lib.cec2005_set_input_dir.restype = ctypes.c_int
+        lib.cec2005_init.argtypes = [ctypes.c_int, ctypes.c_int]
+        lib.cec2005_init.restype = ctypes.c_int
+        lib.cec2005_evaluate.argtypes = [
+            ctypes.POINTER(ctypes.c_double), ctypes.c_int, ctypes.POINTER(ctypes.c_double)
+        ]
+        lib.cec2005_evaluate.restype = ctypes.c_int
+        lib.cec2005_init_times.argtypes = [
+            ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double)
+        ]
+        lib.cec2005_init_times.restype = None
+        lib.cec2005_set_threads.argtypes = [ctypes.c_int]
+        lib.cec2005_set_threads.restype = ctypes.c_int
+        lib.cec2005_threads.argtypes = []
+        lib.cec2005_threads.restype = ctypes.c_int
+        lib.cec2005_landscape.argtypes = [
+            ctypes.c_double, ctypes.c_int, ctypes.POINTER(ctypes.c_double)
+        ]
+        lib.cec2005_landscape.restype = ctypes.c_int
+        lib.cec2005_set_trace.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+        lib.cec2005_set_trace.restype = ctypes.c_int
+        lib.cec2005_free.argtypes = []
+        lib.cec2005_free.restype = None
+
+        input_dir = (Path(self.implementation_dir) / "input_data").resolve()
+        if lib.cec2005_set_input_dir(str(input_dir).encode()) != 0:
+            raise RuntimeError(f"Could not set input data directory: {input_dir}")
+        return lib
+
+    def set_threads(self, threads: int) -> None:
+        """Change the number of threads a batch is split across (see __init__)."""
+        if threads < 0:
+            raise ValueError(f"threads must be at least 0, got {threads}")
+        self.threads = threads
+
+    def _apply_settings(self, state: _LibraryState) -> ctypes.CDLL:
+        """Pass this executor's thread count and trace to the library (under state.lock).
+
+        A trace selected by set_trace reopens the current function's trace file
+        when it is first passed.
+        """
+        lib = state.lib
+        if state.threads != self.threads:
+            lib.cec2005_set_threads(self.threads)
+            state.threads = self.threads
+        trace = self.trace
+        if trace is None and state.trace is not None:
+            # Another executor configured a trace: restore the environment's
+            trace = (os.environ.get(C_TRACE_ENV, ""), os.environ.get(C_TRACE_DIR_ENV) or ".")
+        if trace is not None and trace != state.trace:
+            functions, directory = trace
+            if lib.cec2005_set_trace(functions.encode(), directory.encode()) != 0:
+                raise RuntimeError(f"Could not trace functions '{functions}' to {directory}")
+            state.trace = trace
+        return lib
+
+    def effective_threads(self) -> int:
+        """Threads a large batch is actually split across (1 for a build without OpenMP)."""
+        state = self._load_library()
+        with state.lock:
+            return self._apply_settings(state).cec2005_threads()
+
+    def _ensure_initialized(self, state: _LibraryState, func_id: int, dimension: int) -> ctypes.CDLL:
+        """Initialize the library for a function/dimension unless it holds them (under state.lock)."""
+        lib = self._apply_settings(state)
+        if state.current != (func_id, dimension):
+            state.current = None
+            if lib.cec2005_init(func_id, dimension) != 0:
+                raise RuntimeError(
+                    f"Failed to initialize F{func_id} with dimension {dimension}"
+                )
+            state.current = (func_id, dimension)
+            if self.timings is not None:
+                initialize_seconds = ctypes.c_double()
+                normalize_seconds = ctypes.c_double()
+                lib.cec2005_init_times(ctypes.byref(initialize_seconds),
+                                       ctypes.byref(normalize_seconds))
+                self.timings.add(func_id, dimension, "initialize", initialize_seconds.value)
+                if func_id >= 15:
+                    self.timings.add(func_id, dimension, "normalize", normalize_seconds.value)
+        return lib
+
+    def evaluate(self, func_id: int, dimension: int, population: np.ndarray) -> np.ndarray:
+        """Evaluate an (N, D) array of vectors and return an (N,) array of values."""
+        x = np.ascontiguousarray(population, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if x.ndim != 2 or x.shape[1] != dimension:
+            raise ValueError(
+                f"Expected an array of shape (N, {dimension}), got {x.shape}"
+            )
+
+        values = np.empty(x.shape[0], dtype=np.float64)
+        if x.shape[0] == 0:
+            return values
+
+        state = self._load_library()
+        with state.lock:
+            lib = self._ensure_initialized(state, func_id, dimension)
+            with timed(self.timings, func_id, dimension, "evaluate"):
+                status = lib.cec2005_evaluate(
+                    x.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+                    x.shape[0],
+                    values.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+                )
+
+        if status != 0:
+            raise RuntimeError(f"Function evaluation failed for F{func_id}")
+        return values
+
+    def landscape(self, func_id: int, bound: float, density: int,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Evaluate a function at D=2 on the density x density grid over [-bound, bound]^2.
+
+        Args:
+            func_id: Function ID
+            bound: Half-width of the square
+            density: Grid points per axis (numpy.linspace(-bound, bound, density))
+            out: Optional C-contiguous (density, density) float64 array to fill,
+                e.g. a memory-mapped file
+
+        Returns:
+            (density, density) values; row i is at x2 = point i, column j at x1 = point j
+        """
+        if out is None:
+            out = np.empty((density, density), dtype=np.float64)
+        if out.shape != (density, density) or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError(f"Expected a C-contiguous float64 array of shape ({density}, {density})")
+
+        state = self._load_library()
+        with state.lock:
+            lib = self._ensure_initialized(state, func_id, 2)
+            with timed(self.timings, func_id, 2, "evaluate"):
+                status = lib.cec2005_landscape(
+                    float(bound), density, out.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+                )
+        if status != 0:
+            raise RuntimeError(f"Landscape evaluation failed for F{func_id}")
+        return out
+
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Execute a CEC2005 function in-process."""
+        return float(self.evaluate(func_id, dimension, np.asarray([input_vector]))[0])
+
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a CEC2005 function in-process on many vectors."""
+        if len(vectors) == 0:
+            return []
+        return self.evaluate(func_id, dimension, np.asarray(vectors)).tolist()
+
+    async def arun(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Execute a CEC2005 function in-process, in the event loop's default thread pool
+        (not through the subprocess of CEC2005Executor.arun)."""
+        async with self.concurrency.slot():
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.run, func_id, dimension, input_vector
+            )
+
+    async def arun_batch(self, func_id: int, dimension: int,
+                         vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a CEC2005 function in-process on many vectors, in the event loop's
+        default thread pool."""
+        if len(vectors) == 0:
+            return []
+        async with self.concurrency.slot():
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.run_batch, func_id, dimension, vectors
+            )
+
+    def cleanup(self) -> None:
+        """Release the constants held by the library (the next evaluation of any
+        executor of the library loads its own again)."""
+        state = self._state
+        if state is not None:
+            with state.lock:
+                state.lib.cec2005_free()
+                state.current = None
@@ -0,0 +1,538 @@
+"""
+CEC2005 NumPy Executor
+
+Pure NumPy port of the CEC2005 C implementation that evaluates a whole
+(N, D) population per call. Each function mirrors its C counterpart in
+CEC2005-C (def1.c basic functions, def2.c transform/calc_weight, def3.c
+initialization, def4.c benchmark and normalization functions); rotations are
+applied to the whole population as one matrix product.
+
+Constants are read with the same flat-stream semantics as the C code, so
+quirks such as F5 reading A right after the first D shift values, or F12
+reading alpha twice, are reproduced. The normalization constants of the
+composite functions are taken from the cache written by ``make norm``
+(input_data/fNN/norm_D*.txt) when it is up to date, as in the C code.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import FunctionExecutor
+from .constants import load_constant_values, load_derived_values
+from .timing import timed
+
+
+# Constant of the composite functions' normalization (C in allocate_memory)
+NORMALIZATION_C = 2000.0
+
+# Cached normalization constants of a composite function, written by "make norm"
+NORM_FILE_PATTERN = "f{func_id:02d}/norm_D{dim}.txt"
+
+# Environment variable disabling the normalization cache (as in the C code)
+NORM_CACHE_DISABLE_ENV = "CEC2005_NO_NORM_CACHE"
+
+
+# ============================================================================
+# Basic functions (def1.c), all operating on an (N, D) array of rows
+# ============================================================================
+
+
+def calc_sphere(z: np.ndarray) -> np.ndarray:
+    """Sphere function."""
+    return np.sum(z * z, axis=1)
+
+
+def calc_schwefel(z: np.ndarray) -> np.ndarray:
+    """Schwefel's problem 1.2."""
+    partial = np.cumsum(z, axis=1)
+    return np.sum(partial * partial, axis=1)
+
+
+def calc_rosenbrock(z: np.ndarray) -> np.ndarray:
+    """Rosenbrock's function."""
+    head, tail = z[:, :-1], z[:, 1:]
+    return np.sum(100.0 * (head * head - tail) ** 2 + (head - 1.0) ** 2, axis=1)
+
+
+def calc_rastrigin(z: np.ndarray) -> np.ndarray:
+    """Rastrigin's function."""
+    return np.sum(z * z - 10.0 * np.cos(2.0 * np.pi * z) + 10.0, axis=1)
+
+
+def calc_weierstrass(z: np.ndarray) -> np.ndarray:
+    """Weierstrass function (a = 0.5, b = 3, k_max = 20)."""
+    k = np.arange(21)
+    a_k = 0.5 ** k
+    b_k = 3.0 ** k
+    terms = a_k * np.cos(2.0 * np.pi * b_k * (z[:, :, np.newaxis] + 0.5))
+    return np.sum(terms, axis=(1, 2))
+
+
+def calc_griewank(z: np.ndarray) -> np.ndarray:
+    """Griewank's function."""
+    divisors = np.sqrt(1.0 + np.arange(z.shape[1]))
+    return 1.0 + np.sum(z * z, axis=1) / 4000.0 - np.prod(np.cos(z / divisors), axis=1)
+
+
+def calc_ackley(z: np.ndarray) -> np.ndarray:
+    """Ackley's function."""
+    dimension = z.shape[1]
+    sum1 = -0.2 * np.sqrt(np.sum(z * z, axis=1) / dimension)
+    sum2 = np.sum(np.cos(2.0 * np.pi * z), axis=1) / dimension
+    return 20.0 + np.e - 20.0 * np.exp(sum1) - np.exp(sum2)
+
+
+def calc_elliptic(z: np.ndarray) -> np.ndarray:
+    """High conditioned elliptic function (F3 and F24/F25 component 9)."""
+    dimension = z.shape[1]
+    scale = 1.0e6 ** (np.arange(dimension) / (dimension - 1.0))
+    return np.sum(z * z * scale, axis=1)
+
+
+def _schaffer_f6(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Schaffer's F6 function of two variables."""
+    square = x * x + y * y
+    temp1 = np.sin(np.sqrt(square)) ** 2
+    temp2 = 1.0 + 0.001 * square
+    return 0.5 + (temp1 - 0.5) / (temp2 * temp2)
+
+
+def calc_expanded_schaffer(z: np.ndarray) -> np.ndarray:
+    """Expanded Schaffer's F6 function (F14), pairs wrap around to the first variable."""
+    return np.sum(_schaffer_f6(z, np.roll(z, -1, axis=1)), axis=1)
+
+
+def calc_griewank_rosenbrock(z: np.ndarray) -> np.ndarray:
+    """Expanded Griewank's plus Rosenbrock's function (F13), pairs wrap around."""
+    nxt = np.roll(z, -1, axis=1)
+    temp = 100.0 * (z * z - nxt) ** 2 + (z - 1.0) ** 2
+    return np.sum(temp * temp / 4000.0 - np.cos(temp) + 1.0, axis=1)
+
+
+def round_off(x: np.ndarray) -> np.ndarray:
+    """Round values to the nearest multiple of 0.5 the way the C code does.
+
+    2x is truncated to an integer; a remainder of 0.5 or more rounds away
+    from zero.
+    """
+    res = 2.0 * x
+    a = np.trunc(res)
+    rounded = np.where(res <= 0.0, (a - 1.0) / 2.0, (a + 1.0) / 2.0)
+    return np.where(np.abs(res - a) < 0.5, a / 2.0, rounded)
+
+
+def nc_expanded_schaffer(z: np.ndarray) -> np.ndarray:
+    """Non-continuous expanded Schaffer's F6 function (nc_schaffer)."""
+    t = np.where(np.abs(z) >= 0.5, round_off(z), z)
+    return np.sum(_schaffer_f6(t, np.roll(t, -1, axis=1)), axis=1)
+
+
+def nc_rastrigin(z: np.ndarray) -> np.ndarray:
+    """Non-continuous Rastrigin's function."""
+    return calc_rastrigin(np.where(np.abs(z) >= 0.5, round_off(z), z))
+
+
+def calc_weierstrass_offset(z: np.ndarray) -> np.ndarray:
+    """Weierstrass function minus its value at the origin (F11, composites)."""
+    return calc_weierstrass(z) - calc_weierstrass(np.zeros((1, z.shape[1])))[0]
+
+
+# ============================================================================
+# Function definitions (def3.c / def4.c)
+# ============================================================================
+
+
+@dataclass
+class CompositionSpec:
+    """Static definition of a composite function (F15-F25)."""
+    components: Tuple[Callable[[np.ndarray], np.ndarray], ...]
+    shift_file: str
+    rotation_file: Optional[str]
+    sigma: Tuple[float, ...]
+    lambdas: Tuple[float, ...]
+    global_bias: float
+    noisy_component: Optional[int] = None
+    last_shift_zero: bool = False
+    odd_shift_value: Optional[float] = None
+    round_input: bool = False
+    output_noise: float = 0.0
+
+
+_F15_COMPONENTS = (calc_rastrigin, calc_rastrigin, calc_weierstrass_offset, calc_weierstrass_offset,
+                   calc_griewank, calc_griewank, calc_ackley, calc_ackley, calc_sphere, calc_sphere)
+_F15_LAMBDAS = (1.0, 1.0, 10.0, 10.0, 1.0 / 12.0, 1.0 / 12.0, 5.0 / 32.0, 5.0 / 32.0,
+                1.0 / 20.0, 1.0 / 20.0)
+
+_F18_COMPONENTS = (calc_ackley, calc_ackley, calc_rastrigin, calc_rastrigin, calc_sphere, calc_sphere,
+                   calc_weierstrass_offset, calc_weierstrass_offset, calc_griewank, calc_griewank)
+_F18_SIGMA = (1.0, 2.0, 1.5, 1.5, 1.0, 1.0, 1.5, 1.5, 2.0, 2.0)
+_F18_LAMBDAS = (5.0 / 16.0, 5.0 / 32.0, 2.0, 1.0, 1.0 / 10.0, 1.0 / 20.0, 20.0, 10.0,
+                1.0 / 6.0, 1.0 / 12.0)
+
+_F21_COMPONENTS = (calc_expanded_schaffer, calc_expanded_schaffer, calc_rastrigin, calc_rastrigin,
+                   calc_griewank_rosenbrock, calc_griewank_rosenbrock, calc_weierstrass_offset,
+                   calc_weierstrass_offset, calc_griewank, calc_griewank)
+_F21_SIGMA = (1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 2.0, 2.0)
+_F21_LAMBDAS = (1.0 / 4.0, 1.0 / 20.0, 5.0, 1.0, 5.0, 1.0, 50.0, 10.0, 1.0 / 8.0, 1.0 / 40.0)
+
+_F24_COMPONENTS = (calc_weierstrass_offset, calc_expanded_schaffer, calc_griewank_rosenbrock,
+                   calc_ackley, calc_rastrigin, calc_griewank, nc_expanded_schaffer, nc_rastrigin,
+                   calc_elliptic, calc_sphere)
+_F24_LAMBDAS = (10.0, 1.0 / 4.0, 1.0, 5.0 / 32.0, 1.0, 1.0 / 20.0, 1.0 / 10.0, 1.0,
+                1.0 / 20.0, 1.0 / 20.0)
+
+COMPOSITIONS: Dict[int, CompositionSpec] = {
+    15: CompositionSpec(_F15_COMPONENTS, "f15/shift_D50.txt", None, (1.0,) * 10, _F15_LAMBDAS, 120.0),
+    16: CompositionSpec(_F15_COMPONENTS, "f15/shift_D50.txt", "f16/rot_D{dim}.txt",
+                        (1.0,) * 10, _F15_LAMBDAS, 120.0),
+    17: CompositionSpec(_F15_COMPONENTS, "f15/shift_D50.txt", "f16/rot_D{dim}.txt",
+                        (1.0,) * 10, _F15_LAMBDAS, 120.0, output_noise=0.2),
+    18: CompositionSpec(_F18_COMPONENTS, "f18/shift_D50.txt", "f18/rot_D{dim}.txt",
+                        _F18_SIGMA, _F18_LAMBDAS, 10.0, last_shift_zero=True),
+    19: CompositionSpec(_F18_COMPONENTS, "f18/shift_D50.txt", "f18/rot_D{dim}.txt",
+                        (0.1,) + _F18_SIGMA[1:], (0.5 / 32.0,) + _F18_LAMBDAS[1:], 10.0,
+                        last_shift_zero=True),
+    20: CompositionSpec(_F18_COMPONENTS, "f18/shift_D50.txt", "f18/rot_D{dim}.txt",
+                        _F18_SIGMA, _F18_LAMBDAS, 10.0, last_shift_zero=True, odd_shift_value=5.0),
+    21: CompositionSpec(_F21_COMPONENTS, "f21/shift_D50.txt", "f21/rot_D{dim}.txt",
+                        _F21_SIGMA, _F21_LAMBDAS, 360.0),
+    22: CompositionSpec(_F21_COMPONENTS, "f21/shift_D50.txt", "f22/rot_sub_D{dim}.txt",
+                        _F21_SIGMA, _F21_LAMBDAS, 360.0),
+    23: CompositionSpec(_F21_COMPONENTS, "f21/shift_D50.txt", "f21/rot_D{dim}.txt",
+                        _F21_SIGMA, _F21_LAMBDAS, 360.0, round_input=True),
+    24: CompositionSpec(_F24_COMPONENTS, "f24/shift_D50.txt", "f24/rot_D{dim}.txt",
+                        (2.0,) * 10, _F24_LAMBDAS, 260.0, noisy_component=9),
+    25: CompositionSpec(_F24_COMPONENTS, "f24/shift_D50.txt", "f24/rot_D{dim}.txt",
+                        (2.0,) * 10, _F24_LAMBDAS, 260.0, noisy_component=9),
+}
+
+# F1-F14: (shift file, rotation file, basic function, bias)
+SINGLE_FUNCTIONS: Dict[int, Tuple[Optional[str], Optional[str],
+                                  Optional[Callable[[np.ndarray], np.ndarray]], float]] = {
+    1: ("f01/shift_D50.txt", None, calc_sphere, -450.0),
+    2: ("f02/shift_D50.txt", None, calc_schwefel, -450.0),
+    3: ("f03/shift_D50.txt", "f03/rot_D{dim}.txt", calc_elliptic, -450.0),
+    4: ("f02/shift_D50.txt", None, calc_schwefel, -450.0),
+    5: (None, None, None, -310.0),
+    6: ("f06/shift_D50.txt", None, calc_rosenbrock, 390.0),
+    7: ("f07/shift_D50.txt", "f07/rot_D{dim}.txt", calc_griewank, -180.0),
+    8: ("f08/shift_D50.txt", "f08/rot_D{dim}.txt", calc_ackley, -140.0),
+    9: ("f09/shift_D50.txt", None, calc_rastrigin, -330.0),
+    10: ("f09/shift_D50.txt", "f10/rot_D{dim}.txt", calc_rastrigin, -330.0),
+    11: ("f11/shift_D50.txt", "f11/rot_D{dim}.txt", calc_weierstrass_offset, 90.0),
+    12: (None, None, None, -460.0),
+    13: ("f13/shift_D50.txt", None, calc_griewank_rosenbrock, -130.0),
+    14: ("f14/shift_D50.txt", "f14/rot_D{dim}.txt", calc_expanded_schaffer, -300.0),
+}
+
+
+@dataclass
+class _FunctionData:
+    """Constants of one (function, dimension) pair, as set up by initialize_fNN."""
+    shift: np.ndarray
+    rotations: List[Optional[np.ndarray]]
+    lambdas: np.ndarray
+    sigma: np.ndarray
+    bias: np.ndarray
+    norm: Optional[np.ndarray] = None
+    extra: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def transform(self, x: np.ndarray, count: int) -> np.ndarray:
+        """Shift, scale and rotate a population for component `count` (transform)."""
+        z = (x - self.shift[count]) / self.lambdas[count]
+        rotation = self.rotations[count]
+        return z if rotation is None else z @ rotation
+
+    def transform_norm(self, count: int) -> np.ndarray:
+        """Transform the vector of 5.0 values without shift (transform_norm)."""
+        z = np.full((1, self.shift.shape[1]), 5.0 / self.lambdas[count])
+        rotation = self.rotations[count]
+        return z if rotation is None else z @ rotation
+
+    def weights(self, x: np.ndarray) -> np.ndarray:
+        """Component weights of a composite function for a population (calc_weight)."""
+        dimension = x.shape[1]
+        distance = np.sum((x[:, np.newaxis, :] - self.shift[np.newaxis, :, :]) ** 2, axis=2)
+        weight = np.exp(-distance / (2.0 * dimension * self.sigma * self.sigma))
+        w_max = np.max(weight, axis=1, keepdims=True)
+        weight = np.where(weight != w_max, weight * (1.0 - w_max ** 10.0), weight)
+        total = np.sum(weight, axis=1, keepdims=True)
+        uniform = np.full_like(weight, 1.0 / weight.shape[1])
+        return np.where(total == 0.0, uniform, weight / np.where(total == 0.0, 1.0, total))
+
+
+def composition_sources(func_id: int, dimension: int) -> List[str]:
+    """Constant files a composite function's normalization is derived from."""
+    spec = COMPOSITIONS[func_id]
+    sources = [spec.shift_file]
+    if spec.rotation_file is not None:
+        sources.append(spec.rotation_file.format(dim=dimension))
+    return sources
+
+
+def compute_norm(spec: CompositionSpec, data: _FunctionData) -> np.ndarray:
+    """Compute the noiseless normalization constants (calc_benchmark_norm_fNN)."""
+    return np.array([
+        spec.components[i](data.transform_norm(i))[0] for i in range(len(spec.components))
+    ])
+
+
+def check_norm_cache(executor: "CEC2005NumpyExecutor", func_id: int, dimension: int,
+                     rtol: float = 1e-9, computed: Optional[Sequence[float]] = None,
+                     source: str = "NumPy") -> Optional[str]:
+    """Check the cached normalization constants of a function against a recomputation.
+
+    Args:
+        executor: NumPy executor loading the function's constants
+        func_id: Composite function ID (15-25)
+        dimension: Problem dimension
+        rtol: Relative tolerance of the comparison
+        computed: Freshly computed constants (default: the NumPy port's)
+        source: Name of what computed them, for the problem description
+
+    Returns:
+        The problem, or None if the cache file is present, up to date and
+        agrees with the recomputation
+    """
+    spec = COMPOSITIONS[func_id]
+    name = NORM_FILE_PATTERN.format(func_id=func_id, dim=dimension)
+    if not (executor.input_dir / name).exists():
+        return f"{name}: missing (run make norm)"
+    cached = load_derived_values(executor.input_dir, name, composition_sources(func_id, dimension))
+    if cached is None:
+        return f"{name}: older than its constant files (run make norm)"
+    if len(cached) != len(spec.components):
+        return f"{name}: {len(cached)} values, {len(spec.components)} expected"
+    if computed is None:
+        computed = compute_norm(spec, executor._initialize(func_id, dimension))
+    expected = np.asarray(computed, dtype=np.float64)
+    if not np.allclose(cached, expected, rtol=rtol, atol=0.0):
+        worst = int(np.argmax(np.abs(cached - expected) / np.abs(expected)))
+        return (f"{name}: value {worst} is {float(cached[worst])!r}, "
+                f"{source} computes {float(expected[worst])!r} (run make norm)")
+    return None
+
+
+def verify_norm_constants(implementation_dir: Path, rtol: float = 1e-9) -> List[str]:
+    """Check the cached normalization constants against a NumPy recomputation.
+
+    Returns:
+        List of problems (empty if every cache file is present, up to date and
+        agrees with the NumPy port)
+    """
+    executor = CEC2005NumpyExecutor(implementation_dir)
+    problems = []
+    for func_id in COMPOSITIONS:
+        for dimension in (2, 10, 30, 50):
+            problem = check_norm_cache(executor, func_id, dimension, rtol)
+            if problem is not None:
+                problems.append(problem)
+    return problems
+
+
+class CEC2005NumpyExecutor(FunctionExecutor):
+    """Vectorized NumPy executor for the 25 CEC2005 functions.
+
+    Constants are loaded (through the constant pack when available) and
+    normalized once per (function, dimension) pair and kept for later calls.
+    """
+
+    def __init__(self, implementation_dir: Path, seed: Optional[int] = None):
+        self.implementation_dir = Path(implementation_dir)
+        self.input_dir = self.implementation_dir / "input_data"
+        self.rng = np.random.default_rng(seed)
+        self._data: Dict[Tuple[int, int], _FunctionData] = {}
+
+    def build(self) -> bool:
+        """Nothing to compile; check that the input data is available."""
+        return self.input_dir.is_dir()
+
+    # ------------------------------------------------------------------
+    # Initialization (def3.c)
+    # ------------------------------------------------------------------
+
+    def _read(self, name: str, count: int) -> np.ndarray:
+        """Read the first `count` values of a constant file's value stream."""
+        values = load_constant_values(self.input_dir, name)
+        if len(values) < count:
+            raise ValueError(f"{name} holds {len(values)} values, {count} required")
+        return np.array(values[:count], dtype=np.float64)
+
+    def _read_rotation(self, pattern: str, dimension: int, nfunc: int) -> np.ndarray:
+        """Read nfunc rotation matrices for a dimension."""
+        name = pattern.format(dim=dimension)
+        if not (self.input_dir / name).exists():
+            raise ValueError(f"Dimension {dimension} is not supported (no {name})")
+        return self._read(name, nfunc * dimension * dimension).reshape(nfunc, dimension, dimension)
+
+    def _initialize(self, func_id: int, dimension: int) -> _FunctionData:
+        """Set up the constants of a function, mirroring initialize_fNN."""
+        if func_id in COMPOSITIONS:
+            return self._initialize_composition(func_id, dimension)
+        if func_id not in SINGLE_FUNCTIONS:
+            raise ValueError(f"Invalid function ID {func_id}")
+
+        shift_file, rotation_file, _, bias = SINGLE_FUNCTIONS[func_id]
+        data = _FunctionData(
+            shift=np.zeros((1, dimension)),
+            rotations=[None],
+            lambdas=np.ones(1),
+            sigma=np.ones(1),
+            bias=np.array([bias]),
+        )
+        if rotation_file is not None:
+            data.rotations[0] = self._read_rotation(rotation_file, dimension, 1)[0]
+        if shift_file is not None:
+            data.shift = self._read(shift_file, dimension).reshape(1, dimension)
+
+        if func_id in (6, 13):
+            data.shift -= 1.0
+        elif func_id == 8:
+            data.shift[0, 0:2 * (dimension // 2):2] = -32.0
+        elif func_id == 5:
+            values = self._read("f05/shift_D50.txt", dimension + dimension * dimension)
+            shift = values[:dimension]
+            matrix = values[dimension:].reshape(dimension, dimension)
+            shift[:(dimension + 3) // 4] = -100.0
+            shift[(3 * dimension) // 4 - 1:] = 100.0
+            data.shift = shift.reshape(1, dimension)
+            data.extra["A"] = matrix
+            data.extra["B"] = matrix @ shift
+        elif func_id == 12:
+            n2 = dimension * dimension
+            values = self._read("f12/bias_D50.txt", 2 * dimension + 2 * n2)
+            data.extra["A"] = values[dimension:dimension + n2].reshape(dimension, dimension)
+            data.extra["B"] = values[dimension + n2:dimension + 2 * n2].reshape(dimension, dimension)
+            # alpha is read a second time after B, that second read is the one used
+            data.extra["alpha"] = values[dimension + 2 * n2:]
+        return data
+
+    def _initialize_composition(self, func_id: int, dimension: int) -> _FunctionData:
+        """Set up the constants of a composite function."""
+        spec = COMPOSITIONS[func_id]
+        nfunc = len(spec.components)
+        shift = self._read(spec.shift_file, nfunc * dimension).reshape(nfunc, dimension)
+        if spec.odd_shift_value is not None:
+            shift[0, 1:2 * (dimension // 2):2] = spec.odd_shift_value
+        if spec.last_shift_zero:
+            shift[nfunc - 1] = 0.0
+
+        rotations: List[Optional[np.ndarray]] = [None] * nfunc
+        if spec.rotation_file is not None:
+            rotations = list(self._read_rotation(spec.rotation_file, dimension, nfunc))
+
+        data = _FunctionData(
+            shift=shift,
+            rotations=rotations,
+            lambdas=np.array(spec.lambdas),
+            sigma=np.array(spec.sigma),
+            bias=100.0 * np.arange(nfunc),
+        )
+        return data
+
+    def _normalize(self, func_id: int, data: _FunctionData) -> None:
+        """Set the normalization of a composite function (calc_benchmark_norm)."""
+        spec = COMPOSITIONS[func_id]
+        dimension = data.shift.shape[1]
+        norm = None
+        if os.environ.get(NORM_CACHE_DISABLE_ENV) is None:
+            norm = load_derived_values(
+                self.input_dir, NORM_FILE_PATTERN.format(func_id=func_id, dim=dimension),
+                composition_sources(func_id, dimension)
+            )
+        if norm is not None and len(norm) == len(spec.components):
+            data.norm = np.array(norm, dtype=np.float64)
+        else:
+            data.norm = compute_norm(spec, data)
+        if spec.noisy_component is not None:
+            data.norm[spec.noisy_component] *= 1.0 + 0.1 * abs(self.rng.standard_normal())
+
+    def _get_data(self, func_id: int, dimension: int) -> _FunctionData:
+        """Get (initializing on first use) the constants of a function."""
+        key = (func_id, dimension)
+        if key not in self._data:
+            with timed(self.timings, func_id, dimension, "initialize"):
+                data = self._initialize(func_id, dimension)
+            if func_id in COMPOSITIONS:
+                with timed(self.timings, func_id, dimension, "normalize"):
+                    self._normalize(func_id, data)
+            self._data[key] = data
+        return self._data[key]
+
+    # ------------------------------------------------------------------
+    # Evaluation (def4.c)
+    # ------------------------------------------------------------------
+
+    def _noise(self, size: int) -> np.ndarray:
+        """Absolute standard normal deviates, one per vector."""
+        return np.abs(self.rng.standard_normal(size))
+
+    def _evaluate_single(self, func_id: int, data: _FunctionData, x: np.ndarray) -> np.ndarray:
+        """Evaluate F1-F14."""
+        if func_id == 5:
+            basic = np.max(np.abs(x @ data.extra["A"].T - data.extra["B"]), axis=1)
+        elif func_id == 12:
+            alpha = data.extra["alpha"]
+            A, B = data.extra["A"], data.extra["B"]
+            target = A @ np.sin(alpha) + B @ np.cos(alpha)
+            basic = np.sum((target - (np.sin(x) @ A.T + np.cos(x) @ B.T)) ** 2, axis=1)
+        else:
+            basic = SINGLE_FUNCTIONS[func_id][2](data.transform(x, 0))
+            if func_id == 4:
+                basic = basic * (1.0 + 0.4 * self._noise(len(x)))
+        return basic + data.bias[0]
+
+    def _evaluate_composition(self, func_id: int, data: _FunctionData, x: np.ndarray) -> np.ndarray:
+        """Evaluate F15-F25."""
+        spec = COMPOSITIONS[func_id]
+        if spec.round_input:
+            x = np.where(np.abs(x - data.shift[0]) >= 0.5, round_off(x), x)
+
+        basic = np.empty((len(x), len(spec.components)))
+        for i, component in enumerate(spec.components):
+            basic[:, i] = component(data.transform(x, i))
+        if spec.noisy_component is not None:
+            basic[:, spec.noisy_component] *= 1.0 + 0.1 * self._noise(len(x))
+        basic *= NORMALIZATION_C / data.norm
+
+        res = np.sum(data.weights(x) * (basic + data.bias), axis=1)
+        if spec.output_noise:
+            res = res * (1.0 + spec.output_noise * self._noise(len(x)))
+        return res + spec.global_bias
+
+    def evaluate(self, func_id: int, dimension: int, population: np.ndarray) -> np.ndarray:
+        """Evaluate an (N, D) array of vectors and return an (N,) array of values."""
+        x = np.asarray(population, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if x.ndim != 2 or x.shape[1] != dimension:
+            raise ValueError(
+                f"Expected an array of shape (N, {dimension}), got {x.shape}"
+            )
+
+        data = self._get_data(func_id, dimension)
+        if x.shape[0] == 0:
+            return np.empty(0, dtype=np.float64)
+        with timed(self.timings, func_id, dimension, "evaluate"):
+            if func_id in COMPOSITIONS:
+                return self._evaluate_composition(func_id, data, x)
+            return self._evaluate_single(func_id, data, x)
+
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        """Execute a CEC2005 function with NumPy."""
+        return float(self.evaluate(func_id, dimension, np.asarray([input_vector]))[0])
+
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[float]:
+        """Execute a CEC2005 function with NumPy on many vectors at once."""
+        if len(vectors) == 0:
+            return []
+        return self.evaluate(func_id, dimension, np.asarray(vectors)).tolist()
+
+    def cleanup(self) -> None:
+        """Drop the cached constants."""
+        self._data.clear()
@@ -2,78 +2,178 @@
 CEC2006 Benchmark Executor
 
 Handles execution of CEC2006 constrained optimization benchmark functions via the C implementation.
+Vectors are evaluated by the binary's batch mode, whose machine-readable output
+carries the objective, the constraint values, the violation and the feasibility.
 """
 
-import os
 import subprocess
-import tempfile
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 from .base import FunctionExecutor
+from .build import BuildCache, get_build_profile
+from .cec2006_numpy import PROBLEM_INFO, VARIABLE_DIMENSION
+from .concurrency import run_process
+from .fingerprint import SourceGraph, module_fingerprint
+from .results import ConstrainedResult, EvaluationResult
+from .timing import timed
 
 
 class CEC2006Executor(FunctionExecutor):
     """Executor for CEC2006 constrained optimization problems."""
     
-    def __init__(self, implementation_dir: Path):
+    supports_profiles = True
+    
+    # C functions that belong to a single benchmark function (g01 ... g24)
+    function_symbols = r"^g(\d+)$"
+    
+    # Files of a build kept in the build cache
+    artifacts = ("main",)
+    
+    def __init__(self, implementation_dir: Path, profile: Optional[str] = None):
         self.implementation_dir = implementation_dir
+        self.profile = get_build_profile(profile)
+        self.build_cache = BuildCache(implementation_dir, self.artifacts)
+        self.artifact_dir: Optional[Path] = None
         self.executable = "./main"
+        self._source_graph: Optional[SourceGraph] = None
         
     def build(self) -> bool:
-        """Build the C implementation using make."""
+        """Build the C implementation with the executor's profile.
+        
+        The build is skipped when the sources, flags and compiler match a
+        build already in the cache.
+        """
         try:
-            subprocess.run(
-                ["make", "clean"], 
-                cwd=self.implementation_dir, 
-                capture_output=True, 
-                check=False
-            )
-            result = subprocess.run(
-                ["make"], 
-                cwd=self.implementation_dir, 
-                capture_output=True, 
-                check=True
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError:
+            self.artifact_dir = self.build_cache.build(self.profile)
+            self.executable = str((self.artifact_dir / "main").resolve())
+            return True
+        except (subprocess.CalledProcessError, OSError):
             return False
     
-    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
-        """Execute a CEC2006 function via C binary.
+    def source_fingerprint(self, func_id: int) -> str:
+        """Fingerprint of the C code reachable from the function, the build flags and the compiler."""
+        if self._source_graph is None:
+            self._source_graph = SourceGraph(self.implementation_dir)
+        return self._source_graph.function_fingerprint(func_id, self.function_symbols, [
+            module_fingerprint(type(self)),
+            f"OPTFLAGS={self.profile.optflags}",
+            f"CPPFLAGS={self.profile.cppflags}",
+            self.build_cache.compiler_version()
+        ])
+    
+    def evaluate(self, func_id: int, population: np.ndarray) -> ConstrainedResult:
+        """Evaluate an (N, nx) array of vectors with one C process.
         
-        Note: CEC2006 functions have fixed dimensions, so the dimension parameter
-        is ignored and -1 is passed to use the default dimension for each function.
-        """
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            for val in input_vector:
-                f.write(f"{val}\n")
-            temp_file = f.name
+        The vectors are streamed to the binary's batch mode on stdin, which
+        prints the objective, the violation, the feasibility and the
+        constraint values of each vector as one line of numbers.
         
-        try:
-            # CEC2006 uses -1 for default dimension
+        Returns:
+            ConstrainedResult with f (N,), g (N, ng), h (N, nh) and violation (N,)
+        """
+        x = self._population(func_id, population)
+        input_text = self._batch_input(func_id, x)
+        with timed(self.timings, func_id, x.shape[1], "spawn"):
             result = subprocess.run(
-                [self.executable, str(func_id), "-1", temp_file],
+                self._batch_args(func_id, x),
+                input=input_text,
                 capture_output=True,
                 text=True,
                 cwd=str(self.implementation_dir)
             )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Function execution failed: {result.stderr}")
-            
-            return self._parse_output(result.stdout)
-            
-        finally:
-            os.unlink(temp_file)
-    
-    def _parse_output(self, output: str) -> float:
-        """Parse the objective value from C program output."""
-        for line in output.strip().split('\n'):
-            if line.startswith("Objective value = "):
-                value_str = line.split("=")[1].strip()
-                return float(value_str.replace("E", "e"))
-        raise ValueError(f"Could not parse output: {output}")
+        return self._batch_result(func_id, x, result.returncode, result.stdout, result.stderr)
+    
+    async def aevaluate(self, func_id: int, population: np.ndarray) -> ConstrainedResult:
+        """Asynchronous counterpart of evaluate(), with an asyncio subprocess."""
+        x = self._population(func_id, population)
+        input_text = self._batch_input(func_id, x)
+        async with self.concurrency.slot():
+            with timed(self.timings, func_id, x.shape[1], "spawn"):
+                result = await run_process(self._batch_args(func_id, x),
+                                           self.implementation_dir, input_text)
+        return self._batch_result(func_id, x, result.returncode, result.stdout, result.stderr)
+    
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> EvaluationResult:
+        """Execute a CEC2006 function via the C binary.
+        
+        Note: CEC2006 functions have fixed dimensions, so the dimension parameter
+        is ignored; the problem's dimension (or the vector length for g02 and
+        g03) is used.
+        
+        Returns:
+            The objective value, with the constraint values and the violation
+        """
+        return self.evaluate(func_id, np.asarray([input_vector])).results()[0]
+    
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[EvaluationResult]:
+        """Execute a CEC2006 function on many vectors with one C process."""
+        if len(vectors) == 0:
+            return []
+        return self.evaluate(func_id, np.asarray(vectors)).results()
+    
+    async def arun(self, func_id: int, dimension: int, input_vector: List[float]) -> EvaluationResult:
+        """Execute a CEC2006 function via an asyncio subprocess, the vector on stdin."""
+        return (await self.aevaluate(func_id, np.asarray([input_vector]))).results()[0]
+    
+    async def arun_batch(self, func_id: int, dimension: int,
+                         vectors: Sequence[Sequence[float]]) -> List[EvaluationResult]:
+        """Execute a CEC2006 function on many vectors with one asyncio subprocess."""
+        if len(vectors) == 0:
+            return []
+        return (await self.aevaluate(func_id, np.asarray(vectors))).results()
+    
+    @staticmethod
+    def _population(func_id: int, population: np.ndarray) -> np.ndarray:
+        """The vectors as an (N, nx) array, checked against the problem's dimension."""
+        x = np.asarray(population, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if func_id not in PROBLEM_INFO:
+            raise ValueError("function_id must be between 1 and 24")
+        nx = PROBLEM_INFO[func_id].nx
+        if x.ndim != 2 or (func_id not in VARIABLE_DIMENSION and x.shape[1] != nx):
+            raise ValueError(
+                f"Expected an array of shape (N, {nx}) for g{func_id:02d}, got {x.shape}"
+            )
+        return x
+    
+    def _batch_args(self, func_id: int, x: np.ndarray) -> List[str]:
+        """Command line of the batch mode; g02 and g03 take the vector length as dimension."""
+        dimension = x.shape[1] if func_id in VARIABLE_DIMENSION else -1
+        return [self.executable, str(func_id), str(dimension), "--batch", "-"]
+    
+    def _batch_input(self, func_id: int, x: np.ndarray) -> str:
+        """Format vectors as batch mode input, one vector per line."""
+        with timed(self.timings, func_id, x.shape[1], "write_input"):
+            return "".join(" ".join(repr(float(val)) for val in row) + "\n" for row in x)
+    
+    def _batch_result(self, func_id: int, x: np.ndarray, returncode: int,
+                      stdout: str, stderr: str) -> ConstrainedResult:
+        """Check the process and parse its results, one per vector."""
+        if returncode != 0:
+            raise RuntimeError(f"Function execution failed: {stderr}")
+        with timed(self.timings, func_id, x.shape[1], "parse_output"):
+            result = self._parse_batch_output(stdout)
+        if len(result) != x.shape[0]:
+            raise ValueError(f"Expected {x.shape[0]} results, got {len(result)}")
+        return result
+    
+    @staticmethod
+    def _parse_batch_output(output: str) -> ConstrainedResult:
+        """Parse the batch mode output: a "# nx ng nh" header, then
+        "f violation feasible g[1..ng] h[1..nh]" per vector."""
+        header, _, body = output.partition("\n")
+        fields = header.split()
+        if len(fields) != 4 or fields[0] != "#":
+            raise ValueError(f"Could not parse output: {output[:200]}")
+        ng, nh = int(fields[2]), int(fields[3])
+        values = np.array(body.split(), dtype=np.float64).reshape(-1, 3 + ng + nh)
+        return ConstrainedResult(f=values[:, 0], g=values[:, 3:3 + ng],
+                                 h=values[:, 3 + ng:], violation=values[:, 1])
     
     def cleanup(self) -> None:
         """No cleanup needed for C implementation."""
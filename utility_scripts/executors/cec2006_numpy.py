@@ -0,0 +1,568 @@
+"""
+CEC2006 NumPy Executor
+
+Pure NumPy port of the CEC2006 constrained problems g01-g24 (CEC2006-C/fcnsuite.c).
+Each problem evaluates an (N, nx) population at once and returns the
+objective values, the inequality constraints g(x) <= 0, the equality
+constraints h(x) = 0 and the total constraint violation computed by
+CEC2006-C/main.c.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .base import FunctionExecutor
+from .results import EQUALITY_TOLERANCE, ConstrainedResult, EvaluationResult, total_violation
+from .timing import timed
+
+
+@dataclass(frozen=True)
+class ProblemInfo:
+    """Problem dimension and constraint counts (problem_info in main.c)."""
+    nx: int  # number of variables
+    ng: int  # number of inequality constraints g(x) <= 0
+    nh: int  # number of equality constraints h(x) = 0
+
+
+PROBLEM_INFO: Dict[int, ProblemInfo] = {
+    1: ProblemInfo(13, 9, 0),
+    2: ProblemInfo(20, 2, 0),    # dimension is variable, 20 by default
+    3: ProblemInfo(10, 0, 1),    # dimension is variable, 10 by default
+    4: ProblemInfo(5, 6, 0),
+    5: ProblemInfo(4, 2, 3),
+    6: ProblemInfo(2, 2, 0),
+    7: ProblemInfo(10, 8, 0),
+    8: ProblemInfo(2, 2, 0),
+    9: ProblemInfo(7, 4, 0),
+    10: ProblemInfo(8, 6, 0),
+    11: ProblemInfo(2, 0, 1),
+    12: ProblemInfo(3, 1, 0),
+    13: ProblemInfo(5, 0, 3),
+    14: ProblemInfo(10, 0, 3),
+    15: ProblemInfo(3, 0, 2),
+    16: ProblemInfo(5, 38, 0),
+    17: ProblemInfo(6, 0, 4),
+    18: ProblemInfo(9, 13, 0),
+    19: ProblemInfo(15, 5, 0),
+    20: ProblemInfo(24, 6, 14),
+    21: ProblemInfo(7, 1, 5),
+    22: ProblemInfo(22, 1, 19),
+    23: ProblemInfo(9, 2, 4),
+    24: ProblemInfo(2, 2, 0),
+}
+
+# Problems whose dimension can be chosen by the caller
+VARIABLE_DIMENSION = (2, 3)
+
+
+Constraints = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _stack(columns: Sequence[np.ndarray], n: int) -> np.ndarray:
+    """Stack per-constraint columns into an (N, k) array."""
+    if not columns:
+        return np.empty((n, 0))
+    return np.column_stack(columns)
+
+
+# ============================================================================
+# Problems (fcnsuite.c), x is an (N, nx) array
+# ============================================================================
+
+
+def g01(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3 = x[:, 0], x[:, 1], x[:, 2], x[:, 3]
+    f = 5.0 * (x0 + x1 + x2 + x3) - 5.0 * (x0 * x0 + x1 * x1 + x2 * x2 + x3 * x3)
+    for j in range(4, 13):
+        f = f - x[:, j]
+    g = [
+        2.0 * x0 + 2.0 * x1 + x[:, 9] + x[:, 10] - 10.,
+        2.0 * x0 + 2.0 * x2 + x[:, 9] + x[:, 11] - 10.,
+        2.0 * x1 + 2.0 * x2 + x[:, 10] + x[:, 11] - 10.,
+        -8.0 * x0 + x[:, 9],
+        -8.0 * x1 + x[:, 10],
+        -8.0 * x2 + x[:, 11],
+        -2.0 * x3 - x[:, 4] + x[:, 9],
+        -2.0 * x[:, 5] - x[:, 6] + x[:, 10],
+        -2.0 * x[:, 7] - x[:, 8] + x[:, 11],
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g02(x: np.ndarray) -> Constraints:
+    nx = x.shape[1]
+    cos_x = np.cos(x)
+    f1 = np.sum(np.power(cos_x, 4), axis=1)
+    f2 = np.prod(cos_x * cos_x, axis=1)
+    f3 = np.sum(np.arange(1, nx + 1) * x * x, axis=1)
+    f = -np.abs((f1 - 2 * f2) / np.sqrt(f3))
+    g = [0.75 - np.prod(x, axis=1), np.sum(x, axis=1) - 7.5 * nx]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g03(x: np.ndarray) -> Constraints:
+    nx = x.shape[1]
+    f = -np.prod(np.sqrt(float(nx)) * x, axis=1)
+    h = [np.sum(x * x, axis=1) - 1.0]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+def g04(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4 = (x[:, i] for i in range(5))
+    f = 5.3578547 * x2 * x2 + 0.8356891 * x0 * x4 + 37.293239 * x0 - 40792.141
+    g = [
+        85.334407 + 0.0056858 * x1 * x4 + 0.0006262 * x0 * x3 - 0.0022053 * x2 * x4 - 92.,
+        -85.334407 - 0.0056858 * x1 * x4 - 0.0006262 * x0 * x3 + 0.0022053 * x2 * x4,
+        80.51249 + 0.0071317 * x1 * x4 + 0.0029955 * x0 * x1 + 0.0021813 * x2 * x2 - 110.,
+        -80.51249 - 0.0071317 * x1 * x4 - 0.0029955 * x0 * x1 - 0.0021813 * x2 * x2 + 90.,
+        9.300961 + 0.0047026 * x2 * x4 + 0.0012547 * x0 * x2 + 0.0019085 * x2 * x3 - 25.,
+        -9.300961 - 0.0047026 * x2 * x4 - 0.0012547 * x0 * x2 - 0.0019085 * x2 * x3 + 20.,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g05(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3 = (x[:, i] for i in range(4))
+    f = 3.0 * x0 + 0.000001 * np.power(x0, 3) + 2.0 * x1 + (0.000002 / 3.0) * np.power(x1, 3)
+    g = [-x3 + x2 - 0.55, -x2 + x3 - 0.55]
+    h = [
+        1000.0 * np.sin(-x2 - 0.25) + 1000.0 * np.sin(-x3 - 0.25) + 894.8 - x0,
+        1000.0 * np.sin(x2 - 0.25) + 1000.0 * np.sin(x2 - x3 - 0.25) + 894.8 - x1,
+        1000.0 * np.sin(x3 - 0.25) + 1000.0 * np.sin(x3 - x2 - 0.25) + 1294.8,
+    ]
+    return f, _stack(g, len(x)), _stack(h, len(x))
+
+
+def g06(x: np.ndarray) -> Constraints:
+    x0, x1 = x[:, 0], x[:, 1]
+    f = np.power(x0 - 10., 3) + np.power(x1 - 20., 3)
+    g = [
+        100. - (x0 - 5.) * (x0 - 5.) - (x1 - 5.) * (x1 - 5.),
+        (x0 - 6.) * (x0 - 6.) + (x1 - 5.) * (x1 - 5.) - 82.81,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g07(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6, x7, x8, x9 = (x[:, i] for i in range(10))
+    f = (x0 * x0 + x1 * x1 + x0 * x1 - 14.0 * x0 - 16.0 * x1 + (x2 - 10.0) * (x2 - 10.0)
+         + 4.0 * (x3 - 5.0) * (x3 - 5.0) + (x4 - 3.0) * (x4 - 3.0) + 2.0 * (x5 - 1.0) * (x5 - 1.0)
+         + 5.0 * x6 * x6 + 7.0 * (x7 - 11) * (x7 - 11) + 2.0 * (x8 - 10.0) * (x8 - 10.0)
+         + (x9 - 7.0) * (x9 - 7.0) + 45.)
+    g = [
+        -105.0 + 4.0 * x0 + 5.0 * x1 - 3.0 * x6 + 9.0 * x7,
+        10.0 * x0 - 8.0 * x1 - 17.0 * x6 + 2.0 * x7,
+        -8.0 * x0 + 2.0 * x1 + 5.0 * x8 - 2.0 * x9 - 12.0,
+        3.0 * (x0 - 2.0) * (x0 - 2.0) + 4.0 * (x1 - 3.0) * (x1 - 3.0) + 2.0 * x2 * x2 - 7.0 * x3 - 120.0,
+        5.0 * x0 * x0 + 8.0 * x1 + (x2 - 6.0) * (x2 - 6.0) - 2.0 * x3 - 40.0,
+        x0 * x0 + 2.0 * (x1 - 2.0) * (x1 - 2.0) - 2.0 * x0 * x1 + 14.0 * x4 - 6.0 * x5,
+        0.5 * (x0 - 8.0) * (x0 - 8.0) + 2.0 * (x1 - 4.0) * (x1 - 4.0) + 3.0 * x4 * x4 - x5 - 30.0,
+        -3.0 * x0 + 6.0 * x1 + 12.0 * (x8 - 8.0) * (x8 - 8.0) - 7.0 * x9,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g08(x: np.ndarray) -> Constraints:
+    x0, x1 = x[:, 0], x[:, 1]
+    pi = 4.0 * np.arctan(1.0)
+    f = -(np.power(np.sin(2 * pi * x0), 3) * np.sin(2 * pi * x1) / (np.power(x0, 3) * (x0 + x1)))
+    g = [x0 * x0 - x1 + 1.0, 1.0 - x0 + (x1 - 4.0) * (x1 - 4.0)]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g09(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6 = (x[:, i] for i in range(7))
+    f = ((x0 - 10.0) * (x0 - 10.0) + 5.0 * (x1 - 12.0) * (x1 - 12.0) + np.power(x2, 4)
+         + 3.0 * (x3 - 11.0) * (x3 - 11.0) + 10.0 * np.power(x4, 6) + 7.0 * x5 * x5
+         + np.power(x6, 4) - 4.0 * x5 * x6 - 10.0 * x5 - 8.0 * x6)
+    g = [
+        -127.0 + 2 * x0 * x0 + 3.0 * np.power(x1, 4) + x2 + 4.0 * x3 * x3 + 5.0 * x4,
+        -282.0 + 7.0 * x0 + 3.0 * x1 + 10.0 * x2 * x2 + x3 - x4,
+        -196.0 + 23.0 * x0 + x1 * x1 + 6.0 * x5 * x5 - 8.0 * x6,
+        4.0 * x0 * x0 + x1 * x1 - 3.0 * x0 * x1 + 2.0 * x2 * x2 + 5.0 * x5 - 11.0 * x6,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g10(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6, x7 = (x[:, i] for i in range(8))
+    f = x0 + x1 + x2
+    g = [
+        -1.0 + 0.0025 * (x3 + x5),
+        -1.0 + 0.0025 * (x4 + x6 - x3),
+        -1.0 + 0.01 * (x7 - x4),
+        -x0 * x5 + 833.33252 * x3 + 100.0 * x0 - 83333.333,
+        -x1 * x6 + 1250.0 * x4 + x1 * x3 - 1250.0 * x3,
+        -x2 * x7 + 1250000.0 + x2 * x4 - 2500.0 * x4,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g11(x: np.ndarray) -> Constraints:
+    x0, x1 = x[:, 0], x[:, 1]
+    f = x0 * x0 + (x1 - 1.0) * (x1 - 1.0)
+    h = [x1 - x0 * x0]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+# Centers of the 9^3 disjoint spheres of g12, in the C loop order
+_G12_CENTERS = np.array(
+    [(i, j, k) for i in range(1, 10) for j in range(1, 10) for k in range(1, 10)], dtype=np.float64
+)
+
+
+def g12(x: np.ndarray) -> Constraints:
+    x0, x1, x2 = x[:, 0], x[:, 1], x[:, 2]
+    f = -((100. - (x0 - 5.) * (x0 - 5.) - (x1 - 5.) * (x1 - 5.) - (x2 - 5.) * (x2 - 5.)) / 100.)
+    d = x[:, np.newaxis, :3] - _G12_CENTERS
+    gt = d[:, :, 0] * d[:, :, 0] + d[:, :, 1] * d[:, :, 1] + d[:, :, 2] * d[:, :, 2] - 0.0625
+    g = [np.min(gt, axis=1)]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g13(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4 = (x[:, i] for i in range(5))
+    f = np.exp(x0 * x1 * x2 * x3 * x4)
+    h = [
+        x0 * x0 + x1 * x1 + x2 * x2 + x3 * x3 + x4 * x4 - 10.0,
+        x1 * x2 - 5.0 * x3 * x4,
+        np.power(x0, 3) + np.power(x1, 3) + 1.0,
+    ]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+_G14_C = np.array([-6.089, -17.164, -34.054, -5.914, -24.721, -14.986, -24.100, -10.708,
+                   -26.662, -22.179])
+
+
+def g14(x: np.ndarray) -> Constraints:
+    x = x[:, :10]
+    sumlog = np.sum(x, axis=1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = np.sum(x * (_G14_C + np.log(x / sumlog)), axis=1)
+    h = [
+        x[:, 0] + 2.0 * x[:, 1] + 2.0 * x[:, 2] + x[:, 5] + x[:, 9] - 2.0,
+        x[:, 3] + 2.0 * x[:, 4] + x[:, 5] + x[:, 6] - 1.0,
+        x[:, 2] + x[:, 6] + x[:, 7] + 2.0 * x[:, 8] + x[:, 9] - 1.0,
+    ]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+def g15(x: np.ndarray) -> Constraints:
+    x0, x1, x2 = x[:, 0], x[:, 1], x[:, 2]
+    f = 1000.0 - np.power(x0, 2.0) - 2.0 * x1 * x1 - x2 * x2 - x0 * x1 - x0 * x2
+    h = [
+        np.power(x0, 2.0) + np.power(x1, 2.0) + np.power(x2, 2.0) - 25.0,
+        8.0 * x0 + 14.0 * x1 + 7.0 * x2 - 56.0,
+    ]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+def g16(x: np.ndarray) -> Constraints:
+    x1, x2, x3, x4, x5 = (x[:, i] for i in range(5))
+    Y = [None] * 17
+    C = [None] * 17
+
+    Y[0] = x2 + x3 + 41.6
+    C[0] = 0.024 * x4 - 4.62
+    Y[1] = (12.5 / C[0]) + 12.0
+    C[1] = 0.0003535 * np.power(x1, 2.0) + 0.5311 * x1 + 0.08705 * Y[1] * x1
+    C[2] = 0.052 * x1 + 78.0 + 0.002377 * Y[1] * x1
+    Y[2] = C[1] / C[2]
+    Y[3] = 19.0 * Y[2]
+    C[3] = (0.04782 * (x1 - Y[2]) + ((0.1956 * np.power(x1 - Y[2], 2.0)) / x2)
+            + 0.6376 * Y[3] + 1.594 * Y[2])
+    C[4] = 100 * x2
+    C[5] = x1 - Y[2] - Y[3]
+    C[6] = 0.950 - (C[3] / C[4])
+    Y[4] = C[5] * C[6]
+    Y[5] = x1 - Y[4] - Y[3] - Y[2]
+    C[7] = (Y[4] + Y[3]) * 0.995
+    Y[6] = C[7] / Y[0]
+    Y[7] = C[7] / 3798.0
+    C[8] = Y[6] - (0.0663 * Y[6] / Y[7]) - 0.3153
+    Y[8] = (96.82 / C[8]) + 0.321 * Y[0]
+    Y[9] = 1.29 * Y[4] + 1.258 * Y[3] + 2.29 * Y[2] + 1.71 * Y[5]
+    Y[10] = 1.71 * x1 - 0.452 * Y[3] + 0.580 * Y[2]
+    C[9] = 12.3 / 752.3
+    C[10] = 1.75 * Y[1] * 0.995 * x1
+    C[11] = 0.995 * Y[9] + 1998.0
+    Y[11] = C[9] * x1 + (C[10] / C[11])
+    Y[12] = C[11] - 1.75 * Y[1]
+    Y[13] = 3623.0 + 64.4 * x2 + 58.4 * x3 + (146312.0 / (Y[8] + x5))
+    C[12] = 0.995 * Y[9] + 60.8 * x2 + 48 * x4 - 0.1121 * Y[13] - 5095.0
+    Y[14] = Y[12] / C[12]
+    Y[15] = 148000.0 - 331000.0 * Y[14] + 40.0 * Y[12] - 61.0 * Y[14] * Y[12]
+    C[13] = 2324 * Y[9] - 28740000 * Y[1]
+    Y[16] = 14130000 - 1328.0 * Y[9] - 531.0 * Y[10] + (C[13] / C[11])
+    C[14] = (Y[12] / Y[14]) - (Y[12] / 0.52)
+    C[15] = 1.104 - 0.72 * Y[14]
+    C[16] = Y[8] + x5
+
+    f = -(0.0000005843 * Y[16] - 0.000117 * Y[13] - 0.1365 - 0.00002358 * Y[12]
+          - 0.000001502 * Y[15] - 0.0321 * Y[11] - 0.004324 * Y[4] - 0.0001 * (C[14] / C[15])
+          - 37.48 * (Y[1] / C[11]))
+    g = [
+        -Y[3] + (0.28 / 0.72) * Y[4],
+        -1.5 * x2 + x3,
+        -21.0 + 3496.0 * (Y[1] / C[11]),
+        -(62212.0 / C[16]) + 110.6 + Y[0],
+    ]
+    # Lower and upper bounds on Y[0]..Y[16]
+    bounds = [
+        (213.1, 405.23), (17.505, 1053.6667), (11.275, 35.03), (214.228, 665.585),
+        (7.458, 584.463), (0.961, 265.916), (1.612, 7.046), (0.146, 0.222),
+        (107.99, 273.366), (922.693, 1286.105), (926.832, 1444.046), (18.766, 537.141),
+        (1072.163, 3247.039), (8961.448, 26844.086), (0.063, 0.386), (71084.33, 140000.0),
+        (2802713.0, 12146108.0),
+    ]
+    for y, (lower, upper) in zip(Y, bounds):
+        g.append(lower - y)
+        g.append(y - upper)
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+def g17(x: np.ndarray) -> Constraints:
+    x1, x2, x3, x4, x5, x6 = (x[:, i] for i in range(6))
+    aux1 = 300.0 - (((x3 * x4) * np.cos(1.48477 - x6))
+                    - ((0.90798 * np.power(x3, 2.0)) * np.cos(1.47588))) / 131.078
+    aux2 = -(((x3 * x4) * np.cos(1.48477 + x6))
+             - ((0.90798 * np.power(x4, 2.0)) * np.cos(1.47588))) / 131.078
+    aux5 = -(((x3 * x4) * np.sin(1.48477 + x6))
+             - ((0.90798 * np.power(x4, 2.0)) * np.sin(1.47588))) / 131.078
+    aux4 = 200.0 - (((x3 * x4) * np.sin(1.48477 - x6))
+                    - ((0.90798 * np.power(x3, 2.0)) * np.sin(1.47588))) / 131.078
+
+    # Piecewise objective, zero outside the defined ranges as in the C code
+    f1 = np.select([(x1 >= 0.0) & (x1 < 300.0), (x1 >= 300.0) & (x1 <= 400.0)],
+                   [30.0 * aux1, 31.0 * aux1], 0.0)
+    f2 = np.select([(x2 >= 0.0) & (x2 < 100.0), (x2 >= 100.0) & (x2 < 200.0),
+                    (x2 >= 200.0) & (x2 <= 1000.0)],
+                   [28.0 * aux2, 29.0 * aux2, 30.0 * aux2], 0.0)
+    f = f1 + f2
+    h = [aux1 - x1, aux2 - x2, aux5 - x5, aux4]
+    return f, _stack([], len(x)), _stack(h, len(x))
+
+
+def g18(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6, x7, x8 = (x[:, i] for i in range(9))
+    f = -(0.5 * (x0 * x3 - x1 * x2 + x2 * x8 - x4 * x8 + x4 * x7 - x5 * x6))
+    g = [
+        -1.0 + np.power(x2, 2.0) + np.power(x3, 2.0),
+        -1.0 + np.power(x8, 2.0),
+        -1.0 + np.power(x4, 2.0) + np.power(x5, 2.0),
+        -1.0 + np.power(x0, 2.0) + np.power(x1 - x8, 2.0),
+        -1.0 + np.power(x0 - x4, 2.0) + np.power(x1 - x5, 2.0),
+        -1.0 + np.power(x0 - x6, 2.0) + np.power(x1 - x7, 2.0),
+        -1.0 + np.power(x2 - x4, 2.0) + np.power(x3 - x5, 2.0),
+        -1.0 + np.power(x2 - x6, 2.0) + np.power(x3 - x7, 2.0),
+        -1.0 + np.power(x6, 2.0) + np.power(x7 - x8, 2.0),
+        -x0 * x3 + x1 * x2,
+        -x2 * x8,
+        x4 * x8,
+        -x4 * x7 + x5 * x6,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+_G19_A = np.array([
+    [-16.0, 2.0, 0.0, 1.0, 0.0],
+    [0.0, -2.0, 0.0, 0.4, 2.0],
+    [-3.5, 0.0, 2.0, 0.0, 0.0],
+    [0.0, -2.0, 0.0, -4.0, -1.0],
+    [0.0, -9.0, -2.0, 1.0, -2.8],
+    [2.0, 0.0, -4.0, 0.0, 0.0],
+    [-1.0, -1.0, -1.0, -1.0, -1.0],
+    [-1.0, -2.0, -3.0, -2.0, -1.0],
+    [1.0, 2.0, 3.0, 4.0, 5.0],
+    [1.0, 1.0, 1.0, 1.0, 1.0],
+])
+_G19_B = np.array([-40.0, -2.0, -0.25, -4.0, -4.0, -1.0, -40.0, -60.0, 5.0, 1.0])
+_G19_C = np.array([
+    [30.0, -20.0, -10.0, 32.0, -10.0],
+    [-20.0, 39.0, -6.0, -31.0, 32.0],
+    [-10.0, -6.0, 10.0, -6.0, -10.0],
+    [32.0, -31.0, -6.0, 39.0, -20.0],
+    [-10.0, 32.0, -10.0, -20.0, 30.0],
+])
+_G19_D = np.array([4.0, 8.0, 10.0, 6.0, 2.0])
+_G19_E = np.array([-15.0, -27.0, -36.0, -18.0, -12.0])
+
+
+def g19(x: np.ndarray) -> Constraints:
+    xa, xc = x[:, :10], x[:, 10:15]
+    sum1 = xa @ _G19_B
+    sum2 = np.einsum("ni,ij,nj->n", xc, _G19_C, xc)
+    sum3 = np.power(xc, 3.0) @ _G19_D
+    f = -(sum1 - sum2 - 2.0 * sum3)
+    g = -((2.0 * (xc @ _G19_C)) + (3.0 * _G19_D * np.power(xc, 2.0)) + _G19_E - xa @ _G19_A)
+    return f, g, _stack([], len(x))
+
+
+_G20_A = np.array([0.0693, 0.0577, 0.05, 0.2, 0.26, 0.55, 0.06, 0.1, 0.12, 0.18, 0.1, 0.09] * 2)
+_G20_B = np.array([44.094, 58.12, 58.12, 137.4, 120.9, 170.9, 62.501, 84.94, 133.425, 82.507,
+                   46.07, 60.097] * 2)
+_G20_C = np.array([123.7, 31.7, 45.7, 14.7, 84.7, 27.7, 49.7, 7.1, 2.1, 17.7, 0.85, 0.64])
+_G20_D = np.array([31.244, 36.12, 34.784, 92.7, 82.7, 91.6, 56.708, 82.7, 80.8, 64.517, 49.4, 49.1])
+_G20_E = np.array([0.1, 0.3, 0.4, 0.3, 0.6, 0.3])
+
+
+def g20(x: np.ndarray) -> Constraints:
+    f = x @ _G20_A
+    sum1 = np.sum(x[:, :12] / _G20_B[:12], axis=1, keepdims=True)
+    sum2 = np.sum(x[:, 12:] / _G20_B[12:], axis=1, keepdims=True)
+    h = (x[:, 12:] / (_G20_B[12:] * sum2)) - ((_G20_C * x[:, :12]) / (40.0 * _G20_B[:12] * sum1))
+    sumtotal = np.sum(x, axis=1, keepdims=True)
+    h12 = sumtotal[:, 0] - 1.0
+    sum1 = np.sum(x[:, :12] / _G20_D, axis=1)
+    h13 = sum1 + (0.7302 * 530.0 * (14.7 / 40)) * sum2[:, 0] - 1.671
+    pairs = np.column_stack([x[:, 0:3] + x[:, 12:15], x[:, 6:9] + x[:, 18:21]])
+    g = pairs / (sumtotal + _G20_E)
+    return f, g, np.column_stack([h, h12, h13])
+
+
+def g21(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6 = (x[:, i] for i in range(7))
+    f = x0.copy()
+    g = [-x0 + 35.0 * np.power(x1, 0.6) + 35.0 * np.power(x2, 0.6)]
+    h = [
+        -300.0 * x2 + 7500 * x4 - 7500 * x5 - 25.0 * x3 * x4 + 25.0 * x3 * x5 + x2 * x3,
+        100.0 * x1 + 155.365 * x3 + 2500 * x6 - x1 * x3 - 25.0 * x3 * x6 - 15536.5,
+        -x4 + np.log(-x3 + 900.0),
+        -x5 + np.log(x3 + 300.0),
+        -x6 + np.log(-2.0 * x3 + 700.0),
+    ]
+    return f, _stack(g, len(x)), _stack(h, len(x))
+
+
+def g22(x: np.ndarray) -> Constraints:
+    c = [x[:, i] for i in range(22)]
+    f = c[0].copy()
+    g = [-c[0] + np.power(c[1], 0.6) + np.power(c[2], 0.6) + np.power(c[3], 0.6)]
+    h = [
+        c[4] - 100000.0 * c[7] + 10000000.0,
+        c[5] + 100000.0 * c[7] - 100000.0 * c[8],
+        c[6] + 100000.0 * c[8] - 50000000.0,
+        c[4] + 100000.0 * c[9] - 33000000.0,
+        c[5] + 100000 * c[10] - 44000000.0,
+        c[6] + 100000 * c[11] - 66000000.0,
+        c[4] - 120.0 * c[1] * c[12],
+        c[5] - 80.0 * c[2] * c[13],
+        c[6] - 40.0 * c[3] * c[14],
+        c[7] - c[10] + c[15],
+        c[8] - c[11] + c[16],
+        -c[17] + np.log(c[9] - 100.0),
+        -c[18] + np.log(-c[7] + 300.0),
+        -c[19] + np.log(c[15]),
+        -c[20] + np.log(-c[8] + 400.0),
+        -c[21] + np.log(c[16]),
+        -c[7] - c[9] + c[12] * c[17] - c[12] * c[18] + 400.0,
+        c[7] - c[8] - c[10] + c[13] * c[19] - c[13] * c[20] + 400.0,
+        c[8] - c[11] - 4.60517 * c[14] + c[14] * c[21] + 100.0,
+    ]
+    return f, _stack(g, len(x)), _stack(h, len(x))
+
+
+def g23(x: np.ndarray) -> Constraints:
+    x0, x1, x2, x3, x4, x5, x6, x7, x8 = (x[:, i] for i in range(9))
+    f = -9.0 * x4 - 15.0 * x7 + 6.0 * x0 + 16.0 * x1 + 10.0 * (x5 + x6)
+    g = [
+        x8 * x2 + 0.02 * x5 - 0.025 * x4,
+        x8 * x3 + 0.02 * x6 - 0.015 * x7,
+    ]
+    h = [
+        x0 + x1 - x2 - x3,
+        0.03 * x0 + 0.01 * x1 - x8 * (x2 + x3),
+        x2 + x5 - x4,
+        x3 + x6 - x7,
+    ]
+    return f, _stack(g, len(x)), _stack(h, len(x))
+
+
+def g24(x: np.ndarray) -> Constraints:
+    x0, x1 = x[:, 0], x[:, 1]
+    f = -x0 - x1
+    g = [
+        -2.0 * np.power(x0, 4.0) + 8.0 * np.power(x0, 3.0) - 8.0 * np.power(x0, 2.0) + x1 - 2.0,
+        -4.0 * np.power(x0, 4.0) + 32.0 * np.power(x0, 3.0) - 88.0 * np.power(x0, 2.0)
+        + 96.0 * x0 + x1 - 36.0,
+    ]
+    return f, _stack(g, len(x)), _stack([], len(x))
+
+
+PROBLEMS: Dict[int, Callable[[np.ndarray], Constraints]] = {
+    1: g01, 2: g02, 3: g03, 4: g04, 5: g05, 6: g06, 7: g07, 8: g08,
+    9: g09, 10: g10, 11: g11, 12: g12, 13: g13, 14: g14, 15: g15, 16: g16,
+    17: g17, 18: g18, 19: g19, 20: g20, 21: g21, 22: g22, 23: g23, 24: g24,
+}
+
+
+class CEC2006NumpyExecutor(FunctionExecutor):
+    """Vectorized NumPy executor for the CEC2006 problems g01-g24."""
+
+    def __init__(self, implementation_dir: Path):
+        self.implementation_dir = Path(implementation_dir)
+
+    def build(self) -> bool:
+        """Nothing to compile."""
+        return True
+
+    def problem_info(self, func_id: int, dimension: int = -1) -> ProblemInfo:
+        """Get the problem shape; g02 and g03 accept any dimension (-1 for the default)."""
+        if func_id not in PROBLEM_INFO:
+            raise ValueError("function_id must be between 1 and 24")
+        info = PROBLEM_INFO[func_id]
+        if func_id in VARIABLE_DIMENSION and dimension > 0:
+            return ProblemInfo(dimension, info.ng, info.nh)
+        return info
+
+    def evaluate(self, func_id: int, population: np.ndarray) -> ConstrainedResult:
+        """Evaluate an (N, nx) array of vectors.
+
+        Returns:
+            ConstrainedResult with f (N,), g (N, ng), h (N, nh) and violation (N,)
+        """
+        x = np.asarray(population, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        info = self.problem_info(func_id, x.shape[1] if x.ndim == 2 else -1)
+        if x.ndim != 2 or x.shape[1] != info.nx:
+            raise ValueError(
+                f"Expected an array of shape (N, {info.nx}) for g{func_id:02d}, got {x.shape}"
+            )
+
+        with timed(self.timings, func_id, info.nx, "evaluate"), np.errstate(all="ignore"):
+            f, g, h = PROBLEMS[func_id](x)
+            violation = total_violation(g, h)
+        return ConstrainedResult(f=f, g=g, h=h, violation=violation)
+
+    def _check_dimension(self, func_id: int, dimension: int, vector_length: int) -> None:
+        """Reject vectors whose length does not match the problem."""
+        info = self.problem_info(func_id, vector_length)
+        if vector_length != info.nx:
+            raise ValueError(
+                f"g{func_id:02d} has dimension {info.nx}, got vectors of length {vector_length}"
+            )
+
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> EvaluationResult:
+        """Execute a CEC2006 problem and return its objective and constraint values.
+
+        As with the C executor, the dimension follows the problem definition
+        (or the vector length for g02 and g03).
+        """
+        self._check_dimension(func_id, dimension, len(input_vector))
+        return self.evaluate(func_id, np.asarray([input_vector])).results()[0]
+
+    def run_batch(self, func_id: int, dimension: int,
+                  vectors: Sequence[Sequence[float]]) -> List[EvaluationResult]:
+        """Execute a CEC2006 problem on many vectors and return their objective and constraint values."""
+        if len(vectors) == 0:
+            return []
+        return self.evaluate(func_id, np.asarray(vectors)).results()
+
+    def cleanup(self) -> None:
+        """No cleanup needed."""
+        pass
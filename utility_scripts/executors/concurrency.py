@@ -0,0 +1,95 @@
+"""
+Asynchronous evaluation support for CEC benchmark executors.
+
+FunctionExecutor.arun() and arun_batch() are the asyncio counterparts of run()
+and run_batch(). The C executors drive their binaries with
+asyncio.create_subprocess_exec and pass the vectors on stdin, so an event loop
+can keep many evaluations in flight without a thread per call. A
+ConcurrencyLimit bounds how many evaluations (processes) are in flight at once.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+# Default number of evaluations an executor keeps in flight
+DEFAULT_MAX_CONCURRENCY = os.cpu_count() or 1
+
+
+class ConcurrencyLimit:
+    """Semaphore bounding the evaluations in flight, usable from any event loop.
+
+    asyncio semaphores belong to the event loop that first waits on them, so
+    the semaphore is created for the running loop and replaced when the
+    executor is used from another loop (e.g. by successive asyncio.run calls).
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self._limit = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.set_limit(limit if limit is not None else DEFAULT_MAX_CONCURRENCY)
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of evaluations in flight."""
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        """Change the maximum number of evaluations in flight.
+
+        Evaluations already holding a slot finish normally; the new limit
+        applies to the evaluations started afterwards.
+        """
+        if limit < 1:
+            raise ValueError(f"Concurrency limit must be at least 1, got {limit}")
+        self._limit = limit
+        self._loop = None
+        self._semaphore = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the slots for the duration of the enclosed block."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._limit)
+        async with self._semaphore:
+            yield
+
+
+@dataclass
+class ProcessResult:
+    """Exit status and decoded output of a finished process."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+async def run_process(args: List[str], cwd: Union[str, os.PathLike],
+                      input_text: Optional[str] = None,
+                      env: Optional[Dict[str, str]] = None) -> ProcessResult:
+    """Run a process without blocking the event loop, feeding it input on stdin.
+
+    The process is killed if the awaiting task is cancelled.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE if input_text is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+        env=env
+    )
+    try:
+        stdout, stderr = await process.communicate(
+            input_text.encode() if input_text is not None else None
+        )
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    return ProcessResult(process.returncode, stdout.decode(), stderr.decode())
@@ -0,0 +1,332 @@
+"""
+Binary constant pack for CEC benchmark input data.
+
+Packs every constant text file of a year's ``input_data`` directory (shift
+vectors, rotation matrices, F5 ``A``, F12 ``A``/``B``/``alpha`` ...) into one
+indexed, memory-mappable file. Each text file is stored as the flat stream of
+its values, so readers consume it exactly like the C code's sequential
+``fscanf`` calls. The layout matches ``CEC2005-C/pack.c``:
+
+    header   64 bytes   magic "CECPACK", version, endian marker, year,
+                        entry count, index offset, data offset, data size
+    index    128 bytes per entry: relative path (e.g. "f03/rot_D10.txt"),
+                        data offset, value count, text rows/cols, SHA-256 of
+                        the source text file
+    data     per entry, 64-byte aligned: the little-endian float64 values,
+             then as many float64 remainders
+
+The C code reads the constants as long double (x87 80-bit extended): value +
+remainder is exactly the long double nearest to the text, as fscanf reads it,
+while the value alone is the double nearest to it, as the double build and
+the NumPy port read it.
+"""
+
+import hashlib
+import json
+import re
+import struct
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+PACK_FILENAME = "constants.pack"
+PACK_MAGIC = b"CECPACK\0"
+PACK_VERSION = 2
+PACK_ENDIAN_MARKER = 0x01020304
+PACK_ALIGNMENT = 64
+
+# Significand bits of the C code's long double (x87 extended precision)
+LONG_DOUBLE_MANTISSA_BITS = 64
+
+_HEADER = struct.Struct("<8sIIIIQQQ16x")
+_ENTRY = struct.Struct("<64sQQII32s8x")
+
+# {DATATYPE}{VARIANT}_D{DIMENSION}.txt, see cec_constant_naming_convention.md
+CONSTANT_FILE_PATTERN = re.compile(
+    r"^(?P<datatype>[a-z]+)(?P<variant>(?:_[a-z]+)*)_D(?P<dimension>\d+)\.txt$"
+)
+
+
+@dataclass
+class PackEntry:
+    """Index entry of one packed constant file."""
+    name: str
+    offset: int
+    count: int
+    rows: int
+    cols: int
+    sha256: str
+
+
+def parse_constant_text(text: str) -> Tuple[np.ndarray, int, int]:
+    """Parse a constant text file into its flat values, row count and column count."""
+    lines = [line for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+    values = np.array([float(token) for line in lines for token in line.split()], dtype=np.float64)
+    cols = len(lines[0].split()) if lines else 0
+    return values, len(lines), cols
+
+
+def long_double_remainders(text: str) -> np.ndarray:
+    """Remainders of the values of a constant text file to their long double values.
+
+    For each value, the long double nearest to the decimal text (rounded to
+    LONG_DOUBLE_MANTISSA_BITS bits, ties to even, as strtold does) minus the
+    double nearest to it. The difference is exact in a double.
+    """
+    lines = [line for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+    remainders = []
+    for token in (token for line in lines for token in line.split()):
+        exact = Fraction(token)
+        if exact == 0:
+            remainders.append(0.0)
+            continue
+        magnitude = abs(exact)
+        exponent = magnitude.numerator.bit_length() - magnitude.denominator.bit_length()
+        if magnitude < Fraction(2) ** exponent:
+            exponent -= 1
+        # Scale to a 64-bit integer significand; round() on a Fraction ties to even
+        scale = Fraction(2) ** (LONG_DOUBLE_MANTISSA_BITS - 1 - exponent)
+        extended = Fraction(round(magnitude * scale)) / scale
+        if exact < 0:
+            extended = -extended
+        remainders.append(float(extended - Fraction(float(token))))
+    return np.array(remainders, dtype=np.float64)
+
+
+def list_constant_files(input_dir: Path, metadata: Optional[Dict] = None) -> List[str]:
+    """List constant files (relative paths) in manifest order.
+
+    Functions are ordered as in the ``meta_{YEAR}.json`` manifest, followed by
+    any other ``fNN`` folders; files inside a folder follow the naming
+    convention and are sorted by name.
+    """
+    input_dir = Path(input_dir)
+    folders = []
+    if metadata:
+        folders.extend(metadata.get("functions", {}).keys())
+    for folder in sorted(p.name for p in input_dir.iterdir() if p.is_dir()):
+        if re.match(r"^f\d{2}$", folder) and folder not in folders:
+            folders.append(folder)
+
+    names = []
+    for folder in folders:
+        folder_path = input_dir / folder
+        if not folder_path.is_dir():
+            continue
+        for file_path in sorted(folder_path.iterdir()):
+            if CONSTANT_FILE_PATTERN.match(file_path.name):
+                names.append(f"{folder}/{file_path.name}")
+    return names
+
+
+def build_constant_pack(input_dir: Path, output_path: Optional[Path] = None,
+                        year: int = 0) -> Path:
+    """Pack all constant files of an input_data directory into one binary file.
+
+    Args:
+        input_dir: The year's ``input_data`` directory
+        output_path: Destination (default: ``input_dir/constants.pack``)
+        year: CEC year recorded in the header (read from the manifest if 0)
+
+    Returns:
+        Path of the written pack
+    """
+    input_dir = Path(input_dir)
+    output_path = Path(output_path) if output_path else input_dir / PACK_FILENAME
+
+    metadata = _load_manifest(input_dir)
+    if metadata and not year:
+        year = int(metadata.get("year", 0))
+
+    # Files referenced by the manifest must exist
+    if metadata:
+        for func_key, func_info in metadata.get("functions", {}).items():
+            for rel_path in func_info.get("files", {}).values():
+                if not (input_dir / rel_path).exists():
+                    raise FileNotFoundError(f"{func_key}: constant file not found: {rel_path}")
+
+    names = list_constant_files(input_dir, metadata)
+    index_offset = _HEADER.size
+    data_offset = _align(index_offset + _ENTRY.size * len(names))
+
+    entries = []
+    blobs = []
+    offset = 0
+    for name in names:
+        if len(name.encode()) >= 64:
+            raise ValueError(f"Constant file name too long for the pack index: {name}")
+        raw = (input_dir / name).read_bytes()
+        values, rows, cols = parse_constant_text(raw.decode())
+        entries.append(PackEntry(name, offset, len(values), rows, cols,
+                                 hashlib.sha256(raw).hexdigest()))
+        blob = (values.astype("<f8").tobytes()
+                + long_double_remainders(raw.decode()).astype("<f8").tobytes())
+        padding = _align(len(blob)) - len(blob)
+        blobs.append(blob + b"\0" * padding)
+        offset += len(blob) + padding
+
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, PACK_ENDIAN_MARKER, year, len(entries),
+                          index_offset, data_offset, offset)
+
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for entry in entries:
+            f.write(_ENTRY.pack(entry.name.encode(), entry.offset, entry.count, entry.rows,
+                                entry.cols, bytes.fromhex(entry.sha256)))
+        f.write(b"\0" * (data_offset - index_offset - _ENTRY.size * len(entries)))
+        for blob in blobs:
+            f.write(blob)
+    tmp_path.replace(output_path)
+    return output_path
+
+
+class ConstantPack:
+    """Read-only, memory-mapped view of a constant pack."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode="r")
+
+        (magic, version, endian_marker, self.year, entry_count,
+         index_offset, data_offset, data_size) = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION or endian_marker != PACK_ENDIAN_MARKER:
+            raise ValueError(f"Not a valid constant pack: {self.path}")
+        if data_offset + data_size > len(self._map):
+            raise ValueError(f"Truncated constant pack: {self.path}")
+
+        self.entries: Dict[str, PackEntry] = {}
+        for i in range(entry_count):
+            name, offset, count, rows, cols, digest = _ENTRY.unpack_from(
+                self._map, index_offset + i * _ENTRY.size
+            )
+            name = name.rstrip(b"\0").decode()
+            self.entries[name] = PackEntry(name, offset, count, rows, cols, digest.hex())
+
+        self._data = self._map[data_offset:data_offset + data_size]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def get(self, name: str) -> np.ndarray:
+        """Return the flat values of a packed file as a read-only float64 view."""
+        entry = self.entries.get(name)
+        if entry is None:
+            raise KeyError(f"Constant file not in pack: {name}")
+        start = entry.offset
+        return self._data[start:start + entry.count * 8].view("<f8")
+
+    def remainders(self, name: str) -> np.ndarray:
+        """Return the remainders of a packed file's values to their long double values."""
+        entry = self.entries.get(name)
+        if entry is None:
+            raise KeyError(f"Constant file not in pack: {name}")
+        start = entry.offset + entry.count * 8
+        return self._data[start:start + entry.count * 8].view("<f8")
+
+    def verify(self, input_dir: Path) -> List[str]:
+        """Check the pack against the original text files.
+
+        Returns:
+            List of problems (empty if the pack is faithful to the text files)
+        """
+        input_dir = Path(input_dir)
+        problems = []
+        expected = set(list_constant_files(input_dir, _load_manifest(input_dir)))
+
+        for name in sorted(expected - set(self.entries)):
+            problems.append(f"{name}: missing from pack")
+
+        for name, entry in self.entries.items():
+            text_path = input_dir / name
+            if not text_path.exists():
+                problems.append(f"{name}: source text file not found")
+                continue
+            raw = text_path.read_bytes()
+            if hashlib.sha256(raw).hexdigest() != entry.sha256:
+                problems.append(f"{name}: checksum differs from source text file")
+                continue
+            values, _, _ = parse_constant_text(raw.decode())
+            if not np.array_equal(values, self.get(name)):
+                problems.append(f"{name}: packed values differ from source text file")
+            elif not np.array_equal(long_double_remainders(raw.decode()), self.remainders(name)):
+                problems.append(f"{name}: packed long double remainders differ from source text file")
+        return problems
+
+
+def load_constant_values(input_dir: Path, name: str) -> np.ndarray:
+    """Return the flat values of a constant file, from the pack when it is up to date.
+
+    Mirrors the C loader: a text file whose SHA-256 differs from its pack
+    entry's (edited since the pack was built) is parsed directly instead of
+    using the stale entry.
+    """
+    input_dir = Path(input_dir)
+    text_path = input_dir / name
+    pack = _open_pack(input_dir)
+    entry = pack.entries.get(name) if pack is not None else None
+    if entry is not None and not text_path.exists():
+        return pack.get(name)
+    raw = text_path.read_bytes()
+    if entry is not None and hashlib.sha256(raw).hexdigest() == entry.sha256:
+        return pack.get(name)
+    values, _, _ = parse_constant_text(raw.decode())
+    return values
+
+
+def load_derived_values(input_dir: Path, name: str, sources: Sequence[str]) -> Optional[np.ndarray]:
+    """Return the values of a file derived from constant files, None if it is missing or stale.
+
+    Mirrors ``open_derived_file`` in the C code: the derived file (e.g. the
+    cached normalization constants) is only used when it is at least as new as
+    every constant file it was computed from.
+    """
+    input_dir = Path(input_dir)
+    try:
+        mtime = (input_dir / name).stat().st_mtime
+    except OSError:
+        return None
+    for source in sources:
+        source_path = input_dir / source
+        if source_path.exists() and int(source_path.stat().st_mtime) > int(mtime):
+            return None
+    return load_constant_values(input_dir, name)
+
+
+_open_packs: Dict[Path, Tuple[float, Optional[ConstantPack]]] = {}
+
+
+def _open_pack(input_dir: Path) -> Optional[ConstantPack]:
+    """Open (and cache) the pack of an input directory, None if absent or invalid."""
+    path = (Path(input_dir) / PACK_FILENAME).resolve()
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    cached = _open_packs.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        pack = ConstantPack(path)
+    except (OSError, ValueError):
+        pack = None
+    _open_packs[path] = (mtime, pack)
+    return pack
+
+
+def _load_manifest(input_dir: Path) -> Optional[Dict]:
+    """Load the meta_{YEAR}.json manifest of an input directory, if present."""
+    manifests = sorted(Path(input_dir).glob("meta_*.json"))
+    if not manifests:
+        return None
+    with open(manifests[0], "r") as f:
+        return json.load(f)
+
+
+def _align(size: int) -> int:
+    """Round size up to the pack alignment."""
+    return (size + PACK_ALIGNMENT - 1) // PACK_ALIGNMENT * PACK_ALIGNMENT
@@ -3,11 +3,15 @@ Factory for creating CEC benchmark executors.
 """
 
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from .base import FunctionExecutor
+from .caching import CachingExecutor
 from .cec2005 import CEC2005Executor
+from .cec2005_lib import CEC2005LibraryExecutor
+from .cec2005_numpy import CEC2005NumpyExecutor
 from .cec2006 import CEC2006Executor
+from .cec2006_numpy import CEC2006NumpyExecutor
 
 
 class ExecutorFactory:
@@ -22,25 +26,84 @@ class ExecutorFactory:
         # 2009: CEC2009Executor,
     }
     
+    # Alternative backends per year, selectable by name
+    _backends: Dict[int, Dict[str, Type[FunctionExecutor]]] = {
+        2005: {
+            "subprocess": CEC2005Executor,
+            "ctypes": CEC2005LibraryExecutor,
+            "numpy": CEC2005NumpyExecutor,
+        },
+        2006: {
+            "subprocess": CEC2006Executor,
+            "numpy": CEC2006NumpyExecutor,
+        },
+    }
+    
     @classmethod
-    def create_executor(cls, year: int, implementation_dir: str) -> FunctionExecutor:
+    def create_executor(cls, year: int, implementation_dir: str,
+                        backend: Optional[str] = None,
+                        profile: Optional[str] = None,
+                        cache_entries: Optional[int] = None,
+                        threads: Optional[int] = None) -> FunctionExecutor:
         """Create an appropriate executor for the CEC year.
         
         Args:
             year: The CEC year (e.g., 2005, 2006)
             implementation_dir: Path to the implementation directory
+            backend: Optional backend name (see available_backends); the
+                year's default executor is used when omitted
+            profile: Optional build profile name for compiled executors
+                (see build.BUILD_PROFILES; default: the Makefile's flags)
+            cache_entries: If given, wrap the executor in a CachingExecutor
+                memoizing up to this many evaluations (noisy functions, read
+                from input_data/meta_{year}.json, are not cached)
+            threads: Optional number of threads a batch is split across, for
+                executors that support it (0: one per core)
             
         Returns:
             A FunctionExecutor instance for the specified year
             
         Raises:
             ValueError: If no executor is implemented for the specified year
+                or the backend is unknown, or if a build profile is given for an
+                executor that does not compile its implementation, or a thread
+                count for one that does not split batches across threads
         """
-        executor_class = cls._executors.get(year)
+        if backend is None:
+            executor_class = cls._executors.get(year)
+        else:
+            executor_class = cls._backends.get(year, {}).get(backend)
+            if not executor_class:
+                raise ValueError(
+                    f"No '{backend}' backend for CEC{year}. "
+                    f"Available backends: {cls.available_backends(year)}"
+                )
         if not executor_class:
             raise ValueError(f"No executor implemented for CEC{year}")
         
-        return executor_class(Path(implementation_dir))
+        kwargs = {}
+        if threads is not None:
+            if not executor_class.supports_threads:
+                raise ValueError(
+                    f"{executor_class.__name__} does not split batches across threads "
+                    f"and takes no thread count"
+                )
+            kwargs["threads"] = threads
+        
+        if profile is not None:
+            if not executor_class.supports_profiles:
+                raise ValueError(
+                    f"{executor_class.__name__} does not compile its implementation "
+                    f"and takes no build profile"
+                )
+            executor = executor_class(Path(implementation_dir), profile, **kwargs)
+        else:
+            executor = executor_class(Path(implementation_dir), **kwargs)
+        
+        if cache_entries is not None:
+            metadata_path = Path(implementation_dir) / "input_data" / f"meta_{year}.json"
+            executor = CachingExecutor.from_metadata(executor, metadata_path, max_entries=cache_entries)
+        return executor
     
     @classmethod
     def register_executor(cls, year: int, executor_class: Type[FunctionExecutor]) -> None:
@@ -54,6 +117,36 @@ class ExecutorFactory:
         """
         cls._executors[year] = executor_class
     
+    @classmethod
+    def register_backend(cls, year: int, name: str,
+                         executor_class: Type[FunctionExecutor]) -> None:
+        """Register a named alternative backend for a specific year.
+        
+        Args:
+            year: The CEC year
+            name: Backend name used to select the executor
+            executor_class: The executor class to register
+        """
+        cls._backends.setdefault(year, {})[name] = executor_class
+    
+    @classmethod
+    def backend_class(cls, year: int, backend: str) -> Optional[Type[FunctionExecutor]]:
+        """Get the executor class of a named backend.
+        
+        Returns:
+            The executor class, or None if the year has no such backend
+        """
+        return cls._backends.get(year, {}).get(backend)
+    
+    @classmethod
+    def available_backends(cls, year: int) -> list[str]:
+        """Get the backend names available for a CEC year.
+        
+        Returns:
+            Sorted list of backend names
+        """
+        return sorted(cls._backends.get(year, {}).keys())
+    
     @classmethod
     def supported_years(cls) -> list[int]:
         """Get list of supported CEC years.
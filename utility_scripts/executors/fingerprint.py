@@ -0,0 +1,174 @@
+"""
+Source fingerprints of single benchmark functions.
+
+A fingerprint is a hash of all the code a benchmark function's results depend
+on, so a change to the implementation only invalidates the functions it can
+affect. For the C implementations, SourceGraph parses the sources into their
+function definitions and the calls between them: the fingerprint of a
+benchmark function covers the definitions reachable from its own functions
+(e.g. initialize_f21, calc_benchmark_f21 and calc_benchmark_norm_f21) and from
+the shared entry points (main, the library API), without descending into the
+functions of other benchmark functions. Everything outside function bodies
+(declarations, globals, macros) and the headers and Makefile is shared by all.
+"""
+
+import hashlib
+import inspect
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# Files of an implementation, as in build.SOURCE_PATTERNS
+C_SOURCE_PATTERN = "*.c"
+SHARED_PATTERNS = ("*.h", "Makefile")
+
+# Comments, string and character literals
+_C_NOISE = re.compile(
+    r'/\*.*?\*/|//[^\n]*|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'',
+    re.DOTALL
+)
+# Function header before a top-level "{": name, parameter list, nothing else
+_C_FUNCTION_HEADER = re.compile(r'([A-Za-z_]\w*)\s*\([^;{}()]*\)\s*$')
+_C_CALL = re.compile(r'\b([A-Za-z_]\w*)\s*\(')
+_C_KEYWORDS = frozenset(("if", "for", "while", "switch", "return", "sizeof", "defined"))
+
+
+def sha256_text(*parts: str) -> str:
+    """Hash of a sequence of strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def module_fingerprint(cls: type) -> str:
+    """Hash of the source of the module defining a class (e.g. an executor)."""
+    return sha256_text(cls.__name__, inspect.getsource(inspect.getmodule(cls)))
+
+
+def _strip_c(text: str) -> str:
+    """Remove comments and blank out literals, keeping the code structure."""
+    def replace(match):
+        token = match.group(0)
+        if token.startswith("/"):
+            return " "
+        # Keep literals in the hash, but without braces or parentheses
+        return token[0] + hashlib.sha1(token.encode()).hexdigest() + token[0]
+    return _C_NOISE.sub(replace, text)
+
+
+class SourceGraph:
+    """Function definitions of a C source tree and the calls between them."""
+
+    def __init__(self, source_dir: Path):
+        self.source_dir = Path(source_dir)
+        self.bodies: Dict[str, List[str]] = {}
+        self.calls: Dict[str, Set[str]] = {}
+        shared = []
+        for path in sorted(self.source_dir.glob(C_SOURCE_PATTERN)):
+            shared.append(path.name)
+            shared.append(self._parse(path.read_text(errors="replace")))
+        for pattern in SHARED_PATTERNS:
+            for path in sorted(self.source_dir.glob(pattern)):
+                shared.append(path.name)
+                shared.append(path.read_text(errors="replace"))
+        self.shared = sha256_text(*shared)
+        # Only calls to functions defined in the tree matter
+        for name in self.calls:
+            self.calls[name] &= self.bodies.keys()
+
+    def _parse(self, text: str) -> str:
+        """Record the function definitions of a file and return its remaining top-level text."""
+        code = _strip_c(text)
+        top_level = []
+        start = 0
+        pos = 0
+        while True:
+            brace = code.find("{", pos)
+            if brace < 0:
+                break
+            end = self._matching_brace(code, brace)
+            header = code[start:brace]
+            statement_start = max(header.rfind(";"), header.rfind("}")) + 1
+            match = _C_FUNCTION_HEADER.search(header[statement_start:])
+            if match:
+                # Preprocessor lines before the definition stay top-level text
+                directives = re.match(r'(?:\s*#[^\n]*\n)*', header[statement_start:])
+                definition_start = statement_start + directives.end()
+                name = match.group(1)
+                body = code[brace:end]
+                top_level.append(header[:definition_start])
+                self.bodies.setdefault(name, []).append(header[definition_start:] + body)
+                self.calls.setdefault(name, set()).update(
+                    call for call in _C_CALL.findall(body) if call not in _C_KEYWORDS
+                )
+                start = end
+            pos = end
+        top_level.append(code[start:])
+        # Whitespace-only edits do not change the fingerprints
+        return " ".join("".join(top_level).split())
+
+    @staticmethod
+    def _matching_brace(code: str, open_pos: int) -> int:
+        """Position just after the brace closing the one at open_pos."""
+        depth = 0
+        for pos in range(open_pos, len(code)):
+            if code[pos] == "{":
+                depth += 1
+            elif code[pos] == "}":
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+        return len(code)
+
+    def reachable(self, roots: Iterable[str], excluded: Set[str]) -> Set[str]:
+        """Functions reachable from roots through calls, never entering excluded ones."""
+        seen: Set[str] = set()
+        stack = [name for name in roots if name in self.bodies and name not in excluded]
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            stack.extend(call for call in self.calls.get(name, ()) if call not in excluded)
+        return seen
+
+    def function_fingerprint(self, func_id: int, symbol_pattern: str,
+                             extra: Optional[Iterable[str]] = None) -> str:
+        """Fingerprint of the code one benchmark function depends on.
+
+        Args:
+            func_id: Benchmark function ID
+            symbol_pattern: Regular expression matching the C functions that
+                belong to a single benchmark function, with the function ID as
+                its first group (e.g. r"_f(\\d+)$" or r"^g(\\d+)$")
+            extra: Further strings to include (e.g. compiler flags)
+        """
+        pattern = re.compile(symbol_pattern)
+        own, others = set(), set()
+        for name in self.bodies:
+            match = pattern.search(name)
+            if match:
+                (own if int(match.group(1)) == func_id else others).add(name)
+
+        # Functions of other benchmark functions called by this one's (F25 calls F24's)
+        borrowed = set()
+        frontier = set(own)
+        while frontier:
+            frontier = set().union(*(self.calls.get(name, set()) for name in frontier)) & others - borrowed
+            borrowed |= frontier
+        own |= borrowed
+        others -= borrowed
+
+        # Shared entry points: functions of no benchmark function that nothing calls
+        called = set().union(*self.calls.values()) if self.calls else set()
+        entry_points = {name for name in self.bodies
+                        if name not in called and name not in own and name not in others}
+
+        parts = [self.shared]
+        for name in sorted(self.reachable(own | entry_points, others)):
+            parts.append(name)
+            parts.extend(" ".join(body.split()) for body in self.bodies[name])
+        parts.extend(extra or ())
+        return sha256_text(*parts)
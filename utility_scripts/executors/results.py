@@ -0,0 +1,71 @@
+"""
+Structured evaluation results of constrained benchmark functions.
+
+run() and run_batch() of the constrained executors (CEC2006) return
+EvaluationResult values: floats equal to the objective value, so code that
+only needs the objective is unaffected, that also carry the inequality
+constraints g(x) <= 0, the equality constraints h(x) = 0, the total
+violation and the feasibility of the evaluation. evaluate() returns the same
+data for a whole population as a ConstrainedResult of arrays.
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import numpy as np
+
+# Tolerance main.c uses to flag an equality constraint as violated
+EQUALITY_TOLERANCE = 1e-6
+
+
+def total_violation(g: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Total constraint violation as computed by main.c: sum of positive g plus sum of |h|."""
+    return np.sum(np.where(g > 0, g, 0.0), axis=1) + np.sum(np.abs(h), axis=1)
+
+
+class EvaluationResult(float):
+    """Objective value of one evaluation, with its constraint values."""
+
+    def __new__(cls, objective: float, g: Sequence[float] = (), h: Sequence[float] = (),
+                violation: float = 0.0):
+        result = super().__new__(cls, objective)
+        result.g = np.asarray(g, dtype=np.float64)
+        result.h = np.asarray(h, dtype=np.float64)
+        result.violation = float(violation)
+        return result
+
+    @property
+    def objective(self) -> float:
+        """The objective value as a plain float."""
+        return float(self)
+
+    @property
+    def feasible(self) -> bool:
+        """Whether all constraints are satisfied (|h| within EQUALITY_TOLERANCE)."""
+        return bool(np.all(self.g <= 0.0) and np.all(np.abs(self.h) <= EQUALITY_TOLERANCE))
+
+    def __repr__(self) -> str:
+        return (f"EvaluationResult(objective={float(self)!r}, violation={self.violation!r}, "
+                f"feasible={self.feasible}, ng={len(self.g)}, nh={len(self.h)})")
+
+
+@dataclass
+class ConstrainedResult:
+    """Objective and constraint values of a population."""
+    f: np.ndarray          # (N,) objective values
+    g: np.ndarray          # (N, ng) inequality constraints, satisfied when <= 0
+    h: np.ndarray          # (N, nh) equality constraints, satisfied when == 0
+    violation: np.ndarray  # (N,) sum of positive g plus sum of |h|
+
+    @property
+    def feasible(self) -> np.ndarray:
+        """(N,) mask of individuals satisfying all constraints (|h| within EQUALITY_TOLERANCE)."""
+        return np.all(self.g <= 0.0, axis=1) & np.all(np.abs(self.h) <= EQUALITY_TOLERANCE, axis=1)
+
+    def __len__(self) -> int:
+        return len(self.f)
+
+    def results(self) -> List[EvaluationResult]:
+        """The evaluations of the population, one EvaluationResult per individual."""
+        return [EvaluationResult(self.f[i], self.g[i], self.h[i], self.violation[i])
+                for i in range(len(self.f))]
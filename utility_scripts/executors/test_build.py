@@ -0,0 +1,64 @@
+"""Tests of the build profiles and the content-hashed build cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from executors.build import BuildCache, BuildProfile, get_build_profile
+
+# Writes its flags into the artifact slowly, so overlapping builds would mix them up
+MAKEFILE = """\
+OPTFLAGS=none
+all:
+\tprintf '%s' "$(OPTFLAGS)" > main.tmp && sleep 0.2 && mv main.tmp main
+clean:
+\trm -f main main.tmp
+"""
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    (tmp_path / "Makefile").write_text(MAKEFILE)
+    (tmp_path / "main.c").write_text("int main(void) { return 0; }\n")
+    return tmp_path
+
+
+def profile(flags):
+    return BuildProfile(flags.strip("-"), flags, "test profile")
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError, match="Unknown build profile"):
+        get_build_profile("fastest")
+
+
+def test_build_is_cached_until_the_sources_change(source_dir):
+    cache = BuildCache(source_dir, ["main"])
+    first = cache.build(profile("-O1"))
+    assert cache.build(profile("-O1")) == first
+    (source_dir / "main.c").write_text("int main(void) { return 1; }\n")
+    assert not cache.is_cached(profile("-O1"))
+    assert cache.build(profile("-O1")) != first
+
+
+def test_concurrent_builds_keep_their_own_artifacts(source_dir):
+    flags = ["-O0", "-O1", "-O2", "-O3"]
+    cache = BuildCache(source_dir, ["main"])
+    with ThreadPoolExecutor(len(flags)) as pool:
+        targets = list(pool.map(lambda f: cache.build(profile(f)), flags))
+    assert [(target / "main").read_text() for target in targets] == flags
+
+
+def test_a_new_build_evicts_the_least_recently_used(source_dir):
+    cache = BuildCache(source_dir, ["main"], keep=2)
+    other = cache.build(profile("-O2"))
+    builds = []
+    for status in range(3):
+        (source_dir / "main.c").write_text(f"int main(void) {{ return {status}; }}\n")
+        builds.append(cache.build(profile("-O1")))
+        if status == 1:
+            # Reuse the first build, so the second one is the least recently used
+            (source_dir / "main.c").write_text("int main(void) { return 0; }\n")
+            assert cache.build(profile("-O1")) == builds[0]
+    assert [build.exists() for build in builds] == [True, False, True]
+    assert other.exists()
@@ -0,0 +1,86 @@
+"""Tests of the memoizing CachingExecutor."""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from executors import CachingExecutor
+from executors.base import FunctionExecutor
+from executors.caching import ENTRY_OVERHEAD_BYTES
+
+
+class CountingExecutor(FunctionExecutor):
+    """Sum of the vector plus the function ID; records every vector it evaluates."""
+
+    def __init__(self, implementation_dir: Path = Path(".")):
+        self.implementation_dir = implementation_dir
+        self.evaluated: List[List[float]] = []
+
+    def build(self) -> bool:
+        return True
+
+    def run(self, func_id: int, dimension: int, input_vector: List[float]) -> float:
+        self.evaluated.append(list(input_vector))
+        return float(sum(input_vector) + func_id)
+
+    def cleanup(self) -> None:
+        pass
+
+
+def test_repeated_vectors_are_evaluated_once():
+    inner = CountingExecutor()
+    cache = CachingExecutor(inner, 2005)
+    assert cache.run_batch(1, 2, [[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]]) == [4.0, 8.0, 4.0]
+    assert cache.run(1, 2, [3.0, 4.0]) == 8.0
+    assert inner.evaluated == [[1.0, 2.0], [3.0, 4.0]]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+
+
+def test_the_function_and_the_sign_of_zero_are_part_of_the_key():
+    inner = CountingExecutor()
+    cache = CachingExecutor(inner, 2005)
+    assert cache.run(1, 1, [0.0]) == 1.0
+    assert cache.run(2, 1, [0.0]) == 2.0
+    cache.run(1, 1, [-0.0])
+    assert len(inner.evaluated) == 3
+
+
+def test_the_least_recently_used_entry_is_evicted():
+    inner = CountingExecutor()
+    cache = CachingExecutor(inner, 2005, max_entries=2)
+    cache.run(1, 1, [1.0])
+    cache.run(1, 1, [2.0])
+    cache.run(1, 1, [1.0])   # [2.0] is now the least recently used
+    cache.run(1, 1, [3.0])
+    assert cache.stats().evictions == 1
+    inner.evaluated.clear()
+    cache.run(1, 1, [1.0])
+    cache.run(1, 1, [2.0])
+    assert inner.evaluated == [[2.0]]
+
+
+def test_max_bytes_bounds_the_cache():
+    entry_bytes = 8 * 4 + ENTRY_OVERHEAD_BYTES
+    cache = CachingExecutor(CountingExecutor(), 2005, max_entries=None, max_bytes=3 * entry_bytes)
+    cache.run_batch(1, 4, [[float(i)] * 4 for i in range(5)])
+    stats = cache.stats()
+    assert (stats.entries, stats.bytes, stats.evictions) == (3, 3 * entry_bytes, 2)
+
+
+def test_noisy_functions_are_never_cached():
+    inner = CountingExecutor()
+    cache = CachingExecutor(inner, 2005, noisy=[4])
+    cache.run(4, 1, [1.0])
+    cache.run_batch(4, 1, [[1.0], [1.0]])
+    assert len(inner.evaluated) == 3
+    stats = cache.stats()
+    assert (stats.bypassed, stats.hits, stats.misses, stats.entries) == (3, 0, 0, 0)
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        CachingExecutor(CountingExecutor(), 2005, max_entries=0)
+    with pytest.raises(ValueError):
+        CachingExecutor(CountingExecutor(), 2005, max_bytes=0)
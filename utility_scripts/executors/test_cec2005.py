@@ -0,0 +1,38 @@
+"""Tests of the CEC2005 subprocess executor."""
+
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from executors import CEC2005Executor
+
+IMPLEMENTATION_DIR = Path(__file__).resolve().parents[2] / "CEC2005-C"
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = CEC2005Executor(IMPLEMENTATION_DIR)
+    if not executor.build():
+        pytest.skip("The CEC2005 C code could not be built")
+    return executor
+
+
+def test_batches_accept_arrays(executor):
+    points = np.random.default_rng(1).uniform(-5.0, 5.0, size=(3, 10))
+    values = [executor.run(1, 10, list(point)) for point in points]
+    np.testing.assert_allclose(executor.run_batch(1, 10, points), values, rtol=1e-13)
+    np.testing.assert_allclose(asyncio.run(executor.arun_batch(1, 10, points)), values, rtol=1e-13)
+
+
+def test_empty_batches(executor):
+    empty = np.empty((0, 10))
+    assert executor.run_batch(1, 10, empty) == []
+    assert asyncio.run(executor.arun_batch(1, 10, empty)) == []
+    assert executor.run_batch(1, 10, []) == []
+
+
+def test_norm_constants_match_the_cache(executor):
+    cached = (IMPLEMENTATION_DIR / "input_data" / "f21" / "norm_D10.txt").read_text().split()
+    assert executor.norm_constants(21, 10) == [float(value) for value in cached]
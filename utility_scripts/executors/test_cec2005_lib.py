@@ -0,0 +1,119 @@
+"""Tests of the CEC2005 shared library executor."""
+
+import asyncio
+import ctypes
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from executors import CEC2005Executor, CEC2005LibraryExecutor
+
+IMPLEMENTATION_DIR = Path(__file__).resolve().parents[2] / "CEC2005-C"
+
+
+def built(executor):
+    if not executor.build():
+        pytest.skip("The CEC2005 C code could not be built")
+    return executor
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return built(CEC2005Executor(IMPLEMENTATION_DIR))
+
+
+@pytest.fixture(scope="module")
+def points():
+    return np.random.default_rng(2005).uniform(-5.0, 5.0, size=(4, 10))
+
+
+def expected(reference, func_id, points):
+    """Values of the subprocess executor (printed with 15 significant digits)."""
+    return np.array(reference.run_batch(func_id, points.shape[1], points.tolist()))
+
+
+def test_matches_the_subprocess_executor(reference, points):
+    executor = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    np.testing.assert_allclose(executor.evaluate(9, 10, points), expected(reference, 9, points), rtol=1e-13)
+
+
+def test_asynchronous_runs_stay_in_process(monkeypatch, points):
+    executor = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    values = executor.evaluate(9, 10, points)
+
+    async def no_process(*args, **kwargs):
+        raise AssertionError("spawned a process")
+
+    monkeypatch.setattr("executors.cec2005.run_process", no_process)
+    assert asyncio.run(executor.arun(9, 10, points[0].tolist())) == values[0]
+    np.testing.assert_array_equal(asyncio.run(executor.arun_batch(9, 10, points)), values)
+    assert asyncio.run(executor.arun_batch(9, 10, [])) == []
+
+
+def test_executors_sharing_the_library_reinitialize_it(reference, points):
+    first = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    second = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    f1 = first.evaluate(1, 10, points)
+    f6 = second.evaluate(6, 10, points)
+    np.testing.assert_allclose(f1, expected(reference, 1, points), rtol=1e-13)
+    np.testing.assert_allclose(f6, expected(reference, 6, points), rtol=1e-13)
+    # The library now holds F6: the first executor must load F1 again
+    np.testing.assert_array_equal(first.evaluate(1, 10, points), f1)
+    np.testing.assert_array_equal(second.evaluate(6, 10, points), f6)
+
+
+def test_cleanup_of_one_executor_does_not_break_another(points):
+    first = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    second = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR))
+    values = first.evaluate(3, 10, points)
+    second.cleanup()
+    np.testing.assert_array_equal(first.evaluate(3, 10, points), values)
+
+
+def test_thread_count_is_per_executor(points):
+    serial = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR, threads=1))
+    parallel = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR, threads=2))
+    parallel.evaluate(1, 10, points)
+    assert serial.effective_threads() == 1
+
+
+def in_thread(function, *args):
+    """Call function(*args) on a new thread and return its result."""
+    result = []
+    thread = threading.Thread(target=lambda: result.append(function(*args)))
+    thread.start()
+    thread.join()
+    return result[0]
+
+
+@pytest.mark.parametrize("threads", [1, 2])
+def test_evaluation_from_another_thread(threads):
+    executor = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR, threads=threads))
+    points = np.random.default_rng(15).uniform(-5.0, 5.0, size=(64, 10))
+    # The library is initialized (and its scratch allocated) on this thread
+    values = executor.evaluate(15, 10, points)
+    np.testing.assert_array_equal(in_thread(executor.evaluate, 15, 10, points), values)
+    # The next constants are loaded by the other thread and freed by this one
+    other = in_thread(executor.evaluate, 16, 10, points)
+    executor.cleanup()
+    np.testing.assert_array_equal(executor.evaluate(16, 10, points), other)
+    np.testing.assert_array_equal(in_thread(executor.evaluate, 15, 10, points), values)
+
+
+@pytest.mark.parametrize("func_id", [4, 17, 24, 25])
+def test_noisy_batches_match_a_serial_run(func_id):
+    executor = built(CEC2005LibraryExecutor(IMPLEMENTATION_DIR, threads=4))
+    libc = ctypes.CDLL(None)
+    points = np.random.default_rng(func_id).uniform(-5.0, 5.0, size=(256, 10))
+    # Initialize with an even number of draws (F24/F25 draw one to normalize), so no
+    # Box-Muller value is left over for the first vector: srand() does not reset it
+    executor.evaluate(func_id, 10, points[:1] if func_id in (24, 25) else points[:2])
+
+    libc.srand(func_id)
+    parallel = executor.evaluate(func_id, 10, points)
+    executor.set_threads(1)
+    libc.srand(func_id)
+    serial = executor.evaluate(func_id, 10, points)
+    np.testing.assert_array_equal(parallel, serial)
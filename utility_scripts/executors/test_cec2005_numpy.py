@@ -0,0 +1,37 @@
+"""Tests of the NumPy port's check of the cached normalization constants."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from executors import CEC2005NumpyExecutor
+from executors.cec2005_numpy import check_norm_cache
+
+INPUT_DIR = Path(__file__).resolve().parents[2] / "CEC2005-C" / "input_data"
+
+
+@pytest.fixture
+def executor(tmp_path):
+    # The constants of F15 only, without the constant pack
+    shutil.copytree(INPUT_DIR / "f15", tmp_path / "input_data" / "f15")
+    return CEC2005NumpyExecutor(tmp_path)
+
+
+def test_the_shipped_cache_agrees(executor):
+    assert check_norm_cache(executor, 15, 10) is None
+
+
+def test_an_edited_cache_value_is_reported(executor):
+    norm_path = executor.input_dir / "f15" / "norm_D10.txt"
+    values = norm_path.read_text().split()
+    values[3] = "1.0E+00"
+    norm_path.write_text("\n".join(values) + "\n")
+    assert check_norm_cache(executor, 15, 10).startswith("f15/norm_D10.txt: value 3 is 1.0, NumPy computes")
+
+
+def test_constants_computed_elsewhere_are_compared(executor):
+    computed = [float(value) for value in (executor.input_dir / "f15" / "norm_D10.txt").read_text().split()]
+    assert check_norm_cache(executor, 15, 10, computed=computed, source="the C code") is None
+    computed[0] *= 2.0
+    assert "value 0" in check_norm_cache(executor, 15, 10, computed=computed, source="the C code")
@@ -0,0 +1,65 @@
+"""Tests of the binary constant pack."""
+
+import os
+
+import numpy as np
+import pytest
+
+from executors.constants import (ConstantPack, build_constant_pack, load_constant_values,
+                                 long_double_remainders)
+
+TEXT = "-3.9311900073407301e+001  5.8899246868125904e+001\n0.1 -2.2204460492503131e-016\n"
+
+extended = pytest.mark.skipif(np.finfo(np.longdouble).nmant != 63,
+                              reason="long double is not x87 extended precision here")
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    (tmp_path / "f01").mkdir()
+    (tmp_path / "f01" / "shift_D2.txt").write_text(TEXT)
+    (tmp_path / "f01" / "rot_D2.txt").write_text("1 0\n0 1\n")
+    return tmp_path
+
+
+@extended
+def test_remainders_restore_the_long_double_values():
+    tokens = TEXT.split()
+    values = np.array([float(token) for token in tokens])
+    restored = values.astype(np.longdouble) + long_double_remainders(TEXT).astype(np.longdouble)
+    assert [np.longdouble(token) for token in tokens] == list(restored)
+    # 0.1 is not a double: its long double value needs a nonzero remainder
+    assert long_double_remainders("0.1")[0] != 0.0
+
+
+def test_exact_values_have_no_remainder():
+    assert long_double_remainders("1 0 -0.5 1024\n").tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_pack_round_trip(input_dir):
+    pack = ConstantPack(build_constant_pack(input_dir, year=2005))
+    assert pack.year == 2005
+    assert sorted(pack.entries) == ["f01/rot_D2.txt", "f01/shift_D2.txt"]
+    assert pack.get("f01/shift_D2.txt").tolist() == [float(token) for token in TEXT.split()]
+    assert pack.remainders("f01/shift_D2.txt").tolist() == long_double_remainders(TEXT).tolist()
+    assert pack.entries["f01/shift_D2.txt"].rows == 2
+    assert pack.verify(input_dir) == []
+
+
+def test_verify_reports_an_edited_text_file(input_dir):
+    pack = ConstantPack(build_constant_pack(input_dir, year=2005))
+    (input_dir / "f01" / "rot_D2.txt").write_text("0 1\n1 0\n")
+    assert pack.verify(input_dir) == ["f01/rot_D2.txt: checksum differs from source text file"]
+
+
+def test_an_edited_text_file_is_read_despite_an_older_mtime(input_dir):
+    pack_path = build_constant_pack(input_dir, year=2005)
+    rot_path = input_dir / "f01" / "rot_D2.txt"
+    assert load_constant_values(input_dir, "f01/rot_D2.txt").tolist() == [1.0, 0.0, 0.0, 1.0]
+    rot_path.write_text("0 1\n1 0\n")
+    older = pack_path.stat().st_mtime - 60
+    os.utime(rot_path, (older, older))
+    assert load_constant_values(input_dir, "f01/rot_D2.txt").tolist() == [0.0, 1.0, 1.0, 0.0]
+    # Without its text file, the packed values are used
+    (input_dir / "f01" / "shift_D2.txt").unlink()
+    assert load_constant_values(input_dir, "f01/shift_D2.txt").tolist() == [float(token) for token in TEXT.split()]
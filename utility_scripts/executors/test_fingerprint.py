@@ -0,0 +1,72 @@
+"""Tests of the per-function source fingerprints of C implementations."""
+
+import pytest
+
+from executors.fingerprint import SourceGraph
+
+SYMBOLS = r"_f(\d+)$"
+
+SOURCES = {
+    "global.h": "extern int nreal;\n",
+    "def1.c": (
+        '# include "global.h"\n'
+        "long double calc_sphere (long double *x) { return x[0]*x[0]; }\n"
+        "long double calc_rastrigin (long double *x) { return x[0] + 10.0; }\n"
+    ),
+    "def2.c": (
+        '# include "global.h"\n'
+        "/* Benchmark functions */\n"
+        "long double calc_benchmark_f1 (long double *x) { return calc_sphere(x); }\n"
+        "long double calc_benchmark_f2 (long double *x) { return calc_rastrigin(x); }\n"
+        "long double calc_benchmark_f3 (long double *x) { return calc_benchmark_f2(x) + 1.0; }\n"
+    ),
+}
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    for name, text in SOURCES.items():
+        (tmp_path / name).write_text(text)
+    return tmp_path
+
+
+def fingerprints(source_dir):
+    graph = SourceGraph(source_dir)
+    return {func_id: graph.function_fingerprint(func_id, SYMBOLS) for func_id in (1, 2, 3)}
+
+
+def edit(source_dir, name, old, new):
+    path = source_dir / name
+    path.write_text(path.read_text().replace(old, new))
+
+
+def test_a_change_only_affects_the_functions_that_reach_it(source_dir):
+    before = fingerprints(source_dir)
+    edit(source_dir, "def1.c", "x[0]*x[0]", "x[0]*x[0]*2.0")
+    after = fingerprints(source_dir)
+    assert after[1] != before[1]
+    assert after[2] == before[2] and after[3] == before[3]
+
+
+def test_functions_borrowed_from_another_benchmark_function_are_covered(source_dir):
+    before = fingerprints(source_dir)
+    edit(source_dir, "def1.c", "x[0] + 10.0", "x[0] + 20.0")
+    after = fingerprints(source_dir)
+    assert after[2] != before[2] and after[3] != before[3]
+    assert after[1] == before[1]
+
+
+def test_comments_and_whitespace_do_not_change_fingerprints(source_dir):
+    before = fingerprints(source_dir)
+    edit(source_dir, "def2.c", "/* Benchmark functions */", "/* The benchmark functions */\n\n")
+    edit(source_dir, "def1.c", "{ return x[0]*x[0]; }", "{\n    return x[0]*x[0];\n}")
+    assert fingerprints(source_dir) == before
+
+
+def test_headers_and_extra_parts_change_every_fingerprint(source_dir):
+    before = fingerprints(source_dir)
+    graph = SourceGraph(source_dir)
+    assert graph.function_fingerprint(1, SYMBOLS, ["OPTFLAGS=-O3"]) != before[1]
+    edit(source_dir, "global.h", "nreal;", "nreal;\nextern int function_id;")
+    after = fingerprints(source_dir)
+    assert all(after[func_id] != before[func_id] for func_id in before)
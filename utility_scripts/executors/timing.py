@@ -0,0 +1,95 @@
+"""
+Opt-in per-phase timing for CEC benchmark executors.
+
+Executors record the time they spend in each phase of an evaluation (writing
+the input, spawning the C process, loading constants, normalizing, evaluating,
+parsing the output) per (function, dimension), once timing has been enabled
+with FunctionExecutor.enable_timing().
+"""
+
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional, Tuple
+
+# Phases in the order they occur during an evaluation
+PHASES = ("write_input", "spawn", "initialize", "normalize", "evaluate", "parse_output")
+
+# Environment variable asking the CEC2005 binary to report its phase timings on stderr
+C_TIMING_ENV = "CEC2005_TIMING"
+C_TIMING_PREFIX = "TIMING "
+
+
+class PhaseTimings:
+    """Accumulated seconds and call counts per (function, dimension) and phase."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds: Dict[Tuple[int, int], Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._calls: Dict[Tuple[int, int], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, func_id: int, dimension: int, phase: str, seconds: float) -> None:
+        """Record time spent in a phase."""
+        with self._lock:
+            self._seconds[(func_id, dimension)][phase] += seconds
+            self._calls[(func_id, dimension)][phase] += 1
+
+    @contextmanager
+    def phase(self, func_id: int, dimension: int, phase: str) -> Iterator[None]:
+        """Time the enclosed block as a phase (wall-clock time)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(func_id, dimension, phase, time.perf_counter() - start)
+
+    def summary(self, func_id: int, dimension: int) -> Dict[str, Dict[str, float]]:
+        """Get {phase: {"seconds": total, "calls": count}} for a function and dimension."""
+        with self._lock:
+            seconds = self._seconds.get((func_id, dimension), {})
+            calls = self._calls.get((func_id, dimension), {})
+            ordered = [p for p in PHASES if p in seconds] + sorted(set(seconds) - set(PHASES))
+            return {p: {"seconds": seconds[p], "calls": calls[p]} for p in ordered}
+
+    def keys(self):
+        """(function, dimension) pairs with recorded timings."""
+        with self._lock:
+            return sorted(self._seconds)
+
+    def reset(self) -> None:
+        """Discard all recorded timings."""
+        with self._lock:
+            self._seconds.clear()
+            self._calls.clear()
+
+
+def parse_c_timings(stderr: str) -> Dict[str, float]:
+    """Parse the "TIMING <phase> <seconds>" lines the CEC2005 binary writes on stderr."""
+    timings = {}
+    for line in stderr.splitlines():
+        if line.startswith(C_TIMING_PREFIX):
+            parts = line.split()
+            if len(parts) == 3:
+                try:
+                    timings[parts[1]] = timings.get(parts[1], 0.0) + float(parts[2])
+                except ValueError:
+                    continue
+    return timings
+
+
+def format_timing_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    """Format one summary as "phase 1.234 ms, ..." with each phase's share of the total."""
+    total = sum(entry["seconds"] for entry in summary.values())
+    parts = []
+    for phase, entry in summary.items():
+        share = entry["seconds"] / total if total > 0 else 0.0
+        parts.append(f"{phase} {entry['seconds'] * 1e3:.3f} ms ({share:.0%})")
+    return ", ".join(parts)
+
+
+def timed(timings: Optional[PhaseTimings], func_id: int, dimension: int, phase: str):
+    """Context manager timing a phase, or doing nothing when timing is disabled."""
+    if timings is None:
+        return nullcontext()
+    return timings.phase(func_id, dimension, phase)
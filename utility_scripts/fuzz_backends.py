@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+CEC Differential Backend Fuzzer
+
+The golden data checks each backend at a handful of points per function and
+dimension. This script cross-checks the backends of a year on large samples
+instead: it draws quasi-random points (a randomly shifted R_d low-discrepancy
+sequence) from each function's "search_range" in meta_{year}.json, evaluates
+them in batches with the reference C implementation (the subprocess backend)
+and with every other backend, and compares the values with the tolerances of
+validate_cec.py. For CEC2006 the constraint values g and h are compared too.
+
+For each (function, dimension) and backend it reports the number of
+disagreements (values outside the tolerance) and the worst deviations, in
+units of the tolerance. Each disagreeing vector among the worst is minimized:
+its coordinates are replaced, one at a time, by the simplest values (0, or
+the coordinate rounded to as few decimals as possible) that keep the
+disagreement. With --save-regressions, the minimized vectors are added to the
+golden data as "regression" test cases holding the reference values, which
+validate_cec.py then checks on every backend.
+
+The (function, dimension) cases are fuzzed in parallel with --jobs; noisy
+functions are skipped.
+
+Usage:
+    python fuzz_backends.py --year 2005                         # 100000 points per function and dimension
+    python fuzz_backends.py --year 2005 --func 15 22 --dim 50 --samples 2000000 --jobs 0
+    python fuzz_backends.py --year 2006 --backend numpy --save-regressions
+    python fuzz_backends.py --year 2005 --output fuzz.json       # Save the report as JSON
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from executors import ExecutorFactory, FunctionExecutor, TestType
+from executors.caching import noisy_functions
+from golden_store import GoldenStore, golden_path
+from problem import ARRAY_EXECUTORS, CONSTRAINED_EXECUTORS, REPO_ROOT
+from validate_cec import CECConfig, ToleranceChecker, get_cec_config
+
+# Default number of points per function and dimension
+DEFAULT_SAMPLES = 100_000
+
+# Points evaluated per executor call
+DEFAULT_BATCH = 10_000
+
+# Backend whose values are taken as correct
+REFERENCE_BACKEND = "subprocess"
+
+# Worst deviations kept (and minimized when they disagree) per case and backend
+WORST_KEPT = 3
+
+# Passes of the minimization over the coordinates of a vector
+MINIMIZE_PASSES = 3
+
+
+@dataclass(frozen=True)
+class FuzzConfig:
+    """Settings of a fuzzing session (picklable, shared with the worker processes)."""
+    year: int
+    backends: Tuple[str, ...]          # backends compared against the reference
+    reference: str = REFERENCE_BACKEND
+    samples: int = DEFAULT_SAMPLES
+    batch: int = DEFAULT_BATCH
+    seed: int = 0
+    threads: Optional[int] = None      # threads of the backends that split batches
+    base_dir: str = str(REPO_ROOT)
+
+
+@dataclass
+class Deviation:
+    """A point where a backend deviates from the reference."""
+    backend: str
+    func_id: int
+    dimension: int
+    x: List[float]
+    expected: List[float]   # reference values: the objective, then g and h for CEC2006
+    actual: List[float]
+    ratio: float            # largest deviation in units of the tolerance (> 1: disagreement)
+    minimized: Optional[List[float]] = None   # simplified x that still disagrees
+    minimized_value: Optional[float] = None   # reference objective value at minimized
+
+    @property
+    def disagrees(self) -> bool:
+        return self.ratio > 1.0
+
+
+@dataclass
+class CaseReport:
+    """Comparison of the backends on one (function, dimension)."""
+    func_id: int
+    dimension: int
+    points: int
+    disagreements: Dict[str, int] = field(default_factory=dict)
+    max_ratio: Dict[str, float] = field(default_factory=dict)
+    seconds: Dict[str, float] = field(default_factory=dict)
+    worst: List[Deviation] = field(default_factory=list)
+
+
+def quasi_random(count: int, dimension: int, start: int, shift: np.ndarray) -> np.ndarray:
+    """Points start .. start+count-1 of the R_d sequence in [0, 1)^dimension, shifted by shift (mod 1).
+
+    R_d adds multiples of the powers of 1/phi_d, phi_d being the positive
+    root of x^(d+1) = x + 1; it covers the cube evenly in any dimension.
+    """
+    phi = 2.0
+    for _ in range(64):
+        phi = (1.0 + phi) ** (1.0 / (dimension + 1))
+    alpha = (1.0 / phi) ** np.arange(1, dimension + 1)
+    n = np.arange(start + 1, start + count + 1, dtype=np.float64)[:, None]
+    return np.mod(shift + n * alpha, 1.0)
+
+
+def function_bounds(info: Dict, dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bounds of each variable from a function's "search_range".
+
+    The range is either one [low, high] pair for every variable or one pair
+    per variable.
+    """
+    ranges = np.asarray(info["search_range"], dtype=np.float64).reshape(-1, 2)
+    ranges = np.broadcast_to(ranges, (dimension, 2))
+    return ranges[:, 0].copy(), ranges[:, 1].copy()
+
+
+def simpler_values(value: float, low: float, high: float) -> List[float]:
+    """Values simpler than value within [low, high], simplest first: 0, then value rounded to 0..6 decimals."""
+    values = []
+    for candidate in [0.0] + [round(value, digits) for digits in range(7)]:
+        if low <= candidate <= high and candidate != value and candidate not in values:
+            values.append(candidate)
+    return values
+
+
+def evaluate_columns(executor: FunctionExecutor, func_id: int, dimension: int,
+                     x: np.ndarray) -> np.ndarray:
+    """Values of an (N, D) array as (N, k) columns: the objective, then g and h for constrained functions."""
+    if isinstance(executor, CONSTRAINED_EXECUTORS):
+        result = executor.evaluate(func_id, x)
+        return np.column_stack([result.f, result.g, result.h])
+    if isinstance(executor, ARRAY_EXECUTORS):
+        values = executor.evaluate(func_id, dimension, x)
+    else:
+        values = np.asarray(executor.run_batch(func_id, dimension, x.tolist()), dtype=np.float64)
+    return values.reshape(-1, 1)
+
+
+class DifferentialFuzzer:
+    """Compares the backends of a CEC year against the reference on quasi-random samples."""
+
+    def __init__(self, fuzz: FuzzConfig):
+        self.fuzz = fuzz
+        self.config: CECConfig = get_cec_config(fuzz.year, fuzz.base_dir)
+        with open(self.config.metadata_path, "r") as f:
+            self.functions: Dict[str, Dict] = json.load(f)["functions"]
+        self.noisy = set(noisy_functions(self.config.metadata_path))
+        self.tolerance = ToleranceChecker()
+        self.executors: Dict[str, FunctionExecutor] = {}
+
+    def build(self) -> List[str]:
+        """Build the reference and the compared backends.
+
+        Returns:
+            The compared backends that built (the others are reported and left out)
+
+        Raises:
+            RuntimeError: If the reference does not build
+        """
+        built = []
+        for name in (self.fuzz.reference,) + self.fuzz.backends:
+            if name in self.executors:
+                continue
+            executor = ExecutorFactory.create_executor(
+                self.fuzz.year, self.config.implementation_dir, backend=name
+            )
+            if not executor.build():
+                executor.cleanup()
+                if name == self.fuzz.reference:
+                    raise RuntimeError(f"Failed to build the reference backend '{name}'")
+                print(f"Warning: backend '{name}' could not be built, skipping it", file=sys.stderr)
+                continue
+            if self.fuzz.threads is not None and executor.supports_threads:
+                executor.set_threads(self.fuzz.threads)
+            self.executors[name] = executor
+            if name != self.fuzz.reference:
+                built.append(name)
+        return built
+
+    def cases(self, func_ids: Optional[List[int]] = None,
+              dimensions: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+        """(function, dimension) pairs to fuzz: the selected noiseless functions at their dimensions."""
+        cases = []
+        for func_id in func_ids or range(1, self.config.num_functions + 1):
+            if func_id in self.noisy:
+                continue
+            info = self.functions.get(f"f{func_id:02d}")
+            if info is None:
+                raise ValueError(f"Function F{func_id} not found in {self.config.metadata_path}")
+            if "search_range" not in info:
+                raise ValueError(f"No search range for F{func_id} in {self.config.metadata_path}")
+            cases.extend((func_id, dim) for dim in info["dimensions"]
+                         if dimensions is None or dim in dimensions)
+        return cases
+
+    def _ratios(self, expected: np.ndarray, actual: np.ndarray) -> np.ndarray:
+        """Largest deviation of each point over its value columns, in units of the tolerance."""
+        if expected.shape != actual.shape:
+            raise ValueError(f"Backends returned values of shapes {expected.shape} and {actual.shape}")
+        return np.max(self.tolerance.tolerance_ratio(expected, actual), axis=1)
+
+    def _compare(self, backend: str, func_id: int, dimension: int,
+                 x: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Reference values, backend values and deviation ratios of the points x."""
+        expected = evaluate_columns(self.executors[self.fuzz.reference], func_id, dimension, x)
+        actual = evaluate_columns(self.executors[backend], func_id, dimension, x)
+        return expected, actual, self._ratios(expected, actual)
+
+    def fuzz_case(self, func_id: int, dimension: int) -> CaseReport:
+        """Compare every built backend against the reference on one (function, dimension)."""
+        lower, upper = function_bounds(self.functions[f"f{func_id:02d}"], dimension)
+        rng = np.random.default_rng(np.random.SeedSequence(self.fuzz.seed, spawn_key=(func_id, dimension)))
+        shift = rng.random(dimension)
+        backends = [name for name in self.executors if name != self.fuzz.reference]
+        report = CaseReport(func_id, dimension, self.fuzz.samples)
+        report.seconds = {name: 0.0 for name in self.executors}
+        worst: Dict[str, List[Deviation]] = {name: [] for name in backends}
+
+        for start in range(0, self.fuzz.samples, self.fuzz.batch):
+            count = min(self.fuzz.batch, self.fuzz.samples - start)
+            x = lower + (upper - lower) * quasi_random(count, dimension, start, shift)
+            clock = time.perf_counter()
+            expected = evaluate_columns(self.executors[self.fuzz.reference], func_id, dimension, x)
+            report.seconds[self.fuzz.reference] += time.perf_counter() - clock
+            for name in backends:
+                clock = time.perf_counter()
+                actual = evaluate_columns(self.executors[name], func_id, dimension, x)
+                report.seconds[name] += time.perf_counter() - clock
+                ratios = self._ratios(expected, actual)
+                report.disagreements[name] = report.disagreements.get(name, 0) + int(np.sum(ratios > 1.0))
+                top = np.argsort(ratios)[::-1][:WORST_KEPT]
+                worst[name].extend(
+                    Deviation(name, func_id, dimension, x[i].tolist(), expected[i].tolist(),
+                              actual[i].tolist(), float(ratios[i]))
+                    for i in top
+                )
+                worst[name] = sorted(worst[name], key=lambda d: d.ratio, reverse=True)[:WORST_KEPT]
+
+        for name in backends:
+            report.max_ratio[name] = worst[name][0].ratio if worst[name] else 0.0
+            for deviation in worst[name]:
+                if deviation.disagrees:
+                    self.minimize(deviation, lower, upper)
+            report.worst.extend(worst[name])
+        return report
+
+    def minimize(self, deviation: Deviation, lower: np.ndarray, upper: np.ndarray) -> None:
+        """Simplify the vector of a disagreement while the backend still disagrees.
+
+        Each coordinate in turn is replaced by the first of its simpler values
+        (see simpler_values) that keeps the disagreement; the coordinates are
+        swept until nothing changes.
+        """
+        x = np.array(deviation.x)
+        for _ in range(MINIMIZE_PASSES):
+            changed = False
+            for i in range(deviation.dimension):
+                options = simpler_values(float(x[i]), lower[i], upper[i])
+                if not options:
+                    continue
+                trials = np.repeat(x[None, :], len(options), axis=0)
+                trials[:, i] = options
+                _, _, ratios = self._compare(deviation.backend, deviation.func_id,
+                                             deviation.dimension, trials)
+                hits = np.flatnonzero(ratios > 1.0)
+                if hits.size:
+                    x[i] = options[hits[0]]
+                    changed = True
+            if not changed:
+                break
+        expected, _, _ = self._compare(deviation.backend, deviation.func_id,
+                                       deviation.dimension, x[None, :])
+        deviation.minimized = x.tolist()
+        deviation.minimized_value = float(expected[0, 0])
+
+    def close(self) -> None:
+        """Release the executors' resources."""
+        for executor in self.executors.values():
+            executor.cleanup()
+        self.executors.clear()
+
+
+# Fuzzer of a worker process, built once per session settings
+_WORKER_FUZZERS: Dict[FuzzConfig, DifferentialFuzzer] = {}
+
+
+def fuzz_case(fuzz: FuzzConfig, func_id: int, dimension: int) -> CaseReport:
+    """Fuzz one (function, dimension) with the fuzzer of the calling process."""
+    fuzzer = _WORKER_FUZZERS.get(fuzz)
+    if fuzzer is None:
+        fuzzer = DifferentialFuzzer(fuzz)
+        fuzzer.build()
+        _WORKER_FUZZERS[fuzz] = fuzzer
+    return fuzzer.fuzz_case(func_id, dimension)
+
+
+def run_fuzzing(fuzz: FuzzConfig, cases: Sequence[Tuple[int, int]], jobs: int = 1) -> List[CaseReport]:
+    """Fuzz the cases, in parallel across jobs processes (0: one per CPU core)."""
+    reports = []
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for func_id, dimension in cases:
+            report = fuzz_case(fuzz, func_id, dimension)
+            print_report(report)
+            reports.append(report)
+        return reports
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        remaining = {pool.submit(fuzz_case, fuzz, *case) for case in cases}
+        try:
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report = future.result()
+                    print_report(report)
+                    reports.append(report)
+        except KeyboardInterrupt:
+            for future in remaining:
+                future.cancel()
+            raise
+    return sorted(reports, key=lambda report: (report.func_id, report.dimension))
+
+
+def save_regressions(config: CECConfig, deviations: List[Deviation]) -> int:
+    """Add the minimized disagreeing vectors to the golden data as "regression" cases.
+
+    The cases hold the reference's objective values. The function JSON files
+    are updated, and the golden store is rebuilt from them when it exists.
+
+    Returns:
+        Number of vectors added (vectors already in a case are not repeated)
+    """
+    added = 0
+    test_type = TestType.REGRESSION.value
+    by_function: Dict[int, List[Deviation]] = {}
+    for deviation in deviations:
+        if deviation.minimized is not None:
+            by_function.setdefault(deviation.func_id, []).append(deviation)
+
+    for func_id, func_deviations in sorted(by_function.items()):
+        path = Path(config.validation_dir) / f"f{func_id:02d}.json"
+        with open(path, "r") as f:
+            func_data = json.load(f)
+        for deviation in func_deviations:
+            dim_data = func_data["dimensions"].setdefault(str(deviation.dimension), {"results": {}})
+            case = dim_data["results"].setdefault(test_type, {"input_vector": [], "objective_value": []})
+            vectors, values = case["input_vector"], case["objective_value"]
+            # A case holding one point stores it unwrapped
+            if vectors and not isinstance(vectors[0], list):
+                vectors, values = [vectors], [values]
+            if deviation.minimized not in vectors:
+                vectors.append(deviation.minimized)
+                values.append(deviation.minimized_value)
+                added += 1
+            case["input_vector"], case["objective_value"] = vectors, values
+        with open(path, "w") as f:
+            json.dump(func_data, f, indent=2)
+
+    store_path = golden_path(config.validation_dir)
+    if added and store_path.exists():
+        GoldenStore.from_json_dir(config.validation_dir, config.year).save(store_path)
+    return added
+
+
+def print_report(report: CaseReport):
+    """Print the comparison of one case."""
+    parts = []
+    for name, ratio in report.max_ratio.items():
+        count = report.disagreements.get(name, 0)
+        status = "✓" if count == 0 else "✗"
+        parts.append(f"{name} {status} {count} disagreeing, worst {ratio:.2e} tol "
+                     f"({report.seconds.get(name, 0.0):.1f} s)")
+    print(f"  F{report.func_id:02d} D{report.dimension:2d}: {report.points} points  " + "  ".join(parts))
+
+
+def print_summary(reports: List[CaseReport], top: int = 10) -> List[Deviation]:
+    """Print the totals and the worst disagreements, and return all disagreements."""
+    print("\n" + "=" * 70)
+    print("SUMMARY")
+    print("=" * 70)
+    backends = sorted({name for report in reports for name in report.max_ratio})
+    for name in backends:
+        points = sum(report.points for report in reports if name in report.max_ratio)
+        count = sum(report.disagreements.get(name, 0) for report in reports)
+        print(f"{name}: {points} points, {count} disagreeing")
+    disagreements = sorted((deviation for report in reports for deviation in report.worst
+                            if deviation.disagrees), key=lambda d: d.ratio, reverse=True)
+    if disagreements:
+        print("\nWorst disagreements:")
+    for deviation in disagreements[:top]:
+        print(f"  - {deviation.backend} F{deviation.func_id:02d} D{deviation.dimension}: "
+              f"{deviation.ratio:.3g} tol, expected {deviation.expected[0]!r}, got {deviation.actual[0]!r}")
+        if deviation.minimized is not None:
+            print(f"    minimized x = {deviation.minimized}")
+    return disagreements
+
+
+def main():
+    """Main entry point for the differential fuzzer."""
+    parser = argparse.ArgumentParser(
+        description="Cross-check the CEC backends against the reference C code on quasi-random samples",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        choices=[2005, 2006],
+        required=True,
+        help="CEC competition year"
+    )
+    parser.add_argument(
+        "--func",
+        type=int,
+        nargs='+',
+        metavar="ID",
+        help="Function IDs to fuzz (default: all noiseless functions)"
+    )
+    parser.add_argument(
+        "--dim",
+        type=int,
+        nargs='+',
+        help="Dimensions to fuzz (default: every dimension of each function)"
+    )
+    parser.add_argument(
+        "--backend",
+        nargs='+',
+        help="Backends compared against the reference (default: all the others)"
+    )
+    parser.add_argument(
+        "--reference",
+        default=REFERENCE_BACKEND,
+        help="Backend taken as correct (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help="Points per function and dimension (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=DEFAULT_BATCH,
+        help="Points per executor call (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the sequence shifts (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Cases fuzzed in parallel processes (0: one per CPU core, default: %(default)s)"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Threads of the backends that split batches (0: one per core)"
+    )
+    parser.add_argument(
+        "--save-regressions",
+        action="store_true",
+        help="Add the minimized disagreeing vectors to the golden data as regression cases"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write the case reports as JSON"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=str(REPO_ROOT),
+        help="Base directory for CEC implementations (default: the repository root)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.samples < 1 or args.batch < 1:
+            raise ValueError("--samples and --batch must be at least 1")
+        backends = args.backend or [name for name in ExecutorFactory.available_backends(args.year)
+                                    if name != args.reference]
+        fuzz = FuzzConfig(args.year, tuple(backends), args.reference, args.samples, args.batch,
+                          args.seed, args.threads, args.base_dir)
+        # Build once here so the workers find every build in the cache
+        fuzzer = DifferentialFuzzer(fuzz)
+        try:
+            built = fuzzer.build()
+            cases = fuzzer.cases(args.func, args.dim)
+        finally:
+            fuzzer.close()
+        if not built:
+            raise RuntimeError("None of the compared backends could be built")
+        fuzz = FuzzConfig(args.year, tuple(built), args.reference, args.samples, args.batch,
+                          args.seed, args.threads, args.base_dir)
+
+        print("=" * 70)
+        print(f"CEC{args.year} differential fuzzing: {', '.join(built)} against '{args.reference}'")
+        print("=" * 70)
+        skipped = sorted(set(args.func or []) & fuzzer.noisy) if args.func else sorted(fuzzer.noisy)
+        if skipped:
+            print(f"Skipping the noisy functions {', '.join(f'F{func_id}' for func_id in skipped)}")
+        reports = run_fuzzing(fuzz, cases, args.jobs)
+        disagreements = print_summary(reports)
+
+        if args.save_regressions and disagreements:
+            added = save_regressions(fuzzer.config, disagreements)
+            print(f"\nAdded {added} regression cases to {fuzzer.config.validation_dir}")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump({"config": asdict(fuzz), "cases": [asdict(report) for report in reports]},
+                          f, indent=2)
+            print(f"\nReport written to {args.output}")
+        sys.exit(1 if disagreements else 0)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ Usage:
     python generate_validation_data.py --year 2006                # Generate all CEC2006 data  
     python generate_validation_data.py --year 2005 --func 1 4 17  # Generate specific functions
     python generate_validation_data.py --year 2005 --dim 10 30    # Generate specific dimensions
+    python generate_validation_data.py --year 2005 --jobs 0       # Generate functions on all cores
+    python generate_validation_data.py --year 2005 --profile release  # Generate with the -O2 build
     
 Safety features:
 - Backup existing data before regeneration
@@ -32,15 +34,18 @@ import tempfile
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import argparse
 import numpy as np
-import random
 
 # Import from executors module and validation script
 sys.path.append(os.path.dirname(__file__))
 from executors import TestType, FunctionExecutor, ExecutorFactory
+from executors.build import BUILD_PROFILES
+from executors.constants import load_constant_values
+from golden_store import GoldenStore, golden_path, json_sources_digest, load_golden_data
 from validate_cec import CECConfig, get_cec_config
 
 
@@ -60,11 +65,15 @@ class GenerationConfig:
     
     # Output configuration
     backup_existing: bool = True
+    export_json: bool = True  # also write the per-function JSON files
     validate_generated: bool = True
     compare_with_existing: bool = True
     
     # Precision for numerical values
     precision: int = 6
+    
+    # Build profile of the C implementation (None: the Makefile's flags)
+    build_profile: Optional[str] = None
 
 
 @dataclass 
@@ -86,7 +95,9 @@ class ValidationDataGenerator(ABC):
     def __init__(self, config: CECConfig, gen_config: GenerationConfig):
         self.config = config
         self.gen_config = gen_config
-        self.executor = ExecutorFactory.create_executor(config.year, config.implementation_dir)
+        self.executor = ExecutorFactory.create_executor(
+            config.year, config.implementation_dir, profile=gen_config.build_profile
+        )
         
     @abstractmethod
     def get_function_metadata(self, func_id: int) -> Dict[str, Any]:
@@ -98,77 +109,133 @@ class ValidationDataGenerator(ABC):
         """Generate test vectors for a function and dimension."""
         pass
         
-    def generate_validation_data(self, func_ids: Optional[List[int]] = None, 
-                               dimensions: Optional[List[int]] = None) -> Dict[str, Any]:
-        """Generate validation data for specified functions and dimensions."""
-        print(f"Generating validation data for CEC{self.config.year}")
+    def test_rng(self, func_id: int, dimension: int, test_index: int) -> np.random.Generator:
+        """Get the random stream of one test case.
         
-        # Build implementation
-        print("Building implementation...")
-        if not self.executor.build():
-            raise RuntimeError("Failed to build implementation")
-        print("Build successful!")
+        Each (year, function, dimension, test index) draws from its own stream
+        derived from the configured seed, so generated vectors do not depend on
+        which functions are generated or in which order.
+        """
+        seed_sequence = np.random.SeedSequence(
+            self.gen_config.random_seed,
+            spawn_key=(self.config.year, func_id, dimension, test_index)
+        )
+        return np.random.default_rng(seed_sequence)
         
-        # Set random seed for reproducibility
-        random.seed(self.gen_config.random_seed)
-        np.random.seed(self.gen_config.random_seed)
+    def _execute_test_cases(self, func_id: int, dimension: int, test_cases: List[TestCase],
+                            log: Callable[[str], None] = print) -> List[Optional[float]]:
+        """Evaluate test cases, batching them when there is more than one.
         
-        results = {}
-        func_ids = func_ids or list(range(1, self.config.num_functions + 1))
+        Single evaluations that fail are reported and yield None.
+        """
+        if len(test_cases) > 1:
+            return self.executor.run_batch(
+                func_id, dimension, [test_case.input_vector for test_case in test_cases]
+            )
         
-        for func_id in func_ids:
-            print(f"\nProcessing F{func_id:02d}...")
+        outputs = []
+        for test_case in test_cases:
             try:
-                func_key = f"f{func_id:02d}"
-                metadata = self.get_function_metadata(func_id)
-                print(f"  Loaded metadata: {metadata.get('name', 'Unknown')}")
+                outputs.append(self.executor.run(func_id, dimension, test_case.input_vector))
+            except Exception as e:
+                log(f"    Error executing {test_case.test_type}: {e}")
+                outputs.append(None)
+        return outputs
+    
+    def _generate_function(self, func_id: int, dimensions: Optional[List[int]],
+                           date_generated: str) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Generate the validation data of one function.
+        
+        Returns:
+            The function's data (None if it failed) and its progress log lines
+        """
+        lines = []
+        log = lines.append
+        log(f"\nProcessing F{func_id:02d}...")
+        try:
+            metadata = self.get_function_metadata(func_id)
+            log(f"  Loaded metadata: {metadata.get('name', 'Unknown')}")
+            
+            # Determine dimensions to test
+            dims_to_test = dimensions or metadata.get("dimensions", self.config.supported_dimensions)
+            log(f"  Testing dimensions: {dims_to_test}")
+            
+            func_data = {
+                "function_id": func_id,
+                "function_name": metadata.get("name", f"Function {func_id}"),
+                "date_generated": date_generated,
+                "dimensions": {}
+            }
+            
+            for dim in dims_to_test:
+                if dim not in self.config.supported_dimensions:
+                    log(f"  Skipping unsupported dimension {dim}")
+                    continue
+                    
+                log(f"  Generating test cases for dimension {dim}...")
+                test_cases = self.generate_test_vectors(func_id, dim, metadata)
                 
-                # Determine dimensions to test
-                dims_to_test = dimensions or metadata.get("dimensions", self.config.supported_dimensions)
-                print(f"  Testing dimensions: {dims_to_test}")
+                # Execute test cases and collect results
+                dim_results = {"results": {}}
                 
-                func_data = {
-                    "function_id": func_id,
-                    "function_name": metadata.get("name", f"Function {func_id}"),
-                    "date_generated": datetime.now().isoformat(),
-                    "dimensions": {}
-                }
+                try:
+                    outputs = self._execute_test_cases(func_id, dim, test_cases, log)
+                except Exception as e:
+                    for test_case in test_cases:
+                        log(f"    Error executing {test_case.test_type}: {e}")
+                    outputs = []
                 
-                for dim in dims_to_test:
-                    if dim not in self.config.supported_dimensions:
-                        print(f"  Skipping unsupported dimension {dim}")
+                for test_case, actual_output in zip(test_cases, outputs):
+                    if actual_output is None:
                         continue
-                        
-                    print(f"  Generating test cases for dimension {dim}...")
-                    test_cases = self.generate_test_vectors(func_id, dim, metadata)
                     
-                    # Execute test cases and collect results
-                    dim_results = {"results": {}}
-                    
-                    for test_case in test_cases:
-                        try:
-                            actual_output = self.executor.run(func_id, dim, test_case.input_vector)
-                            
-                            dim_results["results"][test_case.test_type] = {
-                                "input_vector": test_case.input_vector,
-                                "objective_value": round(actual_output, self.gen_config.precision)
-                            }
-                            
-                            print(f"    {test_case.test_type}: {actual_output:.6f}")
-                            
-                        except Exception as e:
-                            print(f"    Error executing {test_case.test_type}: {e}")
-                            continue
+                    dim_results["results"][test_case.test_type] = {
+                        "input_vector": test_case.input_vector,
+                        "objective_value": round(actual_output, self.gen_config.precision)
+                    }
                     
-                    func_data["dimensions"][str(dim)] = dim_results
+                    log(f"    {test_case.test_type}: {actual_output:.6f}")
                 
-                results[func_key] = func_data
-                
-            except Exception as e:
-                import traceback
-                print(f"Error processing F{func_id}: {e}")
-                print(f"Traceback: {traceback.format_exc()}")
-                continue
+                func_data["dimensions"][str(dim)] = dim_results
+            
+            return func_data, lines
+            
+        except Exception as e:
+            import traceback
+            log(f"Error processing F{func_id}: {e}")
+            log(f"Traceback: {traceback.format_exc()}")
+            return None, lines
+        
+    def generate_validation_data(self, func_ids: Optional[List[int]] = None, 
+                               dimensions: Optional[List[int]] = None,
+                               jobs: int = 1) -> Dict[str, Any]:
+        """Generate validation data for specified functions and dimensions.
+        
+        With jobs > 1, functions are generated concurrently; the data and the
+        progress output are the same as for a serial run.
+        """
+        print(f"Generating validation data for CEC{self.config.year}")
+        
+        # Build implementation
+        print("Building implementation...")
+        if not self.executor.build():
+            raise RuntimeError("Failed to build implementation")
+        print("Build successful!")
+        
+        results = {}
+        func_ids = func_ids or list(range(1, self.config.num_functions + 1))
+        date_generated = datetime.now().isoformat()
+        jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            generated = pool.map(
+                lambda func_id: self._generate_function(func_id, dimensions, date_generated),
+                func_ids
+            )
+            for func_id, (func_data, lines) in zip(func_ids, generated):
+                print("\n".join(lines))
+                if func_data is not None:
+                    results[f"f{func_id:02d}"] = func_data
         
         # Cleanup
         self.executor.cleanup()
@@ -229,10 +296,8 @@ class CEC2005DataGenerator(ValidationDataGenerator):
         
         # Generate random test cases
         for i in range(self.gen_config.num_random_tests):
-            random_vec = [
-                random.uniform(search_range[0], search_range[1]) 
-                for _ in range(dimension)
-            ]
+            rng = self.test_rng(func_id, dimension, i)
+            random_vec = rng.uniform(search_range[0], search_range[1], dimension).tolist()
             test_name = "random" if i == 0 else f"random{i+1}"
             test_cases.append(
                 TestCase(test_name, random_vec, 0.0, f"Random test case {i+1}")
@@ -244,26 +309,17 @@ class CEC2005DataGenerator(ValidationDataGenerator):
         """Get optimal vector (shift vector) for CEC2005 function."""
         try:
             # Read shift vector from input data - try dimension-specific first, then D50
+            input_dir = Path(self.config.implementation_dir) / "input_data"
             shift_files = [
-                f"shift_D{dimension}.txt",
-                "shift_D50.txt"
+                f"f{func_id:02d}/shift_D{dimension}.txt",
+                f"f{func_id:02d}/shift_D50.txt"
             ]
             
-            for shift_filename in shift_files:
-                shift_file = Path(self.config.implementation_dir) / "input_data" / f"f{func_id:02d}" / shift_filename
-                
-                if shift_file.exists():
-                    with open(shift_file, 'r') as f:
-                        content = f.read().strip()
-                        
-                    # Parse space-separated values on one line or newline-separated values
-                    if ' ' in content:
-                        shift_data = [float(x) for x in content.split()]
-                    else:
-                        shift_data = [float(line.strip()) for line in content.split('\n') if line.strip()]
-                        
+            for shift_name in shift_files:
+                if (input_dir / shift_name).exists():
+                    shift_data = load_constant_values(input_dir, shift_name)
                     if len(shift_data) >= dimension:
-                        return shift_data[:dimension]
+                        return shift_data[:dimension].tolist()
                         
         except Exception as e:
             print(f"    Warning: Could not read shift vector for F{func_id} D{dimension}: {e}")
@@ -281,7 +337,9 @@ class CEC2006DataGenerator(ValidationDataGenerator):
     def __init__(self, config: CECConfig, gen_config: GenerationConfig):
         super().__init__(config, gen_config)
         # Use the standard executor from validate_cec
-        self.executor = ExecutorFactory.create_executor(config.year, config.implementation_dir)
+        self.executor = ExecutorFactory.create_executor(
+            config.year, config.implementation_dir, profile=gen_config.build_profile
+        )
         
     def get_function_metadata(self, func_id: int) -> Dict[str, Any]:
         """Get CEC2006 function metadata."""
@@ -331,18 +389,19 @@ class CEC2006DataGenerator(ValidationDataGenerator):
         
         # Generate random test cases within bounds
         for i in range(self.gen_config.num_random_tests):
+            rng = self.test_rng(func_id, dimension, i)
             random_vec = []
             if "xi" in search_ranges:
                 bounds = search_ranges["xi"]
-                random_vec = [random.uniform(bounds[0], bounds[1]) for _ in range(actual_dimension)]
+                random_vec = rng.uniform(bounds[0], bounds[1], actual_dimension).tolist()
             else:
                 for j in range(actual_dimension):
                     var_key = f"x{j+1}"
                     if var_key in search_ranges:
                         bounds = search_ranges[var_key]
-                        random_vec.append(random.uniform(bounds[0], bounds[1]))
+                        random_vec.append(float(rng.uniform(bounds[0], bounds[1])))
                     else:
-                        random_vec.append(random.uniform(0.0, 10.0))
+                        random_vec.append(float(rng.uniform(0.0, 10.0)))
             
             test_cases.append(
                 TestCase("random", random_vec, 0.0, f"Random test case {i+1}")
@@ -388,63 +447,77 @@ class ValidationDataManager:
         self.config = config
         self.gen_config = gen_config
         self.output_dir = Path(config.validation_dir)
+        self.store_path = golden_path(config.validation_dir)
         
     def backup_existing_data(self) -> Optional[Path]:
-        """Create backup of existing validation data."""
-        if not self.output_dir.exists():
+        """Create backup of existing validation data (JSON files and store)."""
+        if not self.output_dir.exists() and not self.store_path.exists():
             return None
             
         backup_dir = self.output_dir.parent / f"{self.output_dir.name}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         print(f"Creating backup: {backup_dir}")
-        shutil.copytree(self.output_dir, backup_dir)
+        if self.output_dir.exists():
+            shutil.copytree(self.output_dir, backup_dir)
+        else:
+            backup_dir.mkdir(parents=True)
+        if self.store_path.exists():
+            shutil.copy2(self.store_path, backup_dir / self.store_path.name)
         
         return backup_dir
     
+    def load_existing_data(self) -> Optional[GoldenStore]:
+        """Load the existing validation data (see load_golden_data), None if there is none."""
+        try:
+            return load_golden_data(str(self.output_dir), self.config.year)
+        except FileNotFoundError:
+            return None
+    
     def save_validation_data(self, data: Dict[str, Any]) -> None:
-        """Save validation data to files."""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        for func_key, func_data in data.items():
-            output_file = self.output_dir / f"{func_key}.json"
-            
-            print(f"Saving {output_file}")
-            with open(output_file, 'w') as f:
-                json.dump(func_data, f, indent=2)
+        """Save validation data into the year's store, and export it as JSON files.
+        
+        Functions that were not generated keep their existing data. The store
+        records the digest of the JSON files when they hold the same data:
+        not when it was saved without them (--no-json) before or now.
+        """
+        new_store = GoldenStore.from_validation_data(data, self.config.year)
+        existing = self.load_existing_data()
+        store = existing.merged(new_store) if existing is not None else new_store
+        
+        if self.gen_config.export_json:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            for func_key, func_data in data.items():
+                output_file = self.output_dir / f"{func_key}.json"
+                
+                print(f"Saving {output_file}")
+                with open(output_file, 'w') as f:
+                    json.dump(func_data, f, indent=2)
+            if existing is None or existing.sources_sha256 is not None:
+                store.sources_sha256 = json_sources_digest(str(self.output_dir))
+        
+        print(f"Saving {self.store_path}")
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        store.save(self.store_path)
     
     def compare_with_existing(self, new_data: Dict[str, Any]) -> Dict[str, List[str]]:
-        """Compare new data with existing validation data."""
-        differences = {}
+        """Compare new data with existing validation data (one vectorized diff of the values)."""
+        existing = self.load_existing_data()
+        if existing is None:
+            return {}
         
-        for func_key, new_func_data in new_data.items():
-            existing_file = self.output_dir / f"{func_key}.json"
-            
-            if existing_file.exists():
-                with open(existing_file, 'r') as f:
-                    existing_data = json.load(f)
-                    
-                func_diffs = []
-                
-                # Compare dimensions and test results
-                for dim_key, new_dim_data in new_func_data.get("dimensions", {}).items():
-                    if dim_key in existing_data.get("dimensions", {}):
-                        existing_dim_data = existing_data["dimensions"][dim_key]
-                        
-                        for test_type, new_result in new_dim_data.get("results", {}).items():
-                            if test_type in existing_dim_data.get("results", {}):
-                                existing_result = existing_dim_data["results"][test_type]
-                                
-                                # Compare objective values
-                                new_val = new_result.get("objective_value", 0)
-                                existing_val = existing_result.get("objective_value", 0)
-                                
-                                if abs(new_val - existing_val) > 1e-10:
-                                    func_diffs.append(
-                                        f"Dim {dim_key}, {test_type}: {existing_val} -> {new_val}"
-                                    )
-                
-                if func_diffs:
-                    differences[func_key] = func_diffs
+        new_store = GoldenStore.from_validation_data(new_data, self.config.year)
+        differences = {}
+        for (func_id, dim, test_type), row, existing_val, new_val in existing.diff(new_store):
+            key = (func_id, dim, test_type)
+            rows = max(existing.entries[key].count, new_store.entries[key].count)
+            case = test_type if rows == 1 else f"{test_type}[{row}]"
+            if existing_val is None:
+                change = f"added {new_val}"
+            elif new_val is None:
+                change = f"removed {existing_val}"
+            else:
+                change = f"{existing_val} -> {new_val}"
+            differences.setdefault(f"f{func_id:02d}", []).append(f"Dim {dim}, {case}: {change}")
         
         return differences
 
@@ -496,11 +569,28 @@ def main():
         action="store_true",
         help="Skip validation of generated data"
     )
+    parser.add_argument(
+        "--no-json",
+        action="store_true",
+        help="Only update the golden data store, not the per-function JSON files"
+    )
     parser.add_argument(
         "--base-dir",
         default=".",
         help="Base directory for CEC implementations"
     )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(BUILD_PROFILES),
+        help="Build profile of the C implementation (default: the Makefile's flags)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of functions generated in parallel (0: one per CPU core; default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -509,7 +599,9 @@ def main():
         config = get_cec_config(args.year, args.base_dir)
         gen_config = GenerationConfig(
             backup_existing=not args.no_backup,
-            validate_generated=not args.no_validate
+            validate_generated=not args.no_validate,
+            export_json=not args.no_json,
+            build_profile=args.profile
         )
         
         # Create generator and data manager
@@ -523,7 +615,7 @@ def main():
         
         # Generate validation data
         print(f"\nGenerating validation data for CEC{args.year}")
-        validation_data = generator.generate_validation_data(args.func, args.dim)
+        validation_data = generator.generate_validation_data(args.func, args.dim, args.jobs)
         
         # Compare with existing data
         if gen_config.compare_with_existing:
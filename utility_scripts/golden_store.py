@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+CEC Golden Validation Data Store
+
+Columnar, memory-mappable store of the golden validation data of one CEC
+year (validation_data/CEC{YEAR}.golden). Every test case is a row: its input
+vector is stored in a float64 input column and its objective value in a
+float64 value column, and a small index maps each (function, dimension,
+test type) to its rows. Loading the store only maps the file, so it stays
+fast however many points a case holds. The per-function JSON files
+(validation_data/CEC{YEAR}/fNN.json) remain as an export format, and may be
+edited: a store built from them records their SHA-256, and when the JSON
+files no longer match it, they are loaded instead of the stale store.
+
+Layout (all fields little-endian):
+
+    header   96 bytes   magic "CECGOLD", version, endian marker, year,
+                        entry count, index offset, metadata offset and size,
+                        input column offset, value column offset, SHA-256
+                        of the JSON files the store matches (zero if it was
+                        saved without them)
+    index    48 bytes per entry: function ID, dimension, test type,
+                        first row, row count, offset in the input column
+    metadata JSON with each function's name and generation date
+    inputs   float64 input vectors, row-major, one row per test case
+    values   float64 objective values, one per test case
+
+Usage:
+    python golden_store.py --year 2005                  # Build CEC2005.golden from the JSON files
+    python golden_store.py --year 2005 --export-json    # Write the JSON files from the store
+    python golden_store.py --year 2005 --verify         # Check the store against the JSON files
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+GOLDEN_SUFFIX = ".golden"
+GOLDEN_MAGIC = b"CECGOLD\0"
+GOLDEN_VERSION = 2
+GOLDEN_ENDIAN_MARKER = 0x01020304
+GOLDEN_ALIGNMENT = 64
+
+_HEADER = struct.Struct("<8sIIIIQQQQQ32s")
+_NO_SOURCES = bytes(32)
+_ENTRY = struct.Struct("<II16sQQQ")
+
+# (function ID, dimension, test type)
+CaseKey = Tuple[int, int, str]
+
+
+@dataclass
+class GoldenEntry:
+    """Index entry: the rows of one (function, dimension, test type)."""
+    func_id: int
+    dimension: int
+    test_type: str
+    row: int           # first row in the value column
+    count: int         # number of rows
+    input_offset: int  # first value in the input column
+
+    @property
+    def key(self) -> CaseKey:
+        return (self.func_id, self.dimension, self.test_type)
+
+
+def golden_path(validation_dir: str) -> Path:
+    """Path of a year's store, next to its JSON directory (validation_data/CEC2005.golden)."""
+    return Path(validation_dir).with_suffix(GOLDEN_SUFFIX)
+
+
+def json_sources_digest(validation_dir: str) -> Optional[str]:
+    """SHA-256 of the names and contents of the fNN.json files of a directory (None if there are none)."""
+    paths = sorted(Path(validation_dir).glob("f[0-9][0-9].json"))
+    if not paths:
+        return None
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class GoldenStore:
+    """Golden validation data of one CEC year, held as two float64 columns.
+
+    Stores loaded from a file are read-only memory maps; stores built from
+    validation data dictionaries live in memory until saved.
+    """
+
+    def __init__(self, year: int, entries: List[GoldenEntry], inputs: np.ndarray,
+                 values: np.ndarray, functions: Dict[int, Dict],
+                 sources_sha256: Optional[str] = None):
+        self.year = year
+        self.entries: Dict[CaseKey, GoldenEntry] = {entry.key: entry for entry in entries}
+        self.inputs = inputs
+        self.values = values
+        self.functions = functions
+        # Digest (json_sources_digest) of the JSON files holding the same data, if any
+        self.sources_sha256 = sources_sha256
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __contains__(self, key: CaseKey) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        """Number of test cases (rows)."""
+        return len(self.values)
+
+    def cases(self, func_id: int, dimension: int, test_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Input vectors (count, dimension) and objective values (count,) of a case."""
+        entry = self.entries.get((func_id, dimension, test_type))
+        if entry is None:
+            raise KeyError(f"No golden data for F{func_id} D{dimension} {test_type}")
+        inputs = self.inputs[entry.input_offset:entry.input_offset + entry.count * entry.dimension]
+        return (inputs.reshape(entry.count, entry.dimension),
+                self.values[entry.row:entry.row + entry.count])
+
+    def function_entries(self, func_id: int) -> List[GoldenEntry]:
+        """Index entries of a function, in stored order."""
+        return [entry for entry in self.entries.values() if entry.func_id == func_id]
+
+    # ------------------------------------------------------------------
+    # Conversion from and to the JSON validation data
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_validation_data(cls, data: Dict[str, Dict], year: int) -> "GoldenStore":
+        """Build a store from {"fNN": function data} dictionaries (the JSON file contents)."""
+        entries = []
+        inputs: List[float] = []
+        values: List[float] = []
+        functions = {}
+        for func_data in sorted(data.values(), key=lambda d: d["function_id"]):
+            func_id = int(func_data["function_id"])
+            functions[func_id] = {
+                "function_name": func_data.get("function_name", f"Function {func_id}"),
+                "date_generated": func_data.get("date_generated"),
+            }
+            for dim_key, dim_data in func_data.get("dimensions", {}).items():
+                dimension = int(dim_key)
+                for test_type, result in dim_data.get("results", {}).items():
+                    vectors = result["input_vector"]
+                    objective = result["objective_value"]
+                    # A case holds one point in JSON, or a list of points
+                    if vectors and not isinstance(vectors[0], (list, tuple)):
+                        vectors, objective = [vectors], [objective]
+                    entries.append(GoldenEntry(func_id, dimension, test_type, len(values),
+                                               len(vectors), len(inputs)))
+                    for vector in vectors:
+                        if len(vector) != dimension:
+                            raise ValueError(
+                                f"F{func_id} D{dimension} {test_type}: input vector of length {len(vector)}"
+                            )
+                        inputs.extend(vector)
+                    values.extend(objective)
+        return cls(year, entries, np.array(inputs, dtype=np.float64),
+                   np.array(values, dtype=np.float64), functions)
+
+    @classmethod
+    def from_json_dir(cls, validation_dir: Path, year: int) -> "GoldenStore":
+        """Build a store from a directory of fNN.json files, recording their digest."""
+        data = {}
+        for path in sorted(Path(validation_dir).glob("f[0-9][0-9].json")):
+            with open(path, "r") as f:
+                data[path.stem] = json.load(f)
+        store = cls.from_validation_data(data, year)
+        store.sources_sha256 = json_sources_digest(validation_dir)
+        return store
+
+    def matches_json(self, validation_dir: str) -> bool:
+        """Whether the JSON files of a directory hold the store's data as far as it knows.
+
+        True unless the store was built from JSON files that changed since
+        (a store saved without JSON files, or a directory without any, matches).
+        """
+        if self.sources_sha256 is None:
+            return True
+        current = json_sources_digest(validation_dir)
+        return current is None or current == self.sources_sha256
+
+    def to_validation_data(self, func_ids: Optional[List[int]] = None) -> Dict[str, Dict]:
+        """Export as {"fNN": function data} dictionaries in the JSON file format."""
+        data = {}
+        for func_id in sorted(func_ids or self.functions):
+            info = self.functions.get(func_id, {})
+            func_data = {
+                "function_id": func_id,
+                "function_name": info.get("function_name", f"Function {func_id}"),
+                "date_generated": info.get("date_generated"),
+                "dimensions": {}
+            }
+            for entry in self.function_entries(func_id):
+                inputs, values = self.cases(*entry.key)
+                if entry.count == 1:
+                    result = {"input_vector": inputs[0].tolist(), "objective_value": float(values[0])}
+                else:
+                    result = {"input_vector": inputs.tolist(), "objective_value": values.tolist()}
+                dim_data = func_data["dimensions"].setdefault(str(entry.dimension), {"results": {}})
+                dim_data["results"][entry.test_type] = result
+            data[f"f{func_id:02d}"] = func_data
+        return data
+
+    def merged(self, other: "GoldenStore") -> "GoldenStore":
+        """A new store with the functions of other replacing those of this store."""
+        data = self.to_validation_data()
+        data.update(other.to_validation_data())
+        return GoldenStore.from_validation_data(data, other.year or self.year)
+
+    # ------------------------------------------------------------------
+    # Comparison
+    # ------------------------------------------------------------------
+
+    def diff(self, other: "GoldenStore",
+             tolerance: float = 1e-10) -> List[Tuple[CaseKey, int, Optional[float], Optional[float]]]:
+        """Rows of the cases present in both stores whose objective values differ.
+
+        Both value columns are gathered for all common rows at once and
+        compared in one vectorized operation. Rows only one of the stores has
+        (a case that gained or lost points) are listed too, with None as the
+        value of the store without them.
+
+        Returns:
+            (case key, row within the case, value in self, value in other)
+            tuples, sorted by case and row
+        """
+        keys, own_rows, other_rows, offsets = [], [], [], []
+        extra = []
+        for key, entry in self.entries.items():
+            match = other.entries.get(key)
+            if match is None:
+                continue
+            count = min(entry.count, match.count)
+            keys.append(key)
+            offsets.append(count)
+            own_rows.append(np.arange(entry.row, entry.row + count))
+            other_rows.append(np.arange(match.row, match.row + count))
+            # Rows removed in other, then rows added in other
+            extra.extend((key, row, float(self.values[entry.row + row]), None)
+                         for row in range(count, entry.count))
+            extra.extend((key, row, None, float(other.values[match.row + row]))
+                         for row in range(count, match.count))
+        if not keys:
+            return []
+
+        own = self.values[np.concatenate(own_rows)]
+        theirs = other.values[np.concatenate(other_rows)]
+        # Equal values (including infinities), values within tolerance and NaN on both sides are unchanged
+        with np.errstate(invalid="ignore"):
+            same = (own == theirs) | (np.abs(own - theirs) <= tolerance) | (np.isnan(own) & np.isnan(theirs))
+        changed = np.flatnonzero(~same)
+
+        starts = np.concatenate(([0], np.cumsum(offsets)[:-1]))
+        case_of_row = np.searchsorted(starts, changed, side="right") - 1
+        differences = [(keys[case], int(row - starts[case]), float(own[row]), float(theirs[row]))
+                       for case, row in zip(case_of_row, changed)]
+        order = {key: i for i, key in enumerate(keys)}
+        return sorted(differences + extra, key=lambda d: (order[d[0]], d[1]))
+
+    # ------------------------------------------------------------------
+    # File format
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> Path:
+        """Write the store, replacing the file atomically."""
+        path = Path(path)
+        entries = list(self.entries.values())
+        metadata = json.dumps({str(k): v for k, v in sorted(self.functions.items())}).encode()
+
+        index_offset = _HEADER.size
+        meta_offset = index_offset + _ENTRY.size * len(entries)
+        inputs_offset = _align(meta_offset + len(metadata))
+        inputs = np.ascontiguousarray(self.inputs, dtype="<f8").tobytes()
+        values_offset = _align(inputs_offset + len(inputs))
+        values = np.ascontiguousarray(self.values, dtype="<f8").tobytes()
+
+        sources = bytes.fromhex(self.sources_sha256) if self.sources_sha256 else _NO_SOURCES
+        header = _HEADER.pack(GOLDEN_MAGIC, GOLDEN_VERSION, GOLDEN_ENDIAN_MARKER, self.year,
+                              len(entries), index_offset, meta_offset, len(metadata),
+                              inputs_offset, values_offset, sources)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            for entry in entries:
+                if len(entry.test_type.encode()) >= 16:
+                    raise ValueError(f"Test type name too long for the index: {entry.test_type}")
+                f.write(_ENTRY.pack(entry.func_id, entry.dimension, entry.test_type.encode(),
+                                    entry.row, entry.count, entry.input_offset))
+            f.write(metadata)
+            f.write(b"\0" * (inputs_offset - meta_offset - len(metadata)))
+            f.write(inputs)
+            f.write(b"\0" * (values_offset - inputs_offset - len(inputs)))
+            f.write(values)
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "GoldenStore":
+        """Map a store file (read-only).
+
+        Raises:
+            ValueError: If the file is not a store of this version
+        """
+        path = Path(path)
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"Not a valid golden data store: {path}")
+        (magic, version, endian_marker, year, entry_count, index_offset, meta_offset,
+         meta_size, inputs_offset, values_offset, sources) = _HEADER.unpack_from(raw, 0)
+        if magic != GOLDEN_MAGIC or endian_marker != GOLDEN_ENDIAN_MARKER:
+            raise ValueError(f"Not a valid golden data store: {path}")
+        if version != GOLDEN_VERSION:
+            raise ValueError(f"Golden data store {path} has version {version}, expected "
+                             f"{GOLDEN_VERSION}: rebuild it with golden_store.py")
+
+        entries = []
+        for i in range(entry_count):
+            func_id, dimension, test_type, row, count, input_offset = _ENTRY.unpack_from(
+                raw, index_offset + i * _ENTRY.size
+            )
+            entries.append(GoldenEntry(func_id, dimension, test_type.rstrip(b"\0").decode(),
+                                       row, count, input_offset))
+        functions = {int(k): v for k, v in
+                     json.loads(bytes(raw[meta_offset:meta_offset + meta_size])).items()}
+
+        input_count = sum(entry.count * entry.dimension for entry in entries)
+        value_count = sum(entry.count for entry in entries)
+        if values_offset + value_count * 8 > len(raw) or inputs_offset + input_count * 8 > values_offset:
+            raise ValueError(f"Truncated golden data store: {path}")
+        inputs = raw[inputs_offset:inputs_offset + input_count * 8].view("<f8")
+        values = raw[values_offset:values_offset + value_count * 8].view("<f8")
+        return cls(year, entries, inputs, values, functions,
+                   sources.hex() if sources != _NO_SOURCES else None)
+
+
+def load_golden_data(validation_dir: str, year: int) -> GoldenStore:
+    """Load a year's golden data: the store when present and current, else the JSON files.
+
+    The JSON files are loaded instead of the store (with a warning) when they
+    changed since the store was built from them, or when the store is of
+    another version.
+
+    Raises:
+        FileNotFoundError: If neither the store nor any JSON file exists
+        ValueError: If the store is invalid and there are no JSON files
+    """
+    path = golden_path(validation_dir)
+    has_json = any(Path(validation_dir).glob("f[0-9][0-9].json"))
+    if path.exists():
+        try:
+            store = GoldenStore.load(path)
+        except ValueError as e:
+            if not has_json:
+                raise
+            print(f"Warning: {e}; using the JSON files", file=sys.stderr)
+        else:
+            if store.matches_json(validation_dir):
+                return store
+            print(f"Warning: the JSON files in {validation_dir} changed since {path} was built; "
+                  f"using them (rebuild the store with golden_store.py --year {year})",
+                  file=sys.stderr)
+    elif not has_json:
+        raise FileNotFoundError(f"Validation data not found: {path} or {validation_dir}/fNN.json")
+    return GoldenStore.from_json_dir(validation_dir, year)
+
+
+def iter_case_rows(store: GoldenStore, func_id: int, dimension: int,
+                   test_type: str) -> Iterator[Tuple[str, List[float], float]]:
+    """(label, input vector, objective value) of each row of a case.
+
+    Single-point cases are labelled by their test type, rows of larger cases
+    as "type[i]".
+    """
+    inputs, values = store.cases(func_id, dimension, test_type)
+    for i in range(len(values)):
+        label = test_type if len(values) == 1 else f"{test_type}[{i}]"
+        yield label, inputs[i].tolist(), float(values[i])
+
+
+def _align(size: int) -> int:
+    """Round size up to the store alignment."""
+    return (size + GOLDEN_ALIGNMENT - 1) // GOLDEN_ALIGNMENT * GOLDEN_ALIGNMENT
+
+
+# ============================================================================
+# Main Entry Point
+# ============================================================================
+
+
+def main():
+    """Main entry point for the golden store converter."""
+    sys.path.append(os.path.dirname(__file__))
+    from validate_cec import get_cec_config
+
+    parser = argparse.ArgumentParser(
+        description="Build, export or verify the golden validation data store of a CEC year",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        required=True,
+        choices=[2005, 2006],
+        help="CEC competition year"
+    )
+    parser.add_argument(
+        "--export-json",
+        action="store_true",
+        help="Write the per-function JSON files from the store"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check the store against the JSON files instead of building it"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=".",
+        help="Base directory for CEC implementations (default: current directory)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        config = get_cec_config(args.year, args.base_dir)
+        path = golden_path(config.validation_dir)
+
+        if args.verify:
+            store = GoldenStore.load(path)
+            reference = GoldenStore.from_json_dir(config.validation_dir, args.year)
+            problems = [f"{key}: missing from store" for key in reference.entries if key not in store]
+            problems += [f"{key}: not in the JSON files" for key in store.entries if key not in reference]
+            if not store.matches_json(config.validation_dir):
+                problems.append("the JSON files changed since the store was built")
+            for (func_id, dim, test_type), row, value, expected in store.diff(reference, tolerance=0.0):
+                if value is None:
+                    problems.append(f"F{func_id} D{dim} {test_type}[{row}]: not in the store")
+                elif expected is None:
+                    problems.append(f"F{func_id} D{dim} {test_type}[{row}]: not in the JSON files")
+                else:
+                    problems.append(f"F{func_id} D{dim} {test_type}[{row}]: {value!r} != {expected!r}")
+            for key, entry in store.entries.items():
+                if key not in reference or entry.count != reference.entries[key].count:
+                    continue
+                if not np.array_equal(store.cases(*key)[0], reference.cases(*key)[0]):
+                    problems.append(f"{key}: input vectors differ")
+            for problem in problems:
+                print(f"  {problem}")
+            print(f"Checked {len(store)} test cases: "
+                  f"{'OK' if not problems else f'{len(problems)} problems'}")
+            sys.exit(1 if problems else 0)
+
+        if args.export_json:
+            store = GoldenStore.load(path)
+            output_dir = Path(config.validation_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for func_key, func_data in store.to_validation_data().items():
+                with open(output_dir / f"{func_key}.json", "w") as f:
+                    json.dump(func_data, f, indent=2)
+            # The store now matches the exported files
+            GoldenStore.from_json_dir(output_dir, args.year).save(path)
+            print(f"Exported {len(store.functions)} functions to {output_dir}")
+            return
+
+        store = GoldenStore.from_json_dir(config.validation_dir, args.year)
+        store.save(path)
+        print(f"Stored {len(store)} test cases of {len(store.functions)} functions in {path}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+CEC Fitness Landscapes of Two-Variable Functions
+
+Evaluates a CEC function on a dense grid of its two variables (e.g.
+1000 x 1000 points) in one batched pass and writes the surface as a
+memory-mapped .npy array. Every CEC2005 function is available at D = 2;
+from CEC2006, the two-variable problems g06, g08, g11 and g24, and g02/g03
+with their dimension set to 2.
+
+The surfaces are cached in .landscape_cache/ by (year, function, bounds,
+density), next to a JSON file recording the backend and the fingerprint of
+the code that computed them; a surface is recomputed only when that code
+changes.
+
+    surface[i, j] = f(x1[j], x2[i]),   x1, x2 = numpy.linspace(lower, upper, density)
+
+The CEC2005 shared library evaluates grids over [-bound, bound]^2 itself
+(cec2005_landscape, split across OpenMP threads); other bounds and the other
+backends evaluate the grid in blocks of rows through their array API. For
+CEC2006, the total constraint violation is stored as a second surface.
+
+Usage:
+    python landscape.py --year 2005 --func 9                    # 1000 x 1000 over the search range
+    python landscape.py --year 2005 --func 1 9 15 --density 2000 --threads 0
+    python landscape.py --year 2005 --func 8 --bounds -5 5
+    python landscape.py --year 2006 --func 6 8 11 24 --image-dir landscapes
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from executors.cec2006_numpy import PROBLEM_INFO, VARIABLE_DIMENSION
+from problem import ARRAY_EXECUTORS, CONSTRAINED_EXECUTORS, REPO_ROOT, select_executor
+from validate_cec import get_cec_config
+
+# Default number of grid points per axis
+DEFAULT_DENSITY = 1000
+
+# Grid points evaluated per executor call on the generic path
+ROW_CHUNK_POINTS = 1 << 18
+
+LANDSCAPE_CACHE_DIRNAME = ".landscape_cache"
+
+Bounds = Tuple[np.ndarray, np.ndarray]
+
+
+@dataclass
+class Landscape:
+    """Values of a two-variable function on a grid."""
+    year: int
+    func_id: int
+    x1: np.ndarray                          # (density,) points of the first variable (columns)
+    x2: np.ndarray                          # (density,) points of the second variable (rows)
+    values: np.ndarray                      # (density, density) objective values
+    violation: Optional[np.ndarray] = None  # (density, density) total constraint violation
+    backend: str = ""
+    cached: bool = False                    # whether the surface was read from the cache
+
+    @property
+    def density(self) -> int:
+        return len(self.x1)
+
+    def minimum(self) -> Tuple[float, float, float]:
+        """Smallest value on the grid (among the feasible points, if constrained) and its (x1, x2)."""
+        values = np.asarray(self.values)
+        if self.violation is not None and np.any(np.asarray(self.violation) == 0.0):
+            values = np.where(np.asarray(self.violation) == 0.0, values, np.inf)
+        i, j = np.unravel_index(int(np.argmin(values)), values.shape)
+        return float(values[i, j]), float(self.x1[j]), float(self.x2[i])
+
+
+def is_two_variable(year: int, func_id: int) -> bool:
+    """Whether a function can be evaluated with two variables."""
+    if year == 2006:
+        info = PROBLEM_INFO.get(func_id)
+        return info is not None and (info.nx == 2 or func_id in VARIABLE_DIMENSION)
+    return True
+
+
+def function_bounds(metadata_path: str, func_id: int) -> Bounds:
+    """Lower and upper bounds of the two variables, from the "search_range" in meta_{year}.json.
+
+    The range is either one [low, high] pair for every variable or one pair
+    per variable.
+
+    Raises:
+        ValueError: If the function has no search range
+    """
+    with open(metadata_path, "r") as f:
+        info = json.load(f)["functions"].get(f"f{func_id:02d}", {})
+    if "search_range" not in info:
+        raise ValueError(f"No search range for F{func_id} in {metadata_path}; give --bounds")
+    ranges = np.broadcast_to(np.asarray(info["search_range"], dtype=np.float64).reshape(-1, 2), (2, 2))
+    return ranges[:, 0].copy(), ranges[:, 1].copy()
+
+
+def grid_axes(bounds: Bounds, density: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Grid points of the two variables."""
+    lower, upper = bounds
+    return (np.linspace(lower[0], upper[0], density),
+            np.linspace(lower[1], upper[1], density))
+
+
+def cache_stem(year: int, func_id: int, bounds: Bounds, density: int) -> str:
+    """File name (without suffix) of a surface in the cache."""
+    lower, upper = bounds
+    key = f"{year}:{func_id}:{lower.tolist()}:{upper.tolist()}:{density}"
+    return f"CEC{year}-f{func_id:02d}-{hashlib.sha256(key.encode()).hexdigest()[:16]}"
+
+
+class LandscapeBuilder:
+    """Computes and caches the landscapes of one CEC year."""
+
+    def __init__(self, year: int, backend: Optional[str] = None, threads: Optional[int] = None,
+                 base_dir: Optional[str] = None, cache_dir: Optional[str] = None):
+        """
+        Args:
+            year: CEC year
+            backend: Backend to use (default: the fastest one that builds)
+            threads: Threads of the backends that split batches (0: one per core)
+            base_dir: Base directory of the configuration (default: the repository root)
+            cache_dir: Directory of the cached surfaces (default: <base_dir>/.landscape_cache)
+        """
+        base_dir = str(base_dir or REPO_ROOT)
+        self.year = year
+        self.config = get_cec_config(year, base_dir)
+        self.cache_dir = Path(cache_dir or Path(base_dir) / LANDSCAPE_CACHE_DIRNAME)
+        self.backend, self.executor = select_executor(
+            year, self.config.implementation_dir, [backend] if backend else None
+        )
+        if threads is not None and self.executor.supports_threads:
+            self.executor.set_threads(threads)
+
+    def landscape(self, func_id: int, density: int = DEFAULT_DENSITY,
+                  bounds: Optional[Bounds] = None, refresh: bool = False) -> Landscape:
+        """The landscape of a function, from the cache when it is up to date.
+
+        Args:
+            func_id: Function ID
+            density: Grid points per axis
+            bounds: (lower, upper) arrays of the two variables (default: the search range)
+            refresh: Recompute even if the cached surface is up to date
+
+        Raises:
+            ValueError: If the function has no two-variable form, or no bounds
+        """
+        if not is_two_variable(self.year, func_id):
+            raise ValueError(f"CEC{self.year} F{func_id} is not defined for two variables")
+        if density < 2:
+            raise ValueError(f"density must be at least 2, got {density}")
+        if bounds is None:
+            bounds = function_bounds(self.config.metadata_path, func_id)
+        bounds = (np.asarray(bounds[0], dtype=np.float64), np.asarray(bounds[1], dtype=np.float64))
+        x1, x2 = grid_axes(bounds, density)
+
+        stem = cache_stem(self.year, func_id, bounds, density)
+        info_path = self.cache_dir / f"{stem}.json"
+        fingerprint = self.executor.source_fingerprint(func_id)
+        constrained = isinstance(self.executor, CONSTRAINED_EXECUTORS)
+        names = ["values", "violation"] if constrained else ["values"]
+        paths = {name: self.cache_dir / f"{stem}.{name}.npy" for name in names}
+
+        cached = False
+        if not refresh and info_path.exists() and all(path.exists() for path in paths.values()):
+            with open(info_path, "r") as f:
+                cached = json.load(f).get("fingerprint") == fingerprint
+        if not cached:
+            self._compute(func_id, bounds, x1, x2, paths)
+            info = {
+                "year": self.year,
+                "function": func_id,
+                "lower": bounds[0].tolist(),
+                "upper": bounds[1].tolist(),
+                "density": density,
+                "backend": self.backend,
+                "fingerprint": fingerprint,
+            }
+            with open(info_path, "w") as f:
+                json.dump(info, f, indent=2)
+
+        surfaces = {name: np.load(path, mmap_mode="r") for name, path in paths.items()}
+        return Landscape(self.year, func_id, x1, x2, surfaces["values"], surfaces.get("violation"),
+                         backend=self.backend, cached=cached)
+
+    def _compute(self, func_id: int, bounds: Bounds, x1: np.ndarray, x2: np.ndarray,
+                 paths) -> None:
+        """Evaluate the grid into memory-mapped files, renamed into place when complete."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        density = len(x1)
+        staging = {name: path.with_name(f".{path.name}.tmp") for name, path in paths.items()}
+        surfaces = {name: np.lib.format.open_memmap(str(path), mode="w+", dtype=np.float64,
+                                                    shape=(density, density))
+                    for name, path in staging.items()}
+
+        lower, upper = bounds
+        symmetric = np.all(lower == -upper) and lower[0] == lower[1] and upper[0] > 0
+        if symmetric and hasattr(self.executor, "landscape"):
+            # The library evaluates the whole grid in one call
+            self.executor.landscape(func_id, float(upper[0]), density, out=surfaces["values"])
+        else:
+            rows = max(1, ROW_CHUNK_POINTS // density)
+            for start in range(0, density, rows):
+                stop = min(start + rows, density)
+                grid1, grid2 = np.meshgrid(x1, x2[start:stop])
+                points = np.column_stack([grid1.ravel(), grid2.ravel()])
+                for name, block in self._evaluate(func_id, points).items():
+                    surfaces[name][start:stop] = block.reshape(stop - start, density)
+
+        for name, surface in surfaces.items():
+            surface.flush()
+            del surface
+            os.replace(staging[name], paths[name])
+
+    def _evaluate(self, func_id: int, points: np.ndarray):
+        """Surfaces of a block of grid points, by name."""
+        if isinstance(self.executor, CONSTRAINED_EXECUTORS):
+            result = self.executor.evaluate(func_id, points)
+            return {"values": result.f, "violation": result.violation}
+        if isinstance(self.executor, ARRAY_EXECUTORS):
+            return {"values": self.executor.evaluate(func_id, 2, points)}
+        return {"values": np.asarray(self.executor.run_batch(func_id, 2, points.tolist()),
+                                     dtype=np.float64)}
+
+    def close(self) -> None:
+        """Release the executor's resources."""
+        self.executor.cleanup()
+
+
+def write_pgm(path: str, landscape: Landscape, log_scale: bool = True) -> None:
+    """Write a landscape as an 8-bit grayscale PGM image (dark: low values).
+
+    The second variable grows upwards. Infeasible points of a constrained
+    function are drawn at half intensity.
+    """
+    values = np.asarray(landscape.values, dtype=np.float64)
+    finite = np.isfinite(values)
+    low = float(np.min(values[finite])) if np.any(finite) else 0.0
+    scaled = np.where(finite, values - low, 0.0)
+    if log_scale:
+        scaled = np.log1p(scaled)
+    top = float(np.max(scaled))
+    pixels = scaled / top if top > 0 else scaled
+    if landscape.violation is not None:
+        pixels = np.where(np.asarray(landscape.violation) > 0.0, 0.5 * pixels, pixels)
+    image = np.round(255.0 * pixels[::-1]).astype(np.uint8)
+    with open(path, "wb") as f:
+        f.write(f"P5\n{image.shape[1]} {image.shape[0]}\n255\n".encode())
+        f.write(image.tobytes())
+
+
+def main():
+    """Main entry point for the landscape generator."""
+    parser = argparse.ArgumentParser(
+        description="Evaluate CEC functions on a dense grid of two variables",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        choices=[2005, 2006],
+        required=True,
+        help="CEC competition year"
+    )
+    parser.add_argument(
+        "--func",
+        type=int,
+        nargs='+',
+        metavar="ID",
+        required=True,
+        help="Function IDs"
+    )
+    parser.add_argument(
+        "--density",
+        type=int,
+        default=DEFAULT_DENSITY,
+        help="Grid points per axis (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--bounds",
+        type=float,
+        nargs=2,
+        metavar=("LOW", "HIGH"),
+        help="Range of both variables (default: the function's search range)"
+    )
+    parser.add_argument(
+        "--backend",
+        help="Executor backend (default: the fastest one that builds)"
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Threads of the backends that split batches (0: one per core)"
+    )
+    parser.add_argument(
+        "--image-dir",
+        metavar="DIR",
+        help="Also write each landscape as a grayscale image DIR/CEC{YEAR}_fNN.pgm"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recompute the surfaces even if cached"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=str(REPO_ROOT),
+        help="Base directory for CEC implementations (default: the repository root)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory of the cached surfaces (default: <base-dir>/.landscape_cache)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        builder = LandscapeBuilder(args.year, args.backend, args.threads, args.base_dir,
+                                   args.cache_dir)
+        bounds = None
+        if args.bounds:
+            bounds = (np.full(2, args.bounds[0]), np.full(2, args.bounds[1]))
+        if args.image_dir:
+            os.makedirs(args.image_dir, exist_ok=True)
+        try:
+            for func_id in args.func:
+                start = time.perf_counter()
+                landscape = builder.landscape(func_id, args.density, bounds, args.refresh)
+                elapsed = time.perf_counter() - start
+                value, x1, x2 = landscape.minimum()
+                source = "cached" if landscape.cached else f"{landscape.backend}, {elapsed:.2f} s"
+                print(f"F{func_id:02d}: {args.density}x{args.density} grid ({source}), "
+                      f"minimum {value:.6g} at ({x1:.6g}, {x2:.6g})")
+                if args.image_dir:
+                    image = os.path.join(args.image_dir, f"CEC{args.year}_f{func_id:02d}.pgm")
+                    write_pgm(image, landscape)
+                    print(f"  image written to {image}")
+        finally:
+            builder.close()
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
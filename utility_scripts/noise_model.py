@@ -0,0 +1,204 @@
+"""
+CEC Noise Models and Statistical Validation of Noisy Functions
+
+The noisy CEC2005 functions draw a fresh |N(0, 1)| deviate on every
+evaluation, so at a fixed input vector their values follow
+
+    f = a + b |Z|,    Z ~ N(0, 1)
+
+with a location a (the noiseless value) and a scale b >= 0:
+
+    F4       f = S(x) (1 + 0.4 |Z|) + bias           b = 0.4 (a - bias)
+    F17      f = R(x) (1 + 0.2 |Z|) + bias           b = 0.2 (a - bias)
+    F24/F25  component 10 is scaled by (1 + 0.1 |Z|); its normalization
+             constant also by (1 + 0.1 |Z'|), drawn once per initialization,
+             which shifts a between processes by up to about 3 b
+
+Instead of comparing one noisy value against one golden (noisy) value,
+check_noise_samples takes hundreds of samples at the same vector (one batched
+execution) and checks that:
+
+1. the samples follow the shifted half-normal distribution: a
+   Kolmogorov-Smirnov test of one half of the samples against the
+   distribution fitted on the other half
+2. the fitted scale matches the model's relative scale (F4, F17)
+3. the golden value is a plausible draw from the fitted distribution
+
+The significance level applies to all the checks of a function's vectors
+together (Bonferroni correction): with dozens of vectors and three checks
+each, an uncorrected level would fail correct implementations.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+# Default number of samples drawn per test vector of a noisy function
+DEFAULT_NOISE_SAMPLES = 200
+
+# Significance level of all the statistical checks of a function together
+DEFAULT_ALPHA = 1e-3
+
+# Statistical checks per test vector (shape, scale, golden value)
+CHECKS_PER_VECTOR = 3
+
+# Samples spread less than this (relative to their magnitude) carry no noise
+DEGENERATE_RTOL = 1e-9
+
+
+@dataclass(frozen=True)
+class NoiseModel:
+    """Noise of a function: f = a + b |Z| at a fixed input vector."""
+    description: str
+    relative_scale: Optional[float] = None  # b / (a - offset), when the model fixes it
+    offset: float = 0.0                     # the function's bias
+    location_jitter: float = 0.0            # spread of a between initializations, in units of b
+
+
+NOISE_MODELS: Dict[int, Dict[int, NoiseModel]] = {
+    2005: {
+        4: NoiseModel("f = S(x) (1 + 0.4|Z|) + bias", 0.4, -450.0),
+        17: NoiseModel("f = R(x) (1 + 0.2|Z|) + bias", 0.2, 120.0),
+        # Over 1000 initializations, a spread over 3.3 b (2.9 b between the
+        # 0.1% and 99.9% quantiles)
+        24: NoiseModel("component 10 scaled by (1 + 0.1|Z|)", location_jitter=3.0),
+        25: NoiseModel("component 10 scaled by (1 + 0.1|Z|)", location_jitter=3.0),
+    },
+}
+
+
+def get_noise_model(year: int, func_id: int) -> Optional[NoiseModel]:
+    """Noise model of a function, or None if it has none."""
+    return NOISE_MODELS.get(year, {}).get(func_id)
+
+
+@dataclass
+class NoiseTestResult:
+    """Outcome of the statistical checks of a noisy test vector."""
+    passed: bool
+    location: float                # fitted a
+    scale: float                   # fitted b (0 when the samples carry no noise)
+    ks_pvalue: float = 1.0         # p-value of the shape test
+    golden_pvalue: float = 1.0     # probability of a draw at least as far out as the golden value
+    scale_ratio: Optional[float] = None  # fitted b / (a - offset)
+    reason: str = ""               # the failed check, if any
+
+    @property
+    def degenerate(self) -> bool:
+        """Whether the samples carry no noise (e.g. at the optimum)."""
+        return self.scale == 0.0
+
+    def summary(self) -> str:
+        """One-line description of the checks."""
+        if self.degenerate:
+            return "noiseless at this vector"
+        text = f"KS p={self.ks_pvalue:.2g}, golden p={self.golden_pvalue:.2g}"
+        if self.scale_ratio is not None:
+            text += f", scale={self.scale_ratio:.3f}"
+        return text + (f"; {self.reason}" if self.reason else "")
+
+
+def half_normal_cdf(u: np.ndarray) -> np.ndarray:
+    """CDF of |Z|, Z ~ N(0, 1) (0 for negative u)."""
+    u = np.maximum(np.asarray(u, dtype=np.float64), 0.0)
+    return np.array([math.erf(v / math.sqrt(2.0)) for v in u.ravel()]).reshape(u.shape)
+
+
+def normal_critical_value(level: float) -> float:
+    """z such that P(|Z| > z) = level, Z ~ N(0, 1) (by bisection)."""
+    low, high = 0.0, 40.0
+    for _ in range(100):
+        middle = 0.5 * (low + high)
+        if math.erfc(middle / math.sqrt(2.0)) > level:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def kolmogorov_pvalue(statistic: float, n: int) -> float:
+    """Asymptotic p-value of a one-sample KS statistic (with Stephens' correction)."""
+    root_n = math.sqrt(n)
+    lam = (root_n + 0.12 + 0.11 / root_n) * statistic
+    if lam < 0.2:
+        return 1.0
+    total = sum((-1) ** (k - 1) * math.exp(-2.0 * k * k * lam * lam) for k in range(1, 101))
+    return min(max(2.0 * total, 0.0), 1.0)
+
+
+def fit_half_normal(samples: np.ndarray):
+    """Fit a + b|Z| to samples: (a, b).
+
+    The location is the sample minimum corrected for its expected distance
+    to a (about b sqrt(pi/2) / n); the scale is the root mean square
+    distance to the location.
+    """
+    n = len(samples)
+    minimum = float(np.min(samples))
+    scale = float(np.sqrt(np.mean((samples - minimum) ** 2)))
+    location = minimum - scale * math.sqrt(math.pi / 2.0) / n
+    scale = float(np.sqrt(np.mean((samples - location) ** 2)))
+    return location, scale
+
+
+def ks_test(samples: np.ndarray, location: float, scale: float) -> float:
+    """p-value of samples against the half-normal distribution a + b|Z|."""
+    u = np.sort((samples - location) / scale)
+    n = len(u)
+    cdf = half_normal_cdf(u)
+    statistic = max(np.max(np.arange(1, n + 1) / n - cdf), np.max(cdf - np.arange(n) / n))
+    return kolmogorov_pvalue(float(statistic), n)
+
+
+def check_noise_samples(model: NoiseModel, expected: float, samples,
+                        alpha: float = DEFAULT_ALPHA, vectors: int = 1) -> NoiseTestResult:
+    """Check noisy samples at one vector against the model and the golden value.
+
+    Args:
+        model: Noise model of the function
+        expected: Golden value at the vector (itself one noisy draw)
+        samples: Values of repeated evaluations at the vector
+        alpha: Significance level of the checks of all the vectors together
+        vectors: Number of vectors checked together; each check is made at
+            level alpha / (CHECKS_PER_VECTOR * vectors)
+
+    Returns:
+        The result; samples without noise are reported as degenerate with
+        their median as location, for a deterministic comparison.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    spread = float(np.max(samples) - np.min(samples))
+    if spread <= DEGENERATE_RTOL * max(abs(float(np.median(samples))), 1.0):
+        return NoiseTestResult(passed=True, location=float(np.median(samples)), scale=0.0)
+
+    level = alpha / (CHECKS_PER_VECTOR * max(vectors, 1))
+    location, scale = fit_half_normal(samples)
+    result = NoiseTestResult(passed=True, location=location, scale=scale)
+
+    # 1. Shape: fit on one half of the samples, test the other half
+    fit_location, fit_scale = fit_half_normal(samples[0::2])
+    result.ks_pvalue = ks_test(samples[1::2], fit_location, fit_scale)
+    if result.ks_pvalue < level:
+        result.passed = False
+        result.reason = "samples do not follow a + b|Z|"
+
+    # 2. Scale relative to the noiseless value; the sample RMS has a relative
+    #    standard error of about 1/sqrt(2n)
+    if model.relative_scale is not None and location != model.offset:
+        result.scale_ratio = scale / (location - model.offset)
+        limit = normal_critical_value(level) / math.sqrt(2.0 * len(samples))
+        if abs(result.scale_ratio / model.relative_scale - 1.0) > limit:
+            result.passed = False
+            result.reason = f"noise scale {result.scale_ratio:.3f}, expected {model.relative_scale}"
+
+    # 3. The golden value is one draw of the same distribution (up to the
+    #    location jitter between initializations)
+    z = (expected - location) / scale
+    result.golden_pvalue = math.erfc(max(z - model.location_jitter, 0.0) / math.sqrt(2.0))
+    if z < -(model.location_jitter + 0.1) or result.golden_pvalue < level:
+        result.passed = False
+        result.reason = f"golden value {z:+.2f} scales from the fitted location"
+
+    return result
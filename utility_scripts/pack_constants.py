@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+CEC Constant Pack Builder
+
+Converts the constant text files of a CEC implementation (shift vectors,
+rotation matrices, ...) into a single binary, memory-mappable pack at
+input_data/constants.pack. The C code and the Python executors read constants
+from the pack when it is present and newer than the text files, and fall back
+to parsing the text files otherwise. The text files remain the source of truth.
+
+--verify also checks the cached normalization constants of the CEC2005
+composite functions (input_data/fNN/norm_D*.txt, written by "make norm")
+against a recomputation with the NumPy port.
+
+Usage:
+    python pack_constants.py --year 2005             # Build CEC2005-C/input_data/constants.pack
+    python pack_constants.py --year 2005 --verify    # Check an existing pack against the text files
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.dirname(__file__))
+from executors.cec2005_numpy import verify_norm_constants
+from executors.constants import PACK_FILENAME, ConstantPack, build_constant_pack
+from validate_cec import get_cec_config
+
+
+def main():
+    """Main entry point for the constant pack builder."""
+    parser = argparse.ArgumentParser(
+        description="Build or verify the binary constant pack of a CEC implementation",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        required=True,
+        choices=[2005],
+        help="CEC competition year"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=".",
+        help="Base directory for CEC implementations (default: current directory)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify the existing pack against the text files instead of building it"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        config = get_cec_config(args.year, args.base_dir)
+        input_dir = Path(config.implementation_dir) / "input_data"
+        pack_path = input_dir / PACK_FILENAME
+
+        if args.verify:
+            pack = ConstantPack(pack_path)
+            problems = pack.verify(input_dir)
+            for problem in problems:
+                print(f"  {problem}")
+            print(f"Checked {len(pack.entries)} packed files: "
+                  f"{'OK' if not problems else f'{len(problems)} problems'}")
+
+            norm_problems = verify_norm_constants(config.implementation_dir)
+            for problem in norm_problems:
+                print(f"  {problem}")
+            print(f"Checked the normalization constants: "
+                  f"{'OK' if not norm_problems else f'{len(norm_problems)} problems'}")
+            sys.exit(1 if problems or norm_problems else 0)
+
+        build_constant_pack(input_dir, pack_path, args.year)
+        pack = ConstantPack(pack_path)
+        total = sum(entry.count for entry in pack.entries.values())
+        print(f"Packed {len(pack.entries)} files ({total} values) into {pack_path}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Optimizer-facing CEC Benchmark Problems
+
+A Problem is one (year, function, dimension) benchmark as an optimizer sees
+it: the search range, the optimum value (the function's bias), and a
+vectorized objective that evaluates an (N, D) population in one call. It
+enforces the competition's budget of function evaluations (FEs) and records
+the error to the optimum, f(best) - bias, at the reporting checkpoints:
+
+    CEC2005  max FEs = 10000 D, errors reported after 1e3, 1e4, 1e5 FEs and
+             at termination; a run terminates early once its error is at
+             most 1e-8, and records the FEs it took to reach the function's
+             fixed accuracy level
+
+    problem = Problem(2005, 9, 10)
+    while not problem.done:
+        values = problem(population)    # (N,) values, NaN past the budget
+        ...
+    problem.checkpoint_errors           # {1000: ..., 10000: ..., 100000: ...}
+
+The evaluations go to the fastest executor that builds here: the in-process
+ctypes library, then the NumPy port, then the subprocess executor; the
+Problems of a process share one built executor per backend. The bounds,
+biases and accuracy levels come from the "search_range", "bias", "bounded"
+and "accuracy" entries of the year's meta_{year}.json.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from executors import (CEC2005LibraryExecutor, CEC2005NumpyExecutor, CEC2006Executor,
+                       CEC2006NumpyExecutor, ExecutorFactory, FunctionExecutor)
+from validate_cec import get_cec_config
+
+# Repository root, the default base directory of the configurations
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class BudgetRules:
+    """Evaluation budget and reporting checkpoints of a competition."""
+    fes_per_dimension: int            # max FEs = fes_per_dimension * D
+    checkpoints: Tuple[int, ...]      # FEs after which the error is reported
+    termination_error: Optional[float] = None  # a run ends once its error is at most this
+
+
+BUDGET_RULES: Dict[int, BudgetRules] = {
+    2005: BudgetRules(10000, (1000, 10000, 100000), termination_error=1e-8),
+}
+
+# Executors with an evaluate(func_id, dimension, population) array API
+ARRAY_EXECUTORS = (CEC2005LibraryExecutor, CEC2005NumpyExecutor)
+
+# Executors with an evaluate(func_id, population) API returning a ConstrainedResult
+CONSTRAINED_EXECUTORS = (CEC2006Executor, CEC2006NumpyExecutor)
+
+# Backends by decreasing speed; the first one that builds is used
+BACKEND_PREFERENCE: Dict[int, Tuple[str, ...]] = {
+    2005: ("ctypes", "numpy", "subprocess"),
+}
+
+
+# Built executors shared by the Problems of the process, by (year, backend,
+# implementation directory); None marks a backend that did not build
+_SHARED_EXECUTORS: Dict[Tuple[int, str, str], Optional[FunctionExecutor]] = {}
+_SHARED_EXECUTORS_LOCK = threading.Lock()
+
+
+class BudgetExhausted(RuntimeError):
+    """Raised when a problem is evaluated after its run ended (budget used up or terminated)."""
+
+
+def shared_executor(year: int, implementation_dir: str, backend: str) -> Optional[FunctionExecutor]:
+    """The process's built executor of a backend, created and built on first use.
+
+    Returns:
+        The executor, or None if the backend does not build
+    """
+    key = (year, backend, str(Path(implementation_dir).resolve()))
+    with _SHARED_EXECUTORS_LOCK:
+        if key not in _SHARED_EXECUTORS:
+            executor = ExecutorFactory.create_executor(year, implementation_dir, backend=backend)
+            if not executor.build():
+                executor.cleanup()
+                executor = None
+            _SHARED_EXECUTORS[key] = executor
+        return _SHARED_EXECUTORS[key]
+
+
+def select_executor(year: int, implementation_dir: str,
+                    backends: Optional[Sequence[str]] = None,
+                    shared: bool = False) -> Tuple[str, FunctionExecutor]:
+    """Create and build the first backend of a year that builds.
+
+    Args:
+        year: CEC year
+        implementation_dir: Path to the implementation directory
+        backends: Backend names to try, in order (default: BACKEND_PREFERENCE)
+        shared: Use the process's shared executors (see shared_executor)
+            instead of new ones the caller may configure
+
+    Returns:
+        The backend name and its built executor
+
+    Raises:
+        RuntimeError: If none of the backends builds
+    """
+    candidates = backends or BACKEND_PREFERENCE.get(year) or ExecutorFactory.available_backends(year)
+    for name in candidates:
+        if shared:
+            executor = shared_executor(year, implementation_dir, name)
+            if executor is not None:
+                return name, executor
+            continue
+        executor = ExecutorFactory.create_executor(year, implementation_dir, backend=name)
+        if executor.build():
+            return name, executor
+        executor.cleanup()
+    raise RuntimeError(f"None of the CEC{year} backends {list(candidates)} could be built")
+
+
+class Problem:
+    """One CEC benchmark function at one dimension, with an FE budget."""
+
+    def __init__(self, year: int, func_id: int, dimension: int,
+                 backend: Optional[str] = None, max_fes: Optional[int] = None,
+                 base_dir: Optional[str] = None):
+        """
+        Args:
+            year: CEC year
+            func_id: Function ID
+            dimension: Problem dimension (one of the function's dimensions in the metadata)
+            backend: Backend to use (default: the fastest one that builds)
+            max_fes: FE budget (default: the competition's budget)
+            base_dir: Base directory of the configuration (default: the repository root)
+
+        Raises:
+            ValueError: If the year has no budget rules or bounds, or the
+                function or dimension is unknown
+        """
+        if year not in BUDGET_RULES:
+            raise ValueError(f"No evaluation budget defined for CEC{year}. "
+                             f"Supported years: {sorted(BUDGET_RULES)}")
+        self.config = get_cec_config(year, str(base_dir or REPO_ROOT))
+        with open(self.config.metadata_path, "r") as f:
+            functions = json.load(f)["functions"]
+        info = functions.get(f"f{func_id:02d}")
+        if info is None:
+            raise ValueError(f"Function F{func_id} not found in {self.config.metadata_path}")
+        if "bias" not in info or "search_range" not in info:
+            raise ValueError(f"No bias or search range for F{func_id} in {self.config.metadata_path}")
+        if dimension not in info["dimensions"]:
+            raise ValueError(f"F{func_id} is defined for dimensions {info['dimensions']}, "
+                             f"got {dimension}")
+
+        self.year = year
+        self.func_id = func_id
+        self.dimension = dimension
+        self.name: str = info.get("name", f"Function {func_id}")
+        self.noisy: bool = info.get("noisy", False)
+        self.bias = float(info["bias"])
+        self.lower = np.full(dimension, float(info["search_range"][0]))
+        self.upper = np.full(dimension, float(info["search_range"][1]))
+        # F7 and F25 may be searched outside their (initialization) range
+        self.bounded: bool = info.get("bounded", True)
+        # Fixed accuracy level: the error a run counts as a success
+        self.accuracy: Optional[float] = info.get("accuracy")
+
+        rules = BUDGET_RULES[year]
+        self.max_fes = max_fes if max_fes is not None else rules.fes_per_dimension * dimension
+        if self.max_fes < 1:
+            raise ValueError(f"max_fes must be at least 1, got {self.max_fes}")
+        self.checkpoints: Tuple[int, ...] = tuple(
+            sorted({fes for fes in rules.checkpoints if fes < self.max_fes} | {self.max_fes})
+        )
+        self.termination_error = rules.termination_error
+
+        if backend is None:
+            self.backend, self.executor = select_executor(year, self.config.implementation_dir,
+                                                          shared=True)
+        else:
+            self.backend = backend
+            self.executor = shared_executor(year, self.config.implementation_dir, backend)
+            if self.executor is None:
+                raise RuntimeError(f"Failed to build the '{backend}' backend for CEC{year}")
+        self._evaluate = self._vectorized_evaluator(self.executor)
+        self.reset()
+
+    def _vectorized_evaluator(self, executor: FunctionExecutor) -> Callable[[np.ndarray], np.ndarray]:
+        """Evaluate (N, D) arrays with the executor's array API, or its batch API."""
+        if isinstance(executor, ARRAY_EXECUTORS):
+            return lambda x: executor.evaluate(self.func_id, self.dimension, x)
+        return lambda x: np.asarray(executor.run_batch(self.func_id, self.dimension, x.tolist()),
+                                    dtype=np.float64)
+
+    @property
+    def optimum(self) -> float:
+        """Value of the global optimum (the function's bias)."""
+        return self.bias
+
+    @property
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Lower and upper bounds of the search (initialization) range."""
+        return self.lower.copy(), self.upper.copy()
+
+    @property
+    def remaining(self) -> int:
+        """Evaluations left in the budget."""
+        return self.max_fes - self.fes
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the FE budget is used up."""
+        return self.fes >= self.max_fes
+
+    @property
+    def terminated(self) -> bool:
+        """Whether the run reached the termination error before the end of its budget."""
+        return self.terminated_fes is not None
+
+    @property
+    def done(self) -> bool:
+        """Whether the run is over: budget used up or termination error reached."""
+        return self.exhausted or self.terminated
+
+    @property
+    def best_error(self) -> float:
+        """Error to the optimum of the best evaluation so far."""
+        return self.best_value - self.bias
+
+    def reset(self) -> None:
+        """Start a new run: clear the FE count, the best solution and the checkpoints."""
+        self.fes = 0
+        self.best_value = np.inf
+        self.best_x: Optional[np.ndarray] = None
+        self.checkpoint_errors: Dict[int, float] = {}
+        self.terminated_fes: Optional[int] = None   # FE at which the termination error was reached
+        self.fes_to_accuracy: Optional[int] = None  # FE at which the accuracy level was reached
+        self._next_checkpoint = 0
+
+    def __call__(self, population) -> np.ndarray:
+        """Evaluate an (N, D) array of vectors (or a single (D,) vector).
+
+        Only the vectors that fit in the remaining budget are evaluated; the
+        values of the others are NaN. When a vector reaches the termination
+        error, the run ends there: the vectors after it are evaluated but
+        not counted.
+
+        Returns:
+            (N,) array of values
+
+        Raises:
+            BudgetExhausted: If the run was already over
+        """
+        x = np.asarray(population, dtype=np.float64)
+        if x.ndim == 1:
+            x = x.reshape(1, -1)
+        if x.ndim != 2 or x.shape[1] != self.dimension:
+            raise ValueError(f"Expected an array of shape (N, {self.dimension}), got {x.shape}")
+        if self.terminated:
+            raise BudgetExhausted(f"F{self.func_id} D{self.dimension}: the run terminated "
+                                  f"after {self.terminated_fes} FEs")
+        if self.exhausted:
+            raise BudgetExhausted(f"F{self.func_id} D{self.dimension}: the budget of "
+                                  f"{self.max_fes} FEs is used up")
+
+        count = min(len(x), self.remaining)
+        values = np.full(len(x), np.nan)
+        if count == 0:
+            return values
+        values[:count] = self._evaluate(x[:count])
+        self._record(x[:count], values[:count])
+        return values
+
+    def _record(self, x: np.ndarray, values: np.ndarray) -> None:
+        """Update the best solution and the checkpoints passed by an evaluated batch."""
+        start = self.fes
+        errors = values - self.bias
+        if self.termination_error is not None:
+            hits = np.flatnonzero(errors <= self.termination_error)
+            if hits.size:
+                x, values, errors = x[:hits[0] + 1], values[:hits[0] + 1], errors[:hits[0] + 1]
+                self.terminated_fes = start + len(values)
+        if self.accuracy is not None and self.fes_to_accuracy is None:
+            hits = np.flatnonzero(errors <= self.accuracy)
+            if hits.size:
+                self.fes_to_accuracy = start + int(hits[0]) + 1
+        self.fes += len(values)
+
+        # Checkpoints inside the batch see the best value up to their FE
+        while (self._next_checkpoint < len(self.checkpoints)
+               and self.checkpoints[self._next_checkpoint] <= self.fes):
+            checkpoint = self.checkpoints[self._next_checkpoint]
+            best = min(self.best_value, float(np.min(values[:checkpoint - start])))
+            self.checkpoint_errors[checkpoint] = best - self.bias
+            self._next_checkpoint += 1
+        index = int(np.argmin(values))
+        if values[index] < self.best_value:
+            self.best_value = float(values[index])
+            self.best_x = x[index].copy()
+
+        # A terminated run reports its final error at the checkpoints it did not reach
+        if self.terminated:
+            for checkpoint in self.checkpoints[self._next_checkpoint:]:
+                self.checkpoint_errors[checkpoint] = self.best_error
+            self._next_checkpoint = len(self.checkpoints)
+
+    def close(self) -> None:
+        """End the use of the problem; its executor is shared and stays built."""
+
+    def __enter__(self) -> "Problem":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"Problem(CEC{self.year} F{self.func_id} D{self.dimension}, "
+                f"{self.fes}/{self.max_fes} FEs, backend={self.backend!r})")
@@ -0,0 +1,138 @@
+"""
+CEC Validation Result Cache
+
+Local record of the validation cases that passed, keyed by a fingerprint of
+everything a case depends on, so that validate_cec.py --changed-only only
+re-runs the (function, dimension, test type) cases whose inputs changed. A
+case fingerprint covers:
+
+- the implementation code the function depends on, as reported by the
+  executor (for the C implementations: the functions reachable from the
+  benchmark function in the call graph, the build flags and the compiler)
+- the function's entry in meta_{year}.json and the constant files listed
+  under its "files", with their variants for the case's dimension
+- the golden entry (input vectors and expected values) of the case
+- the tolerance checks of the validator
+
+The cache is kept per year and executor in .validation_cache/ and is updated
+by every validation run: passing cases are recorded, failing cases are
+removed. Noisy functions are never skipped, as a single passing run of a
+noisy function proves little about the next one.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from golden_store import GoldenStore
+
+CACHE_VERSION = 1
+
+_DIMENSION_SUFFIX = re.compile(r"_D\d+(\.\w+)$")
+
+
+def case_key(func_id: int, dimension: int, test_type: str) -> str:
+    """Cache key of a validation case."""
+    return f"f{func_id:02d}/D{dimension}/{test_type}"
+
+
+def constant_files(input_dir: Path, files: Dict[str, str], dimension: int) -> List[Path]:
+    """Constant files a function reads at a dimension.
+
+    The files listed in the metadata, their variants for the dimension
+    (rot_D2.txt lists the rot_D*.txt family) and the other files of the
+    function's directories for that dimension (e.g. norm_D30.txt).
+    """
+    paths = set()
+    for relative in files.values():
+        path = input_dir / relative
+        paths.add(path)
+        paths.add(path.with_name(_DIMENSION_SUFFIX.sub(rf"_D{dimension}\1", path.name)))
+        paths.update(path.parent.glob(f"*_D{dimension}.*"))
+    return sorted(path for path in paths if path.is_file())
+
+
+def file_fingerprint(paths: Sequence[Path], root: Path) -> str:
+    """Hash of the names (relative to root) and contents of files."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(str(path.relative_to(root)).encode() + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def golden_fingerprint(store: GoldenStore, func_id: int, dimension: int, test_type: str) -> str:
+    """Hash of the input vectors and expected values of a golden entry."""
+    inputs, values = store.cases(func_id, dimension, test_type)
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(inputs, dtype="<f8").tobytes())
+    digest.update(np.ascontiguousarray(values, dtype="<f8").tobytes())
+    return digest.hexdigest()
+
+
+def code_fingerprint(*objects) -> str:
+    """Hash of the source code of classes or functions (e.g. the tolerance checks)."""
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode())
+    return digest.hexdigest()
+
+
+def case_fingerprint(*parts: str) -> str:
+    """Combine the fingerprints of a case's dependencies."""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """Fingerprints of the validation cases that passed, stored as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, str] = {}
+        self._dirty = False
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.entries = dict(data.get("passed", {}))
+            except (OSError, ValueError):
+                # A corrupt cache only costs a full run
+                self.entries = {}
+
+    @staticmethod
+    def cache_path(cache_dir: str, year: int, executor_name: str,
+                   profile: Optional[str] = None) -> Path:
+        """Cache file of a year, executor and build profile."""
+        suffix = f"-{profile}" if profile else ""
+        return Path(cache_dir) / f"CEC{year}-{executor_name}{suffix}.json"
+
+    def is_current(self, key: str, fingerprint: str) -> bool:
+        """Check whether a case passed with exactly this fingerprint."""
+        return self.entries.get(key) == fingerprint
+
+    def record(self, key: str, fingerprint: str, passed: bool) -> None:
+        """Record a case's outcome: remember passing cases, forget failing ones."""
+        if passed:
+            if self.entries.get(key) != fingerprint:
+                self.entries[key] = fingerprint
+                self._dirty = True
+        elif self.entries.pop(key, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed (atomically)."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "passed": dict(sorted(self.entries.items()))}, f, indent=1)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+CEC Competition Protocol Runner
+
+Runs an optimizer on every function, dimension and independent trial of a
+CEC competition (CEC2005: 25 functions, D = 10, 30, 50, 25 runs each) across
+a process pool, following the protocol of docs/CEC2005_Tech-Report.md: each
+run gets a Problem with the 10000·D FE budget, terminates at an error of
+1e-8, and reports its error at 1e3, 1e4, 1e5 FEs and at termination as well
+as the FEs it took to reach the function's fixed accuracy level.
+
+Every finished run is appended as one JSON line to the results file, so an
+interrupted experiment resumes where it stopped: runs already in the file are
+not repeated. The results are aggregated into the tech report's tables
+(error values at the checkpoints, FEs to the fixed accuracy level with the
+success rate and success performance).
+
+The optimizer is a function optimizer(problem, rng) that evaluates
+problem(population) on (N, D) arrays until problem.done; it is given as
+"module:function" or "path/to/file.py:function". Run i of every function
+and dimension draws from the same seed, so comparison pairs (e.g. F1-F4)
+start from the same initial populations.
+
+Usage:
+    python run_competition.py --optimizer my_de.py:optimize --results de.jsonl
+    python run_competition.py --optimizer run_competition:random_search \\
+        --results rs.jsonl --func 1 9 --dim 10 --runs 5 --jobs 4
+    python run_competition.py --results de.jsonl --aggregate-only --report de.md
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from problem import BUDGET_RULES, BudgetExhausted, Problem
+from validate_cec import get_cec_config
+
+Optimizer = Callable[[Problem, np.random.Generator], None]
+
+# Statistics rows of the tech report tables: 1st (best), 7th, 13th (median),
+# 19th and 25th (worst) of 25 runs, as quantiles for any number of runs
+ORDER_STATISTICS = (("1st (Best)", 0.0), ("7th", 0.25), ("Median", 0.5),
+                    ("19th", 0.75), ("25th (Worst)", 1.0))
+
+# Functions per error table of the tech report (Tables 3-2 to 3-4)
+ERROR_TABLE_GROUPS: Dict[int, Tuple[Tuple[int, ...], ...]] = {
+    2005: (tuple(range(1, 9)), tuple(range(9, 18)), tuple(range(18, 26))),
+}
+
+
+# ============================================================================
+# Data Structures
+# ============================================================================
+
+
+@dataclass
+class CompetitionConfig:
+    """Configuration of a protocol run."""
+    year: int = 2005
+    func_ids: Optional[List[int]] = None     # default: every function
+    dimensions: List[int] = field(default_factory=lambda: [10, 30, 50])
+    runs: int = 25
+    seed: int = 0
+    jobs: int = 0                            # worker processes (0: one per CPU core)
+    backend: Optional[str] = None            # default: the fastest backend that builds
+    base_dir: Optional[str] = None
+
+
+@dataclass
+class RunRecord:
+    """Outcome of one optimizer run, one line of the results file."""
+    year: int
+    func_id: int
+    dimension: int
+    run: int
+    seed: int
+    fes: int
+    max_fes: int
+    final_error: float
+    checkpoint_errors: Dict[int, float]
+    terminated_fes: Optional[int] = None     # FE at which the termination error was reached
+    fes_to_accuracy: Optional[int] = None    # FE at which the fixed accuracy level was reached
+    seconds: float = 0.0
+
+    @property
+    def key(self) -> Tuple[int, int, int, int]:
+        """Identity of the run, used to resume an experiment."""
+        return (self.year, self.func_id, self.dimension, self.run)
+
+    @property
+    def success(self) -> bool:
+        """Whether the run reached the fixed accuracy level within its budget."""
+        return self.fes_to_accuracy is not None
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["checkpoint_errors"] = {str(fes): error for fes, error in self.checkpoint_errors.items()}
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, line: str) -> "RunRecord":
+        data = json.loads(line)
+        data["checkpoint_errors"] = {int(fes): error for fes, error in data["checkpoint_errors"].items()}
+        return cls(**data)
+
+
+class ResultsLog:
+    """Append-only JSON lines file of the finished runs of an experiment."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> List[RunRecord]:
+        """Read the records; lines cut short by an interruption are skipped."""
+        if not self.path.exists():
+            return []
+        records = []
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    records.append(RunRecord.from_json(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return records
+
+    def append(self, record: RunRecord) -> None:
+        """Append a record and flush it to disk before returning."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            # Start on a fresh line after a record cut short by an interruption
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(record.to_json().encode() + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+# ============================================================================
+# Runs
+# ============================================================================
+
+
+def random_search(problem: Problem, rng: np.random.Generator, population: int = 100) -> None:
+    """Baseline optimizer: uniform samples of the search range until the run is over."""
+    while not problem.done:
+        problem(rng.uniform(problem.lower, problem.upper, (population, problem.dimension)))
+
+
+def load_optimizer(spec: str) -> Optimizer:
+    """Resolve "module:function" or "path/to/file.py:function" to the function."""
+    module_name, sep, function_name = spec.rpartition(":")
+    if not sep or not module_name or not function_name:
+        raise ValueError(f"Optimizer must be given as module:function, got '{spec}'")
+    if module_name.endswith(".py"):
+        path = Path(module_name).resolve()
+        module_spec = importlib.util.spec_from_file_location(path.stem, path)
+        if module_spec is None or module_spec.loader is None:
+            raise ValueError(f"Cannot load optimizer module {path}")
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+    optimizer = getattr(module, function_name, None)
+    if not callable(optimizer):
+        raise ValueError(f"No function '{function_name}' in {module_name}")
+    return optimizer
+
+
+def run_seed(seed: int, dimension: int, run: int) -> np.random.SeedSequence:
+    """Seed of a run; it does not depend on the function, so comparison pairs share it."""
+    return np.random.SeedSequence(seed, spawn_key=(dimension, run))
+
+
+# Optimizers of a worker process, loaded once
+_WORKER_OPTIMIZERS: Dict[str, Optimizer] = {}
+
+
+def execute_run(optimizer: Union[str, Optimizer], config: CompetitionConfig,
+                func_id: int, dimension: int, run: int) -> RunRecord:
+    """Run the optimizer once on a problem and record the outcome.
+
+    Each run gets a new Problem; the Problems of a worker share its built
+    executor (see problem.shared_executor), so this builds nothing.
+
+    Args:
+        optimizer: The optimizer, or its "module:function" spec
+        config: Configuration of the experiment
+        func_id: Function ID
+        dimension: Problem dimension
+        run: Index of the run (0-based)
+    """
+    if isinstance(optimizer, str):
+        if optimizer not in _WORKER_OPTIMIZERS:
+            _WORKER_OPTIMIZERS[optimizer] = load_optimizer(optimizer)
+        optimizer = _WORKER_OPTIMIZERS[optimizer]
+
+    problem = Problem(config.year, func_id, dimension,
+                      backend=config.backend, base_dir=config.base_dir)
+
+    rng = np.random.default_rng(run_seed(config.seed, dimension, run))
+    start = time.perf_counter()
+    try:
+        optimizer(problem, rng)
+    except BudgetExhausted:
+        # Evaluating past the end of the run ends it
+        pass
+    seconds = time.perf_counter() - start
+    if problem.fes == 0:
+        raise RuntimeError(f"The optimizer did not evaluate F{func_id} D{dimension}")
+
+    return RunRecord(
+        year=config.year,
+        func_id=func_id,
+        dimension=dimension,
+        run=run,
+        seed=config.seed,
+        fes=problem.fes,
+        max_fes=problem.max_fes,
+        final_error=problem.best_error,
+        checkpoint_errors=dict(problem.checkpoint_errors),
+        terminated_fes=problem.terminated_fes,
+        fes_to_accuracy=problem.fes_to_accuracy,
+        seconds=seconds,
+    )
+
+
+def pending_runs(config: CompetitionConfig, num_functions: int,
+                 done: Iterable[Tuple[int, int, int, int]]) -> List[Tuple[int, int, int]]:
+    """(function, dimension, run) of the runs not in the results yet."""
+    done = set(done)
+    func_ids = config.func_ids or list(range(1, num_functions + 1))
+    return [(func_id, dimension, run)
+            for dimension in config.dimensions
+            for func_id in func_ids
+            for run in range(config.runs)
+            if (config.year, func_id, dimension, run) not in done]
+
+
+def run_competition(optimizer: Union[str, Optimizer], config: CompetitionConfig,
+                    log: ResultsLog, num_functions: int,
+                    progress: Optional[Callable[[RunRecord, int, int], None]] = None) -> int:
+    """Run the pending runs of an experiment and append them to the results.
+
+    With more than one job, the optimizer must be picklable (a module-level
+    function) or given as its "module:function" spec.
+
+    Returns:
+        Number of runs that failed (they are retried by the next invocation)
+    """
+    tasks = pending_runs(config, num_functions, (record.key for record in log.load()))
+    total = len(tasks)
+    failures = 0
+
+    def finished(record: RunRecord, completed: int) -> None:
+        log.append(record)
+        if progress:
+            progress(record, completed, total)
+
+    jobs = config.jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for completed, (func_id, dimension, run) in enumerate(tasks, 1):
+            try:
+                finished(execute_run(optimizer, config, func_id, dimension, run), completed)
+            except Exception as e:
+                failures += 1
+                print(f"  F{func_id:02d} D{dimension} run {run + 1}: ✗ Error: {e}", file=sys.stderr)
+        return failures
+
+    completed = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(execute_run, optimizer, config, *task): task for task in tasks}
+        try:
+            remaining = set(futures)
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    func_id, dimension, run = futures[future]
+                    completed += 1
+                    try:
+                        finished(future.result(), completed)
+                    except Exception as e:
+                        failures += 1
+                        print(f"  F{func_id:02d} D{dimension} run {run + 1}: ✗ Error: {e}",
+                              file=sys.stderr)
+        except KeyboardInterrupt:
+            # The finished runs are in the results file; the rest is resumed later
+            for future in futures:
+                future.cancel()
+            raise
+    return failures
+
+
+# ============================================================================
+# Tech Report Tables
+# ============================================================================
+
+
+def format_value(value: Optional[float]) -> str:
+    """Format a value like the tech report (4.8672e+2)."""
+    if value is None or not np.isfinite(value):
+        return "N/A"
+    mantissa, exponent = f"{value:.4e}".split("e")
+    return f"{mantissa}e{int(exponent):+d}"
+
+
+def format_fes(fes: int) -> str:
+    """Format an FE count as in the table headers ($10^3$, $3 \\times 10^5$)."""
+    exponent = len(str(fes)) - 1
+    leading, rest = divmod(fes, 10 ** exponent)
+    if rest:
+        return f"{fes:,}"
+    return f"$10^{exponent}$" if leading == 1 else f"${leading} \\times 10^{exponent}$"
+
+
+def order_statistics(values: Sequence[float]) -> List[float]:
+    """The 1st, 7th, 13th, 19th and 25th of the sorted values (for 25 runs)."""
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return [ordered[int(round(q * last))] for _, q in ORDER_STATISTICS]
+
+
+class CompetitionReport:
+    """Aggregates run records into the tables of the tech report."""
+
+    def __init__(self, records: Iterable[RunRecord], year: int):
+        self.year = year
+        self.runs: Dict[Tuple[int, int], List[RunRecord]] = {}
+        for record in records:
+            if record.year == year:
+                self.runs.setdefault((record.func_id, record.dimension), []).append(record)
+
+    @property
+    def dimensions(self) -> List[int]:
+        return sorted({dimension for _, dimension in self.runs})
+
+    def functions(self, dimension: int) -> List[int]:
+        return sorted(func_id for func_id, dim in self.runs if dim == dimension)
+
+    def error_table(self, dimension: int, func_ids: Sequence[int]) -> List[str]:
+        """Error values at each checkpoint (Tables 3-2 to 3-4); "T" marks terminated runs."""
+        func_ids = [func_id for func_id in func_ids if (func_id, dimension) in self.runs]
+        checkpoints = sorted({fes for func_id in func_ids
+                              for record in self.runs[(func_id, dimension)]
+                              for fes in record.checkpoint_errors})
+        lines = ["| FES | Statistic | " + " | ".join(f"Prob {func_id}" for func_id in func_ids) + " |",
+                 "|-----|-----------|" + "|".join("-------------" for _ in func_ids) + "|"]
+        for fes in checkpoints:
+            cells: List[List[str]] = []
+            for func_id in func_ids:
+                entries = sorted(
+                    (record.checkpoint_errors[fes],
+                     record.terminated_fes is not None and record.terminated_fes <= fes)
+                    for record in self.runs[(func_id, dimension)] if fes in record.checkpoint_errors
+                )
+                if not entries:
+                    cells.append(["N/A"] * (len(ORDER_STATISTICS) + 2))
+                    continue
+                errors = np.array([error for error, _ in entries])
+                column = [format_value(error) + ("T" if terminated else "")
+                          for error, terminated in order_statistics(entries)]
+                column += [format_value(float(np.mean(errors))), format_value(float(np.std(errors)))]
+                cells.append(column)
+            labels = [name for name, _ in ORDER_STATISTICS] + ["Mean", "Std"]
+            for row, label in enumerate(labels):
+                first = format_fes(fes) if row == 0 else ""
+                lines.append(f"| {first} | {label} | " + " | ".join(column[row] for column in cells) + " |")
+        return lines
+
+    def accuracy_table(self, dimension: int) -> List[str]:
+        """FEs to reach the fixed accuracy level, success rate and performance (Table 3-5)."""
+        lines = ["| Prob | " + " | ".join(f"{name} FES" for name, _ in ORDER_STATISTICS)
+                 + " | Mean FES | Std FES | Success Rate | Success Performance |",
+                 "|------|" + "|".join("------" for _ in ORDER_STATISTICS) + "|------|------|------|------|"]
+        for func_id in self.functions(dimension):
+            records = self.runs[(func_id, dimension)]
+            fes = [record.fes_to_accuracy if record.success else np.inf for record in records]
+            successful = [value for value in fes if np.isfinite(value)]
+            cells = ["N/A" if not np.isfinite(value) else str(int(value)) for value in order_statistics(fes)]
+            if successful:
+                mean = float(np.mean(successful))
+                cells += [format_value(mean), format_value(float(np.std(successful))),
+                          f"{len(successful) / len(records):.0%}",
+                          format_value(mean * len(records) / len(successful))]
+            else:
+                cells += ["N/A", "N/A", "0%", "N/A"]
+            lines.append(f"| $F_{{{func_id}}}$ | " + " | ".join(cells) + " |")
+        return lines
+
+    def render(self, title: str = "") -> str:
+        """The tables of every dimension as Markdown."""
+        lines = [f"# {title or f'CEC{self.year} Results'}", ""]
+        groups = ERROR_TABLE_GROUPS.get(self.year)
+        for dimension in self.dimensions:
+            func_ids = self.functions(dimension)
+            max_fes = max(record.max_fes for func_id in func_ids
+                          for record in self.runs[(func_id, dimension)])
+            runs = min(len(self.runs[(func_id, dimension)]) for func_id in func_ids)
+            lines += [f"## Results for D={dimension} (Max_FES = {max_fes:,}, {runs} runs)", ""]
+            for group in (groups or (tuple(func_ids),)):
+                members = [func_id for func_id in group if func_id in func_ids]
+                if not members:
+                    continue
+                lines += [f"### Error Values, Problems {members[0]}-{members[-1]}", ""]
+                lines += self.error_table(dimension, members) + [""]
+            lines += [f"### Number of FES to Achieve the Fixed Accuracy Level (D={dimension})", ""]
+            lines += self.accuracy_table(dimension) + [""]
+        return "\n".join(lines)
+
+
+# ============================================================================
+# Main Entry Point
+# ============================================================================
+
+
+def print_progress(record: RunRecord, completed: int, total: int) -> None:
+    """Print one finished run."""
+    marker = "T" if record.terminated_fes is not None else ""
+    print(f"  [{completed}/{total}] F{record.func_id:02d} D{record.dimension} run {record.run + 1}: "
+          f"error {format_value(record.final_error)}{marker} after {record.fes} FEs "
+          f"({record.seconds:.1f}s)")
+
+
+def main():
+    """Main entry point for the competition runner."""
+    parser = argparse.ArgumentParser(
+        description="Run an optimizer through the CEC competition protocol",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--optimizer",
+        metavar="SPEC",
+        help="Optimizer as module:function or path/to/file.py:function"
+    )
+    parser.add_argument(
+        "--results",
+        required=True,
+        metavar="FILE",
+        help="Append-only results file (JSON lines); existing runs are not repeated"
+    )
+    parser.add_argument(
+        "--year",
+        type=int,
+        choices=sorted(BUDGET_RULES),
+        default=2005,
+        help="CEC competition year (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--func",
+        type=int,
+        nargs='+',
+        metavar="ID",
+        help="Function IDs (default: all)"
+    )
+    parser.add_argument(
+        "--dim",
+        type=int,
+        nargs='+',
+        default=CompetitionConfig().dimensions,
+        help="Dimensions (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=CompetitionConfig.runs,
+        help="Independent runs per function and dimension (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=CompetitionConfig.jobs,
+        help="Worker processes (0: one per CPU core; default: %(default)s)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=CompetitionConfig.seed,
+        help="Base seed of the runs (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--backend",
+        help="Executor backend (default: the fastest one that builds)"
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="Write the tech report tables as Markdown (default: print them)"
+    )
+    parser.add_argument(
+        "--aggregate-only",
+        action="store_true",
+        help="Only aggregate the results file into the tables"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=".",
+        help="Base directory for CEC implementations (default: current directory)"
+    )
+
+    args = parser.parse_args()
+    if not args.aggregate_only and not args.optimizer:
+        parser.error("--optimizer is required unless --aggregate-only is given")
+
+    config = CompetitionConfig(
+        year=args.year,
+        func_ids=args.func,
+        dimensions=args.dim,
+        runs=args.runs,
+        seed=args.seed,
+        jobs=args.jobs,
+        backend=args.backend,
+        base_dir=str(Path(args.base_dir).resolve())
+    )
+    log = ResultsLog(args.results)
+
+    try:
+        failures = 0
+        if not args.aggregate_only:
+            # Fail early on a bad optimizer spec instead of in every worker
+            load_optimizer(args.optimizer)
+            num_functions = get_cec_config(config.year, config.base_dir).num_functions
+            failures = run_competition(args.optimizer, config, log, num_functions, print_progress)
+
+        report = CompetitionReport(log.load(), config.year).render(
+            f"CEC{config.year} Results: {args.optimizer or Path(args.results).stem}"
+        )
+        if args.report:
+            with open(args.report, "w") as f:
+                f.write(report + "\n")
+            print(f"\nReport written to {args.report}")
+        else:
+            print("\n" + report)
+        sys.exit(1 if failures else 0)
+
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; finished runs are kept in {args.results}", file=sys.stderr)
+        sys.exit(130)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Tests of the benchmark results, their comparison and the sampled vectors."""
+
+import numpy as np
+
+from benchmark_cec import (BenchmarkConfig, BenchmarkRunner, BenchmarkResult, find_regressions,
+                           load_results, save_results)
+from problem import REPO_ROOT
+from validate_cec import get_cec_config
+
+
+def result(evals_per_sec, func_id=1, profile="default", year=2005, backend="ctypes"):
+    return BenchmarkResult(year, backend, func_id, 10, 100, 10, evals_per_sec,
+                           1.0, 1.0, 1.5, 2.0, profile)
+
+
+def test_only_drops_beyond_the_threshold_are_regressions():
+    baseline = [result(1000.0, func_id) for func_id in (1, 2, 3)]
+    results = [result(850.0, 1), result(750.0, 2), result(900.0, 4)]
+    regressions, compared = find_regressions(results, baseline, threshold=0.2)
+    assert compared == 2
+    assert regressions == [(results[1], baseline[1])]
+
+
+def test_results_of_another_profile_are_not_compared():
+    regressions, compared = find_regressions([result(100.0, profile="release")],
+                                             [result(1000.0, profile="default")], threshold=0.2)
+    assert (regressions, compared) == ([], 0)
+
+
+def test_saved_results_load_back(tmp_path):
+    results = [result(1234.5), result(10.0, func_id=5, profile=None, year=2006, backend="numpy")]
+    path = tmp_path / "baseline.json"
+    save_results(str(path), results, BenchmarkConfig(), "default", threads=2)
+    loaded = load_results(str(path))
+    assert loaded == results
+    assert [entry.label for entry in loaded] == ["F01", "g05"]
+    regressions, compared = find_regressions(results, loaded, threshold=0.0)
+    assert (regressions, compared) == ([], 2)
+
+
+def test_cec2006_vectors_are_drawn_within_each_variable_bounds():
+    runner = BenchmarkRunner(get_cec_config(2006, str(REPO_ROOT)), "numpy", BenchmarkConfig())
+    low, high = runner.sample_bounds(1, 13)
+    assert np.all(low == 0.0)
+    assert high.tolist() == [1.0] * 9 + [100.0] * 3 + [1.0]
@@ -0,0 +1,71 @@
+"""Tests of the columnar golden validation data store."""
+
+import json
+
+import numpy as np
+import pytest
+
+from golden_store import GoldenStore, golden_path, load_golden_data
+
+
+def function_data(func_id, values):
+    """JSON data of a function at D=2: one "min" point, and a "random" case of several points."""
+    return {
+        "function_id": func_id,
+        "function_name": f"F{func_id}",
+        "date_generated": "2025-01-01",
+        "dimensions": {"2": {"results": {
+            "min": {"input_vector": [-1.0, -1.0], "objective_value": values[0]},
+            "random": {"input_vector": [[0.5, float(i)] for i in range(len(values) - 1)],
+                       "objective_value": list(values[1:])},
+        }}},
+    }
+
+
+@pytest.fixture
+def validation_dir(tmp_path):
+    directory = tmp_path / "CEC2005"
+    directory.mkdir()
+    for func_id, values in ((1, [1.0, 2.0, 3.0]), (2, [4.0, float("nan"), 6.0])):
+        (directory / f"f{func_id:02d}.json").write_text(json.dumps(function_data(func_id, values)))
+    return directory
+
+
+def test_round_trip_through_the_file(validation_dir):
+    store = GoldenStore.from_json_dir(validation_dir, 2005)
+    loaded = GoldenStore.load(store.save(golden_path(validation_dir)))
+    assert loaded.year == 2005
+    assert len(loaded) == 6
+    inputs, values = loaded.cases(1, 2, "random")
+    assert inputs.tolist() == [[0.5, 0.0], [0.5, 1.0]]
+    assert values.tolist() == [2.0, 3.0]
+    assert loaded.functions[2]["function_name"] == "F2"
+    assert loaded.to_validation_data()["f01"] == function_data(1, [1.0, 2.0, 3.0])
+    assert loaded.diff(store, tolerance=0.0) == []
+
+
+def test_edited_json_files_take_precedence_over_the_store(validation_dir, capsys):
+    GoldenStore.from_json_dir(validation_dir, 2005).save(golden_path(validation_dir))
+    assert load_golden_data(str(validation_dir), 2005).cases(1, 2, "min")[1].tolist() == [1.0]
+
+    (validation_dir / "f01.json").write_text(json.dumps(function_data(1, [9.0, 2.0, 3.0])))
+    assert load_golden_data(str(validation_dir), 2005).cases(1, 2, "min")[1].tolist() == [9.0]
+    assert "changed since" in capsys.readouterr().err
+
+
+def test_store_saved_without_json_files_is_used_as_is(validation_dir):
+    store = GoldenStore.from_validation_data({"f01": function_data(1, [7.0, 2.0, 3.0])}, 2005)
+    store.save(golden_path(validation_dir))
+    assert load_golden_data(str(validation_dir), 2005).cases(1, 2, "min")[1].tolist() == [7.0]
+
+
+def test_diff_lists_changed_added_and_removed_rows():
+    old = GoldenStore.from_validation_data({"f01": function_data(1, [1.0, 2.0, 3.0, 4.0])}, 2005)
+    new = GoldenStore.from_validation_data({"f01": function_data(1, [1.0, 2.5, 3.0])}, 2005)
+    assert old.diff(new) == [((1, 2, "random"), 0, 2.0, 2.5), ((1, 2, "random"), 2, 4.0, None)]
+    assert new.diff(old) == [((1, 2, "random"), 0, 2.5, 2.0), ((1, 2, "random"), 2, None, 4.0)]
+
+
+def test_diff_treats_nan_on_both_sides_as_equal():
+    store = GoldenStore.from_validation_data({"f02": function_data(2, [4.0, np.nan, 6.0])}, 2005)
+    assert store.diff(store, tolerance=0.0) == []
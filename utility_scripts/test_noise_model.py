@@ -0,0 +1,102 @@
+"""Tests of the statistical checks of noisy functions."""
+
+import numpy as np
+import pytest
+
+from noise_model import (check_noise_samples, get_noise_model, kolmogorov_pvalue,
+                         normal_critical_value)
+
+F4 = get_noise_model(2005, 4)
+F17 = get_noise_model(2005, 17)
+F24 = get_noise_model(2005, 24)
+
+# Noiseless value of the samples and the F4 noise scale there
+LOCATION = 1000.0
+SCALE = 0.4 * (LOCATION - F4.offset)
+
+
+@pytest.fixture
+def deviates():
+    return np.random.default_rng(4).standard_normal(400)
+
+
+def test_half_normal_samples_pass(deviates):
+    result = check_noise_samples(F4, LOCATION + 0.5 * SCALE, LOCATION + SCALE * np.abs(deviates))
+    assert result.passed, result.reason
+    assert result.ks_pvalue > 1e-3
+    assert result.scale_ratio == pytest.approx(0.4, rel=0.05)
+    assert result.location == pytest.approx(LOCATION, abs=0.05 * SCALE)
+
+
+def test_samples_of_another_shape_fail_the_ks_check(deviates):
+    # Normal rather than half-normal, shifted to start at the location
+    samples = LOCATION + SCALE * (deviates - deviates.min()) / 3.0
+    result = check_noise_samples(F24, LOCATION + 0.5 * SCALE, samples)
+    assert not result.passed
+    assert result.ks_pvalue < 1e-5
+    assert result.reason == "samples do not follow a + b|Z|"
+
+
+def test_a_wrong_noise_scale_fails(deviates):
+    result = check_noise_samples(F4, LOCATION, LOCATION + 0.5 * SCALE * np.abs(deviates))
+    assert not result.passed
+    assert result.scale_ratio == pytest.approx(0.2, rel=0.05)
+    assert result.reason.startswith("noise scale")
+
+
+@pytest.mark.parametrize("golden_scales", [-1.0, 8.0])
+def test_an_implausible_golden_value_fails(deviates, golden_scales):
+    result = check_noise_samples(F4, LOCATION + golden_scales * SCALE,
+                                 LOCATION + SCALE * np.abs(deviates))
+    assert not result.passed
+    assert result.reason.startswith("golden value")
+
+
+@pytest.mark.parametrize("model", [F4, F24], ids=["F4", "F24"])
+def test_a_shifted_noise_distribution_fails(deviates, model):
+    # The samples start 5 scales above the golden value's distribution
+    result = check_noise_samples(model, LOCATION + 0.5 * SCALE,
+                                 LOCATION + SCALE * (5.0 + np.abs(deviates)))
+    assert not result.passed
+    assert result.reason.startswith("golden value")
+
+
+@pytest.mark.parametrize("model, factor", [(F4, 0.8), (F4, 1.25), (F17, 1.25)])
+def test_a_scaled_noise_distribution_fails(deviates, model, factor):
+    scale = factor * model.relative_scale * (LOCATION - model.offset)
+    result = check_noise_samples(model, LOCATION, LOCATION + scale * np.abs(deviates))
+    assert not result.passed
+    assert result.reason.startswith("noise scale")
+
+
+def test_the_level_is_shared_by_the_vectors(deviates):
+    # A golden value 4 scales out: p = 6e-5, below 1e-3 / 3 but not 1e-3 / 300
+    samples = LOCATION + SCALE * np.abs(deviates)
+    assert not check_noise_samples(F4, LOCATION + 4.0 * SCALE, samples).passed
+    assert check_noise_samples(F4, LOCATION + 4.0 * SCALE, samples, vectors=100).passed
+
+
+def test_the_location_jitter_of_f24_tolerates_a_shifted_golden_value(deviates):
+    samples = LOCATION + SCALE * np.abs(deviates)
+    assert check_noise_samples(F24, LOCATION + 3.0 * SCALE, samples).passed
+    assert check_noise_samples(F24, LOCATION - 3.0 * SCALE, samples).passed
+    assert not check_noise_samples(F24, LOCATION + 8.0 * SCALE, samples).passed
+
+
+def test_samples_without_noise_are_degenerate():
+    result = check_noise_samples(F4, -450.0, np.full(200, -450.0))
+    assert result.passed and result.degenerate
+    assert result.location == -450.0
+    assert result.summary() == "noiseless at this vector"
+
+
+def test_normal_critical_values():
+    assert normal_critical_value(0.05) == pytest.approx(1.959964, abs=1e-6)
+    assert normal_critical_value(1e-3) == pytest.approx(3.290527, abs=1e-6)
+
+
+def test_kolmogorov_pvalues():
+    assert kolmogorov_pvalue(0.01, 100) == 1.0
+    assert kolmogorov_pvalue(0.5, 100) < 1e-10
+    # Critical value of the 5% level: 1.358 / sqrt(n)
+    assert kolmogorov_pvalue(1.358 / np.sqrt(10000), 10000) == pytest.approx(0.05, abs=0.005)
@@ -0,0 +1,95 @@
+"""Tests of the optimizer-facing Problem API."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from executors.constants import load_constant_values
+from problem import BudgetExhausted, Problem
+
+INPUT_DIR = Path(__file__).resolve().parent.parent / "CEC2005-C" / "input_data"
+
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(18).uniform(-50.0, 50.0, size=(5, 10))
+
+
+def test_interleaved_problems_evaluate_their_own_function(points):
+    sphere = Problem(2005, 1, 10)
+    before = sphere(points)
+    rosenbrock = Problem(2005, 6, 10)
+    other = rosenbrock(points)
+    np.testing.assert_array_equal(sphere(points), before)
+    np.testing.assert_array_equal(rosenbrock(points), other)
+    assert not np.allclose(before, other)
+
+
+def test_problems_share_the_built_executor():
+    first = Problem(2005, 1, 10)
+    second = Problem(2005, 9, 30)
+    assert first.executor is second.executor
+    assert Problem(2005, 1, 10, backend="numpy").executor is not first.executor
+
+
+def test_closing_a_problem_keeps_the_others_working(points):
+    first = Problem(2005, 3, 10)
+    values = first(points)
+    with Problem(2005, 3, 10) as second:
+        second(points)
+    np.testing.assert_array_equal(first(points), values)
+
+
+def sphere_optimum(dimension):
+    """The shift vector of F1, where it reaches its bias."""
+    return np.array(load_constant_values(INPUT_DIR, "f01/shift_D50.txt")[:dimension])
+
+
+def test_vectors_beyond_the_budget_are_not_evaluated(points):
+    problem = Problem(2005, 6, 10, max_fes=7)
+    problem(points)
+    values = problem(points)
+    assert np.all(np.isfinite(values[:2])) and np.all(np.isnan(values[2:]))
+    assert (problem.fes, problem.remaining) == (7, 0)
+    assert problem.exhausted and problem.done and not problem.terminated
+    with pytest.raises(BudgetExhausted):
+        problem(points)
+    problem.reset()
+    assert (problem.fes, problem.checkpoint_errors) == (0, {})
+    problem(points)
+
+
+def test_checkpoints_inside_a_batch_see_the_best_value_up_to_them():
+    problem = Problem(2005, 6, 10, max_fes=1500)
+    assert problem.checkpoints == (1000, 1500)
+    population = np.random.default_rng(6).uniform(-100.0, 100.0, size=(1200, 10))
+    values = problem(population)
+    assert list(problem.checkpoint_errors) == [1000]
+    assert problem.checkpoint_errors[1000] == np.min(values[:1000]) - problem.bias
+    problem(population[:400])
+    assert problem.fes == 1500
+    assert problem.checkpoint_errors[1500] == problem.best_error
+
+
+def test_reaching_the_termination_error_ends_the_run(points):
+    problem = Problem(2005, 1, 10, max_fes=1500)
+    problem(points)
+    values = problem(np.vstack([points[0], sphere_optimum(10), points[1]]))
+    assert values[1] == problem.bias and np.isfinite(values[2])
+    assert problem.terminated and problem.done and not problem.exhausted
+    assert problem.fes == problem.terminated_fes == problem.fes_to_accuracy == 7
+    assert problem.checkpoint_errors == {1000: 0.0, 1500: 0.0}
+    with pytest.raises(BudgetExhausted):
+        problem(points)
+
+
+def test_fes_to_accuracy_is_recorded_without_terminating(points):
+    problem = Problem(2005, 1, 10)
+    near = sphere_optimum(10)
+    near[0] += 3e-4   # error 9e-8: within the accuracy level 1e-6, above the termination error
+    problem(np.vstack([points, near]))
+    assert problem.fes_to_accuracy == 6
+    assert not problem.terminated
+    problem.reset()
+    assert (problem.fes, problem.fes_to_accuracy, problem.checkpoint_errors) == (0, None, {})
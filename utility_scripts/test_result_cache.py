@@ -0,0 +1,73 @@
+"""Tests of the validation result cache and its case fingerprints."""
+
+import pytest
+
+from golden_store import GoldenStore
+from result_cache import (ResultCache, case_key, constant_files, file_fingerprint,
+                          golden_fingerprint)
+
+
+def golden_store(random_values):
+    return GoldenStore.from_validation_data({"f01": {
+        "function_id": 1,
+        "dimensions": {"2": {"results": {
+            "min": {"input_vector": [0.0, 0.0], "objective_value": -450.0},
+            "random": {"input_vector": [[1.0, 2.0], [3.0, 4.0]], "objective_value": random_values},
+        }}},
+    }}, 2005)
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    (tmp_path / "f01").mkdir()
+    (tmp_path / "f02").mkdir()
+    for name in ("f01/shift_D50.txt", "f01/rot_D2.txt", "f01/rot_D10.txt", "f02/shift_D50.txt"):
+        (tmp_path / name).write_text("1.0 2.0\n")
+    return tmp_path
+
+
+def test_golden_fingerprints_follow_their_own_entry():
+    store = golden_store([5.0, 25.0])
+    fingerprint = golden_fingerprint(store, 1, 2, "random")
+    assert golden_fingerprint(golden_store([5.0, 25.0]), 1, 2, "random") == fingerprint
+    assert golden_fingerprint(golden_store([5.0, 25.5]), 1, 2, "random") != fingerprint
+    assert golden_fingerprint(golden_store([5.0, 25.5]), 1, 2, "min") == \
+        golden_fingerprint(store, 1, 2, "min")
+
+
+def test_constant_files_are_the_variants_of_the_dimension(input_dir):
+    files = {"o": "f01/shift_D50.txt", "M": "f01/rot_D2.txt"}
+    paths = constant_files(input_dir, files, 10)
+    assert [path.relative_to(input_dir).as_posix() for path in paths] == [
+        "f01/rot_D10.txt", "f01/rot_D2.txt", "f01/shift_D50.txt"
+    ]
+
+
+def test_file_fingerprints_cover_names_and_contents(input_dir):
+    paths = constant_files(input_dir, {"o": "f01/shift_D50.txt"}, 50)
+    fingerprint = file_fingerprint(paths, input_dir)
+    (input_dir / "f02" / "shift_D50.txt").write_text("9.0\n")
+    assert file_fingerprint(paths, input_dir) == fingerprint
+    (input_dir / "f01" / "shift_D50.txt").write_text("1.0 2.5\n")
+    assert file_fingerprint(paths, input_dir) != fingerprint
+
+
+def test_passing_cases_are_kept_and_failing_ones_forgotten(tmp_path):
+    path = ResultCache.cache_path(str(tmp_path), 2005, "CEC2005Executor", "double")
+    assert path.name == "CEC2005-CEC2005Executor-double.json"
+    cache = ResultCache(path)
+    cache.record(case_key(1, 10, "random"), "abc", passed=True)
+    cache.record(case_key(2, 10, "random"), "def", passed=True)
+    cache.record(case_key(2, 10, "random"), "def", passed=False)
+    cache.save()
+
+    reloaded = ResultCache(path)
+    assert reloaded.is_current("f01/D10/random", "abc")
+    assert not reloaded.is_current("f01/D10/random", "abd")
+    assert not reloaded.is_current("f02/D10/random", "def")
+
+
+def test_a_corrupt_cache_file_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text('{"version": 1, "passed": {')
+    assert ResultCache(path).entries == {}
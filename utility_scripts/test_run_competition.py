@@ -0,0 +1,58 @@
+"""Tests of the competition protocol runner."""
+
+from run_competition import (CompetitionConfig, ResultsLog, RunRecord, execute_run,
+                             pending_runs, random_search, run_competition)
+
+
+def outcome(record):
+    return record.fes, record.final_error, record.checkpoint_errors
+
+
+def test_runs_do_not_depend_on_the_runs_before_them():
+    config = CompetitionConfig(func_ids=[1, 6], dimensions=[10], runs=2, jobs=1)
+    fresh = execute_run(random_search, config, 1, 10, 1)
+    execute_run(random_search, config, 1, 10, 0)
+    execute_run(random_search, config, 6, 10, 0)
+    again = execute_run(random_search, config, 1, 10, 1)
+    assert outcome(again) == outcome(fresh)
+
+
+def one_population(problem, rng):
+    """Optimizer that evaluates a single population of 10 and stops."""
+    problem(rng.uniform(problem.lower, problem.upper, (10, problem.dimension)))
+
+
+def record(run, error=1.5):
+    return RunRecord(2005, 1, 10, run, 0, 10, 100000, error, {1000: error})
+
+
+def test_the_log_skips_a_line_cut_short_and_continues_after_it(tmp_path):
+    log = ResultsLog(tmp_path / "results.jsonl")
+    log.append(record(0))
+    with open(log.path, "a") as f:
+        f.write(record(1).to_json()[:30])
+    log.append(record(2, error=0.25))
+    loaded = log.load()
+    assert [r.key for r in loaded] == [(2005, 1, 10, 0), (2005, 1, 10, 2)]
+    assert loaded[1] == record(2, error=0.25)
+
+
+def test_pending_runs_leave_out_the_finished_ones():
+    config = CompetitionConfig(func_ids=[1, 2], dimensions=[10], runs=2)
+    assert pending_runs(config, 25, [(2005, 1, 10, 0), (2005, 2, 10, 1), (2006, 1, 10, 1)]) == [
+        (1, 10, 1), (2, 10, 0)
+    ]
+
+
+def test_an_interrupted_experiment_resumes_with_the_missing_runs(tmp_path):
+    config = CompetitionConfig(func_ids=[1], dimensions=[10], runs=3, jobs=1)
+    log = ResultsLog(tmp_path / "results.jsonl")
+    log.append(execute_run(one_population, config, 1, 10, 1))
+
+    executed = []
+    assert run_competition(one_population, config, log, 25,
+                           progress=lambda r, done, total: executed.append(r.run)) == 0
+    assert executed == [0, 2]
+    assert sorted(r.run for r in log.load()) == [0, 1, 2]
+    assert run_competition(one_population, config, log, 25, progress=lambda *a: executed.append(a)) == 0
+    assert executed == [0, 2]
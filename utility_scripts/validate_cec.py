@@ -16,6 +16,12 @@ Usage:
     python validate_cec.py --year 2005 --func 1 4 17      # Validate specific functions
     python validate_cec.py --year 2005 --dim 10 30        # Validate specific dimensions
     python validate_cec.py --year 2005 --type optimal     # Validate specific test types
+    python validate_cec.py --year 2005 --backend ctypes   # Validate the shared library backend
+    python validate_cec.py --year 2005 --jobs 0           # Evaluate test cases on all cores
+    python validate_cec.py --year 2005 --profile native   # Validate the -O3 -march=native build
+    python validate_cec.py --year 2005 --timing           # Also report time per evaluation phase
+    python validate_cec.py --year 2005 --changed-only     # Skip cases unchanged since they last passed
+    python validate_cec.py --year 2005 --noise-samples 0  # Check noisy functions on a single sample
 """
 
 import json
@@ -27,9 +33,17 @@ from typing import Dict, List, Optional, Tuple
 
 import argparse
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Import executors from the new module
-from executors import TestType, FunctionExecutor, ExecutorFactory
+from executors import CEC2005Executor, CEC2005NumpyExecutor, TestType, FunctionExecutor, ExecutorFactory
+from executors.build import BUILD_PROFILES
+from executors.cec2005_numpy import COMPOSITIONS, check_norm_cache
+from executors.timing import format_timing_summary
+from golden_store import GoldenStore, iter_case_rows, load_golden_data
+from noise_model import DEFAULT_NOISE_SAMPLES, NoiseModel, check_noise_samples, get_noise_model
+from result_cache import (ResultCache, case_fingerprint, case_key, code_fingerprint,
+                          constant_files, file_fingerprint, golden_fingerprint)
 
 
 # ============================================================================
@@ -71,6 +85,7 @@ class TestResult:
     actual: float
     passed: bool
     error: float
+    detail: str = ""  # e.g. the statistical checks of a noisy function
     
     @property
     def status_symbol(self) -> str:
@@ -88,11 +103,23 @@ class CECConfig:
     num_functions: int
     supported_dimensions: List[int]
     default_test_types: List[str]
+    cache_dir: str = ".validation_cache"  # result cache of --changed-only
 
 
 # The executor classes have been moved to the executors module
 
 
+class _DeferredCall:
+    """Future-like wrapper that runs a call when its result is requested."""
+    
+    def __init__(self, fn, *args):
+        self.fn = fn
+        self.args = args
+    
+    def result(self):
+        return self.fn(*self.args)
+
+
 # ============================================================================
 # Generic Components
 # ============================================================================
@@ -137,6 +164,49 @@ class ToleranceChecker:
         
         return passed
     
+    def check_samples(self, expected: float, samples: List[float],
+                      model: NoiseModel, vectors: int = 1) -> TestResult:
+        """Check repeated samples of a noisy function at one vector against its noise model.
+        
+        See noise_model.check_noise_samples; vectors is the number of vectors of
+        the function checked together. Vectors where the function carries no
+        noise (e.g. the optimum) are compared with the deterministic tolerances.
+        """
+        noise = check_noise_samples(model, expected, samples, vectors=vectors)
+        passed = noise.passed
+        if noise.degenerate:
+            passed = self._check_deterministic(expected, noise.location)
+        return TestResult(
+            expected=expected,
+            actual=noise.location,
+            passed=bool(passed),
+            error=abs(noise.location - expected),
+            detail=noise.summary()
+        )
+    
+    def tolerance_ratio(self, expected: np.ndarray, actual: np.ndarray) -> np.ndarray:
+        """Deviations of deterministic values in units of their tolerance, elementwise.
+        
+        Vectorized counterpart of the deterministic check: a ratio of at most 1
+        is within tolerance. Equal values (infinities included) and NaN on both
+        sides give 0, NaN on one side gives inf.
+        """
+        expected = np.asarray(expected, dtype=np.float64)
+        actual = np.asarray(actual, dtype=np.float64)
+        config = self.config
+        magnitude = np.abs(expected)
+        levels = [magnitude > config.large_threshold, magnitude > config.medium_threshold,
+                  magnitude > config.small_threshold]
+        atol = np.select(levels, [config.large_atol, config.medium_atol, config.small_atol],
+                         config.strict_atol)
+        rtol = np.select(levels, [config.large_rtol, config.medium_rtol, config.small_rtol],
+                         config.strict_rtol)
+        with np.errstate(invalid="ignore"):
+            ratio = np.abs(actual - expected) / (atol + rtol * magnitude)
+            ratio = np.where(expected == actual, 0.0, ratio)
+        ratio = np.where(np.isnan(ratio), np.inf, ratio)
+        return np.where(np.isnan(expected) & np.isnan(actual), 0.0, ratio)
+    
     def _check_deterministic(self, expected: float, actual: float) -> bool:
         """Check tolerance for deterministic functions based on magnitude."""
         abs_expected = abs(expected)
@@ -164,10 +234,15 @@ class ValidationReporter:
         print("=" * 70)
     
     @staticmethod
-    def print_function_header(func_id: int, name: str, is_noisy: bool):
+    def print_function_header(func_id: int, name: str, is_noisy: bool,
+                              noise_model: Optional[NoiseModel] = None, noise_samples: int = 0):
         """Print function validation header."""
         print(f"\nValidating F{func_id}: {name}")
-        if is_noisy:
+        if is_noisy and noise_model is not None and noise_samples > 1:
+            print(f"  [NOISY FUNCTION - {noise_samples} samples per test vector checked against "
+                  f"the noise model]")
+            print(f"  Note: F{func_id}: {noise_model.description}, Z ~ N(0, 1) per evaluation")
+        elif is_noisy:
             print("  [NOISY FUNCTION - Using relaxed tolerance for non-optimal tests]")
             print(f"  Note: F{func_id} includes random noise in its calculation")
     
@@ -176,15 +251,29 @@ class ValidationReporter:
         """Print individual test result."""
         print(f"  Dim {dimension:2d}, {test_type:8s}: {result.status_symbol} ", end="")
         if result.passed:
-            if result.error == 0.0 and np.isnan(result.expected):
+            if result.detail:
+                print(f"({result.detail})")
+            elif result.error == 0.0 and np.isnan(result.expected):
                 print("(both NaN)")
             else:
                 print(f"(error: {result.error:.2e})")
         else:
             if np.isnan(result.expected) or np.isnan(result.actual):
-                print(f"Expected: {result.expected}, Got: {result.actual}")
+                print(f"Expected: {result.expected}, Got: {result.actual}", end="")
             else:
-                print(f"Expected: {result.expected:.6f}, Got: {result.actual:.6f}")
+                print(f"Expected: {result.expected:.6f}, Got: {result.actual:.6f}", end="")
+            print(f" ({result.detail})" if result.detail else "")
+    
+    @staticmethod
+    def print_timings(results: Dict):
+        """Print the per-phase timing summary of each function and dimension."""
+        print("\n" + "=" * 70)
+        print("TIMING SUMMARY")
+        print("=" * 70)
+        for func_key, result in results.items():
+            for dim, summary in result.get("timings", {}).items():
+                if summary:
+                    print(f"  {func_key} D{dim:2d}: {format_timing_summary(summary)}")
     
     @staticmethod
     def print_summary(year: int, total: int, passed: int, failed: int, 
@@ -216,14 +305,46 @@ class ValidationReporter:
 class CECValidator:
     """Generic validator for CEC benchmark functions."""
     
-    def __init__(self, config: CECConfig):
+    def __init__(self, config: CECConfig, backend: Optional[str] = None, jobs: int = 1,
+                 profile: Optional[str] = None, timing: bool = False,
+                 changed_only: bool = False, noise_samples: int = DEFAULT_NOISE_SAMPLES):
         self.config = config
-        self.executor = ExecutorFactory.create_executor(config.year, config.implementation_dir)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.executor = ExecutorFactory.create_executor(
+            config.year, config.implementation_dir, backend, profile
+        )
+        self.timing = timing
+        if timing:
+            self.executor.enable_timing()
         self.tolerance_checker = ToleranceChecker()
+        # Samples per test vector of a noisy function (0 or 1: a single sample)
+        self.noise_samples = noise_samples
         self.reporter = ValidationReporter()
+        self._golden: Optional[GoldenStore] = None
+        
+        # Passing cases are recorded on every run; --changed-only skips them
+        self.changed_only = changed_only
+        if self.executor.supports_profiles:
+            profile = profile or "default"
+        self.result_cache = ResultCache(ResultCache.cache_path(
+            config.cache_dir, config.year, type(self.executor).__name__, profile
+        ))
+        self._fingerprints: Dict[Tuple, str] = {}
+        # Loads the CEC2005 constants to check the cached normalization against
+        self._norm_executor: Optional[CEC2005NumpyExecutor] = None
         
         self._load_metadata()
     
+    def _start_pool(self):
+        """Start the worker pool evaluating test cases when running with several jobs.
+        
+        Threads suffice: the executors spend their time in subprocesses, the
+        C library or NumPy, and results are still reported in order.
+        """
+        if self.jobs > 1 and self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.jobs)
+    
     def _load_metadata(self):
         """Load function metadata."""
         if not Path(self.config.metadata_path).exists():
@@ -234,98 +355,271 @@ class CECValidator:
         with open(self.config.metadata_path, 'r') as f:
             self.metadata = json.load(f)
     
-    def _load_validation_data(self, func_id: int) -> Dict:
-        """Load validation data for a specific function."""
-        func_key = f"f{func_id:02d}"
-        validation_file = Path(self.config.validation_dir) / f"{func_key}.json"
-        
-        if not validation_file.exists():
-            raise FileNotFoundError(f"Validation data not found: {validation_file}")
-        
-        with open(validation_file, 'r') as f:
-            return json.load(f)
+    def _load_validation_data(self, func_id: int) -> GoldenStore:
+        """Load the year's golden data (once), checking that it covers a function.
+        
+        The columnar store (validation_data/CEC{YEAR}.golden) is memory mapped;
+        without it the per-function JSON files are read instead.
+        """
+        if self._golden is None:
+            self._golden = load_golden_data(self.config.validation_dir, self.config.year)
+        if not self._golden.function_entries(func_id):
+            raise FileNotFoundError(
+                f"Validation data not found for F{func_id} in {self.config.validation_dir}"
+            )
+        return self._golden
     
-    def validate_function(self, func_id: int, dimensions: Optional[List[int]] = None,
-                         test_types: Optional[List[str]] = None) -> Dict:
-        """Validate a single function."""
+    def _case_fingerprint(self, func_id: int, func_info: Dict, dimension: int,
+                          test_type: str, golden: GoldenStore) -> str:
+        """Fingerprint of everything a case depends on (see result_cache)."""
+        if func_id not in self._fingerprints:
+            self._fingerprints[func_id] = self.executor.source_fingerprint(func_id)
+        if (func_id, dimension) not in self._fingerprints:
+            input_dir = Path(self.config.metadata_path).parent
+            files = constant_files(input_dir, func_info.get("files", {}), dimension)
+            self._fingerprints[(func_id, dimension)] = file_fingerprint(files, input_dir)
+        if "checks" not in self._fingerprints:
+            self._fingerprints["checks"] = code_fingerprint(ToleranceConfig, ToleranceChecker)
+        return case_fingerprint(
+            self._fingerprints[func_id],
+            self._fingerprints[(func_id, dimension)],
+            json.dumps(func_info, sort_keys=True),
+            golden_fingerprint(golden, func_id, dimension, test_type),
+            self._fingerprints["checks"]
+        )
+    
+    def _noise_samples(self, func_id: int, func_info: Dict) -> int:
+        """Number of evaluations per test vector: several for noisy functions with a noise model."""
+        if (func_info.get("noisy", False) and self.noise_samples > 1
+                and get_noise_model(self.config.year, func_id) is not None):
+            return self.noise_samples
+        return 1
+    
+    def _execute_cases(self, func_id: int, dimension: int,
+                       vectors: List[List[float]]) -> List[float]:
+        """Evaluate test vectors, batching them when there is more than one."""
+        if len(vectors) > 1:
+            return self.executor.run_batch(func_id, dimension, vectors)
+        return [self.executor.run(func_id, dimension, vector) for vector in vectors]
+    
+    def _submit_cases(self, func_id: int, dimension: int, vectors: List[List[float]]):
+        """Submit test vectors to the worker pool, or defer them when running serially."""
+        if self._pool is not None:
+            return self._pool.submit(self._execute_cases, func_id, dimension, vectors)
+        return _DeferredCall(self._execute_cases, func_id, dimension, vectors)
+    
+    def _norm_cache_problem(self, func_id: int, dimension: int) -> Optional[str]:
+        """Problem of the cached normalization constants of a CEC2005 composite function.
+        
+        The cache (input_data/fNN/norm_D*.txt) is only checked for staleness
+        against the constant files when it is loaded, so it is compared here
+        with the NumPy port's recomputation and, for the C backends, with the
+        C code's: an edit to either normalization code fails the validation
+        until "make norm" is run again.
+        """
+        if self.config.year != 2005 or func_id not in COMPOSITIONS:
+            return None
+        if self._norm_executor is None:
+            self._norm_executor = CEC2005NumpyExecutor(Path(self.config.implementation_dir))
+        problem = check_norm_cache(self._norm_executor, func_id, dimension)
+        if problem is None and isinstance(self.executor, CEC2005Executor):
+            problem = check_norm_cache(self._norm_executor, func_id, dimension,
+                                       computed=self.executor.norm_constants(func_id, dimension),
+                                       source="the C code")
+        return problem
+    
+    def _plan_function(self, func_id: int, dimensions: Optional[List[int]] = None,
+                       test_types: Optional[List[str]] = None) -> Dict:
+        """Collect the test cases of a function and submit their evaluation."""
         func_key = f"f{func_id:02d}"
         func_info = self.metadata["functions"].get(func_key)
         
         if not func_info:
             raise ValueError(f"Function F{func_id} not found in metadata")
         
-        is_noisy = func_info.get("noisy", False)
-        
-        validation_data = self._load_validation_data(func_id)
+        golden = self._load_validation_data(func_id)
         
         # Determine what to test
         dims_to_test = dimensions or func_info["dimensions"]
         types_to_test = test_types or self.config.default_test_types
+        # Noisy functions are always re-run: one passing run proves little about the next
+        skip_unchanged = self.changed_only and not func_info.get("noisy", False)
+        samples = self._noise_samples(func_id, func_info)
+        
+        groups = []
+        skipped = []
+        for dim in dims_to_test:
+            if dim not in func_info["dimensions"]:
+                continue
+                
+            # Collect the test cases available for this dimension: (label, type, expected value)
+            cases = []
+            vectors = []
+            fingerprints = {}
+            for test_type_str in types_to_test:
+                if (func_id, dim, test_type_str) not in golden:
+                    continue
+                fingerprint = self._case_fingerprint(func_id, func_info, dim, test_type_str, golden)
+                if skip_unchanged and self.result_cache.is_current(
+                        case_key(func_id, dim, test_type_str), fingerprint):
+                    skipped.append((dim, test_type_str))
+                    continue
+                fingerprints[test_type_str] = fingerprint
+                for label, vector, expected in iter_case_rows(golden, func_id, dim, test_type_str):
+                    cases.append((label, test_type_str, expected))
+                    vectors.extend([vector] * samples)
+            
+            if not cases:
+                continue
+            
+            # All test vectors of a dimension (and their samples) are executed together
+            pending = self._submit_cases(func_id, dim, vectors)
+            groups.append((dim, cases, pending, fingerprints, samples))
+        
+        return {
+            "func_id": func_id,
+            "func_key": func_key,
+            "func_info": func_info,
+            "groups": groups,
+            "skipped": skipped
+        }
+    
+    def _plan_functions(self, func_ids: List[int], dimensions: Optional[List[int]] = None,
+                        test_types: Optional[List[str]] = None):
+        """Plan functions in order, yielding (func_id, plan or planning error).
+        
+        Serially, functions are planned (and evaluated) one at a time as they
+        are reported. With a worker pool, every function is planned up front
+        so that all their evaluations run concurrently.
+        """
+        def plans():
+            for func_id in func_ids:
+                try:
+                    yield func_id, self._plan_function(func_id, dimensions, test_types)
+                except Exception as e:
+                    yield func_id, e
+        
+        return plans() if self._pool is None else list(plans())
+    
+    def _report_function(self, plan) -> Dict:
+        """Check and report the results of a planned function, in order."""
+        if isinstance(plan, Exception):
+            raise plan
+        
+        func_id = plan["func_id"]
+        func_info = plan["func_info"]
+        is_noisy = func_info.get("noisy", False)
+        noise_model = get_noise_model(self.config.year, func_id)
         
         # Print header
-        self.reporter.print_function_header(func_id, func_info["name"], is_noisy)
+        self.reporter.print_function_header(func_id, func_info["name"], is_noisy,
+                                            noise_model, self._noise_samples(func_id, func_info))
+        if plan["skipped"]:
+            print(f"  {len(plan['skipped'])} cases unchanged since their last passing run (skipped)")
         
         # Track results
         all_passed = True
         failed_details = {}
+        # The statistical checks of all the sampled vectors share one significance level
+        sampled_vectors = sum(len(cases) for _, cases, _, _, samples in plan["groups"] if samples > 1)
         
         # Test each dimension and type
-        for dim in dims_to_test:
-            if dim not in func_info["dimensions"]:
+        for dim, cases, pending, fingerprints, samples in plan["groups"]:
+            try:
+                actuals = pending.result()
+            except Exception as e:
+                for label, _, _ in cases:
+                    print(f"  Dim {dim:2d}, {label:8s}: ✗ Error: {e}")
+                all_passed = False
+                for test_type_str, fingerprint in fingerprints.items():
+                    self.result_cache.record(case_key(func_id, dim, test_type_str), fingerprint, False)
                 continue
-                
-            dim_data = validation_data["dimensions"].get(str(dim), {})
             
-            for test_type_str in types_to_test:
-                if "results" not in dim_data or test_type_str not in dim_data["results"]:
-                    continue
-                
+            # A case passes when all of its points pass
+            case_passed = dict.fromkeys(fingerprints, True)
+            for index, (label, test_type_str, expected) in enumerate(cases):
                 test_type = TestType(test_type_str)
-                test_data = dim_data["results"][test_type_str]
                 
                 try:
-                    # Execute function
-                    actual = self.executor.run(
-                        func_id, dim, test_data["input_vector"]
-                    )
-                    
-                    # Check tolerance
-                    passed, error = self.tolerance_checker.check(
-                        test_data["objective_value"], 
-                        actual, 
-                        is_noisy,
-                        test_type
-                    )
-                    
-                    # Create result
-                    result = TestResult(
-                        expected=test_data["objective_value"],
-                        actual=actual,
-                        passed=passed,
-                        error=error
-                    )
+                    if samples > 1:
+                        # Statistical check of the vector's samples against the noise model
+                        result = self.tolerance_checker.check_samples(
+                            expected, actuals[index * samples:(index + 1) * samples], noise_model,
+                            sampled_vectors
+                        )
+                    else:
+                        # Check tolerance
+                        passed, error = self.tolerance_checker.check(
+                            expected, 
+                            actuals[index], 
+                            is_noisy,
+                            test_type
+                        )
+                        
+                        # Create result
+                        result = TestResult(
+                            expected=expected,
+                            actual=actuals[index],
+                            passed=passed,
+                            error=error
+                        )
                     
                     # Track failures
-                    if not passed:
+                    if not result.passed:
                         all_passed = False
+                        case_passed[test_type_str] = False
                         if dim not in failed_details:
                             failed_details[dim] = []
-                        failed_details[dim].append(test_type_str)
+                        failed_details[dim].append(label)
                     
                     # Report result
-                    self.reporter.print_test_result(dim, test_type_str, result)
+                    self.reporter.print_test_result(dim, label, result)
                     
                 except Exception as e:
-                    print(f"  Dim {dim:2d}, {test_type_str:8s}: ✗ Error: {e}")
+                    print(f"  Dim {dim:2d}, {label:8s}: ✗ Error: {e}")
                     all_passed = False
-        
-        return {
-            "function": func_key,
+                    case_passed[test_type_str] = False
+            
+            for test_type_str, fingerprint in fingerprints.items():
+                self.result_cache.record(case_key(func_id, dim, test_type_str), fingerprint,
+                                         case_passed[test_type_str])
+            
+            try:
+                norm_problem = self._norm_cache_problem(func_id, dim)
+            except Exception as e:
+                norm_problem = f"could not be checked: {e}"
+            if norm_problem is not None:
+                print(f"  Dim {dim:2d}, norm    : ✗ Cached normalization {norm_problem}")
+                all_passed = False
+                failed_details.setdefault(dim, []).append("norm")
+        
+        result = {
+            "function": plan["func_key"],
             "name": func_info["name"],
             "passed": all_passed,
             "noisy": is_noisy,
-            "failed_tests": failed_details
+            "failed_tests": failed_details,
+            "skipped": len(plan["skipped"])
         }
+        if self.timing:
+            # Time spent per phase for each dimension, see executors.timing
+            result["timings"] = {
+                dim: self.executor.timings.summary(func_id, dim) for dim, *_ in plan["groups"]
+            }
+        return result
+    
+    def validate_function(self, func_id: int, dimensions: Optional[List[int]] = None,
+                         test_types: Optional[List[str]] = None) -> Dict:
+        """Validate a single function."""
+        return self._report_function(self._plan_function(func_id, dimensions, test_types))
+    
+    def _shutdown(self):
+        """Stop the worker pool and clean up the executor."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self.result_cache.save()
+        self.executor.cleanup()
     
     def validate_all(self) -> Dict:
         """Validate all functions for the CEC year."""
@@ -359,9 +653,11 @@ class CECValidator:
         
         failed_details = {}
         
-        for func_id in range(1, self.config.num_functions + 1):
+        self._start_pool()
+        func_ids = list(range(1, self.config.num_functions + 1))
+        for func_id, plan in self._plan_functions(func_ids):
             try:
-                result = self.validate_function(func_id)
+                result = self._report_function(plan)
                 func_key = result["function"]
                 
                 if result["passed"]:
@@ -382,6 +678,9 @@ class CECValidator:
                 print(f"\nError validating F{func_id}: {e}")
                 results["summary"]["failed"] += 1
         
+        if self.timing:
+            self.reporter.print_timings(results["functions"])
+        
         # Print summary
         self.reporter.print_summary(
             self.config.year,
@@ -393,7 +692,7 @@ class CECValidator:
         )
         
         # Cleanup
-        self.executor.cleanup()
+        self._shutdown()
         
         return results
     
@@ -404,16 +703,20 @@ class CECValidator:
         func_ids = func_ids or list(range(1, self.config.num_functions + 1))
         results = {}
         
-        for func_id in func_ids:
+        self._start_pool()
+        for func_id, plan in self._plan_functions(func_ids, dimensions, test_types):
             try:
-                result = self.validate_function(func_id, dimensions, test_types)
+                result = self._report_function(plan)
                 results[result["function"]] = result
             except Exception as e:
                 print(f"Error validating F{func_id}: {e}")
                 results[f"f{func_id:02d}"] = {"passed": False, "error": str(e)}
         
+        if self.timing:
+            self.reporter.print_timings(results)
+        
         # Cleanup
-        self.executor.cleanup()
+        self._shutdown()
         
         return results
 
@@ -432,7 +735,8 @@ def get_cec_config(year: int, base_dir: str = ".") -> CECConfig:
             metadata_path=f"{base_dir}/CEC2005-C/input_data/meta_2005.json",
             num_functions=25,
             supported_dimensions=[2, 10, 30, 50],
-            default_test_types=["min", "max", "optimal", "random"]
+            default_test_types=["min", "max", "optimal", "random", "regression"],
+            cache_dir=f"{base_dir}/.validation_cache"
         ),
         2006: CECConfig(
             year=2006,
@@ -441,7 +745,8 @@ def get_cec_config(year: int, base_dir: str = ".") -> CECConfig:
             metadata_path=f"{base_dir}/CEC2006-C/input_data/meta_2006.json",
             num_functions=24,  # CEC2006 has 24 test problems
             supported_dimensions=list(range(2, 25)),  # Variable dimensions
-            default_test_types=["min", "max", "optimal", "random"]
+            default_test_types=["min", "max", "optimal", "random", "regression"],
+            cache_dir=f"{base_dir}/.validation_cache"
         ),
         # Add more years as needed
     }
@@ -494,6 +799,42 @@ def main():
         default=".",
         help="Base directory for CEC implementations (default: current directory)"
     )
+    parser.add_argument(
+        "--backend",
+        help="Executor backend to validate (e.g. subprocess, ctypes; default: the year's default executor)"
+    )
+    
+    parser.add_argument(
+        "--profile",
+        choices=sorted(BUILD_PROFILES),
+        help="Build profile of the C implementation (default: the Makefile's flags)"
+    )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Record the time spent in each evaluation phase and print a summary"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of test cases evaluated in parallel (0: one per CPU core; default: 1)"
+    )
+    parser.add_argument(
+        "--noise-samples",
+        type=int,
+        default=DEFAULT_NOISE_SAMPLES,
+        metavar="N",
+        help="Samples per test vector of a noisy function, checked statistically against its "
+             f"noise model (0: compare a single sample with relaxed tolerances; default: {DEFAULT_NOISE_SAMPLES})"
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only run the cases whose code, constants or golden data changed since they last "
+             "passed (noisy functions always run)"
+    )
     
     args = parser.parse_args()
     
@@ -510,7 +851,8 @@ def main():
                 args.dim = [d for d in args.dim if d in config.supported_dimensions]
         
         # Create validator
-        validator = CECValidator(config)
+        validator = CECValidator(config, args.backend, args.jobs, args.profile, args.timing,
+                                 args.changed_only, args.noise_samples)
         
         # Run validation
         if args.func or args.dim or args.type:
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+CEC2005 Double-Precision Verification
+
+The CEC2005 C implementation computes in long double by default (x87 code
+on x86-64). Compiled with -DCEC2005_DOUBLE (the "double" and
+"double-native" build profiles) it computes in double, which vectorizes and
+runs the transcendental functions much faster. This script measures what
+that costs: it evaluates the same vectors with a double build and a
+long double reference build, in-process through libcec2005.so, and reports
+for every function and dimension the maximum absolute deviation
+
+    |f_double(x) - f_long_double(x)|
+
+and the maximum deviation relative to the error to the optimum,
+|f_double - f_long_double| / max(|f_long_double - bias|, 1), over the
+golden vectors and a seeded random sample drawn from the function's search
+range.
+
+The noisy functions (F4, F17, F24, F25) draw their noise from the C library's
+time-seeded generator, so their evaluations cannot be compared point by
+point; they are skipped.
+
+Usage:
+    python verify_precision.py                          # All functions and dimensions
+    python verify_precision.py --func 1 21 --dim 10 50 --samples 100000
+    python verify_precision.py --candidate double-native --reference native
+    python verify_precision.py --tolerance 1e-8         # Exit with 1 above this deviation relative to the error
+    python verify_precision.py --output precision.json  # Save the per-case deviations
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from executors import CEC2005LibraryExecutor
+from executors.build import BUILD_PROFILES
+from executors.caching import noisy_functions
+from golden_store import load_golden_data
+from validate_cec import CECConfig, get_cec_config
+
+# Default number of random vectors per function and dimension
+DEFAULT_SAMPLES = 10_000
+
+
+def computes_in_double(profile: str) -> bool:
+    """Whether a build profile compiles CEC2005 in double precision."""
+    return "-DCEC2005_DOUBLE" in (BUILD_PROFILES[profile].cppflags or "")
+
+
+@dataclass
+class PrecisionResult:
+    """Deviation of the candidate build from the reference on one (function, dimension)."""
+    func_id: int
+    dimension: int
+    golden_vectors: int
+    random_vectors: int
+    max_abs_deviation: float
+    max_error_deviation: float  # relative to max(|f_reference - bias|, 1)
+    worst_value: float          # reference value at the largest absolute deviation
+
+    @property
+    def vectors(self) -> int:
+        return self.golden_vectors + self.random_vectors
+
+
+class PrecisionVerifier:
+    """Compares a double-precision build of CEC2005 against a long double build."""
+
+    def __init__(self, config: CECConfig, candidate: str = "double", reference: str = "release",
+                 samples: int = DEFAULT_SAMPLES, seed: int = 0):
+        """
+        Args:
+            config: CEC2005 configuration
+            candidate: Build profile under test (computing in double)
+            reference: Build profile of the long double reference
+            samples: Random vectors per function and dimension
+            seed: Seed of the random vectors
+        """
+        if computes_in_double(reference) == computes_in_double(candidate):
+            raise ValueError(f"Profiles '{candidate}' and '{reference}' compile the same "
+                             f"precision; compare a double profile against a long double one")
+        self.config = config
+        self.samples = samples
+        self.seed = seed
+        self.candidate = CEC2005LibraryExecutor(config.implementation_dir, candidate)
+        self.reference = CEC2005LibraryExecutor(config.implementation_dir, reference)
+        with open(config.metadata_path, "r") as f:
+            self.functions: Dict[str, Dict] = json.load(f)["functions"]
+        self.noisy = set(noisy_functions(config.metadata_path))
+        self.golden = None
+        try:
+            self.golden = load_golden_data(config.validation_dir, config.year)
+        except FileNotFoundError:
+            print("Warning: no golden data found, comparing on random vectors only")
+
+    def build(self) -> None:
+        """Build both profiles.
+
+        Raises:
+            RuntimeError: If one of them does not build
+        """
+        for executor in (self.candidate, self.reference):
+            if not executor.build():
+                raise RuntimeError(f"Failed to build CEC2005 with the "
+                                   f"'{executor.profile.name}' profile")
+
+    def golden_vectors(self, func_id: int, dimension: int) -> np.ndarray:
+        """Input vectors of every golden test case of a function at a dimension."""
+        if self.golden is None:
+            return np.empty((0, dimension))
+        inputs = [self.golden.cases(func_id, dimension, entry.test_type)[0]
+                  for entry in self.golden.function_entries(func_id)
+                  if entry.dimension == dimension]
+        return np.concatenate(inputs) if inputs else np.empty((0, dimension))
+
+    def random_vectors(self, func_id: int, dimension: int) -> np.ndarray:
+        """Seeded uniform vectors in the function's search range."""
+        low, high = self.functions[f"f{func_id:02d}"]["search_range"]
+        rng = np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(func_id, dimension)))
+        return rng.uniform(low, high, (self.samples, dimension))
+
+    def compare(self, func_id: int, dimension: int) -> PrecisionResult:
+        """Evaluate the golden and random vectors with both builds and measure the deviation."""
+        golden = self.golden_vectors(func_id, dimension)
+        x = np.concatenate([golden, self.random_vectors(func_id, dimension)])
+        expected = self.reference.evaluate(func_id, dimension, x)
+        actual = self.candidate.evaluate(func_id, dimension, x)
+
+        deviation = np.abs(actual - expected)
+        bias = float(self.functions[f"f{func_id:02d}"]["bias"])
+        error_deviation = deviation / np.maximum(np.abs(expected - bias), 1.0)
+        worst = int(np.argmax(deviation))
+        return PrecisionResult(
+            func_id=func_id,
+            dimension=dimension,
+            golden_vectors=len(golden),
+            random_vectors=len(x) - len(golden),
+            max_abs_deviation=float(deviation[worst]),
+            max_error_deviation=float(np.max(error_deviation)),
+            worst_value=float(expected[worst]),
+        )
+
+    def run(self, func_ids: Optional[List[int]] = None,
+            dimensions: Optional[List[int]] = None) -> List[PrecisionResult]:
+        """Compare the selected functions at the selected dimensions."""
+        self.build()
+        results = []
+        func_ids = func_ids or list(range(1, self.config.num_functions + 1))
+        try:
+            for func_id in func_ids:
+                if func_id in self.noisy:
+                    print(f"  F{func_id:02d}: skipped (noisy)")
+                    continue
+                supported = self.functions[f"f{func_id:02d}"]["dimensions"]
+                for dim in (dimensions or supported):
+                    if dim not in supported:
+                        continue
+                    result = self.compare(func_id, dim)
+                    print_result(result)
+                    results.append(result)
+        finally:
+            self.candidate.cleanup()
+            self.reference.cleanup()
+        return results
+
+
+def print_result(result: PrecisionResult):
+    """Print the deviation of one case."""
+    print(f"  F{result.func_id:02d} D{result.dimension:2d}: {result.vectors:7d} vectors  "
+          f"max |diff| {result.max_abs_deviation:9.2e}  "
+          f"max |diff|/error {result.max_error_deviation:9.2e}  "
+          f"(at f = {result.worst_value:.6g})")
+
+
+def print_summary(results: List[PrecisionResult], tolerance: Optional[float]) -> List[PrecisionResult]:
+    """Print the worst cases, and return those above the tolerance."""
+    print("\n" + "=" * 70)
+    print("SUMMARY")
+    print("=" * 70)
+    if not results:
+        print("No cases compared")
+        return []
+    worst = max(results, key=lambda result: result.max_abs_deviation)
+    worst_error = max(results, key=lambda result: result.max_error_deviation)
+    print(f"Cases: {len(results)}, vectors: {sum(result.vectors for result in results)}")
+    print(f"Largest absolute deviation: {worst.max_abs_deviation:.3e} "
+          f"(F{worst.func_id:02d} D{worst.dimension})")
+    print(f"Largest deviation relative to the error: {worst_error.max_error_deviation:.3e} "
+          f"(F{worst_error.func_id:02d} D{worst_error.dimension})")
+    if tolerance is None:
+        return []
+    exceeded = [result for result in results if result.max_error_deviation > tolerance]
+    print(f"Cases above the tolerance {tolerance:g}: {len(exceeded)}")
+    for result in exceeded:
+        print(f"  - F{result.func_id:02d} D{result.dimension}: {result.max_error_deviation:.3e}")
+    return exceeded
+
+
+def save_results(path: str, results: List[PrecisionResult], candidate: str, reference: str,
+                 samples: int, seed: int) -> None:
+    """Write the per-case deviations as JSON."""
+    data = {
+        "metadata": {
+            "date_generated": datetime.now().isoformat(),
+            "candidate": candidate,
+            "reference": reference,
+            "samples": samples,
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    """Main entry point for the precision verification."""
+    parser = argparse.ArgumentParser(
+        description="Measure the deviation of the double-precision CEC2005 build from long double",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "--func",
+        type=int,
+        nargs='+',
+        metavar="ID",
+        help="Function IDs to compare (default: all noiseless functions)"
+    )
+    parser.add_argument(
+        "--dim",
+        type=int,
+        nargs='+',
+        help="Dimensions to compare (default: every dimension of each function)"
+    )
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_SAMPLES,
+        help="Random vectors per function and dimension (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the random vectors (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--candidate",
+        choices=sorted(BUILD_PROFILES),
+        default="double",
+        help="Build profile under test (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--reference",
+        choices=sorted(BUILD_PROFILES),
+        default="release",
+        help="Long double reference build profile (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="Exit with 1 if a deviation relative to the error exceeds this value"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write the results as JSON"
+    )
+    parser.add_argument(
+        "--base-dir",
+        default=".",
+        help="Base directory for CEC implementations (default: current directory)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        config = get_cec_config(2005, args.base_dir)
+        verifier = PrecisionVerifier(config, args.candidate, args.reference,
+                                     args.samples, args.seed)
+        print("=" * 70)
+        print(f"CEC2005 precision: '{args.candidate}' against '{args.reference}'")
+        print("=" * 70)
+        results = verifier.run(args.func, args.dim)
+        exceeded = print_summary(results, args.tolerance)
+
+        if args.output:
+            save_results(args.output, results, args.candidate, args.reference,
+                         args.samples, args.seed)
+            print(f"\nResults written to {args.output}")
+        sys.exit(1 if exceeded else 0)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()